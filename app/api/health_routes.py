@@ -0,0 +1,24 @@
+"""Health-check routes for load balancers and deployment probes."""
+
+from __future__ import annotations
+
+from flask import Blueprint, Response, jsonify
+
+from app.models.model_registry import ModelRegistry
+
+health_api = Blueprint("health_api", __name__)
+
+
+@health_api.route("/readyz", methods=["GET"])
+def readyz() -> Response:
+    """모델별 로드 상태와 워밍업 소요 시간을 보고한다.
+
+    워밍업 대상 모델이 모두 준비되기 전(또는 하나라도 실패하면) 503을 반환해
+    로드 밸런서가 이 노드로 트래픽을 보내지 않도록 한다.
+
+    Returns:
+        JSON {ready, warmup_enabled, models: {모델: {state, warmup_ms, error}}}
+        (200 | 503).
+    """
+    report = ModelRegistry.get_instance().readiness()
+    return jsonify(report), 200 if report["ready"] else 503
@@ -12,6 +12,7 @@ from PIL import Image
 from pillow_heif import register_heif_opener
 
 from app.core.config import constants, settings
+from app.core.deadline import new_deadline
 from app.core.utils import normalize_mission_type, to_legacy_mission_type
 from app.council.graph import pipeline_app
 from app.services.answer_service import get_today_answers
@@ -224,6 +225,8 @@ def mission_submit() -> Response:
     Returns:
         JSON 판정 결과 또는 {"error": str} (400 | 404 | 500).
     """
+    # 업로드 저장 시간까지 포함하도록 요청 도착 시점부터 기한을 잰다.
+    deadline = new_deadline()
     try:
         principal = _require_auth_principal()
     except AuthError as exc:
@@ -270,6 +273,7 @@ def mission_submit() -> Response:
                 "static_hint": session.get("hint", ""),
                 "model_selection": model_selection,
                 "client_location": location_validation,
+                "deadline": deadline,
             },
             "artifacts": {},
             "errors": [],
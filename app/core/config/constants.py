@@ -18,6 +18,8 @@ LOCATION_MODEL_WEIGHTS: dict[str, float] = {"blip": 0.70, "siglip2": 0.30}
 ATMOSPHERE_MODEL_WEIGHTS: dict[str, float] = {"siglip2": 0.80, "blip": 0.20}
 # 레지스트리에 없는 모델의 기본 가중치
 DEFAULT_MODEL_WEIGHT: float = 0.1
+# 같은 모델의 다른 실행 백엔드 → 가중치·힌트 조회에 쓰는 기준 모델
+MODEL_BACKEND_ALIASES: dict[str, str] = {"siglip2-onnx": "siglip2"}
 
 # ── Score Thresholds ───────────────────────────────────────
 # 앙상블 내 모델 간 점수 차이가 이 값 이상이면 충돌(conflict) 플래그 설정
@@ -30,3 +32,9 @@ MODEL_TIMEOUT_BUFFER_SECONDS: float = 5.0
 # ── Coupon ─────────────────────────────────────────────────
 COUPON_CODE_LENGTH: int = 8  # 쿠폰 코드 자릿수
 DEFAULT_DISCOUNT_RULE: str = "10%_OFF"
+# 판정 성공이어도 쿠폰을 막는 validator 리스크 플래그 (앞쪽이 deny_reason 우선)
+COUPON_BLOCKING_RISK_FLAGS: tuple[str, ...] = (
+    "duplicate_image",
+    "perceptual_duplicate",
+    "near_duplicate",
+)
@@ -56,8 +56,12 @@ DEFAULT_PROFILE: dict[str, object] = {
     # MODEL_SELECTION_LOCATION (str)
     #   위치 미션에 사용할 모델 또는 전략.
     #   "siglip2"  → SigLIP2 단독 사용
+    #   "siglip2-onnx" → SigLIP2 (비전 타워를 ONNX Runtime CPU로 실행, onnx extra 필요)
     #   "blip"     → BLIP-VQA 단독 사용
+    #   "gallery"  → 참조 사진 갤러리 kNN (위치 미션 전용, 인덱스 사전 생성 필요)
     #   "ensemble" → settings.ENSEMBLE_MODELS_LOCATION에 정의된 모델 조합
+    #   "cascade"  → 같은 모델 조합을 목록 순서대로 하나씩 실행하고, 가중 점수가
+    #                통과 기준 ± CASCADE_CONFIDENCE_MARGIN 밖이면 나머지 모델을 생략
     #
     "MODEL_SELECTION_LOCATION": "siglip2",
     #
@@ -78,6 +82,13 @@ DEFAULT_PROFILE: dict[str, object] = {
     #   가중치는 constants.ATMOSPHERE_MODEL_WEIGHTS에서 정의.
     #
     "ENSEMBLE_MODELS_ATMOSPHERE": "siglip2,blip",
+    #
+    # CASCADE_CONFIDENCE_MARGIN (float)
+    #   cascade 모드의 확신 구간 반폭. 지금까지의 가중 점수가
+    #   [통과 기준 - 값, 통과 기준 + 값] 밖이면 다음 모델을 부르지 않고 확정한다.
+    #   0이면 기준과 정확히 같을 때만 다음 모델로 넘어간다.
+    #
+    "CASCADE_CONFIDENCE_MARGIN": 0.15,
     # ── API 제한 (Timeout & Retries) ─────────────────────────
     #
     # API_TIMEOUT_SECONDS (float, 초)
@@ -92,6 +103,16 @@ DEFAULT_PROFILE: dict[str, object] = {
     #   0이면 재시도 없이 즉시 실패 처리.
     #
     "API_MAX_RETRIES": 2,
+    #
+    # REQUEST_DEADLINE_SECONDS (float, 초)
+    #   미션 제출 한 건의 전체 처리 기한. mission_submit이 시작 시각에 더해
+    #   request_context["deadline"]으로 전달하고, evaluator·Qwen 재검증·재시도 힌트는
+    #   남은 시간만 기다린 뒤 이미 가진 투표·앙상블 판정·정적 힌트로 폴백한다.
+    #   0이면 기한 없음 (기본값). 기한이 지나면 투표 없이 판정이 실패로 끝나고 제출 횟수도
+    #   차감되므로, 콜드 스타트·CPU BLIP 지연을 측정한 뒤 켠다. 켤 때는 프론트엔드
+    #   fetchWithTimeout(FETCH_TIMEOUT_MS=10초)보다 짧게(예: 9.0) 둔다.
+    #
+    "REQUEST_DEADLINE_SECONDS": 0.0,
     # ── 미션 세션 정책 (Session & Policy) ─────────────────────
     #
     # MISSION_SESSION_TTL_MINUTES (int, 분)
@@ -130,6 +151,206 @@ DEFAULT_PROFILE: dict[str, object] = {
     #   예: 임계값 0.70, margin 0.08 → 0.62~0.78 범위가 경계값.
     #
     "COUNCIL_BORDERLINE_MARGIN": 0.08,
+    # ── 모델 추론 (Inference) ─────────────────────────────────
+    #
+    # BLIP_VQA_BATCH_SIZE (int)
+    #   BLIP VQA에서 한 번의 generate 호출로 묶어 처리할 질문 수.
+    #   0이면 랜드마크 질문 전체를 한 배치로 처리하고,
+    #   1이면 기존처럼 질문별로 순차 디코딩한다.
+    #
+    "BLIP_VQA_BATCH_SIZE": 0,
+    #
+    # BLIP_LOCATION_MODE (str)
+    #   BLIP 위치 검증 방식.
+    #   "generate" → 질문마다 답변 문자열을 생성해 기대 답변과 정확 일치 비교.
+    #                probe 점수는 성공 1.0 / 실패 0.0.
+    #   "score"    → 디코더 forward 한 번으로 "yes"/"no" 토큰 확률을 읽어
+    #                질문별 P(기대 답변)의 평균을 연속 probe 점수로 사용.
+    #
+    "BLIP_LOCATION_MODE": "generate",
+    #
+    # BLIP_EARLY_EXIT (bool)
+    #   True  → 판별력 가중치가 큰 질문부터 청크 단위로 묻고, 남은 질문과
+    #           무관하게 성공/실패가 확정되면 즉시 중단한다.
+    #           BLIP_LOCATION_MODE=generate에서만 적용된다 (score 모드 점수는
+    #           전체 질문의 평균이므로 항상 전체를 실행한다).
+    #   False → 랜드마크 질문 전체를 항상 실행한다.
+    #
+    "BLIP_EARLY_EXIT": False,
+    #
+    # LANDMARK_QA_FILE (str)
+    #   BLIP 위치 검증에 사용할 data/ 아래 Q&A 파일 이름.
+    #   scripts/tools/select_landmark_questions.py로 생성한
+    #   "landmark_qa_selected.json"으로 바꾸면 판별력 높은 질문만 사용한다.
+    #
+    "LANDMARK_QA_FILE": "landmark_qa_labeled.json",
+    #
+    # GALLERY_KNN_K (int)
+    #   gallery 프로브가 비교할 최근접 참조 사진 수 (코사인 유사도 상위 k장).
+    #   참조 인덱스는 scripts/tools/build_gallery_index.py로 미리 만든다.
+    #
+    "GALLERY_KNN_K": 5,
+    #
+    # GALLERY_MIN_SIMILARITY (float, -1.0 ~ 1.0)
+    #   정답 랜드마크 참조 사진이 이 코사인 유사도 이상일 때만 점수에 반영한다.
+    #   가장 가까운 사진이 정답이어도 충분히 닮지 않은 제출은 통과시키지 않는다.
+    #
+    "GALLERY_MIN_SIMILARITY": 0.5,
+    #
+    # SIGLIP2_MICRO_BATCH_ENABLED (bool)
+    #   True  → 동시 요청의 SigLIP2 이미지 텐서를 모아 비전 타워를 한 번에 실행한다.
+    #   False → 요청마다 배치 크기 1로 실행한다.
+    #
+    "SIGLIP2_MICRO_BATCH_ENABLED": False,
+    #
+    # SIGLIP2_MICRO_BATCH_MAX_SIZE (int)
+    #   마이크로 배치 한 번에 묶을 최대 요청 수.
+    #
+    "SIGLIP2_MICRO_BATCH_MAX_SIZE": 8,
+    #
+    # SIGLIP2_MICRO_BATCH_WAIT_MS (float, 밀리초)
+    #   첫 요청 도착 후 다른 요청을 기다리는 최대 시간.
+    #   값이 클수록 배치가 커지지만 단일 요청 지연도 그만큼 늘어난다.
+    #
+    "SIGLIP2_MICRO_BATCH_WAIT_MS": 5.0,
+    #
+    # MODEL_WARMUP_ENABLED (bool)
+    #   True  → create_app 시점에 모델 선택·앙상블 설정에 등장하는 모델을
+    #           백그라운드에서 미리 로드하고 더미 추론을 실행한다.
+    #           /readyz는 워밍업이 끝날 때까지 503을 반환한다.
+    #   False → 첫 제출 시 지연 로드한다. (BYPASS_MODEL_VALIDATION이면 항상 생략)
+    #
+    "MODEL_WARMUP_ENABLED": False,
+    #
+    # MODEL_PRECISION (str)
+    #   SigLIP2·BLIP 로드 시 적용할 추론 정밀도.
+    #   "fp32" → 변환 없음 (기본값)
+    #   "bf16" → 가중치를 bfloat16으로 변환 (메모리 절반, bf16 지원 CPU/GPU에서 이득)
+    #   "int8" → nn.Linear 동적 INT8 양자화 (CPU 전용, GPU에서는 fp32로 되돌림)
+    #   모드별 정확도·지연은 scripts/tools/benchmark_precision.py로 비교한다.
+    #
+    "MODEL_PRECISION": "fp32",
+    #
+    # SIGLIP2_ONNX_INTRA_OP_THREADS (int)
+    #   siglip2-onnx 세션의 연산 내부 스레드 수. 0이면 ONNX Runtime 기본값(물리 코어 수).
+    #   evaluator가 여러 요청을 동시에 처리하므로 코어 수 / 동시 요청 수로 낮추면
+    #   스레드 경합이 줄어든다. (연산 간 스레드는 항상 1)
+    #
+    "SIGLIP2_ONNX_INTRA_OP_THREADS": 0,
+    #
+    # MODEL_WORKER_POOL_ENABLED (bool)
+    #   True  → MODEL_WORKER_PROCESSES에 지정한 모델을 모델 전용 워커 프로세스에서 실행한다.
+    #           각 워커는 모델 하나만 로드하고, 이미지는 공유 메모리로 전달받는다.
+    #   False → evaluator 스레드에서 같은 프로세스의 모델을 직접 호출한다.
+    #
+    "MODEL_WORKER_POOL_ENABLED": False,
+    #
+    # MODEL_WORKER_PROCESSES (str, "모델:프로세스 수" 쉼표 구분)
+    #   워커 풀에서 실행할 모델과 모델별 워커 프로세스 수.
+    #   목록에 없는 모델(예: 원격 API인 qwen)은 기존처럼 스레드에서 실행된다.
+    #
+    "MODEL_WORKER_PROCESSES": "siglip2:1,blip:1",
+    #
+    # MODEL_WORKER_THREADS (int)
+    #   워커 프로세스당 torch.set_num_threads 값.
+    #   0이면 CPU 코어 수 / 전체 워커 수 (워커 간 intra-op 스레드 과다 할당 방지).
+    #
+    "MODEL_WORKER_THREADS": 0,
+    #
+    # MODEL_CONCURRENCY_LIMITS (str, "모델:동시 실행 수" 쉼표 구분)
+    #   ModelRegistry가 모델별로 유지하는 스레드 풀 크기.
+    #   한도를 넘는 요청은 큐에서 대기하고, 시간 초과 시 취소된다.
+    #   로컬 모델은 CPU를 나눠 쓰므로 작게, 원격 API(qwen)는 크게 둔다.
+    #
+    "MODEL_CONCURRENCY_LIMITS": "siglip2:2,siglip2-onnx:2,blip:2,qwen:8",
+    #
+    # MODEL_CONCURRENCY_DEFAULT (int)
+    #   MODEL_CONCURRENCY_LIMITS에 없는 모델의 동시 실행 수.
+    #
+    "MODEL_CONCURRENCY_DEFAULT": 2,
+    #
+    # QWEN_HTTP_KEEPALIVE_SECONDS (float, 초)
+    #   Qwen-VL(OpenRouter) 클라이언트가 유휴 keep-alive 연결을 유지하는 시간.
+    #   연결 풀 크기는 qwen 동시 실행 수(MODEL_CONCURRENCY_LIMITS)를 따른다.
+    #
+    "QWEN_HTTP_KEEPALIVE_SECONDS": 60.0,
+    #
+    # QWEN_IMAGE_MAX_SIDE (int, px)
+    #   Qwen-VL로 보내기 전 이미지 긴 변을 이 크기 이하로 줄인다.
+    #   Qwen-VL은 내부에서 어차피 제한된 픽셀 수로 리사이즈하므로 원본 해상도는 대역폭 낭비다.
+    #   0이면 크기를 유지하고 JPEG 재인코딩만 한다.
+    #
+    "QWEN_IMAGE_MAX_SIDE": 1280,
+    #
+    # QWEN_IMAGE_JPEG_QUALITY (int, 1~95)
+    #   Qwen-VL 전송용 JPEG 재인코딩 품질.
+    #
+    "QWEN_IMAGE_JPEG_QUALITY": 85,
+    #
+    # VOTE_CACHE_ENABLED (bool)
+    #   (image_hash, 모델, 미션 유형, 정답, 프롬프트 지문)별 모델 투표 캐시.
+    #   같은 사진 재제출·council의 Qwen 재호출 시 모델을 다시 실행하지 않는다.
+    #
+    "VOTE_CACHE_ENABLED": True,
+    #
+    # VOTE_CACHE_TTL_SECONDS (float, 초)
+    #   캐시된 투표의 유효 시간. 정답 교체 주기보다 짧게 둔다.
+    #
+    "VOTE_CACHE_TTL_SECONDS": 600.0,
+    #
+    # VOTE_CACHE_MAX_ENTRIES (int)
+    #   보관할 최대 투표 수. 넘으면 가장 오래 쓰지 않은 항목부터 버린다(LRU).
+    #
+    "VOTE_CACHE_MAX_ENTRIES": 1024,
+    #
+    # QWEN_PREFETCH_ENABLED (bool)
+    #   앙상블 투표 하나가 경계값 범위에 들거나 투표끼리 충돌하면, aggregator를
+    #   기다리지 않고 council이 부를 Qwen 호출을 백그라운드로 미리 시작한다.
+    #   council이 열리지 않으면 결과는 캐시에만 남는다 (유료 API 호출이 늘 수 있음).
+    #   VOTE_CACHE_ENABLED가 켜져 있어야 동작한다.
+    #
+    "QWEN_PREFETCH_ENABLED": False,
+    #
+    # EMBEDDING_STORE_ENABLED (bool)
+    #   True  → SigLIP2 이미지 임베딩을 image_hash 키로
+    #           data/embeddings/<모델>--torch-<정밀도>/에 float16으로 쌓고, 같은 사진은
+    #           비전 타워 대신 저장된 벡터를 쓴다 (MODEL_PRECISION마다 별도 저장소).
+    #   False → 요청마다 비전 타워를 실행하고 임베딩을 버린다.
+    #
+    "EMBEDDING_STORE_ENABLED": True,
+    #
+    # NEAR_DUPLICATE_ENABLED (bool)
+    #   True  → validator가 제출 사진의 SigLIP2 임베딩을 같은 사이트의 최근
+    #           제출(다른 사용자)과 비교해, 유사도가 NEAR_DUPLICATE_SIMILARITY
+    #           이상이면 near_duplicate 리스크 플래그를 세우고 쿠폰을 막는다.
+    #           메인 프로세스에 SigLIP2를 올리므로 기본은 꺼 둔다.
+    #   False → 바이트 동일(SHA-256) 중복만 검사한다.
+    #
+    # NEAR_DUPLICATE_SIMILARITY (float)
+    #   근접 중복으로 볼 코사인 유사도 하한. 재인코딩·리사이즈는 0.97 이상,
+    #   같은 장소를 다른 사람이 새로 찍은 사진은 대개 0.9 미만이다.
+    #
+    # NEAR_DUPLICATE_WINDOW_DAYS (int)
+    #   비교할 일자 샤드 수 (오늘 포함, UTC 기준).
+    #
+    "NEAR_DUPLICATE_ENABLED": False,
+    "NEAR_DUPLICATE_SIMILARITY": 0.95,
+    "NEAR_DUPLICATE_WINDOW_DAYS": 7,
+    #
+    # PHASH_INDEX_ENABLED (bool)
+    #   True  → validator가 제출 사진의 64비트 dHash를 사이트별 해시 인덱스
+    #           (data/phash/<사이트>.jsonl)에서 찾아, 다른 사용자의 제출과 해밍 거리
+    #           PHASH_MAX_DISTANCE 이하이면 perceptual_duplicate 플래그를 세운다.
+    #           같은 자리에서 찍은 같은 랜드마크 사진도 가까울 수 있으므로, 실제
+    #           사이트 사진으로 PHASH_MAX_DISTANCE를 보정한 뒤에 켠다.
+    #   False → 지각 해시를 조회·기록하지 않는다.
+    #
+    # PHASH_MAX_DISTANCE (int)
+    #   같은 사진으로 볼 최대 해밍 거리 (0~64). 합성 이미지 기준 재인코딩·리사이즈는
+    #   0~2, 가장자리 2% 자르기는 6 안팎이다 (실사진 미보정 초기값).
+    #
+    "PHASH_INDEX_ENABLED": False,
+    "PHASH_MAX_DISTANCE": 6,
     "DATABASE_URL": "sqlite:///data/pazule.db",
     "STORAGE_BACKEND": "json",
     "SUPABASE_URL": "",
@@ -163,6 +384,10 @@ PROFILES: dict[str, dict[str, object]] = {
         "BYPASS_MODEL_VALIDATION": False,  # 추론 활성화 (mock으로 대체)
         "DEMO_AUTH_ENABLED": False,
         "SKIP_GPS_VALIDATION": False,
+        "VOTE_CACHE_ENABLED": False,  # 테스트 간 투표 재사용 방지
+        "EMBEDDING_STORE_ENABLED": False,  # 테스트가 data/에 임베딩을 쓰지 않도록
+        "NEAR_DUPLICATE_ENABLED": False,
+        "PHASH_INDEX_ENABLED": False,  # 테스트가 data/phash/에 쓰지 않도록
     },
     # ── production ───────────────────────────────────────────
     # 실제 서비스 환경. 모든 검증·추론이 활성화된다.
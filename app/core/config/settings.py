@@ -140,6 +140,9 @@ class Settings:
     ENSEMBLE_MODELS_ATMOSPHERE: str = _env_or_profile(  # type: ignore[assignment]
         "ENSEMBLE_MODELS_ATMOSPHERE", str
     )
+    CASCADE_CONFIDENCE_MARGIN: float = _env_or_profile(  # type: ignore[assignment]
+        "CASCADE_CONFIDENCE_MARGIN", float
+    )
 
     # --- API 제한 ---
     API_TIMEOUT_SECONDS: float = _env_or_profile(  # type: ignore[assignment]
@@ -148,6 +151,9 @@ class Settings:
     API_MAX_RETRIES: int = _env_or_profile(  # type: ignore[assignment]
         "API_MAX_RETRIES", int
     )
+    REQUEST_DEADLINE_SECONDS: float = _env_or_profile(  # type: ignore[assignment]
+        "REQUEST_DEADLINE_SECONDS", float
+    )
 
     # --- 미션 세션 정책 ---
     MISSION_SESSION_TTL_MINUTES: int = _env_or_profile(  # type: ignore[assignment]
@@ -180,6 +186,98 @@ class Settings:
         "COUNCIL_BORDERLINE_MARGIN", float
     )
 
+    # --- 모델 추론 ---
+    BLIP_VQA_BATCH_SIZE: int = _env_or_profile(  # type: ignore[assignment]
+        "BLIP_VQA_BATCH_SIZE", int
+    )
+    BLIP_LOCATION_MODE: str = _env_or_profile(  # type: ignore[assignment]
+        "BLIP_LOCATION_MODE", str
+    )
+    BLIP_EARLY_EXIT: bool = _env_or_profile(  # type: ignore[assignment]
+        "BLIP_EARLY_EXIT", bool
+    )
+    LANDMARK_QA_FILE: str = _env_or_profile(  # type: ignore[assignment]
+        "LANDMARK_QA_FILE", str
+    )
+    GALLERY_KNN_K: int = _env_or_profile(  # type: ignore[assignment]
+        "GALLERY_KNN_K", int
+    )
+    GALLERY_MIN_SIMILARITY: float = _env_or_profile(  # type: ignore[assignment]
+        "GALLERY_MIN_SIMILARITY", float
+    )
+    SIGLIP2_MICRO_BATCH_ENABLED: bool = _env_or_profile(  # type: ignore[assignment]
+        "SIGLIP2_MICRO_BATCH_ENABLED", bool
+    )
+    SIGLIP2_MICRO_BATCH_MAX_SIZE: int = _env_or_profile(  # type: ignore[assignment]
+        "SIGLIP2_MICRO_BATCH_MAX_SIZE", int
+    )
+    SIGLIP2_MICRO_BATCH_WAIT_MS: float = _env_or_profile(  # type: ignore[assignment]
+        "SIGLIP2_MICRO_BATCH_WAIT_MS", float
+    )
+    MODEL_WARMUP_ENABLED: bool = _env_or_profile(  # type: ignore[assignment]
+        "MODEL_WARMUP_ENABLED", bool
+    )
+    MODEL_PRECISION: str = _env_or_profile(  # type: ignore[assignment]
+        "MODEL_PRECISION", str
+    )
+    SIGLIP2_ONNX_INTRA_OP_THREADS: int = _env_or_profile(  # type: ignore[assignment]
+        "SIGLIP2_ONNX_INTRA_OP_THREADS", int
+    )
+    MODEL_WORKER_POOL_ENABLED: bool = _env_or_profile(  # type: ignore[assignment]
+        "MODEL_WORKER_POOL_ENABLED", bool
+    )
+    MODEL_WORKER_PROCESSES: str = _env_or_profile(  # type: ignore[assignment]
+        "MODEL_WORKER_PROCESSES", str
+    )
+    MODEL_WORKER_THREADS: int = _env_or_profile(  # type: ignore[assignment]
+        "MODEL_WORKER_THREADS", int
+    )
+    MODEL_CONCURRENCY_LIMITS: str = _env_or_profile(  # type: ignore[assignment]
+        "MODEL_CONCURRENCY_LIMITS", str
+    )
+    MODEL_CONCURRENCY_DEFAULT: int = _env_or_profile(  # type: ignore[assignment]
+        "MODEL_CONCURRENCY_DEFAULT", int
+    )
+    QWEN_HTTP_KEEPALIVE_SECONDS: float = _env_or_profile(  # type: ignore[assignment]
+        "QWEN_HTTP_KEEPALIVE_SECONDS", float
+    )
+    QWEN_IMAGE_MAX_SIDE: int = _env_or_profile(  # type: ignore[assignment]
+        "QWEN_IMAGE_MAX_SIDE", int
+    )
+    QWEN_IMAGE_JPEG_QUALITY: int = _env_or_profile(  # type: ignore[assignment]
+        "QWEN_IMAGE_JPEG_QUALITY", int
+    )
+    VOTE_CACHE_ENABLED: bool = _env_or_profile(  # type: ignore[assignment]
+        "VOTE_CACHE_ENABLED", bool
+    )
+    VOTE_CACHE_TTL_SECONDS: float = _env_or_profile(  # type: ignore[assignment]
+        "VOTE_CACHE_TTL_SECONDS", float
+    )
+    VOTE_CACHE_MAX_ENTRIES: int = _env_or_profile(  # type: ignore[assignment]
+        "VOTE_CACHE_MAX_ENTRIES", int
+    )
+    QWEN_PREFETCH_ENABLED: bool = _env_or_profile(  # type: ignore[assignment]
+        "QWEN_PREFETCH_ENABLED", bool
+    )
+    EMBEDDING_STORE_ENABLED: bool = _env_or_profile(  # type: ignore[assignment]
+        "EMBEDDING_STORE_ENABLED", bool
+    )
+    NEAR_DUPLICATE_ENABLED: bool = _env_or_profile(  # type: ignore[assignment]
+        "NEAR_DUPLICATE_ENABLED", bool
+    )
+    NEAR_DUPLICATE_SIMILARITY: float = _env_or_profile(  # type: ignore[assignment]
+        "NEAR_DUPLICATE_SIMILARITY", float
+    )
+    NEAR_DUPLICATE_WINDOW_DAYS: int = _env_or_profile(  # type: ignore[assignment]
+        "NEAR_DUPLICATE_WINDOW_DAYS", int
+    )
+    PHASH_INDEX_ENABLED: bool = _env_or_profile(  # type: ignore[assignment]
+        "PHASH_INDEX_ENABLED", bool
+    )
+    PHASH_MAX_DISTANCE: int = _env_or_profile(  # type: ignore[assignment]
+        "PHASH_MAX_DISTANCE", int
+    )
+
     # ── 경로 설정 (환경 무관, 코드 내 고정) ────────────────────
     #
     # BASE_DIR: 프로젝트 루트 디렉터리 절대 경로.
@@ -208,17 +306,23 @@ class Settings:
     # DATA_DIR: JSON 데이터 파일 저장 디렉터리 (쿠폰, 세션 등).
     DATA_DIR: str = os.path.join(BASE_DIR, "data")
     #
+    # MODEL_CACHE_DIR: 내보낸 모델 아티팩트(ONNX 등) 캐시 디렉터리.
+    MODEL_CACHE_DIR: str = os.path.join(DATA_DIR, "model_cache")
+    #
+    # EMBEDDING_STORE_DIR: 제출 이미지 임베딩 저장소(모델 ID별 하위 디렉터리).
+    EMBEDDING_STORE_DIR: str = os.path.join(DATA_DIR, "embeddings")
+    #
     # PROMPT_TEMPLATES_DIR: LLM 프롬프트 YAML 템플릿 디렉터리.
     PROMPT_TEMPLATES_DIR: str = os.path.join(BASE_DIR, "app", "prompts", "templates")
 
     @property
     def LANDMARK_QA_PATH(self) -> str:
-        """로컬 테스트용 랜드마크 QA 데이터셋 파일의 절대 경로를 반환한다.
+        """BLIP 위치 검증용 랜드마크 QA 데이터셋 파일의 절대 경로를 반환한다.
 
         Returns:
-            landmark_qa_labeled.json 파일 경로.
+            DATA_DIR 아래 LANDMARK_QA_FILE 경로 (기본 landmark_qa_labeled.json).
         """
-        return os.path.join(self.DATA_DIR, "landmark_qa_labeled.json")
+        return os.path.join(self.DATA_DIR, self.LANDMARK_QA_FILE)
 
     @staticmethod
     def parse_csv(value: str) -> list[str]:
@@ -232,6 +336,31 @@ class Settings:
         """
         return [token.strip().lower() for token in value.split(",") if token.strip()]
 
+    @classmethod
+    def parse_model_counts(cls, key: str, value: str) -> dict[str, int]:
+        """ "모델:수" 형식의 CSV 설정을 딕셔너리로 파싱한다.
+
+        수를 생략한 항목(예: "siglip2")은 1로 본다.
+
+        Args:
+            key: 오류 메시지에 표시할 설정 키.
+            value: 파싱할 문자열 (예: "siglip2:2,blip").
+
+        Returns:
+            모델 식별자 → 수 (예: {"siglip2": 2, "blip": 1}).
+
+        Raises:
+            ValueError: 수가 0 이상의 정수가 아닌 항목이 있는 경우.
+        """
+        counts: dict[str, int] = {}
+        for token in cls.parse_csv(value):
+            name, _, count = token.partition(":")
+            count = count.strip() or "1"
+            if not name.strip() or not count.isdigit():
+                raise ValueError(f"{key} 형식 오류: '{token}' (예: siglip2:2,blip:1)")
+            counts[name.strip()] = int(count)
+        return counts
+
     @property
     def location_ensemble_models(self) -> list[str]:
         """위치(Location) 미션 앙상블에 참여할 모델 이름 리스트를 반환한다.
@@ -250,5 +379,48 @@ class Settings:
         """
         return self.parse_csv(self.ENSEMBLE_MODELS_ATMOSPHERE)
 
+    @property
+    def model_worker_processes(self) -> dict[str, int]:
+        """워커 풀에서 실행할 모델별 프로세스 수를 반환한다.
+
+        수를 생략한 항목(예: "siglip2")은 1개로 본다.
+
+        Returns:
+            모델 식별자 → 워커 프로세스 수 (예: {"siglip2": 2, "blip": 1}).
+
+        Raises:
+            ValueError: 프로세스 수가 0 이상의 정수가 아닌 항목이 있는 경우.
+        """
+        return self.parse_model_counts(
+            "MODEL_WORKER_PROCESSES", self.MODEL_WORKER_PROCESSES
+        )
+
+    def validate_model_worker_processes(self) -> None:
+        """MODEL_WORKER_PROCESSES 형식을 검사한다 (서버 기동 시 호출).
+
+        Raises:
+            ValueError: 프로세스 수가 0 이상의 정수가 아닌 항목이 있는 경우.
+        """
+        self.parse_model_counts("MODEL_WORKER_PROCESSES", self.MODEL_WORKER_PROCESSES)
+
+    def model_concurrency(self, model_name: str) -> int:
+        """모델 하나가 동시에 실행할 수 있는 추론 수를 반환한다.
+
+        MODEL_CONCURRENCY_LIMITS에 없는 모델은 MODEL_CONCURRENCY_DEFAULT를 쓴다.
+
+        Args:
+            model_name: 모델 식별자.
+
+        Returns:
+            1 이상의 동시 실행 한도.
+
+        Raises:
+            ValueError: MODEL_CONCURRENCY_LIMITS 형식이 잘못된 경우.
+        """
+        limits = self.parse_model_counts(
+            "MODEL_CONCURRENCY_LIMITS", self.MODEL_CONCURRENCY_LIMITS
+        )
+        return max(1, limits.get(model_name, self.MODEL_CONCURRENCY_DEFAULT))
+
 
 settings = Settings()
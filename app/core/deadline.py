@@ -0,0 +1,62 @@
+"""요청 단위 처리 기한(deadline) 유틸리티.
+
+mission_submit이 요청 시작 시각 + REQUEST_DEADLINE_SECONDS를 request_context["deadline"]에
+기록하고, 시간이 드는 단계(evaluator·QwenFallbackJudge·재시도 힌트)는 남은 시간만큼만
+기다린 뒤 이미 가진 결과로 폴백한다. 기한은 time.monotonic() 기준 절대 시각이다.
+"""
+
+from __future__ import annotations
+
+import time
+
+from app.core.config import settings
+
+
+def new_deadline(seconds: float | None = None) -> float | None:
+    """지금부터 seconds 뒤의 기한을 반환한다.
+
+    Args:
+        seconds: 허용 시간(초). None이면 REQUEST_DEADLINE_SECONDS.
+
+    Returns:
+        time.monotonic() 기준 기한. seconds가 0 이하이면 None (기한 없음).
+    """
+    if seconds is None:
+        seconds = settings.REQUEST_DEADLINE_SECONDS
+    if seconds <= 0:
+        return None
+    return time.monotonic() + seconds
+
+
+def remaining(deadline: float | None) -> float | None:
+    """기한까지 남은 시간(초)을 반환한다.
+
+    Args:
+        deadline: new_deadline이 반환한 기한 또는 None.
+
+    Returns:
+        남은 초 (지났으면 0.0). 기한이 없으면 None.
+    """
+    if deadline is None:
+        return None
+    return max(0.0, deadline - time.monotonic())
+
+
+def expired(deadline: float | None) -> bool:
+    """기한이 지났는지 여부를 반환한다 (기한이 없으면 항상 False)."""
+    left = remaining(deadline)
+    return left is not None and left <= 0.0
+
+
+def cap_timeout(timeout: float, deadline: float | None) -> float:
+    """단계별 timeout을 남은 기한 이내로 줄인다.
+
+    Args:
+        timeout: 단계 자체의 최대 대기 시간(초).
+        deadline: 요청 기한 또는 None.
+
+    Returns:
+        min(timeout, 남은 시간).
+    """
+    left = remaining(deadline)
+    return timeout if left is None else min(timeout, left)
@@ -0,0 +1,170 @@
+"""제출 이미지 1건을 파이프라인 전체가 공유하는 디코드-1회 아티팩트.
+
+validator가 요청당 하나의 ImageArtifact를 만들어 request_context에 넣으면,
+메타데이터 검사·중복 해시·각 모델 프로브가 같은 원본 바이트, 같은 RGB 디코드 결과,
+모델별 전처리 텐서를 재사용한다. 모든 값은 처음 필요할 때 한 번만 계산된다.
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import io
+import os
+import threading
+from typing import Any, Callable, TypeVar
+
+from PIL import Image, ImageOps
+from pillow_heif import register_heif_opener
+
+# HEIC 포맷 지원 등록
+register_heif_opener()
+
+T = TypeVar("T")
+
+# dHash: (가로 9 × 세로 8) 그레이스케일 축소본의 인접 픽셀 밝기 비교 64비트
+_DHASH_SIZE = 8
+
+
+class ImageArtifact:
+    """원본 바이트·EXIF·RGB 이미지·모델별 전처리 결과를 지연 계산해 캐시한다.
+
+    evaluator가 여러 모델을 스레드로 동시에 실행하므로 항목마다 잠금을 두어
+    같은 값을 두 번 계산하지 않는다. 캐시된 PIL 이미지와 텐서는 읽기 전용으로 다룬다.
+    """
+
+    def __init__(self, path: str | None = None, data: bytes | None = None) -> None:
+        """아티팩트를 생성한다. 파일은 바이트가 처음 필요할 때 읽는다.
+
+        Args:
+            path: 원본 이미지 파일 경로.
+            data: 이미 메모리에 있는 원본 바이트 (주어지면 파일을 읽지 않는다).
+
+        Raises:
+            ValueError: path와 data가 모두 없을 때.
+        """
+        if path is None and data is None:
+            raise ValueError("path 또는 data 중 하나는 필요합니다.")
+        self.path = path
+        self._values: dict[str, Any] = {}
+        if data is not None:
+            self._values["data"] = data
+        self._locks: dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"ImageArtifact(path={self.path!r})"
+
+    @classmethod
+    def from_path(cls, path: str) -> ImageArtifact:
+        """파일 경로로부터 아티팩트를 생성한다."""
+        return cls(path=path)
+
+    @classmethod
+    def resolve(cls, source: str | ImageArtifact) -> ImageArtifact:
+        """경로 또는 아티팩트를 받아 항상 아티팩트로 돌려준다.
+
+        파이프라인 밖에서 경로로 직접 호출된 프로브도 같은 코드 경로를 쓰게 한다.
+
+        Args:
+            source: 이미지 파일 경로 또는 ImageArtifact.
+
+        Returns:
+            source가 아티팩트면 그대로, 경로면 새 아티팩트.
+        """
+        if isinstance(source, ImageArtifact):
+            return source
+        return cls.from_path(source)
+
+    def cached(self, key: str, factory: Callable[[], T]) -> T:
+        """key에 해당하는 값을 한 번만 계산해 캐시하고 반환한다.
+
+        모델별 전처리 텐서처럼 아티팩트가 모르는 파생 값을 저장할 때 사용한다.
+        factory가 예외를 던지면 캐시하지 않고 그대로 전파한다.
+
+        Args:
+            key: 캐시 키 (예: "siglip2.pixel_values").
+            factory: 값이 없을 때 호출할 무인자 함수.
+
+        Returns:
+            캐시된 값.
+        """
+        if key in self._values:
+            return self._values[key]
+        with self._locks_guard:
+            lock = self._locks.setdefault(key, threading.Lock())
+        with lock:
+            if key not in self._values:
+                self._values[key] = factory()
+            return self._values[key]
+
+    @property
+    def name(self) -> str:
+        """로그용 파일 이름을 반환한다."""
+        return os.path.basename(self.path) if self.path else "(memory)"
+
+    @property
+    def data(self) -> bytes:
+        """원본 파일 바이트."""
+        return self.cached("data", self._read)
+
+    @property
+    def sha256(self) -> str:
+        """원본 바이트의 SHA-256 16진수 해시."""
+        return self.cached("sha256", lambda: hashlib.sha256(self.data).hexdigest())
+
+    @property
+    def base64(self) -> str:
+        """원본 바이트의 Base64 문자열 (API 전송용)."""
+        return self.cached(
+            "base64", lambda: base64.b64encode(self.data).decode("utf-8")
+        )
+
+    @property
+    def exif(self) -> Image.Exif:
+        """EXIF 정보. 헤더만 읽으며 픽셀 디코드는 하지 않는다."""
+        return self.cached("exif", lambda: self.open().getexif())
+
+    @property
+    def rgb(self) -> Image.Image:
+        """RGB로 변환된 디코드 이미지."""
+        return self.cached("rgb", lambda: self.open().convert("RGB"))
+
+    @property
+    def dhash(self) -> int:
+        """64비트 차이 해시(dHash). 재인코딩·리사이즈·약한 보정에도 비트가 거의 같다."""
+        return self.cached("dhash", self._dhash)
+
+    def decode(self) -> Image.Image:
+        """RGB 디코드를 지금 수행해 캐시하고 반환한다.
+
+        프로브가 디코드 오류를 추론 오류와 구분해 처리하려고 먼저 호출한다.
+
+        Raises:
+            OSError: 파일이 없거나 이미지로 디코드할 수 없는 경우.
+        """
+        return self.rgb
+
+    def open(self) -> Image.Image:
+        """원본 바이트 위에 새 PIL 이미지 핸들을 연다 (지연 디코드)."""
+        return Image.open(io.BytesIO(self.data))
+
+    def _dhash(self) -> int:
+        image = self.open()
+        # JPEG은 전체 해상도 대신 1/8까지 축소 디코드한다 (다른 포맷은 무시됨).
+        image.draft("L", (_DHASH_SIZE * 8, _DHASH_SIZE * 8))
+        image = ImageOps.exif_transpose(image).convert("L")
+        pixels = image.resize(
+            (_DHASH_SIZE + 1, _DHASH_SIZE), Image.Resampling.BILINEAR
+        ).tobytes()
+        bits = 0
+        for row in range(_DHASH_SIZE):
+            offset = row * (_DHASH_SIZE + 1)
+            for col in range(_DHASH_SIZE):
+                right_brighter = pixels[offset + col + 1] > pixels[offset + col]
+                bits = (bits << 1) | right_brighter
+        return bits
+
+    def _read(self) -> bytes:
+        with open(self.path, "rb") as image_file:
+            return image_file.read()
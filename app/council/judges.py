@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+import concurrent.futures
 import logging
 from abc import ABC, abstractmethod
 from typing import Any, TypedDict
 
-from app.core.config import settings
+from app.core import deadline as request_deadline
+from app.core.config import constants, settings
+from app.council import vote_cache
 
 logger = logging.getLogger(__name__)
 
@@ -164,7 +167,7 @@ class QwenFallbackJudge(BaseJudge):
             context: Judge 평가 컨텍스트.
 
         Returns:
-            Qwen-VL 기반 판정 결과. 호출 실패 시 ensemble 결과로 폴백.
+            Qwen-VL 기반 판정 결과. 호출 실패 또는 요청 기한 초과 시 ensemble 결과로 폴백.
         """
         from app.models.model_registry import ModelRegistry
         from app.models.prompts import build_prompt_bundle
@@ -172,9 +175,15 @@ class QwenFallbackJudge(BaseJudge):
         ensemble = context["ensemble_result"]
         req = context["request_context"]
         mission_type = req.get("mission_type", "location")
-        image_path = req.get("image_path")
+        image_path = req.get("image_artifact") or req.get("image_path")
         answer = req.get("answer")
+        deadline = req.get("deadline")
 
+        if request_deadline.expired(deadline):
+            logger.warning("[QwenFallbackJudge] 요청 기한 초과 → Qwen 재검증 생략")
+            return self._keep_ensemble(ensemble, "request deadline exceeded")
+
+        future: concurrent.futures.Future | None = None
         try:
             logger.info(
                 "[Council] 모델 간 의견 충돌(Conflict) 또는 경계값 감지로 인해 Qwen-VL API를 통한 최종 재검증을 수행합니다..."
@@ -183,7 +192,37 @@ class QwenFallbackJudge(BaseJudge):
             probe = registry.get("qwen")
             prompt_bundle = build_prompt_bundle(mission_type, answer)
 
-            qwen_vote = probe.probe(mission_type, image_path, answer, prompt_bundle)
+            cache_key = vote_cache.request_key(
+                req, "qwen", mission_type, answer, prompt_bundle
+            )
+            # 앙상블에 qwen이 있었다면 같은 이미지·정답·프롬프트로 이미 받은 투표다.
+            qwen_vote = self._ensemble_qwen_vote(context) or vote_cache.lookup(
+                cache_key
+            )
+            if qwen_vote is None:
+                # evaluator가 선행 호출을 시작했다면 새로 부르지 않고 그 결과를 기다린다.
+                future = vote_cache.in_flight(cache_key)
+                if future is None:
+                    future = registry.submit(
+                        "qwen",
+                        probe.probe,
+                        mission_type,
+                        image_path,
+                        answer,
+                        prompt_bundle,
+                    )
+                qwen_vote = future.result(
+                    timeout=request_deadline.cap_timeout(
+                        settings.API_TIMEOUT_SECONDS
+                        + constants.MODEL_TIMEOUT_BUFFER_SECONDS,
+                        deadline,
+                    )
+                )
+                vote_cache.remember(cache_key, qwen_vote)
+            else:
+                logger.info(
+                    "[QwenFallbackJudge] 기존 Qwen 투표 재사용 (추가 호출 없음)"
+                )
 
             qwen_score = qwen_vote.get("score", 0.0)
             threshold = float(ensemble.get("threshold", 1.0))
@@ -198,17 +237,48 @@ class QwenFallbackJudge(BaseJudge):
                 reason=f"Qwen-VL Fallback Override (Original score was borderline): {qwen_vote.get('reason', '')}",
                 needs_escalation=False,
             )
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            logger.warning(
+                "[QwenFallbackJudge] Qwen 응답 시간 초과 → ensemble 판정 유지"
+            )
+            return self._keep_ensemble(ensemble, "Qwen timed out")
         except Exception as exc:
             logger.error("[QwenFallbackJudge] Error: %s", exc)
-            merged_score = float(ensemble.get("merged_score", 0.0))
-            threshold = float(ensemble.get("threshold", 1.0))
-            return JudgeVerdict(
-                judge="QwenFallbackJudge",
-                approved=merged_score >= threshold,
-                confidence=0.5,
-                reason=f"Qwen fallback failed, keeping original judgment: {exc}",
-                needs_escalation=False,
-            )
+            return self._keep_ensemble(ensemble, str(exc))
+
+    @staticmethod
+    def _ensemble_qwen_vote(context: JudgeContext) -> dict[str, Any] | None:
+        """evaluator가 이미 받은 정상 qwen 투표를 반환한다 (없거나 실패면 None).
+
+        evaluator와 이 Judge는 같은 build_prompt_bundle 결과로 Qwen을 호출하므로
+        프롬프트가 같아 재호출할 이유가 없다.
+        """
+        for vote in context.get("model_votes") or []:
+            if vote.get("model") == "qwen" and vote_cache.is_cacheable(vote):
+                return vote
+        return None
+
+    @staticmethod
+    def _keep_ensemble(ensemble: dict[str, Any], cause: str) -> JudgeVerdict:
+        """Qwen 판정을 얻지 못했을 때 ensemble 점수로 판정을 유지한다.
+
+        Args:
+            ensemble: 앙상블 결과.
+            cause: 폴백 사유.
+
+        Returns:
+            ensemble 점수 기반 판정 결과 (confidence 0.5).
+        """
+        merged_score = float(ensemble.get("merged_score", 0.0))
+        threshold = float(ensemble.get("threshold", 1.0))
+        return JudgeVerdict(
+            judge="QwenFallbackJudge",
+            approved=merged_score >= threshold,
+            confidence=0.5,
+            reason=f"Qwen fallback failed, keeping original judgment: {cause}",
+            needs_escalation=False,
+        )
 
     def _format_votes(self, votes: list[dict[str, Any]]) -> str:
         """투표 목록을 사람이 읽기 좋은 문자열로 포맷한다.
@@ -0,0 +1,241 @@
+"""임베딩 유사도 기반 근접 중복(near-duplicate) 제출 탐지.
+
+is_duplicate_hash_for_user는 같은 사용자의 바이트 동일 파일만 잡는다. 다른 사람의 통과
+사진을 자르거나 재인코딩·화면 캡처해 다시 올리면 해시가 달라지므로, validator가 제출
+사진의 SigLIP2 이미지 임베딩을 (사이트, UTC 날짜) 샤드의 최근 제출과 코사인 유사도로
+비교해 NEAR_DUPLICATE_SIMILARITY 이상이면 near_duplicate 리스크 플래그를 세운다.
+샤드에는 쿠폰 지급이 확정된 제출만 record()로 추가한다. 판정에 실패했거나 거절된 사진이
+나중에 다른 사용자의 정상 사진을 막지 않게 하기 위해서다.
+
+샤드는 하루·한 사이트 분량이라 float32 행렬 하나와의 행렬-벡터 곱(BLAS)으로 전수
+비교해도 수천 건에서 1ms 안팎이므로 근사 인덱스 없이 정확한 최근접을 쓴다.
+샤드 구성원(image_hash, user_id)은 임베딩 저장소 옆 JSONL에 추가 기록하고, 재시작 후에는
+벡터를 저장소에서 다시 읽어 복원한다 (저장소가 꺼져 있으면 메모리에만 유지).
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+from datetime import date, datetime, timedelta, timezone
+from typing import Any
+
+import numpy as np
+
+from app.core.config import settings
+from app.core.image_artifact import ImageArtifact
+from app.models import embedding_store, siglip2
+
+logger = logging.getLogger(__name__)
+
+_shards: dict[tuple[str, str], NearDuplicateShard] = {}
+_shards_lock = threading.Lock()
+
+
+class NearDuplicateShard:
+    """한 사이트·하루의 제출 임베딩 행렬과 행별 (image_hash, user_id)."""
+
+    def __init__(self, path: str | None = None) -> None:
+        """샤드를 생성한다. path의 기록이 있으면 저장소 벡터로 복원한다.
+
+        Args:
+            path: 구성원 JSONL 경로. None이면 메모리에만 유지한다.
+        """
+        self.path = path
+        self.hashes: list[str] = []
+        self.users: list[str] = []
+        self._members: set[tuple[str, str]] = set()
+        self._matrix = np.zeros((0, 0), dtype=np.float32)
+        self._lock = threading.Lock()
+        if path and os.path.exists(path):
+            self._restore(path)
+
+    def __len__(self) -> int:
+        return len(self.hashes)
+
+    def add(self, image_hash: str, user_id: str, vector: np.ndarray) -> None:
+        """제출 임베딩을 추가한다. 같은 사용자의 같은 사진은 한 번만 넣는다.
+
+        Args:
+            image_hash: 원본 이미지 SHA-256.
+            user_id: 제출 사용자.
+            vector: (D,) 정규화된 이미지 임베딩.
+        """
+        with self._lock:
+            if not self._append(image_hash, user_id, vector):
+                return
+        if self.path:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps({"image_hash": image_hash, "user_id": user_id}))
+                f.write("\n")
+
+    def nearest(
+        self, vector: np.ndarray, exclude_user: str
+    ) -> tuple[str, float] | None:
+        """다른 사용자의 제출 중 코사인 유사도가 가장 높은 항목을 찾는다.
+
+        Args:
+            vector: (D,) 정규화된 이미지 임베딩.
+            exclude_user: 비교에서 뺄 사용자 (본인의 재촬영은 부정이 아니다).
+
+        Returns:
+            (image_hash, 유사도). 비교할 항목이 없으면 None.
+        """
+        with self._lock:
+            size = len(self.hashes)
+            if size == 0:
+                return None
+            similarities = self._matrix[:size] @ vector.astype(np.float32)
+            others = np.asarray(self.users) != exclude_user
+            if not others.any():
+                return None
+            similarities = np.where(others, similarities, -np.inf)
+            best = int(np.argmax(similarities))
+            return self.hashes[best], float(similarities[best])
+
+    def _append(self, image_hash: str, user_id: str, vector: np.ndarray) -> bool:
+        if (image_hash, user_id) in self._members:
+            return False
+        vector = np.asarray(vector, dtype=np.float32).reshape(-1)
+        size = len(self.hashes)
+        if size and self._matrix.shape[1] != vector.size:
+            raise ValueError(
+                f"임베딩 차원 {vector.size}이 샤드 차원 {self._matrix.shape[1]}과 다릅니다."
+            )
+        if size == 0 and self._matrix.shape[1] != vector.size:
+            self._matrix = np.zeros((64, vector.size), dtype=np.float32)
+        elif size == self._matrix.shape[0]:
+            # 행을 두 배씩 늘려 추가 비용을 상수 시간으로 유지한다.
+            grown = np.zeros((size * 2, vector.size), dtype=np.float32)
+            grown[:size] = self._matrix
+            self._matrix = grown
+        self._matrix[size] = vector
+        self.hashes.append(image_hash)
+        self.users.append(user_id)
+        self._members.add((image_hash, user_id))
+        return True
+
+    def _restore(self, path: str) -> None:
+        store = embedding_store.get_embedding_store(siglip2.embedding_store_key())
+        if store is None:
+            return
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    member = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                vector = store.get(member["image_hash"])
+                if vector is not None:
+                    self._append(member["image_hash"], member["user_id"], vector)
+
+
+def shard_days(today: date | None = None) -> list[str]:
+    """비교할 샤드 날짜 목록 (오늘부터 NEAR_DUPLICATE_WINDOW_DAYS일, UTC)."""
+    today = today or datetime.now(timezone.utc).date()
+    days = max(1, settings.NEAR_DUPLICATE_WINDOW_DAYS)
+    return [(today - timedelta(days=offset)).isoformat() for offset in range(days)]
+
+
+def _shard_path(site_id: str, day: str) -> str | None:
+    store = embedding_store.get_embedding_store(siglip2.embedding_store_key())
+    if store is None:
+        return None
+    site = site_id.replace("/", "_").replace("\\", "_")
+    return os.path.join(store.directory, "near_duplicate", site, f"{day}.jsonl")
+
+
+def get_shard(site_id: str, day: str) -> NearDuplicateShard:
+    """(사이트, 날짜) 샤드를 지연 생성한다."""
+    key = (site_id, day)
+    shard = _shards.get(key)
+    if shard is None:
+        with _shards_lock:
+            shard = _shards.get(key)
+            if shard is None:
+                shard = NearDuplicateShard(_shard_path(site_id, day))
+                _shards[key] = shard
+    return shard
+
+
+def _evict(active_days: list[str]) -> None:
+    """비교 기간이 지난 샤드를 메모리에서 내린다 (기록 파일은 남는다)."""
+    with _shards_lock:
+        for key in [key for key in _shards if key[1] not in active_days]:
+            del _shards[key]
+
+
+def _enabled() -> bool:
+    return settings.NEAR_DUPLICATE_ENABLED and not settings.BYPASS_MODEL_VALIDATION
+
+
+def _embedding(image: ImageArtifact) -> np.ndarray:
+    siglip2._load_siglip2()
+    return siglip2.image_embedding(image)[0].float().cpu().numpy()
+
+
+def check(
+    request_context: dict[str, Any], image: ImageArtifact
+) -> dict[str, Any] | None:
+    """제출 사진이 다른 사용자의 최근 인정 제출과 근접 중복인지 검사한다.
+
+    NEAR_DUPLICATE_ENABLED가 꺼져 있거나 모델 검증을 우회하면 검사하지 않는다.
+    임베딩 계산·샤드 조회에 실패해도 제출을 막지 않는다 (판정은 이후 모델 단계가 담당).
+
+    Args:
+        request_context: image_hash·user_id·site_id가 든 요청 컨텍스트.
+        image: 요청의 공유 ImageArtifact (임베딩은 이후 SigLIP2 프로브와 공유).
+
+    Returns:
+        근접 중복이면 {"image_hash", "similarity"} (일치한 이전 제출). 아니면 None.
+    """
+    if not _enabled():
+        return None
+    user_id = request_context.get("user_id", "guest")
+    site_id = request_context.get("site_id", "pazule-default")
+    try:
+        vector = _embedding(image)
+        days = shard_days()
+        _evict(days)
+        match: tuple[str, float] | None = None
+        for day in days:
+            found = get_shard(site_id, day).nearest(vector, exclude_user=user_id)
+            if found and (match is None or found[1] > match[1]):
+                match = found
+    except Exception as exc:
+        # 모델 교체로 샤드와 임베딩 차원이 달라진 경우 등
+        logger.warning("[near_duplicate] 검사 실패, 검사 생략: %s", exc)
+        return None
+
+    if match is None or match[1] < settings.NEAR_DUPLICATE_SIMILARITY:
+        return None
+    logger.warning(
+        "[near_duplicate] site=%s user=%s ↔ %s... 유사도 %.3f",
+        site_id,
+        user_id,
+        match[0][:12],
+        match[1],
+    )
+    return {"image_hash": match[0], "similarity": round(match[1], 4)}
+
+
+def record(request_context: dict[str, Any], image: ImageArtifact) -> None:
+    """쿠폰 지급이 확정된 제출을 오늘 샤드에 추가한다. 실패해도 응답을 막지 않는다.
+
+    Args:
+        request_context: image_hash·user_id·site_id가 든 요청 컨텍스트.
+        image: 요청의 공유 ImageArtifact (check()에서 계산한 임베딩을 재사용).
+    """
+    if not _enabled():
+        return
+    image_hash = request_context.get("image_hash") or image.sha256
+    user_id = request_context.get("user_id", "guest")
+    site_id = request_context.get("site_id", "pazule-default")
+    try:
+        vector = _embedding(image)
+        get_shard(site_id, shard_days()[0]).add(image_hash, user_id, vector)
+    except Exception as exc:
+        logger.warning("[near_duplicate] 샤드 기록 실패: %s", exc)
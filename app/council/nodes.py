@@ -3,13 +3,18 @@
 from __future__ import annotations
 
 import concurrent.futures
+import functools
 import logging
+import threading
 import time
 import traceback
 from typing import Any
 
+from app.core import deadline as request_deadline
 from app.core.config import constants, settings
+from app.core.image_artifact import ImageArtifact
 from app.core.utils import normalize_mission_type
+from app.council import near_duplicate, phash_index, vote_cache
 from app.metadata.validator import validate_metadata
 from app.models.prompts import build_prompt_bundle
 from app.services.mission_session_service import mission_session_service
@@ -99,13 +104,13 @@ def _check_image_presence(
 
 
 def _check_metadata(
-    image_path: str,
+    image_path: str | ImageArtifact,
     artifacts: dict[str, Any],
 ) -> bool:
     """EXIF/GPS 메타데이터 유효성을 검증한다. SKIP_METADATA_VALIDATION 설정을 반영한다.
 
     Args:
-        image_path: 검사할 이미지 파일 경로.
+        image_path: 검사할 이미지 파일 경로 또는 공유 ImageArtifact.
         artifacts: 파이프라인 artifacts dict (메타데이터 skip 여부 기록용).
 
     Returns:
@@ -124,14 +129,14 @@ def _check_metadata(
 
 def _check_duplicate(
     user_id: str,
-    image_path: str,
+    image_path: str | ImageArtifact,
     request_context: dict[str, Any],
 ) -> tuple[str, bool]:
     """이미지 해시를 계산하고 동일 사용자의 중복 제출 여부를 검사한다.
 
     Args:
         user_id: 사용자 식별자.
-        image_path: 해시를 계산할 이미지 파일 경로.
+        image_path: 해시를 계산할 이미지 파일 경로 또는 공유 ImageArtifact.
         request_context: 파이프라인 request context dict (image_hash 기록용).
 
     Returns:
@@ -224,6 +229,9 @@ def _process_model_future(
 def validator(state: dict[str, Any]) -> dict[str, Any]:
     """[검증기] 이미지 누락·메타데이터 유효성·중복 제출을 1차 방어한다.
 
+    제출 이미지를 ImageArtifact로 한 번만 읽어 request_context["image_artifact"]에
+    넣고, 이후 메타데이터 검사·해시·모델 프로브가 같은 바이트와 디코드 결과를 공유한다.
+
     Args:
         state: 파이프라인 상태 딕셔너리.
 
@@ -254,14 +262,27 @@ def validator(state: dict[str, Any]) -> dict[str, Any]:
             "messages": ["validator: missing image_path"],
         }
 
-    metadata_valid = _check_metadata(image_path, artifacts)
-    image_hash, is_duplicate = _check_duplicate(user_id, image_path, request_context)
+    image = request_context.get("image_artifact")
+    if not isinstance(image, ImageArtifact):
+        image = ImageArtifact.from_path(image_path)
+        request_context["image_artifact"] = image
+
+    metadata_valid = _check_metadata(image, artifacts)
+    image_hash, is_duplicate = _check_duplicate(user_id, image, request_context)
+    screened = metadata_valid and not is_duplicate
+    phash_match = phash_index.check(request_context, image) if screened else None
+    near_match = near_duplicate.check(request_context, image) if screened else None
 
     risk_flags: list[str] = []
     if not metadata_valid:
         risk_flags.append("metadata_invalid")
     if is_duplicate:
         risk_flags.append("duplicate_image")
+    # 근접 중복은 판정은 계속 진행하고 쿠폰만 policy 단계에서 막는다.
+    if phash_match:
+        risk_flags.append("perceptual_duplicate")
+    if near_match:
+        risk_flags.append("near_duplicate")
 
     passed = metadata_valid and not is_duplicate
     reason = "passed" if passed else (",".join(risk_flags) if risk_flags else "blocked")
@@ -279,6 +300,8 @@ def validator(state: dict[str, Any]) -> dict[str, Any]:
         "risk_flags": risk_flags,
         "metadata_valid": metadata_valid,
         "is_duplicate": is_duplicate,
+        "perceptual_duplicate": phash_match,
+        "near_duplicate": near_match,
         "metadata_check_skipped": settings.SKIP_METADATA_VALIDATION,
     }
     return {
@@ -317,9 +340,29 @@ def router(state: dict[str, Any]) -> dict[str, Any]:
     }
 
 
+def _selection_mode(mission_type: str, override: str | None = None) -> str:
+    """요청에 적용할 모델 선택 모드(모델 이름·"ensemble"·"cascade")를 반환한다.
+
+    Args:
+        mission_type: 'location' | 'atmosphere'.
+        override: 클라이언트 지정 모델 오버라이드 문자열 (선택).
+
+    Returns:
+        소문자로 정규화된 모드 문자열.
+    """
+    if override:
+        return override.lower().strip()
+    if mission_type == "location":
+        return settings.MODEL_SELECTION_LOCATION.lower().strip()
+    return settings.MODEL_SELECTION_ATMOSPHERE.lower().strip()
+
+
 def _select_models(mission_type: str, override: str | None = None) -> list[str]:
     """미션 유형과 커스텀 오버라이드 값에 기반하여 투입할 비전 모델 리스트를 반환한다.
 
+    "ensemble"과 "cascade"는 같은 앙상블 모델 목록을 쓰며, cascade는 목록 순서대로
+    하나씩 실행된다.
+
     Args:
         mission_type: 'location' | 'atmosphere'.
         override: 클라이언트 지정 모델 오버라이드 문자열 (선택).
@@ -327,31 +370,62 @@ def _select_models(mission_type: str, override: str | None = None) -> list[str]:
     Returns:
         사용할 모델 이름 리스트.
     """
-    if override:
-        mode = override.lower().strip()
-        if mode == "ensemble":
-            return (
-                settings.location_ensemble_models
-                if mission_type == "location"
-                else settings.atmosphere_ensemble_models
-            )
-        return [mode]
-
-    if mission_type == "location":
-        mode = settings.MODEL_SELECTION_LOCATION.lower().strip()
-        if mode == "ensemble":
-            return settings.location_ensemble_models
-        return [mode]
-    mode = settings.MODEL_SELECTION_ATMOSPHERE.lower().strip()
-    if mode == "ensemble":
-        return settings.atmosphere_ensemble_models
+    mode = _selection_mode(mission_type, override)
+    if mode in ("ensemble", "cascade"):
+        return (
+            settings.location_ensemble_models
+            if mission_type == "location"
+            else settings.atmosphere_ensemble_models
+        )
     return [mode]
 
 
+def _weighted_score(votes: list[dict[str, Any]], mission_type: str) -> float:
+    """미션별 모델 가중치로 투표 점수를 가중 평균한다 (투표가 없으면 0.0)."""
+    weights = (
+        constants.LOCATION_MODEL_WEIGHTS
+        if mission_type == "location"
+        else constants.ATMOSPHERE_MODEL_WEIGHTS
+    )
+    weighted_sum = 0.0
+    total_weight = 0.0
+    for vote in votes:
+        model = vote.get("model")
+        model = constants.MODEL_BACKEND_ALIASES.get(model, model)
+        weight = weights.get(model, constants.DEFAULT_MODEL_WEIGHT)
+        weighted_sum += float(vote.get("score", 0.0)) * weight
+        total_weight += weight
+    return weighted_sum / total_weight if total_weight > 0 else 0.0
+
+
+def _cascade_settled(votes: list[dict[str, Any]], mission_type: str) -> bool:
+    """cascade에서 지금까지의 투표만으로 판정이 확실한지 여부.
+
+    가중 점수가 통과 기준 ± CASCADE_CONFIDENCE_MARGIN 밖이면 다음 모델을 부르지 않는다.
+    """
+    if not votes:
+        return False
+    threshold = (
+        settings.LOCATION_PASS_THRESHOLD
+        if mission_type == "location"
+        else settings.ATMOSPHERE_PASS_THRESHOLD
+    )
+    score = _weighted_score(votes, mission_type)
+    settled = abs(score - threshold) > settings.CASCADE_CONFIDENCE_MARGIN
+    if settled:
+        logger.info(
+            "[evaluator] cascade 조기 확정: score=%.4f threshold=%s (모델 %d개)",
+            score,
+            threshold,
+            len(votes),
+        )
+    return settled
+
+
 def _invoke_model(
     model_name: str,
     mission_type: str,
-    image_path: str,
+    image_path: str | ImageArtifact,
     answer: str,
     prompt_bundle: Any,
 ) -> dict[str, Any]:
@@ -360,7 +434,7 @@ def _invoke_model(
     Args:
         model_name: 실행할 모델 식별자.
         mission_type: 'location' | 'atmosphere'.
-        image_path: 평가할 이미지 파일 경로.
+        image_path: 평가할 이미지 파일 경로 또는 공유 ImageArtifact.
         answer: 오늘의 정답 키워드.
         prompt_bundle: 모델에 전달할 프롬프트 번들.
 
@@ -374,6 +448,161 @@ def _invoke_model(
     return probe.probe(mission_type, image_path, answer, prompt_bundle)
 
 
+def _qwen_prefetch_key(
+    request_context: dict[str, Any],
+    selected_models: list[str],
+    mission_type: str,
+    answer: str | None,
+    prompt_bundle: Any,
+) -> vote_cache.VoteKey | None:
+    """Qwen 선행 호출에 쓸 캐시 키를 반환한다. 선행 호출 대상이 아니면 None.
+
+    QWEN_PREFETCH_ENABLED·council·투표 캐시가 모두 켜져 있고, 앙상블에 qwen이 없으며,
+    같은 키의 투표가 캐시나 진행 중 호출에 없을 때만 대상이다.
+    """
+    if not settings.QWEN_PREFETCH_ENABLED or not getattr(
+        settings, "COUNCIL_ENABLED", True
+    ):
+        return None
+    if "qwen" in selected_models:
+        return None
+    key = vote_cache.request_key(
+        request_context, "qwen", mission_type, answer, prompt_bundle
+    )
+    if vote_cache.lookup(key) is not None or vote_cache.in_flight(key) is not None:
+        return None
+    return key
+
+
+def _should_prefetch_qwen(votes: list[dict[str, Any]], mission_type: str) -> bool:
+    """지금까지의 투표로 보아 council 에스컬레이션이 유력한지 판단한다.
+
+    투표 하나라도 통과 기준 ± COUNCIL_BORDERLINE_MARGIN 안에 있거나,
+    라벨이 갈리고 점수 차가 ENSEMBLE_CONFLICT_THRESHOLD 이상이면 True.
+    """
+    if not votes:
+        return False
+    threshold = (
+        settings.LOCATION_PASS_THRESHOLD
+        if mission_type == "location"
+        else settings.ATMOSPHERE_PASS_THRESHOLD
+    )
+    margin = settings.COUNCIL_BORDERLINE_MARGIN
+    scores = [float(vote.get("score", 0.0)) for vote in votes]
+    if any(abs(score - threshold) <= margin for score in scores):
+        return True
+    labels = {vote.get("label") for vote in votes}
+    return (
+        len(labels) > 1
+        and max(scores) - min(scores) >= constants.ENSEMBLE_CONFLICT_THRESHOLD
+    )
+
+
+def _prefetch_qwen(
+    registry: Any,
+    key: vote_cache.VoteKey,
+    mission_type: str,
+    image_path: str | ImageArtifact,
+    answer: str | None,
+    prompt_bundle: Any,
+) -> None:
+    """council이 부를 Qwen 호출을 백그라운드로 미리 시작한다.
+
+    결과는 완료 시 투표 캐시에 들어가고, QwenFallbackJudge는 진행 중이면 이 호출을
+    기다린다. council이 열리지 않으면 결과는 캐시에만 남는다.
+    """
+    logger.info("[evaluator] 경계값/충돌 투표 감지 → Qwen 선행 호출 시작")
+    future = registry.submit(
+        "qwen", _invoke_model, "qwen", mission_type, image_path, answer, prompt_bundle
+    )
+    vote_cache.track(key, future)
+
+
+def _get_worker_pool(selected_models: list[str]) -> Any:
+    """워커 풀이 켜져 있고 선택된 모델 중 풀에서 실행할 모델이 있으면 풀을 반환한다.
+
+    Args:
+        selected_models: 이번 요청에 투입할 모델 식별자 목록.
+
+    Returns:
+        ModelWorkerPool 또는 None.
+    """
+    if not settings.MODEL_WORKER_POOL_ENABLED:
+        return None
+    from app.models.worker_pool import get_worker_pool
+
+    try:
+        pool = get_worker_pool()
+    except ValueError as exc:
+        logger.error("[evaluator] 워커 풀 설정 오류, 스레드로 실행: %s", exc)
+        return None
+    if not any(pool.handles(model_name) for model_name in selected_models):
+        return None
+    return pool
+
+
+def _share_image(pool: Any, image_path: str | ImageArtifact | None) -> Any:
+    """워커 프로세스에 넘길 이미지 원본 바이트를 공유 메모리에 올린다.
+
+    이미지를 읽지 못하면 None을 반환해 모든 모델을 스레드에서 실행하게 한다
+    (각 프로브가 이미지 로드 실패 투표를 직접 만든다).
+
+    Args:
+        pool: _get_worker_pool 결과.
+        image_path: 이미지 경로 또는 공유 ImageArtifact.
+
+    Returns:
+        SharedImage 또는 None.
+    """
+    if pool is None or image_path is None:
+        return None
+    from app.models.worker_pool import SharedImage
+
+    try:
+        return SharedImage(ImageArtifact.resolve(image_path))
+    except OSError as exc:
+        logger.warning(
+            "[evaluator] 공유 메모리 이미지 준비 실패, 스레드로 실행: %s", exc
+        )
+        return None
+
+
+def _release_shared_image(
+    shared_image: Any, process_futures: list[concurrent.futures.Future]
+) -> None:
+    """워커 작업이 더 이상 블록을 읽지 않을 때 공유 메모리 이미지를 해제한다.
+
+    시간 초과로 버려진 워커 작업 중 아직 시작하지 않은 것은 취소하고,
+    이미 실행 중인 작업이 있으면 마지막 작업이 끝난 뒤 해제한다.
+
+    Args:
+        shared_image: _share_image 결과 (None이면 아무것도 하지 않는다).
+        process_futures: 워커 풀에 제출한 Future 목록.
+    """
+    if shared_image is None:
+        return
+    running = [
+        future
+        for future in process_futures
+        if not future.cancel() and not future.done()
+    ]
+    if not running:
+        shared_image.close()
+        return
+    remaining = len(running)
+    lock = threading.Lock()
+
+    def _on_done(_: concurrent.futures.Future) -> None:
+        nonlocal remaining
+        with lock:
+            remaining -= 1
+            if remaining == 0:
+                shared_image.close()
+
+    for future in running:
+        future.add_done_callback(_on_done)
+
+
 def evaluator(state: dict[str, Any]) -> dict[str, Any]:
     """[평가기] 선택된 모델 앙상블을 병렬 실행하고 각 AI 투표를 수집한다.
 
@@ -389,7 +618,9 @@ def evaluator(state: dict[str, Any]) -> dict[str, Any]:
     mission_type = normalize_mission_type(
         request_context.get("mission_type", "location")
     )
-    image_path = request_context.get("image_path")
+    image_path = request_context.get("image_artifact") or request_context.get(
+        "image_path"
+    )
     answer = request_context.get("answer")
 
     selected_models = _select_models(
@@ -410,34 +641,134 @@ def evaluator(state: dict[str, Any]) -> dict[str, Any]:
             "messages": [f"evaluator: bypass ({','.join(selected_models)})"],
         }
 
+    deadline = request_context.get("deadline")
+    if request_deadline.expired(deadline):
+        logger.warning("[evaluator] 요청 기한 초과 → 모델 추론 생략")
+        _append_error(
+            errors,
+            "DEADLINE_EXCEEDED",
+            "request deadline exceeded before model evaluation",
+            "evaluator",
+            True,
+        )
+        artifacts["prompt_bundle"] = prompt_bundle
+        artifacts["selected_models"] = selected_models
+        artifacts["model_votes"] = []
+        return {
+            "artifacts": artifacts,
+            "errors": errors,
+            "messages": ["evaluator: deadline exceeded"],
+        }
+
     logger.info(
         "[evaluator] %d개 모델 동시 평가 시작: %s",
         len(selected_models),
         ",".join(selected_models),
     )
     votes: list[dict[str, Any]] = []
-    with concurrent.futures.ThreadPoolExecutor(
-        max_workers=len(selected_models)
-    ) as executor:
-        future_to_model = {
-            executor.submit(
-                _invoke_model,
-                model_name,
-                mission_type,
-                image_path,
-                answer,
-                prompt_bundle,
-            ): model_name
-            for model_name in selected_models
-        }
-        for future in concurrent.futures.as_completed(future_to_model):
-            model_name = future_to_model[future]
-            vote = _process_model_future(future, model_name, errors)
-            if vote is not None:
-                votes.append(vote)
+    pool = _get_worker_pool(selected_models)
+    shared_image = _share_image(pool, image_path)
+    process_futures: list[concurrent.futures.Future] = []
+    from app.models.model_registry import ModelRegistry
+
+    registry = ModelRegistry.get_instance()
+    cache_keys: dict[str, vote_cache.VoteKey | None] = {}
+    prefetch_key = _qwen_prefetch_key(
+        request_context, selected_models, mission_type, answer, prompt_bundle
+    )
+    # cascade면 모델을 하나씩 실행해 확신 구간을 벗어나는 즉시 멈추고,
+    # 그 외에는 모든 모델을 한 단계로 동시에 실행한다.
+    cascade = (
+        _selection_mode(mission_type, request_context.get("model_selection"))
+        == "cascade"
+    )
+    stages = [[model] for model in selected_models] if cascade else [selected_models]
+    executed: list[str] = []
+    try:
+        for stage in stages:
+            if executed and request_deadline.expired(deadline):
+                logger.warning("[evaluator] 요청 기한 초과 → cascade 중단")
+                break
+            # 모델별 시간 제한과 요청 기한 중 먼저 오는 쪽까지만 기다린다.
+            timeout = request_deadline.cap_timeout(
+                settings.API_TIMEOUT_SECONDS + constants.MODEL_TIMEOUT_BUFFER_SECONDS,
+                deadline,
+            )
+            future_to_model: dict[concurrent.futures.Future, str] = {}
+            for model_name in stage:
+                cache_key = vote_cache.request_key(
+                    request_context, model_name, mission_type, answer, prompt_bundle
+                )
+                cached_vote = vote_cache.lookup(cache_key)
+                if cached_vote is not None:
+                    logger.info("[Evaluator/%s] 캐시된 투표 재사용", model_name)
+                    votes.append(cached_vote)
+                    continue
+                cache_keys[model_name] = cache_key
+                if shared_image is not None and pool.handles(model_name):
+                    future = pool.submit(
+                        model_name, shared_image, mission_type, answer, prompt_bundle
+                    )
+                    process_futures.append(future)
+                else:
+                    future = registry.submit(
+                        model_name,
+                        _invoke_model,
+                        model_name,
+                        mission_type,
+                        image_path,
+                        answer,
+                        prompt_bundle,
+                    )
+                future_to_model[future] = model_name
+            pending = set(future_to_model)
+            try:
+                for future in concurrent.futures.as_completed(
+                    future_to_model, timeout=timeout
+                ):
+                    pending.discard(future)
+                    model_name = future_to_model[future]
+                    vote = _process_model_future(future, model_name, errors)
+                    if vote is not None:
+                        votes.append(vote)
+                        vote_cache.remember(cache_keys[model_name], vote)
+                    if prefetch_key is not None and _should_prefetch_qwen(
+                        votes, mission_type
+                    ):
+                        _prefetch_qwen(
+                            registry,
+                            prefetch_key,
+                            mission_type,
+                            image_path,
+                            answer,
+                            prompt_bundle,
+                        )
+                        prefetch_key = None
+            except concurrent.futures.TimeoutError:
+                # 남은 작업은 기다리지 않는다. 시작 전 작업은 큐에서 빼고,
+                # 실행 중인 작업은 모델 풀에서 끝나도록 두고 결과만 버린다.
+                for future in pending:
+                    future.cancel()
+                    _append_error(
+                        errors,
+                        "MODEL_TIMEOUT",
+                        f"{future_to_model[future]} execution timed out",
+                        "evaluator",
+                        False,
+                        model=future_to_model[future],
+                    )
+                    logger.warning(
+                        "[Evaluator/%s] 시간 초과 (Timeout), 결과 폐기",
+                        future_to_model[future],
+                    )
+            executed.extend(stage)
+            if cascade and _cascade_settled(votes, mission_type):
+                break
+    finally:
+        _release_shared_image(shared_image, process_futures)
 
     artifacts["prompt_bundle"] = prompt_bundle
-    artifacts["selected_models"] = selected_models
+    artifacts["selected_models"] = executed
     artifacts["model_votes"] = votes
 
     if not votes:
@@ -448,7 +779,7 @@ def evaluator(state: dict[str, Any]) -> dict[str, Any]:
     return {
         "artifacts": artifacts,
         "errors": errors,
-        "messages": [f"evaluator: {','.join(selected_models)}"],
+        "messages": [f"evaluator: {','.join(executed)}"],
     }
 
 
@@ -470,27 +801,9 @@ def aggregator(state: dict[str, Any]) -> dict[str, Any]:
     )
     votes = list(artifacts.get("model_votes", []))
 
-    weights = (
-        constants.LOCATION_MODEL_WEIGHTS
-        if mission_type == "location"
-        else constants.ATMOSPHERE_MODEL_WEIGHTS
-    )
-
-    weighted_sum = 0.0
-    total_weight = 0.0
-    labels: set[str] = set()
-    scores: list[float] = []
-
-    for vote in votes:
-        model = vote.get("model")
-        score = float(vote.get("score", 0.0))
-        weight = weights.get(model, constants.DEFAULT_MODEL_WEIGHT)
-        weighted_sum += score * weight
-        total_weight += weight
-        labels.add(vote.get("label"))
-        scores.append(score)
-
-    merged_score = weighted_sum / total_weight if total_weight > 0 else 0.0
+    labels = {vote.get("label") for vote in votes}
+    scores = [float(vote.get("score", 0.0)) for vote in votes]
+    merged_score = _weighted_score(votes, mission_type)
     threshold = (
         settings.LOCATION_PASS_THRESHOLD
         if mission_type == "location"
@@ -603,6 +916,21 @@ def judge(state: dict[str, Any]) -> dict[str, Any]:
     }
 
 
+def _record_accepted_submission(request_context: dict[str, Any]) -> None:
+    """쿠폰 지급이 확정된 제출만 근접 중복 인덱스에 추가한다.
+
+    판정에 실패했거나 거절된 사진이 이후 다른 사용자의 정상 사진을 막지 않도록,
+    validator는 조회만 하고 추가는 여기서 한다.
+
+    Args:
+        request_context: 파이프라인 request context dict.
+    """
+    image = request_context.get("image_artifact")
+    if isinstance(image, ImageArtifact):
+        phash_index.record(request_context, image)
+        near_duplicate.record(request_context, image)
+
+
 def policy(state: dict[str, Any]) -> dict[str, Any]:
     """[정책] AI 판단 통과 여부와 리스크 플래그를 종합해 쿠폰 지급 자격을 결정한다.
 
@@ -617,18 +945,16 @@ def policy(state: dict[str, Any]) -> dict[str, Any]:
     gate = artifacts.get("gate_result", {})
     risk_flags = set(gate.get("risk_flags", []))
 
-    eligible = bool(judgment.get("success")) and "duplicate_image" not in risk_flags
+    blocking = [f for f in constants.COUPON_BLOCKING_RISK_FLAGS if f in risk_flags]
+
+    eligible = bool(judgment.get("success")) and not blocking
     deny_reason = (
-        None
-        if eligible
-        else (
-            "duplicate_image"
-            if "duplicate_image" in risk_flags
-            else judgment.get("reason")
-        )
+        None if eligible else (blocking[0] if blocking else judgment.get("reason"))
     )
 
     logger.info("[policy] coupon_eligible=%s  deny=%s", eligible, deny_reason)
+    if eligible:
+        _record_accepted_submission(state.get("request_context", {}))
 
     artifacts["coupon_decision"] = {
         "eligible": eligible,
@@ -643,32 +969,60 @@ def _generate_retry_hint(
     static_hint: str,
     mission_type: str,
     votes: list[dict[str, Any]] | None = None,
+    deadline: float | None = None,
 ) -> str:
     """실패 시 재시도 힌트를 생성한다.
 
     분위기 미션의 경우 모델 점수를 분석하여 대비 힌트를 제공하고,
     그 외에는 LLM 또는 정적 힌트를 사용한다.
+    요청 기한이 있으면 LLM 응답은 남은 시간만큼만 기다리고, 기한이 지났으면
+    LLM을 호출하지 않고 정적 힌트를 반환한다.
     """
     if mission_type == "atmosphere" and votes:
         from app.core.hints import get_atmosphere_hint
 
         # SigLIP2 모델의 상세 점수 추출
-        siglip_vote = next((v for v in votes if v.get("model") == "siglip2"), None)
+        siglip_vote = next(
+            (
+                v
+                for v in votes
+                if constants.MODEL_BACKEND_ALIASES.get(v.get("model"), v.get("model"))
+                == "siglip2"
+            ),
+            None,
+        )
         if siglip_vote and "scores" in siglip_vote:
             return get_atmosphere_hint(answer, siglip_vote["scores"])
 
+    fallback_hint = static_hint or "장소를 다시 한번 살펴보세요."
+    if request_deadline.expired(deadline):
+        logger.info("[responder] 요청 기한 초과 → 정적 힌트 사용")
+        return fallback_hint
+
     from app.models.llm import LLMService
 
     try:
         svc = LLMService()
-        return svc.generate_blip_hint(
+        generate = functools.partial(
+            svc.generate_blip_hint,
             answer=answer,
             static_hint=static_hint,
             mission_type=mission_type,
         )
+        if deadline is None:
+            return generate()
+        from app.models.model_registry import ModelRegistry
+
+        future = ModelRegistry.get_instance().submit("llm", generate)
+        try:
+            return future.result(timeout=request_deadline.remaining(deadline))
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            logger.warning("[responder] 요청 기한 내 LLM 힌트 미완료 → 정적 힌트 사용")
+            return fallback_hint
     except Exception as exc:
         logger.warning("[responder] LLM 힌트 생성 실패, 정적 힌트로 폴백: %s", exc)
-        return static_hint or "장소를 다시 한번 살펴보세요."
+        return fallback_hint
 
 
 def responder(state: dict[str, Any]) -> dict[str, Any]:
@@ -747,7 +1101,13 @@ def responder(state: dict[str, Any]) -> dict[str, Any]:
     static_hint = request_context.get("static_hint", "")
 
     # 실패 시 재시도 힌트 생성 (상세 점수 votes 전달)
-    hint = _generate_retry_hint(answer, static_hint, mission_type, votes)
+    hint = _generate_retry_hint(
+        answer,
+        static_hint,
+        mission_type,
+        votes,
+        deadline=request_context.get("deadline"),
+    )
 
     message = "미션 조건이 충분히 충족되지 않았습니다. 다시 시도해 주세요."
     final_data = {
@@ -0,0 +1,288 @@
+"""지각 해시(dHash) 다중 인덱스 해시 테이블 기반 근접 중복 제출 탐지.
+
+신경망 없이 축소 디코드 한 번으로 얻는 64비트 dHash(ImageArtifact.dhash)를 사이트별
+인덱스에 넣고, 해밍 거리 PHASH_MAX_DISTANCE 이하인 다른 사용자의 이전 제출을 찾는다.
+재인코딩·리사이즈·가벼운 자르기·보정 복사본은 거리가 몇 비트 안에 머문다.
+
+BK-tree는 거리 6 안팎에서 64비트 해시 공간 대부분을 방문해 선형 스캔보다 느려지므로,
+비트 구간별 정확 일치 테이블(multi-index hashing)로 후보만 비교한다. 10만 건에서도
+조회가 1ms 미만이며 전체 사용자를 대상으로 한다 (사용자별 선형 스캔인
+is_duplicate_hash_for_user와 달리).
+사이트마다 DATA_DIR/phash/<사이트>.jsonl 에 추가 전용으로 기록하고, 검색 전에 다른
+프로세스가 덧붙인 줄을 읽어 와 워커 간 인덱스를 맞춘다.
+
+평탄하거나 어둡거나 노출 과다인 사진은 dHash 비트가 거의 모두 0(또는 1)이라 서로 무관한
+사진끼리 충돌하므로 조회·기록하지 않는다. 인덱스에는 쿠폰 지급이 확정된 제출만
+record()로 추가한다.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+from typing import Any, Iterator
+
+from app.core.config import settings
+from app.core.image_artifact import ImageArtifact
+
+logger = logging.getLogger(__name__)
+
+_HASH_BITS = 64
+# 켜진 비트 수가 이 값 미만이거나 (64 - 이 값) 초과면 정보가 부족한 해시로 보고 건너뛴다.
+_MIN_INFORMATIVE_BITS = 8
+
+_indexes: dict[str, PerceptualHashIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+class MultiIndexHash:
+    """64비트 해시의 해밍 거리 검색용 다중 인덱스 해시 테이블.
+
+    해시를 max_distance + 1개 비트 구간으로 나누면, 거리가 max_distance 이하인 두
+    해시는 비둘기집 원리로 적어도 한 구간이 정확히 같다. 구간마다 값 → 항목 번호
+    테이블을 두고 일치 구간의 후보만 거리를 계산한다.
+    """
+
+    def __init__(self, max_distance: int) -> None:
+        """테이블을 생성한다.
+
+        Args:
+            max_distance: 검색할 수 있는 최대 해밍 거리 (구간 수 = max_distance + 1).
+        """
+        self.max_distance = max(0, min(max_distance, _HASH_BITS - 1))
+        bands = self.max_distance + 1
+        bounds = [_HASH_BITS * i // bands for i in range(bands + 1)]
+        self._spans = [
+            (low, (1 << (high - low)) - 1) for low, high in zip(bounds, bounds[1:])
+        ]
+        self._tables: list[dict[int, list[int]]] = [{} for _ in self._spans]
+        self._entries: list[tuple[int, Any]] = []
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, value: int, item: Any) -> None:
+        """해시와 항목을 추가한다."""
+        position = len(self._entries)
+        self._entries.append((value, item))
+        for table, (shift, mask) in zip(self._tables, self._spans):
+            table.setdefault((value >> shift) & mask, []).append(position)
+
+    def search(self, value: int, max_distance: int) -> Iterator[tuple[int, Any]]:
+        """해밍 거리 max_distance 이하인 (거리, 항목)을 순서 없이 내놓는다.
+
+        Raises:
+            ValueError: max_distance가 테이블의 최대 거리보다 큰 경우.
+        """
+        if max_distance > self.max_distance:
+            raise ValueError(
+                f"검색 거리 {max_distance}가 인덱스 최대 거리 {self.max_distance}보다 큽니다."
+            )
+        seen: set[int] = set()
+        for table, (shift, mask) in zip(self._tables, self._spans):
+            for position in table.get((value >> shift) & mask, ()):
+                if position in seen:
+                    continue
+                seen.add(position)
+                stored, item = self._entries[position]
+                distance = (stored ^ value).bit_count()
+                if distance <= max_distance:
+                    yield distance, item
+
+
+class PerceptualHashIndex:
+    """한 사이트의 제출 dHash 인덱스와 추가 전용 JSONL 기록."""
+
+    def __init__(self, path: str | None = None, max_distance: int = 6) -> None:
+        """인덱스를 연다. path의 기록은 첫 조회·추가 때 읽어 들인다.
+
+        Args:
+            path: JSONL 기록 경로. None이면 메모리에만 유지한다.
+            max_distance: 검색할 최대 해밍 거리.
+        """
+        self.path = path
+        self.table = MultiIndexHash(max_distance)
+        self._members: set[tuple[str, str]] = set()
+        self._offset = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.table)
+
+    def add(self, phash: int, image_hash: str, user_id: str) -> None:
+        """제출을 추가한다. 같은 사용자의 같은 사진은 한 번만 넣는다.
+
+        Args:
+            phash: 64비트 dHash.
+            image_hash: 원본 이미지 SHA-256.
+            user_id: 제출 사용자.
+        """
+        with self._lock:
+            self._refresh()
+            if not self._insert(phash, image_hash, user_id):
+                return
+            if self.path:
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                line = json.dumps(
+                    {
+                        "phash": f"{phash:016x}",
+                        "image_hash": image_hash,
+                        "user": user_id,
+                    }
+                )
+                # 한 번의 O_APPEND 쓰기로 다른 프로세스 기록과 줄이 섞이지 않는다.
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.write(line + "\n")
+
+    def nearest(
+        self, phash: int, exclude_user: str, max_distance: int
+    ) -> tuple[str, int] | None:
+        """다른 사용자의 제출 중 해밍 거리가 가장 가까운 항목을 찾는다.
+
+        Args:
+            phash: 64비트 dHash.
+            exclude_user: 비교에서 뺄 사용자 (본인의 재촬영은 부정이 아니다).
+            max_distance: 허용 해밍 거리.
+
+        Returns:
+            (image_hash, 거리). 없으면 None.
+        """
+        with self._lock:
+            self._refresh()
+            best: tuple[str, int] | None = None
+            for distance, (image_hash, user_id) in self.table.search(
+                phash, max_distance
+            ):
+                if user_id != exclude_user and (best is None or distance < best[1]):
+                    best = (image_hash, distance)
+            return best
+
+    def _insert(self, phash: int, image_hash: str, user_id: str) -> bool:
+        if (image_hash, user_id) in self._members:
+            return False
+        self._members.add((image_hash, user_id))
+        self.table.add(phash, (image_hash, user_id))
+        return True
+
+    def _refresh(self) -> None:
+        """마지막으로 읽은 위치 이후 기록(다른 프로세스 추가분 포함)을 인덱스에 넣는다."""
+        if not self.path or not os.path.exists(self.path):
+            return
+        with open(self.path, "rb") as f:
+            f.seek(self._offset)
+            data = f.read()
+        # 쓰는 중인 마지막 줄은 다음 refresh에서 읽는다.
+        complete = data[: data.rfind(b"\n") + 1]
+        self._offset += len(complete)
+        for line in complete.splitlines():
+            try:
+                record = json.loads(line)
+                self._insert(
+                    int(record["phash"], 16), record["image_hash"], record["user"]
+                )
+            except (ValueError, KeyError):
+                continue
+
+
+def index_path(site_id: str) -> str:
+    """사이트별 dHash 기록 경로를 반환한다."""
+    site = site_id.replace("/", "_").replace("\\", "_")
+    return os.path.join(settings.DATA_DIR, "phash", f"{site}.jsonl")
+
+
+def get_index(site_id: str) -> PerceptualHashIndex:
+    """사이트별 인덱스 싱글턴을 지연 생성한다."""
+    index = _indexes.get(site_id)
+    if index is None:
+        with _indexes_lock:
+            index = _indexes.get(site_id)
+            if index is None:
+                index = PerceptualHashIndex(
+                    index_path(site_id), settings.PHASH_MAX_DISTANCE
+                )
+                _indexes[site_id] = index
+    return index
+
+
+def is_informative(phash: int) -> bool:
+    """밝기 변화가 충분해 근접 중복 판단에 쓸 수 있는 해시인지 여부."""
+    return (
+        _MIN_INFORMATIVE_BITS <= phash.bit_count() <= _HASH_BITS - _MIN_INFORMATIVE_BITS
+    )
+
+
+def _informative_phash(
+    request_context: dict[str, Any], image: ImageArtifact
+) -> int | None:
+    """요청 사진의 dHash를 request_context에 기록하고, 비교에 쓸 수 있으면 반환한다."""
+    if not settings.PHASH_INDEX_ENABLED:
+        return None
+    try:
+        phash = image.dhash
+    except Exception as exc:
+        logger.warning("[phash] dHash 계산 실패, 검사 생략: %s", exc)
+        return None
+    request_context["phash"] = f"{phash:016x}"
+    if not is_informative(phash):
+        logger.debug("[phash] 정보가 부족한 해시 %016x → 검사 생략", phash)
+        return None
+    return phash
+
+
+def check(
+    request_context: dict[str, Any], image: ImageArtifact
+) -> dict[str, Any] | None:
+    """제출 사진의 dHash를 사이트 인덱스(인정된 이전 제출)에서 찾는다.
+
+    PHASH_INDEX_ENABLED가 꺼져 있거나 해시의 정보가 부족하면 검사하지 않는다.
+    디코드·조회 실패는 제출을 막지 않는다.
+
+    Args:
+        request_context: user_id·site_id가 든 요청 컨텍스트.
+        image: 요청의 공유 ImageArtifact.
+
+    Returns:
+        다른 사용자의 제출과 가까우면 {"image_hash", "distance"}. 아니면 None.
+    """
+    phash = _informative_phash(request_context, image)
+    if phash is None:
+        return None
+    user_id = request_context.get("user_id", "guest")
+    site_id = request_context.get("site_id", "pazule-default")
+    try:
+        match = get_index(site_id).nearest(phash, user_id, settings.PHASH_MAX_DISTANCE)
+    except (OSError, ValueError) as exc:
+        logger.warning("[phash] 인덱스 조회 실패: %s", exc)
+        return None
+
+    if match is None:
+        return None
+    logger.warning(
+        "[phash] site=%s user=%s ↔ %s... 해밍 거리 %d",
+        site_id,
+        user_id,
+        match[0][:12],
+        match[1],
+    )
+    return {"image_hash": match[0], "distance": match[1]}
+
+
+def record(request_context: dict[str, Any], image: ImageArtifact) -> None:
+    """쿠폰 지급이 확정된 제출의 dHash를 사이트 인덱스에 추가한다.
+
+    Args:
+        request_context: image_hash·user_id·site_id가 든 요청 컨텍스트.
+        image: 요청의 공유 ImageArtifact (check()에서 계산한 해시를 재사용).
+    """
+    phash = _informative_phash(request_context, image)
+    if phash is None:
+        return
+    image_hash = request_context.get("image_hash") or image.sha256
+    user_id = request_context.get("user_id", "guest")
+    site_id = request_context.get("site_id", "pazule-default")
+    try:
+        get_index(site_id).add(phash, image_hash, user_id)
+    except OSError as exc:
+        logger.warning("[phash] 인덱스 기록 실패: %s", exc)
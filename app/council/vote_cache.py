@@ -0,0 +1,194 @@
+"""이미지 해시 기반 모델 투표 캐시.
+
+같은 사진을 다시 제출하거나(제출 버튼 중복 탭, 네트워크 재시도) council이 Qwen을 다시
+부르면 같은 모델이 같은 입력으로 다시 실행된다. (image_hash, 모델, 미션 유형, 정답,
+프롬프트 번들 지문)을 키로 투표를 TTL·LRU로 보관해 재실행을 건너뛴다.
+"""
+
+from __future__ import annotations
+
+import concurrent.futures
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+from app.core.config import settings
+
+VoteKey = tuple[str, str, str, str, str]
+
+_cache: VoteCache | None = None
+_cache_lock = threading.Lock()
+
+# 아직 끝나지 않은 선행(speculative) 호출. 완료되면 결과를 캐시에 넣고 빠진다.
+_in_flight: dict[VoteKey, concurrent.futures.Future] = {}
+_in_flight_lock = threading.Lock()
+
+
+class VoteCache:
+    """TTL과 최대 항목 수를 가진 스레드 안전 LRU 투표 캐시."""
+
+    def __init__(self, max_entries: int, ttl_seconds: float) -> None:
+        """캐시를 생성한다.
+
+        Args:
+            max_entries: 보관할 최대 투표 수. 넘으면 가장 오래 쓰지 않은 항목부터 버린다.
+            ttl_seconds: 투표 유효 시간(초).
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[VoteKey, tuple[float, dict[str, Any]]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def get(self, key: VoteKey) -> dict[str, Any] | None:
+        """유효한 캐시 투표의 사본을 반환한다. 없거나 만료됐으면 None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, vote = entry
+            if time.monotonic() >= expires_at:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return dict(vote)
+
+    def put(self, key: VoteKey, vote: dict[str, Any]) -> None:
+        """투표를 저장한다. 실패 투표는 저장하지 않는다."""
+        if not is_cacheable(vote):
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, dict(vote))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """모든 항목을 비운다."""
+        with self._lock:
+            self._entries.clear()
+
+
+def is_cacheable(vote: dict[str, Any]) -> bool:
+    """정상 판정(match/mismatch)이고 모델 실패로 표시되지 않은 투표인지 여부.
+
+    모델 로드·이미지 디코드·추론 실패를 점수 0의 mismatch로 돌려주는 프로브가 있으므로,
+    프로브는 그런 투표에 failed=True를 담고 캐시는 이를 저장하지 않는다.
+    """
+    if vote.get("label") not in ("match", "mismatch"):
+        return False
+    return not vote.get("failed", False)
+
+
+def prompt_fingerprint(prompt_bundle: Any) -> str:
+    """프롬프트 번들의 SHA-256 지문 (키 순서와 무관)."""
+    encoded = json.dumps(prompt_bundle, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def vote_key(
+    image_hash: str,
+    model_name: str,
+    mission_type: str,
+    answer: str | None,
+    prompt_bundle: Any,
+) -> VoteKey:
+    """투표 캐시 키를 만든다.
+
+    Args:
+        image_hash: validator가 계산한 원본 이미지 SHA-256.
+        model_name: 모델 식별자.
+        mission_type: 'location' | 'atmosphere'.
+        answer: 미션 정답 키워드.
+        prompt_bundle: 모델에 전달한 프롬프트 번들.
+
+    Returns:
+        캐시 키 튜플.
+    """
+    return (
+        image_hash,
+        model_name,
+        mission_type,
+        answer or "",
+        prompt_fingerprint(prompt_bundle),
+    )
+
+
+def get_vote_cache() -> VoteCache | None:
+    """설정값으로 캐시 싱글턴을 지연 생성한다. VOTE_CACHE_ENABLED가 꺼져 있으면 None."""
+    global _cache
+    if not settings.VOTE_CACHE_ENABLED:
+        return None
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = VoteCache(
+                    settings.VOTE_CACHE_MAX_ENTRIES, settings.VOTE_CACHE_TTL_SECONDS
+                )
+    return _cache
+
+
+def request_key(
+    request_context: dict[str, Any],
+    model_name: str,
+    mission_type: str,
+    answer: str | None,
+    prompt_bundle: Any,
+) -> VoteKey | None:
+    """요청 컨텍스트로 캐시 키를 만든다.
+
+    캐시가 꺼져 있거나 image_hash가 없으면(validator를 거치지 않은 호출) None.
+    """
+    image_hash = request_context.get("image_hash")
+    if not image_hash or get_vote_cache() is None:
+        return None
+    return vote_key(image_hash, model_name, mission_type, answer, prompt_bundle)
+
+
+def lookup(key: VoteKey | None) -> dict[str, Any] | None:
+    """key의 캐시 투표를 반환한다. key가 None이거나 캐시에 없으면 None."""
+    cache = get_vote_cache()
+    if key is None or cache is None:
+        return None
+    return cache.get(key)
+
+
+def remember(key: VoteKey | None, vote: dict[str, Any]) -> None:
+    """key가 있으면 투표를 캐시에 저장한다."""
+    cache = get_vote_cache()
+    if key is not None and cache is not None:
+        cache.put(key, vote)
+
+
+def track(key: VoteKey, future: concurrent.futures.Future) -> None:
+    """진행 중인 호출을 등록한다. 성공하면 결과를 캐시에 저장하고 등록을 해제한다.
+
+    같은 키로 다시 모델을 부르려는 쪽은 in_flight()로 이 Future를 받아 기다린다.
+    """
+    with _in_flight_lock:
+        _in_flight[key] = future
+
+    def _done(done: concurrent.futures.Future) -> None:
+        if not done.cancelled() and done.exception() is None:
+            remember(key, done.result())
+        with _in_flight_lock:
+            if _in_flight.get(key) is done:
+                del _in_flight[key]
+
+    future.add_done_callback(_done)
+
+
+def in_flight(key: VoteKey | None) -> concurrent.futures.Future | None:
+    """key로 진행 중인 호출의 Future를 반환한다 (없으면 None)."""
+    if key is None:
+        return None
+    with _in_flight_lock:
+        return _in_flight.get(key)
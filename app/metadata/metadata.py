@@ -3,17 +3,12 @@
 from __future__ import annotations
 
 import logging
-import os
 from datetime import datetime
 
-from PIL import Image
-from pillow_heif import register_heif_opener
+from app.core.image_artifact import ImageArtifact
 
 logger = logging.getLogger(__name__)
 
-# HEIC 포맷 지원 등록
-register_heif_opener()
-
 # 파주출판단지 BBox 경계 (위도/경도)
 MIN_LAT = 37.704316
 MAX_LAT = 37.719660
@@ -21,18 +16,19 @@ MIN_LON = 126.683397
 MAX_LON = 126.690022
 
 
-def extract_gps_coordinates(file_path: str) -> tuple[float, float] | None:
+def extract_gps_coordinates(
+    file_path: str | ImageArtifact,
+) -> tuple[float, float] | None:
     """HEIC/JPEG 파일에서 GPS 좌표를 추출한다.
 
     Args:
-        file_path: 이미지 파일 경로.
+        file_path: 이미지 파일 경로 또는 공유 ImageArtifact.
 
     Returns:
         (latitude, longitude) 튜플 또는 좌표가 없으면 None.
     """
     try:
-        img = Image.open(file_path)
-        exif = img.getexif()
+        exif = ImageArtifact.resolve(file_path).exif
         if not exif:
             return None
 
@@ -87,18 +83,20 @@ def is_in_bbox(lat: float, lon: float) -> bool:
     return (MIN_LAT <= lat <= MAX_LAT) and (MIN_LON <= lon <= MAX_LON)
 
 
-def quick_photo_summary(file_path: str) -> bool:
+def quick_photo_summary(file_path: str | ImageArtifact) -> bool:
     """사진의 촬영 시각·GPS·BBox 유효성·오늘 촬영 여부를 검사한다.
 
+    EXIF는 아티팩트에서 한 번만 읽어 GPS 추출과 공유한다.
+
     Args:
-        file_path: 검사할 이미지 파일 경로.
+        file_path: 검사할 이미지 파일 경로 또는 공유 ImageArtifact.
 
     Returns:
         오늘 촬영 AND 출판단지 내부일 때 True.
     """
     try:
-        img = Image.open(file_path)
-        exif = img.getexif()
+        artifact = ImageArtifact.resolve(file_path)
+        exif = artifact.exif
 
         date_str: str | None = None
         if exif:
@@ -110,9 +108,9 @@ def quick_photo_summary(file_path: str) -> bool:
                     date_str = value
                     break
 
-        coords = extract_gps_coordinates(file_path)
+        coords = extract_gps_coordinates(artifact)
         if not coords:
-            logger.warning("GPS 정보 없음 (좌표 없음): %s", os.path.basename(file_path))
+            logger.warning("GPS 정보 없음 (좌표 없음): %s", artifact.name)
             return False
 
         lat, lon = coords
@@ -123,7 +121,7 @@ def quick_photo_summary(file_path: str) -> bool:
 
         logger.info(
             "파일명: %s | 촬영 시각: %s | 오늘 여부: %s | 좌표: %.6f, %.6f | 위치 판정: %s",
-            os.path.basename(file_path),
+            artifact.name,
             date_str or "(정보 없음)",
             "오늘 촬영" if is_today else "오늘 아님",
             lat,
@@ -133,7 +131,7 @@ def quick_photo_summary(file_path: str) -> bool:
 
         passed = is_today and inside
         if passed:
-            logger.info("메타데이터 조건 통과: %s", file_path)
+            logger.info("메타데이터 조건 통과: %s", artifact.name)
 
         return passed
     except Exception as exc:
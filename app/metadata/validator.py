@@ -4,19 +4,20 @@ from __future__ import annotations
 
 import logging
 
+from app.core.image_artifact import ImageArtifact
 from app.metadata.metadata import quick_photo_summary
 
 logger = logging.getLogger(__name__)
 
 
-def validate_metadata(image_path: str) -> bool:
+def validate_metadata(image_path: str | ImageArtifact) -> bool:
     """사진 메타데이터 유효성 검사를 실행한다.
 
     촬영일이 오늘인지, 파주출판단지 BBox 내부인지 확인하여
     둘 다 만족해야 True를 반환한다.
 
     Args:
-        image_path: 검증할 이미지 파일의 절대 경로.
+        image_path: 검증할 이미지 파일의 절대 경로 또는 공유 ImageArtifact.
 
     Returns:
         촬영일·위치 조건을 모두 만족하면 True, 그렇지 않으면 False.
@@ -6,6 +6,8 @@ import logging
 from abc import ABC, abstractmethod
 from typing import Any
 
+from app.core.image_artifact import ImageArtifact
+
 logger = logging.getLogger(__name__)
 
 
@@ -16,7 +18,7 @@ class VLMProbe(ABC):
     def probe(
         self,
         mission_type: str,
-        image_path: str,
+        image_path: str | ImageArtifact,
         answer: str,
         prompt_bundle: dict[str, Any],
     ) -> dict[str, Any]:
@@ -24,7 +26,7 @@ class VLMProbe(ABC):
 
         Args:
             mission_type: 미션 유형 ('location' | 'atmosphere').
-            image_path: 분석할 이미지 파일 경로.
+            image_path: 분석할 이미지 파일 경로 또는 공유 ImageArtifact.
             answer: 미션 정답 키워드.
             prompt_bundle: 모델별 프롬프트 정보 딕셔너리.
 
@@ -33,6 +35,15 @@ class VLMProbe(ABC):
         """
         ...
 
+    def warmup(self) -> None:
+        """모델을 미리 로드하고 더미 추론을 한 번 실행한다.
+
+        원격 API처럼 로컬 가중치가 없는 프로브는 기본 구현(아무 작업 없음)을 쓴다.
+
+        Raises:
+            Exception: 모델 로드 또는 더미 추론 실패 시.
+        """
+
     @property
     @abstractmethod
     def model_name(self) -> str:
@@ -11,6 +11,8 @@ import torch
 from PIL import Image
 
 from app.core.config import settings
+from app.core.image_artifact import ImageArtifact
+from app.models.precision import apply_precision, input_dtype
 
 logger = logging.getLogger(__name__)
 
@@ -18,6 +20,11 @@ logger = logging.getLogger(__name__)
 _processor = None
 _model = None
 _landmark_qa_data = None
+# 질문 튜플 → 토큰 길이별 (질문 인덱스, input_ids) 그룹. 모델 로드 시 미리 채운다.
+_question_batches: dict[tuple[str, ...], list[tuple[list[int], Any]]] = {}
+_yes_no_ids: tuple[int, int] | None = None
+# 비전 인코더 입력 dtype (MODEL_PRECISION=bf16이면 bfloat16)
+_input_dtype: torch.dtype = torch.float32
 
 # ── 디바이스 및 전역 설정 ──────────────────────────────────────────────────
 DEVICE: str = "cuda" if torch.cuda.is_available() else "cpu"
@@ -28,10 +35,23 @@ DATA_DIR: str = settings.DATA_DIR
 # 미션 성공 기준 (75% 이상 정답)
 SUCCESS_THRESHOLD: float = 0.75
 
+# 조기 종료 모드에서 BLIP_VQA_BATCH_SIZE가 0일 때 한 번에 묻는 질문 수
+EARLY_EXIT_CHUNK_SIZE: int = 4
+
+# 분위기 미션용 시각 컨텍스트 추출 질문
+VISUAL_CONTEXT_PROBES: tuple[str, ...] = (
+    "What is the atmosphere of this picture?",
+    "What is the dominant color?",
+    "Is this picture bright or dark?",
+    "How does this picture feel?",
+    "What objects are in the picture?",
+    "Is it natural or artificial?",
+)
+
 
 def _load_blip() -> None:
     """BLIP VQA 모델과 프로세서를 지연 로드한다."""
-    global _processor, _model
+    global _processor, _model, _input_dtype
     if _model is not None:
         return
 
@@ -42,8 +62,12 @@ def _load_blip() -> None:
         from transformers import BlipForQuestionAnswering, BlipProcessor
 
         _processor = BlipProcessor.from_pretrained(model_name)
-        _model = BlipForQuestionAnswering.from_pretrained(model_name).to(device)
+        _model = apply_precision(
+            BlipForQuestionAnswering.from_pretrained(model_name).to(device), device
+        )
+        _input_dtype = input_dtype(_model)
         logger.info("BLIP VQA 모델 로드 완료.")
+        _pretokenize_questions()
     except ImportError as exc:
         logger.error("BLIP 모델 임포트 실패 (AutoModel 클래스 확인 필요): %s", exc)
         raise
@@ -88,72 +112,380 @@ def load_landmark_qa() -> dict[str, Any]:
 landmark_qa_data = load_landmark_qa()
 
 
-def check_with_blip(
-    user_image_path: str,
+def _get_question_batch(questions: tuple[str, ...]) -> list[tuple[list[int], Any]]:
+    """질문 목록을 한 번만 토크나이즈하고 토큰 길이별로 묶어 캐시한다.
+
+    BLIP VQA 디코더는 질문 임베딩의 패딩 위치까지 cross-attention하므로
+    패딩이 섞인 배치는 질문별 단독 실행과 답이 달라질 수 있다.
+    길이가 같은 질문끼리만 묶어 패딩 없이 배치를 구성한다.
+
+    Args:
+        questions: 배치로 묶을 질문 튜플.
+
+    Returns:
+        (원래 질문 인덱스 목록, input_ids 텐서) 그룹 리스트.
+    """
+    groups = _question_batches.get(questions)
+    if groups is None:
+        by_length: dict[int, list[tuple[int, Any]]] = {}
+        for index, question in enumerate(questions):
+            input_ids = _processor(text=question, return_tensors="pt").input_ids
+            by_length.setdefault(input_ids.shape[1], []).append((index, input_ids))
+        groups = [
+            (
+                [index for index, _ in members],
+                torch.cat([ids for _, ids in members]).to(DEVICE),
+            )
+            for members in by_length.values()
+        ]
+        _question_batches[questions] = groups
+    return groups
+
+
+def _question_chunks(question_list: list[list[Any]]) -> list[list[list[Any]]]:
+    """랜드마크 질문 목록을 실행 순서대로 나눈 청크 리스트를 반환한다.
+
+    BLIP_EARLY_EXIT가 꺼져 있거나 BLIP_LOCATION_MODE가 "score"이면 원래 순서
+    그대로 하나의 청크를 반환한다. score 모드의 점수는 전체 질문의 평균 확신도라
+    어디서 멈추느냐에 따라 앙상블 점수가 달라지기 때문이다.
+    그 밖에는 세 번째 원소(판별력 가중치)가 큰 질문부터 정렬해
+    BLIP_VQA_BATCH_SIZE(0이면 EARLY_EXIT_CHUNK_SIZE) 단위로 나눈다.
+    가중치가 없는 질문은 0으로 간주하며 파일 순서를 유지한다.
+
+    Args:
+        question_list: [질문, 기대 답변(, 가중치)] 목록.
+
+    Returns:
+        질문 청크 리스트.
+    """
+    if not settings.BLIP_EARLY_EXIT or settings.BLIP_LOCATION_MODE == "score":
+        return [question_list]
+    ordered = sorted(
+        question_list,
+        key=lambda item: -float(item[2]) if len(item) > 2 else 0.0,
+    )
+    size = settings.BLIP_VQA_BATCH_SIZE or EARLY_EXIT_CHUNK_SIZE
+    return [ordered[start : start + size] for start in range(0, len(ordered), size)]
+
+
+def _required_correct(total_questions: int) -> int:
+    """정답률이 SUCCESS_THRESHOLD 이상이 되는 최소 정답 개수를 반환한다."""
+    for count in range(total_questions + 1):
+        if count / total_questions >= SUCCESS_THRESHOLD:
+            return count
+    return total_questions + 1
+
+
+def _pretokenize_questions() -> None:
+    """모델 로드 직후 랜드마크별 질문 목록과 시각 컨텍스트 질문을 미리 토크나이즈한다."""
+    try:
+        for question_list in landmark_qa_data.values():
+            for chunk in _question_chunks(question_list):
+                _get_question_batch(tuple(item[0] for item in chunk))
+        _get_question_batch(VISUAL_CONTEXT_PROBES)
+        logger.info(
+            "BLIP 질문 배치 사전 토크나이즈 완료 (%d개)", len(_question_batches)
+        )
+    except Exception as exc:
+        logger.warning("BLIP 질문 사전 토크나이즈 실패 (요청 시 재시도): %s", exc)
+
+
+def _encode_image(pixel_values: Any) -> Any:
+    """ViT 비전 인코더를 한 번 실행해 이미지 임베딩을 반환한다.
+
+    Args:
+        pixel_values: 전처리된 이미지 텐서 (1, C, H, W).
+
+    Returns:
+        (1, P, D) 형태의 이미지 임베딩 텐서.
+    """
+    with torch.no_grad():
+        return _model.vision_model(pixel_values=pixel_values)[0]
+
+
+def _pixel_values(image: ImageArtifact, device: str) -> Any:
+    """BLIP 전처리 텐서를 아티팩트에 캐시해 위치·분위기 프로브가 공유한다."""
+    return image.cached(
+        "blip.pixel_values",
+        lambda: _processor(images=image.rgb, return_tensors="pt").pixel_values.to(
+            device, dtype=_input_dtype
+        ),
+    )
+
+
+def _encode_questions(image_embeds: Any, input_ids: Any) -> tuple[Any, Any]:
+    """이미지 임베딩을 조건으로 질문 배치를 인코딩하고 디코더 시작 토큰을 만든다.
+
+    BlipForQuestionAnswering.generate와 같은 경로(텍스트 인코더 → 디코더)를
+    따르되, 비전 인코더는 다시 실행하지 않고 이미지 임베딩을 배치 크기로 확장한다.
+
+    Args:
+        image_embeds: _encode_image가 반환한 이미지 임베딩 (1, P, D).
+        input_ids: 패딩 없는 질문 토큰 (N, L).
+
+    Returns:
+        (question_embeds, bos_ids) 튜플.
+    """
+    batch_size = input_ids.shape[0]
+    image_embeds = image_embeds.expand(batch_size, -1, -1)
+    image_attention_mask = torch.ones(
+        image_embeds.shape[:-1], dtype=torch.long, device=image_embeds.device
+    )
+    question_embeds = _model.text_encoder(
+        input_ids=input_ids,
+        encoder_hidden_states=image_embeds,
+        encoder_attention_mask=image_attention_mask,
+        return_dict=False,
+    )[0]
+    bos_ids = torch.full(
+        (batch_size, 1),
+        fill_value=_model.decoder_start_token_id,
+        device=input_ids.device,
+    )
+    return question_embeds, bos_ids
+
+
+def _generate_answers(image_embeds: Any, input_ids: Any, max_new_tokens: int) -> Any:
+    """미리 계산한 이미지 임베딩으로 질문 배치의 답변 토큰을 생성한다.
+
+    Args:
+        image_embeds: _encode_image가 반환한 이미지 임베딩 (1, P, D).
+        input_ids: 패딩 없는 질문 토큰 (N, L).
+        max_new_tokens: 답변당 최대 생성 토큰 수.
+
+    Returns:
+        (N, T) 형태의 생성 토큰 텐서.
+    """
+    with torch.no_grad():
+        question_embeds, bos_ids = _encode_questions(image_embeds, input_ids)
+        return _model.text_decoder.generate(
+            input_ids=bos_ids,
+            eos_token_id=_model.config.text_config.sep_token_id,
+            pad_token_id=_model.config.text_config.pad_token_id,
+            encoder_hidden_states=question_embeds,
+            max_new_tokens=max_new_tokens,
+        )
+
+
+def _yes_no_token_ids() -> tuple[int, int]:
+    """디코더 어휘에서 "yes" / "no" 토큰 ID를 조회해 캐시한다."""
+    global _yes_no_ids
+    if _yes_no_ids is None:
+        yes_id, no_id = _processor.tokenizer.convert_tokens_to_ids(["yes", "no"])
+        _yes_no_ids = (yes_id, no_id)
+    return _yes_no_ids
+
+
+def _score_yes_no(image_embeds: Any, questions: tuple[str, ...]) -> list[float | None]:
+    """질문별로 디코더 첫 토큰의 "yes" 확률을 한 번의 forward로 계산한다.
+
+    자기회귀 디코딩 없이 BOS 다음 위치의 로짓에서 "yes"/"no" 두 토큰만
+    softmax해 P(yes)를 구한다. 배치 구성은 _answer_questions와 동일하다.
+
+    Args:
+        image_embeds: _encode_image가 반환한 이미지 임베딩.
+        questions: 예/아니오 질문 튜플.
+
+    Returns:
+        질문 순서와 동일한 P(yes) 리스트 (실패한 질문은 None).
+    """
+    yes_id, no_id = _yes_no_token_ids()
+    probs: list[float | None] = [None] * len(questions)
+    for indices, input_ids in _get_question_batch(questions):
+        batch_size = settings.BLIP_VQA_BATCH_SIZE or len(indices)
+        for start in range(0, len(indices), batch_size):
+            chunk = indices[start : start + batch_size]
+            try:
+                with torch.no_grad():
+                    question_embeds, bos_ids = _encode_questions(
+                        image_embeds, input_ids[start : start + batch_size]
+                    )
+                    logits = _model.text_decoder(
+                        input_ids=bos_ids,
+                        encoder_hidden_states=question_embeds,
+                        return_dict=True,
+                    ).logits[:, -1, :]
+                    yes_probs = torch.softmax(
+                        logits[:, [yes_id, no_id]].float(), dim=-1
+                    )[:, 0]
+            except Exception as exc:
+                logger.warning("VQA 스코어링 오류 (질문 %s): %s", chunk, exc)
+                continue
+            for index, prob in zip(chunk, yes_probs.tolist()):
+                probs[index] = prob
+    return probs
+
+
+def _answer_questions(
+    image_embeds: Any,
+    questions: tuple[str, ...],
+    max_new_tokens: int,
+) -> list[str | None]:
+    """같은 이미지에 대한 여러 질문을 배치 generate 호출로 한꺼번에 답한다.
+
+    길이별 그룹을 BLIP_VQA_BATCH_SIZE 단위로 나누어 실행하며(0이면 그룹 전체),
+    배치 실행이 실패하면 해당 배치의 답변은 None으로 남긴다.
+
+    Args:
+        image_embeds: _encode_image가 반환한 이미지 임베딩.
+        questions: 질문 튜플.
+        max_new_tokens: 답변당 최대 생성 토큰 수.
+
+    Returns:
+        질문 순서와 동일한 답변 문자열 리스트 (실패한 질문은 None).
+    """
+    answers: list[str | None] = [None] * len(questions)
+    for indices, input_ids in _get_question_batch(questions):
+        batch_size = settings.BLIP_VQA_BATCH_SIZE or len(indices)
+        for start in range(0, len(indices), batch_size):
+            chunk = indices[start : start + batch_size]
+            try:
+                out = _generate_answers(
+                    image_embeds,
+                    input_ids[start : start + batch_size],
+                    max_new_tokens,
+                )
+                decoded = _processor.batch_decode(out, skip_special_tokens=True)
+            except Exception as exc:
+                logger.warning("VQA 배치 처리 오류 (질문 %s): %s", chunk, exc)
+                continue
+            for index, answer in zip(chunk, decoded):
+                answers[index] = answer.strip()
+    return answers
+
+
+def _judge_questions(
+    image_embeds: Any,
+    question_list: list[list[str]],
+) -> list[tuple[str, float]]:
+    """질문별 모델 답변과 기대 답변에 대한 확신도를 계산한다.
+
+    BLIP_LOCATION_MODE가 "score"이면 yes/no 토큰 확률로 P(기대 답변)을,
+    "generate"이면 자유 생성 답변의 정확 일치 여부(1.0/0.0)를 확신도로 쓴다.
+
+    Args:
+        image_embeds: _encode_image가 반환한 이미지 임베딩.
+        question_list: [질문, 기대 답변] 목록.
+
+    Returns:
+        질문 순서와 동일한 (model_answer, confidence) 리스트.
+        실패한 질문은 ("error", 0.0).
+    """
+    questions = tuple(item[0] for item in question_list)
+    judged: list[tuple[str, float]] = []
+
+    if settings.BLIP_LOCATION_MODE == "score":
+        yes_probs = _score_yes_no(image_embeds, questions)
+        for item, p_yes in zip(question_list, yes_probs):
+            if p_yes is None:
+                judged.append(("error", 0.0))
+                continue
+            model_answer = "yes" if p_yes >= 0.5 else "no"
+            expected_answer = item[1]
+            if expected_answer == "yes":
+                judged.append((model_answer, p_yes))
+            elif expected_answer == "no":
+                judged.append((model_answer, 1.0 - p_yes))
+            else:
+                judged.append((model_answer, float(model_answer == expected_answer)))
+        return judged
+
+    model_answers = _answer_questions(image_embeds, questions, max_new_tokens=10)
+    for item, model_answer in zip(question_list, model_answers):
+        model_answer = model_answer.lower() if model_answer is not None else "error"
+        judged.append((model_answer, float(model_answer == item[1])))
+    return judged
+
+
+def evaluate_location(
+    user_image_path: str | ImageArtifact,
     landmark_name: str,
-) -> tuple[bool, list[dict[str, str]]]:
-    """BLIP VQA로 사용자 이미지가 해당 랜드마크인지 검증한다.
+) -> tuple[bool, float, list[dict[str, str]]]:
+    """BLIP VQA로 랜드마크 일치 여부와 연속 확신도를 함께 계산한다.
 
     Args:
-        user_image_path: 사용자가 업로드한 이미지 경로.
+        user_image_path: 사용자가 업로드한 이미지 경로 또는 공유 ImageArtifact.
         landmark_name: 오늘의 정답 랜드마크 이름.
 
     Returns:
-        (is_success, hint_payload) 튜플.
+        (is_success, score, hint_payload) 튜플.
         is_success: 미션 성공 여부 (정답률 ≥ SUCCESS_THRESHOLD).
-        hint_payload: 오답 질문 목록 (LLM 힌트 생성용). 성공 시 [].
+        score: "score" 모드에서는 전체 질문별 P(기대 답변)의 평균,
+            "generate" 모드에서는 성공 시 1.0, 실패 시 0.0.
+        hint_payload: 실행한 질문 중 오답 목록 (LLM 힌트 생성용). 성공 시 [].
+
+    "generate" 모드에서 BLIP_EARLY_EXIT가 켜져 있으면 청크 단위로 질문하다가
+    판정이 확정되는 즉시 멈춘다. 판정과 점수는 전체 질문을 실행한 경우와 같다.
+    """
+    is_success, score, hint_payload, _ = _evaluate_location(
+        user_image_path, landmark_name
+    )
+    return is_success, score, hint_payload
+
+
+def _evaluate_location(
+    user_image_path: str | ImageArtifact,
+    landmark_name: str,
+) -> tuple[bool, float, list[dict[str, str]], bool]:
+    """evaluate_location 본체. 마지막 값은 모델·이미지·추론 실패 여부다.
+
+    실패(모델 미로드·이미지 로드/인코딩 오류·"error"로 끝난 질문)는 오답과 달리
+    일시적일 수 있으므로 프로브가 투표에 failed 플래그로 표시한다.
+
+    Args:
+        user_image_path: 사용자가 업로드한 이미지 경로 또는 공유 ImageArtifact.
+        landmark_name: 오늘의 정답 랜드마크 이름.
+
+    Returns:
+        (is_success, score, hint_payload, failed) 튜플. 앞의 세 값은
+        evaluate_location과 같다.
     """
     _load_blip()
     device = "cuda" if torch.cuda.is_available() else "cpu"
 
     if not _processor or not _model:
         logger.error("BLIP 모델 미로드 상태")
-        return False, []
+        return False, 0.0, [], True
 
     question_list = landmark_qa_data.get(landmark_name)
     if not question_list:
         logger.warning("'%s'에 대한 Q&A 데이터 없음", landmark_name)
-        return False, []
+        return False, 0.0, [], False
 
     total_questions = len(question_list)
     if total_questions == 0:
-        return False, []
+        return False, 0.0, [], False
 
+    image = ImageArtifact.resolve(user_image_path)
     try:
-        raw_image = Image.open(user_image_path).convert("RGB")
+        pixel_values = _pixel_values(image, device)
     except FileNotFoundError:
-        logger.error("이미지 파일 없음: '%s'", user_image_path)
-        return False, []
+        logger.error("이미지 파일 없음: '%s'", image.path)
+        return False, 0.0, [], True
     except Exception as exc:
-        logger.error("이미지 로드 오류: %s", exc)
-        return False, []
+        logger.error("이미지 로드/전처리 오류: %s", exc)
+        return False, 0.0, [], True
 
     try:
-        pixel_values = _processor(
-            images=raw_image, return_tensors="pt"
-        ).pixel_values.to(device)
+        image_embeds = _encode_image(pixel_values)
     except Exception as exc:
-        logger.error("이미지 전처리 오류: %s", exc)
-        return False, []
+        logger.error("BLIP 이미지 인코딩 오류: %s", exc)
+        return False, 0.0, [], True
 
     correct_count = 0
+    failed = False
     incorrect_questions_list: list[dict[str, str]] = []
+    confidences: list[float] = []
+    required = _required_correct(total_questions)
 
     logger.info("VQA 실행 중: '%s' (%d개 질문)...", landmark_name, total_questions)
 
-    for item in question_list:
-        question, expected_answer = item[0], item[1]
-        try:
-            inputs = _processor(text=question, return_tensors="pt").to(device)
-            out = _model.generate(
-                pixel_values=pixel_values,
-                input_ids=inputs.input_ids,
-                attention_mask=inputs.attention_mask,
-                max_new_tokens=10,
-            )
-            model_answer = (
-                _processor.decode(out[0], skip_special_tokens=True).strip().lower()
-            )
+    for chunk in _question_chunks(question_list):
+        judged = _judge_questions(image_embeds, chunk)
+        for item, (model_answer, confidence) in zip(chunk, judged):
+            question, expected_answer = item[0], item[1]
+            confidences.append(confidence)
+            failed = failed or model_answer == "error"
             if model_answer == expected_answer:
                 correct_count += 1
             else:
@@ -164,126 +496,163 @@ def check_with_blip(
                         "expected_answer": expected_answer,
                     }
                 )
-        except Exception as exc:
-            logger.warning("VQA 처리 오류 ('%s'): %s", question, exc)
-            incorrect_questions_list.append(
-                {
-                    "question": question,
-                    "model_answer": "error",
-                    "expected_answer": expected_answer,
-                }
-            )
-
-    accuracy = correct_count / total_questions
-    is_success = accuracy >= SUCCESS_THRESHOLD
+        # 남은 질문을 모두 맞히거나 모두 틀려도 판정이 바뀌지 않으면 종료
+        if (
+            correct_count >= required
+            or len(incorrect_questions_list) > total_questions - required
+        ):
+            break
+
+    asked_questions = len(confidences)
+    is_success = correct_count >= required
+    if settings.BLIP_LOCATION_MODE == "score":
+        score = sum(confidences) / asked_questions
+    else:
+        score = 1.0 if is_success else 0.0
     logger.info(
-        "VQA 결과: %d/%d 정답 (%.2f%%). 성공: %s",
+        "VQA 결과: %d/%d 정답 (%d개 질문 실행, 확신도 %.3f). 성공: %s",
         correct_count,
         total_questions,
-        accuracy * 100,
+        asked_questions,
+        score,
         is_success,
     )
 
     if is_success:
-        return True, []
-    return False, incorrect_questions_list
+        return True, score, [], failed
+    return False, score, incorrect_questions_list, failed
 
 
-def get_visual_context(user_image_path: str) -> str:
+def check_with_blip(
+    user_image_path: str | ImageArtifact,
+    landmark_name: str,
+) -> tuple[bool, list[dict[str, str]]]:
+    """BLIP VQA로 사용자 이미지가 해당 랜드마크인지 검증한다.
+
+    Args:
+        user_image_path: 사용자가 업로드한 이미지 경로 또는 공유 ImageArtifact.
+        landmark_name: 오늘의 정답 랜드마크 이름.
+
+    Returns:
+        (is_success, hint_payload) 튜플.
+        is_success: 미션 성공 여부 (정답률 ≥ SUCCESS_THRESHOLD).
+        hint_payload: 오답 질문 목록 (LLM 힌트 생성용). 성공 시 [].
+    """
+    is_success, _, hint_payload = evaluate_location(user_image_path, landmark_name)
+    return is_success, hint_payload
+
+
+def get_visual_context(user_image_path: str | ImageArtifact) -> str:
     """BLIP VQA로 이미지의 전반적인 분위기와 특징을 텍스트로 추출한다.
 
     감성 미션(미션2)에서 CLIP 대체용으로 사용한다.
 
     Args:
-        user_image_path: 분석할 이미지 파일 경로.
+        user_image_path: 분석할 이미지 파일 경로 또는 공유 ImageArtifact.
 
     Returns:
         질문별 BLIP 답변을 줄바꿈으로 연결한 컨텍스트 문자열.
         모델 미로드 또는 이미지 오류 시 에러 메시지 문자열.
     """
+    return _visual_context(user_image_path)[0]
+
+
+def _visual_context(user_image_path: str | ImageArtifact) -> tuple[str, bool]:
+    """get_visual_context 본체. (컨텍스트 문자열, 이미지·추론 실패 여부)를 반환한다."""
     _load_blip()
     device = "cuda" if torch.cuda.is_available() else "cpu"
 
     try:
-        raw_image = Image.open(user_image_path).convert("RGB")
-        pixel_values = _processor(
-            images=raw_image, return_tensors="pt"
-        ).pixel_values.to(device)
+        pixel_values = _pixel_values(ImageArtifact.resolve(user_image_path), device)
     except Exception as exc:
-        return f"이미지 로드 오류: {exc}"
+        return f"이미지 로드 오류: {exc}", True
 
-    probes = [
-        "What is the atmosphere of this picture?",
-        "What is the dominant color?",
-        "Is this picture bright or dark?",
-        "How does this picture feel?",
-        "What objects are in the picture?",
-        "Is it natural or artificial?",
-    ]
+    try:
+        image_embeds = _encode_image(pixel_values)
+    except Exception as exc:
+        return f"이미지 인코딩 오류: {exc}", True
 
     context_parts: list[str] = []
     logger.debug("BLIP으로 시각적 컨텍스트 추출 중...")
 
-    for question in probes:
-        try:
-            inputs = _processor(text=question, return_tensors="pt").to(device)
-            out = _model.generate(
-                pixel_values=pixel_values,
-                input_ids=inputs.input_ids,
-                attention_mask=inputs.attention_mask,
-                max_new_tokens=20,
-            )
-            answer = _processor.decode(out[0], skip_special_tokens=True).strip()
+    answers = _answer_questions(image_embeds, VISUAL_CONTEXT_PROBES, max_new_tokens=20)
+    for question, answer in zip(VISUAL_CONTEXT_PROBES, answers):
+        if answer is not None:
             context_parts.append(f"- {question} -> {answer}")
-        except Exception as exc:
-            logger.warning("VQA 오류 ('%s'): %s", question, exc)
 
-    return "\n".join(context_parts)
+    return "\n".join(context_parts), None in answers
+
+
+def warmup() -> None:
+    """모델을 로드하고 더미 이미지로 비전 인코더·질문 디코딩을 한 번씩 실행한다.
+
+    첫 제출이 from_pretrained와 첫 추론 초기화 비용을 떠안지 않도록
+    서버 시작 시 호출한다. 위치 판정 방식이 "score"이면 yes/no 스코어링도 실행한다.
+
+    Raises:
+        Exception: 모델 로드 또는 더미 추론 실패 시.
+    """
+    _load_blip()
+    device = "cuda" if torch.cuda.is_available() else "cpu"
+    pixel_values = _processor(
+        images=Image.new("RGB", (64, 64)), return_tensors="pt"
+    ).pixel_values.to(device, dtype=_input_dtype)
+    image_embeds = _encode_image(pixel_values)
+    questions = VISUAL_CONTEXT_PROBES[:1]
+    for _, input_ids in _get_question_batch(questions):
+        _generate_answers(image_embeds, input_ids, max_new_tokens=5)
+    if settings.BLIP_LOCATION_MODE == "score":
+        _score_yes_no(image_embeds, questions)
 
 
 def probe_with_blip_location(
-    image_path: str,
+    image_path: str | ImageArtifact,
     answer: str,
     prompt_bundle: dict[str, Any],
 ) -> dict[str, Any]:
     """BLIP VQA로 위치 미션을 검증한다 (파이프라인 인터페이스).
 
     Args:
-        image_path: 이미지 파일 경로.
+        image_path: 이미지 파일 경로 또는 공유 ImageArtifact.
         answer: 미션 정답 랜드마크 이름.
         prompt_bundle: 프롬프트 번들 (현재 미사용, 인터페이스 통일 목적).
 
     Returns:
         모델 투표 결과 딕셔너리 {model, score, label, reason}.
+        모델·이미지·추론 실패로 얻은 판정이면 failed=True를 함께 담는다.
     """
-    is_success, _ = check_with_blip(image_path, answer)
-    return {
+    is_success, score, _, failed = _evaluate_location(image_path, answer)
+    vote = {
         "model": "blip",
-        "score": 1.0 if is_success else 0.0,
+        "score": score,
         "label": "match" if is_success else "mismatch",
         "reason": f"BLIP VQA location probe for '{answer}'",
     }
+    if failed:
+        vote["failed"] = True
+    return vote
 
 
 def probe_with_blip_atmosphere(
-    image_path: str,
+    image_path: str | ImageArtifact,
     answer: str,
     prompt_bundle: dict[str, Any],
 ) -> dict[str, Any]:
     """BLIP VQA로 분위기 미션을 검증한다 (파이프라인 인터페이스).
 
     Args:
-        image_path: 이미지 파일 경로.
+        image_path: 이미지 파일 경로 또는 공유 ImageArtifact.
         answer: 미션 정답 분위기 키워드.
         prompt_bundle: 프롬프트 번들 (현재 미사용, 인터페이스 통일 목적).
 
     Returns:
         모델 투표 결과 딕셔너리 {model, score, label, reason}.
+        이미지·추론 실패로 얻은 판정이면 failed=True를 함께 담는다.
     """
-    context = get_visual_context(image_path)
+    context, failed = _visual_context(image_path)
     keyword_lower = answer.lower()
     found = keyword_lower in context.lower()
-    return {
+    vote = {
         "model": "blip",
         "score": 0.85 if found else 0.2,
         "label": "match" if found else "mismatch",
@@ -292,3 +661,6 @@ def probe_with_blip_atmosphere(
             f"{'keyword found' if found else 'keyword not found'}"
         ),
     }
+    if failed:
+        vote["failed"] = True
+    return vote
@@ -0,0 +1,240 @@
+"""image_hash 키 기반 추가 전용(append-only) 이미지 임베딩 저장소.
+
+제출 사진의 SigLIP2 이미지 임베딩을 float16으로 디스크에 쌓아 두고, 같은 사진을 다시
+채점하거나(재시도·council 재검사·임계값 재보정) 유사 이미지를 찾을 때 비전 타워를
+다시 실행하지 않고 재사용한다. 모델 ID마다 디렉터리 하나를 쓴다.
+
+    vectors.f16  float16 (D,) 행을 이어 붙인 파일 (np.memmap으로 읽는다)
+    index.bin    행마다 40바이트 레코드: SHA-256 digest 32바이트 + 행 번호 uint64
+    meta.json    {"model_id", "dim"}
+
+쓰기는 O_APPEND로 행 하나를 통째로 붙이고, 그 뒤에 인덱스 레코드를 붙인다.
+여러 프로세스(모델 워커 등)가 같은 디렉터리에 써도 행 번호가 겹치지 않으며,
+중간에 끊긴 쓰기는 다음에 열 때 인덱스에 없는 행으로 남을 뿐 읽기를 깨지 않는다.
+50만 장이면 벡터 약 768MB(D=768)·인덱스 20MB 수준이다.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import struct
+import threading
+
+import numpy as np
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+_RECORD = struct.Struct("<32sQ")
+
+_stores: dict[str, EmbeddingStore] = {}
+_stores_lock = threading.Lock()
+
+
+class EmbeddingStore:
+    """한 모델의 이미지 임베딩을 image_hash로 조회·추가하는 디스크 저장소."""
+
+    def __init__(self, directory: str, model_id: str = "") -> None:
+        """저장소를 연다. 디렉터리가 없으면 첫 put()에서 만든다.
+
+        Args:
+            directory: 저장소 디렉터리.
+            model_id: meta.json에 기록할 모델 식별자.
+        """
+        self.directory = directory
+        self.model_id = model_id
+        self.dim: int | None = None
+        self._rows: dict[bytes, int] = {}
+        self._index_offset = 0
+        self._matrix: np.memmap | None = None
+        self._lock = threading.Lock()
+        if self._load_meta():
+            self._drop_partial_writes()
+            self._refresh()
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._refresh()
+            return len(self._rows)
+
+    def __contains__(self, image_hash: str) -> bool:
+        return self.get(image_hash) is not None
+
+    def get(self, image_hash: str) -> np.ndarray | None:
+        """저장된 임베딩을 반환한다.
+
+        Args:
+            image_hash: 원본 이미지 SHA-256 16진수 해시.
+
+        Returns:
+            (D,) float16 벡터 (읽기 전용 메모리 매핑 뷰). 없으면 None.
+        """
+        key = bytes.fromhex(image_hash)
+        with self._lock:
+            if self.dim is None and not self._load_meta():
+                return None
+            row = self._rows.get(key)
+            if row is None:
+                # 다른 프로세스가 그사이 추가했을 수 있으므로 인덱스 끝을 다시 읽는다.
+                self._refresh()
+                row = self._rows.get(key)
+            if row is None:
+                return None
+            return self._view(row + 1)[row]
+
+    def put(self, image_hash: str, vector: np.ndarray) -> bool:
+        """임베딩을 추가한다. 이미 있는 해시는 다시 쓰지 않는다.
+
+        Args:
+            image_hash: 원본 이미지 SHA-256 16진수 해시.
+            vector: (D,) 또는 (1, D) 정규화된 임베딩.
+
+        Returns:
+            새로 추가했으면 True.
+
+        Raises:
+            ValueError: 저장소 차원과 벡터 차원이 다른 경우.
+        """
+        key = bytes.fromhex(image_hash)
+        row_bytes = np.ascontiguousarray(
+            np.asarray(vector, dtype=np.float16).reshape(-1)
+        )
+        with self._lock:
+            if self.dim is None:
+                self._create(row_bytes.size)
+            if row_bytes.size != self.dim:
+                raise ValueError(
+                    f"임베딩 차원 {row_bytes.size}이 저장소 차원 {self.dim}과 다릅니다."
+                )
+            if key in self._rows:
+                return False
+            end = _append(self._path("vectors.f16"), row_bytes.tobytes())
+            row = end // row_bytes.nbytes - 1
+            _append(self._path("index.bin"), _RECORD.pack(key, row))
+            self._rows[key] = row
+            return True
+
+    def matrix(self) -> np.ndarray:
+        """인덱스에 기록된 모든 행을 덮는 (N, D) float16 메모리 매핑을 반환한다.
+
+        hashes()의 행 번호로 조회한다. 끊긴 쓰기로 남은 행은 어느 해시에도 대응하지 않는다.
+        """
+        with self._lock:
+            self._refresh()
+            if not self._rows:
+                return np.zeros((0, self.dim or 0), dtype=np.float16)
+            return self._view(max(self._rows.values()) + 1)
+
+    def hashes(self) -> dict[str, int]:
+        """image_hash → matrix() 행 번호."""
+        with self._lock:
+            self._refresh()
+            return {key.hex(): row for key, row in self._rows.items()}
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.directory, name)
+
+    def _load_meta(self) -> bool:
+        """meta.json이 있으면 차원을 읽고 True를 반환한다."""
+        meta_path = self._path("meta.json")
+        if not os.path.exists(meta_path):
+            return False
+        with open(meta_path, encoding="utf-8") as f:
+            self.dim = int(json.load(f)["dim"])
+        return True
+
+    def _create(self, dim: int) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        if self._load_meta():
+            return
+        meta_path = self._path("meta.json")
+        tmp_path = f"{meta_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"model_id": self.model_id, "dim": dim}, f)
+        os.replace(tmp_path, meta_path)
+        self.dim = dim
+
+    def _drop_partial_writes(self) -> None:
+        """중간에 끊긴 마지막 행·레코드를 잘라 다음 쓰기가 경계에 붙도록 한다."""
+        for name, unit in (
+            ("vectors.f16", self.dim * 2),
+            ("index.bin", _RECORD.size),
+        ):
+            path = self._path(name)
+            if not os.path.exists(path):
+                continue
+            size = os.path.getsize(path)
+            if size % unit:
+                logger.warning(
+                    "[embedding_store] 불완전한 마지막 쓰기 제거: %s (%d바이트)",
+                    path,
+                    size % unit,
+                )
+                os.truncate(path, size - size % unit)
+
+    def _refresh(self) -> None:
+        """마지막으로 읽은 위치 이후의 인덱스 레코드를 읽어 온다."""
+        index_path = self._path("index.bin")
+        if not os.path.exists(index_path):
+            return
+        with open(index_path, "rb") as f:
+            f.seek(self._index_offset)
+            data = f.read()
+        usable = len(data) - len(data) % _RECORD.size
+        vector_rows = self._vector_rows()
+        for key, row in _RECORD.iter_unpack(data[:usable]):
+            if row < vector_rows:
+                self._rows.setdefault(key, row)
+        self._index_offset += usable
+
+    def _vector_rows(self) -> int:
+        path = self._path("vectors.f16")
+        if self.dim is None or not os.path.exists(path):
+            return 0
+        return os.path.getsize(path) // (self.dim * 2)
+
+    def _view(self, rows: int) -> np.memmap:
+        """최소 rows개 행을 덮는 메모리 매핑을 반환한다 (파일이 자라면 다시 매핑)."""
+        if self._matrix is None or self._matrix.shape[0] < rows:
+            self._matrix = np.memmap(
+                self._path("vectors.f16"),
+                dtype=np.float16,
+                mode="r",
+                shape=(self._vector_rows(), self.dim),
+            )
+        return self._matrix[:rows]
+
+
+def _append(path: str, payload: bytes) -> int:
+    """O_APPEND로 payload를 한 번에 붙이고 쓰기가 끝난 파일 위치를 반환한다."""
+    fd = os.open(
+        path, os.O_WRONLY | os.O_CREAT | os.O_APPEND | getattr(os, "O_BINARY", 0)
+    )
+    try:
+        os.write(fd, payload)
+        return os.lseek(fd, 0, os.SEEK_CUR)
+    finally:
+        os.close(fd)
+
+
+def store_path(model_id: str) -> str:
+    """모델 ID에 대응하는 저장소 디렉터리 경로를 반환한다."""
+    return os.path.join(settings.EMBEDDING_STORE_DIR, model_id.replace("/", "--"))
+
+
+def get_embedding_store(model_id: str) -> EmbeddingStore | None:
+    """모델별 저장소 싱글턴을 지연 생성한다. EMBEDDING_STORE_ENABLED가 꺼져 있으면 None."""
+    if not settings.EMBEDDING_STORE_ENABLED:
+        return None
+    store = _stores.get(model_id)
+    if store is None:
+        with _stores_lock:
+            store = _stores.get(model_id)
+            if store is None:
+                store = EmbeddingStore(store_path(model_id), model_id)
+                _stores[model_id] = store
+                logger.info("[embedding_store] %s 열기: %s", model_id, store.directory)
+    return store
@@ -0,0 +1,319 @@
+"""참조 사진 갤러리 kNN 랜드마크 프로브.
+
+data/assets/<랜드마크>/ 의 참조 사진을 SigLIP2 비전 타워로 미리 임베딩해
+float16 행렬(.npy)과 라벨 목록(.json)으로 data/model_cache/ 아래에 저장한다
+(scripts/tools/build_gallery_index.py). 런타임에는 행렬을 메모리 매핑으로 복사 없이
+열고, 제출 사진의 이미지 임베딩 1개와 코사인 유사도 kNN으로 정답 랜드마크를 판정한다.
+
+위치(location) 미션 전용이다.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any, Callable
+
+import numpy as np
+
+from app.core.config import settings
+from app.core.image_artifact import ImageArtifact
+from app.models import siglip2
+
+logger = logging.getLogger(__name__)
+
+IMAGE_SUFFIXES = {".jpg", ".jpeg", ".png", ".jfif", ".webp"}
+
+_index: GalleryIndex | None = None
+_index_lock = threading.Lock()
+
+
+class GalleryIndex:
+    """참조 사진 임베딩 행렬과 행별 랜드마크 라벨."""
+
+    def __init__(self, matrix: np.ndarray, labels: list[str]) -> None:
+        """인덱스를 생성한다.
+
+        Args:
+            matrix: (N, D) 정규화된 참조 사진 임베딩 (float16, 메모리 매핑 가능).
+            labels: 행마다의 랜드마크 이름 (길이 N).
+
+        Raises:
+            ValueError: 행 수와 라벨 수가 다른 경우.
+        """
+        if matrix.shape[0] != len(labels):
+            raise ValueError(
+                f"갤러리 행 수({matrix.shape[0]})와 라벨 수({len(labels)})가 다릅니다."
+            )
+        self.matrix = matrix
+        self.labels = labels
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+    @classmethod
+    def load(cls, path: str) -> GalleryIndex:
+        """save()로 저장한 인덱스를 행렬 복사 없이 메모리 매핑으로 연다.
+
+        Args:
+            path: 행렬 파일(.npy) 경로. 라벨은 같은 이름의 .json에서 읽는다.
+
+        Returns:
+            로드된 GalleryIndex.
+
+        Raises:
+            OSError: 파일이 없거나 읽을 수 없는 경우.
+        """
+        matrix = np.load(path, mmap_mode="r")
+        with open(_labels_path(path), encoding="utf-8") as f:
+            meta = json.load(f)
+        return cls(matrix, meta["labels"])
+
+    def save(self, path: str, files: list[str] | None = None) -> None:
+        """행렬을 float16 .npy로, 라벨을 .json으로 저장한다.
+
+        중단돼도 깨진 파일이 남지 않도록 임시 파일에 쓴 뒤 교체한다.
+
+        Args:
+            path: 행렬 파일(.npy) 경로.
+            files: 행마다의 원본 사진 경로 (확인용 메타데이터).
+        """
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            np.save(f, np.ascontiguousarray(self.matrix, dtype=np.float16))
+        meta = {
+            "model_id": siglip2.MODEL_NAME,
+            "labels": self.labels,
+            "files": files or [],
+        }
+        labels_path = _labels_path(path)
+        with open(f"{labels_path}.tmp", "w", encoding="utf-8") as f:
+            json.dump(meta, f, ensure_ascii=False, indent=1)
+        os.replace(tmp_path, path)
+        os.replace(f"{labels_path}.tmp", labels_path)
+
+    def neighbours(self, query: np.ndarray, k: int) -> list[tuple[str, float]]:
+        """코사인 유사도 상위 k개 참조 사진의 (라벨, 유사도)를 반환한다.
+
+        Args:
+            query: (D,) 정규화된 이미지 임베딩.
+            k: 이웃 수 (인덱스 크기보다 크면 전체).
+
+        Returns:
+            유사도 내림차순 (라벨, 유사도) 목록.
+        """
+        # float16 행렬과 곱해도 누적은 float32로 이루어진다.
+        similarities = np.dot(self.matrix, query.astype(self.matrix.dtype))
+        k = min(k, len(self))
+        top = np.argpartition(-similarities, k - 1)[:k]
+        top = top[np.argsort(-similarities[top])]
+        return [(self.labels[i], float(similarities[i])) for i in top]
+
+
+def index_path() -> str:
+    """현재 SIGLIP2_MODEL_ID에 대응하는 갤러리 행렬 파일 경로를 반환한다."""
+    file_name = siglip2.MODEL_NAME.replace("/", "--") + "-gallery.npy"
+    return os.path.join(settings.MODEL_CACHE_DIR, file_name)
+
+
+def _labels_path(path: str) -> str:
+    return os.path.splitext(path)[0] + ".json"
+
+
+def reference_images(assets_dir: Path, landmarks: list[str]) -> dict[str, list[Path]]:
+    """랜드마크 이름과 같은 폴더에서 참조 사진 경로를 수집한다.
+
+    Args:
+        assets_dir: 랜드마크별 하위 폴더를 가진 에셋 디렉터리.
+        landmarks: 수집할 랜드마크 이름 목록.
+
+    Returns:
+        참조 사진이 하나 이상 있는 랜드마크 → 사진 경로 리스트.
+    """
+    images: dict[str, list[Path]] = {}
+    for landmark in landmarks:
+        folder = assets_dir / landmark
+        if not folder.is_dir():
+            continue
+        paths = sorted(
+            path
+            for path in folder.iterdir()
+            if path.is_file() and path.suffix.lower() in IMAGE_SUFFIXES
+        )
+        if paths:
+            images[landmark] = paths
+    return images
+
+
+def build_index(
+    images: dict[str, list[Path]],
+    embed: Callable[[ImageArtifact], np.ndarray],
+) -> tuple[GalleryIndex, list[str]]:
+    """참조 사진을 임베딩해 갤러리 인덱스를 만든다.
+
+    Args:
+        images: 랜드마크 → 참조 사진 경로 리스트.
+        embed: 아티팩트 → 정규화 이미지 임베딩 배열 ((1, D) 또는 (D,)) 함수.
+
+    Returns:
+        (float16 GalleryIndex, 행마다의 사진 경로 목록).
+    """
+    rows: list[np.ndarray] = []
+    labels: list[str] = []
+    files: list[str] = []
+    for landmark, paths in images.items():
+        for path in paths:
+            embeds = embed(ImageArtifact(path=str(path)))
+            rows.append(np.asarray(embeds, dtype=np.float32).reshape(-1))
+            labels.append(landmark)
+            files.append(str(path))
+    matrix = np.stack(rows).astype(np.float16)
+    return GalleryIndex(matrix, labels), files
+
+
+def get_index() -> GalleryIndex:
+    """갤러리 인덱스 싱글턴을 지연 로드한다.
+
+    Raises:
+        OSError: 인덱스 파일이 없는 경우 (build_gallery_index.py로 먼저 생성).
+    """
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                path = index_path()
+                _index = GalleryIndex.load(path)
+                logger.info("갤러리 인덱스 로드 완료: '%s' (%d장)", path, len(_index))
+    return _index
+
+
+def _load() -> None:
+    siglip2._load_siglip2()
+    get_index()
+
+
+def knn_score(neighbours: list[tuple[str, float]], answer: str) -> float:
+    """이웃 중 정답 랜드마크 사진의 유사도 비중을 점수로 계산한다.
+
+    GALLERY_MIN_SIMILARITY 미만인 정답 이웃은 세지 않으므로, 정답 사진이 가장
+    가깝더라도 충분히 닮지 않았으면 점수가 낮아진다.
+
+    Args:
+        neighbours: (라벨, 유사도) 상위 k개 이웃.
+        answer: 미션 정답 랜드마크.
+
+    Returns:
+        0.0 ~ 1.0 점수.
+    """
+    total = sum(max(similarity, 0.0) for _, similarity in neighbours)
+    if total <= 0.0:
+        return 0.0
+    matched = sum(
+        similarity
+        for label, similarity in neighbours
+        if label == answer and similarity >= settings.GALLERY_MIN_SIMILARITY
+    )
+    return matched / total
+
+
+def warmup() -> None:
+    """SigLIP2 비전 타워와 갤러리 인덱스를 로드하고 더미 kNN을 한 번 실행한다.
+
+    Raises:
+        Exception: 모델 또는 인덱스 로드 실패 시.
+    """
+    siglip2.warmup()
+    index = get_index()
+    index.neighbours(np.asarray(index.matrix[0], dtype=np.float32), 1)
+
+
+def probe_with_gallery(
+    mission_type: str,
+    image_path: str | ImageArtifact,
+    answer: str,
+    prompt_bundle: dict[str, Any],
+) -> dict[str, Any]:
+    """참조 사진 갤러리 kNN으로 제출 사진이 정답 랜드마크인지 판정한다.
+
+    Args:
+        mission_type: 미션 유형 ('location'만 지원).
+        image_path: 이미지 파일 경로 또는 공유 ImageArtifact.
+        answer: 미션 정답 랜드마크 (data/assets/ 폴더 이름).
+        prompt_bundle: 프롬프트 번들 (사용하지 않음).
+
+    Returns:
+        모델 투표 결과 딕셔너리 (model, score, label, reason).
+    """
+    if mission_type != "location":
+        return {
+            "model": "gallery",
+            "score": 0.0,
+            "label": "mismatch",
+            "reason": "gallery probe supports location missions only",
+        }
+    try:
+        _load()
+    except Exception as exc:
+        return {
+            "model": "gallery",
+            "score": 0.0,
+            "label": "mismatch",
+            "reason": f"Model load failed: {exc}",
+            "failed": True,
+        }
+
+    index = get_index()
+    if answer not in index.labels:
+        return {
+            "model": "gallery",
+            "score": 0.0,
+            "label": "mismatch",
+            "reason": f"no gallery reference photos for '{answer}'",
+        }
+
+    image = ImageArtifact.resolve(image_path)
+    try:
+        image.decode()
+    except Exception as exc:
+        return {
+            "model": "gallery",
+            "score": 0.0,
+            "label": "mismatch",
+            "reason": f"Image load failed: {str(exc)}",
+            "failed": True,
+        }
+
+    # 0 이하이거나 인덱스보다 큰 GALLERY_KNN_K는 argpartition이 받을 수 있는 범위로 맞춘다.
+    k = min(max(1, settings.GALLERY_KNN_K), len(index))
+    try:
+        query = siglip2.image_embedding(image)[0].float().cpu().numpy()
+        neighbours = index.neighbours(query, k)
+        if not neighbours:
+            raise ValueError("gallery index returned no neighbours")
+        score = knn_score(neighbours, answer)
+        hits = sum(1 for name, _ in neighbours if name == answer)
+        top_similarity = neighbours[0][1]
+    except Exception as exc:
+        logger.error("[gallery Inference Error] %s", exc, exc_info=True)
+        return {
+            "model": "gallery",
+            "score": 0.0,
+            "label": "mismatch",
+            "reason": f"Inference failed: {exc}",
+            "failed": True,
+        }
+
+    label = "match" if score >= settings.LOCATION_PASS_THRESHOLD else "mismatch"
+    return {
+        "model": "gallery",
+        "score": score,
+        "label": label,
+        "reason": (
+            f"Gallery kNN: {hits}/{len(neighbours)} nearest references are "
+            f"'{answer}' (top similarity {top_similarity:.3f})"
+        ),
+    }
@@ -0,0 +1,119 @@
+"""요청 간 동적 마이크로 배칭 큐.
+
+동시에 들어온 요청의 입력 텐서를 짧은 시간(max_wait_ms) 또는 최대 배치 크기까지
+모아 한 번의 forward로 실행하고, 각 호출자에게 자기 행(row)의 결과만 돌려준다.
+"""
+
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable
+
+import torch
+
+logger = logging.getLogger(__name__)
+
+
+class MicroBatcher:
+    """배치 함수 앞에 놓이는 스레드 기반 마이크로 배칭 큐.
+
+    첫 요청이 도착하면 워커 스레드가 max_wait_ms 동안(또는 max_batch_size개가
+    찰 때까지) 추가 요청을 모은 뒤, 입력 shape이 같은 요청끼리 dim 0으로 이어 붙여
+    batch_fn을 한 번 호출한다. batch_fn 예외는 해당 배치의 모든 호출자에게 전파된다.
+    """
+
+    def __init__(
+        self,
+        batch_fn: Callable[[torch.Tensor], torch.Tensor],
+        max_batch_size: int,
+        max_wait_ms: float,
+        name: str = "micro-batcher",
+    ) -> None:
+        """배치 큐를 생성한다. 워커 스레드는 첫 submit 시점에 시작된다.
+
+        Args:
+            batch_fn: (B, ...) 입력을 받아 (B, ...) 결과를 반환하는 함수.
+            max_batch_size: 한 번에 실행할 최대 요청 수.
+            max_wait_ms: 첫 요청 이후 추가 요청을 기다리는 최대 시간(밀리초).
+            name: 워커 스레드 이름 (로그 식별용).
+        """
+        self._batch_fn = batch_fn
+        self._max_batch_size = max(1, max_batch_size)
+        self._max_wait = max(0.0, max_wait_ms) / 1000.0
+        self._name = name
+        self._queue: queue.Queue[tuple[torch.Tensor, Future]] = queue.Queue()
+        self._worker: threading.Thread | None = None
+        self._start_lock = threading.Lock()
+
+    def submit(self, inputs: torch.Tensor) -> torch.Tensor:
+        """입력을 큐에 넣고 배치 실행 결과 중 자기 몫을 기다려 반환한다.
+
+        Args:
+            inputs: 단일 요청 입력 텐서 (n, ...). 보통 n=1.
+
+        Returns:
+            입력 행 수와 같은 (n, ...) 결과 텐서.
+
+        Raises:
+            Exception: batch_fn 실행 중 발생한 예외.
+        """
+        self._ensure_worker()
+        future: Future = Future()
+        self._queue.put((inputs, future))
+        return future.result()
+
+    def _ensure_worker(self) -> None:
+        if self._worker is not None and self._worker.is_alive():
+            return
+        with self._start_lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(
+                    target=self._run, name=self._name, daemon=True
+                )
+                self._worker.start()
+
+    def _collect(self) -> list[tuple[torch.Tensor, Future]]:
+        """첫 요청을 블로킹으로 받고, 대기 시간 안에 도착한 요청을 더 모은다."""
+        pending = [self._queue.get()]
+        deadline = time.monotonic() + self._max_wait
+        while len(pending) < self._max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                pending.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return pending
+
+    def _run(self) -> None:
+        while True:
+            pending = self._collect()
+            groups: dict[tuple[int, ...], list[tuple[torch.Tensor, Future]]] = {}
+            for inputs, future in pending:
+                groups.setdefault(tuple(inputs.shape[1:]), []).append((inputs, future))
+            for members in groups.values():
+                self._execute(members)
+
+    def _execute(self, members: list[tuple[torch.Tensor, Future]]) -> None:
+        try:
+            outputs = self._batch_fn(torch.cat([inputs for inputs, _ in members]))
+        except Exception as exc:
+            logger.warning(
+                "[%s] 배치 실행 실패 (%d건): %s", self._name, len(members), exc
+            )
+            for _, future in members:
+                future.set_exception(exc)
+            return
+
+        if len(members) > 1:
+            logger.debug("[%s] %d건 배치 실행", self._name, len(members))
+        start = 0
+        for inputs, future in members:
+            end = start + inputs.shape[0]
+            future.set_result(outputs[start:end])
+            start = end
@@ -2,9 +2,14 @@
 
 from __future__ import annotations
 
+import concurrent.futures
 import logging
-from typing import Any
+import threading
+import time
+from typing import Any, Callable
 
+from app.core.config import settings
+from app.core.image_artifact import ImageArtifact
 from app.models.base import VLMProbe
 
 logger = logging.getLogger(__name__)
@@ -21,7 +26,7 @@ class _BLIPProbe(VLMProbe):
     def probe(
         self,
         mission_type: str,
-        image_path: str,
+        image_path: str | ImageArtifact,
         answer: str,
         prompt_bundle: dict[str, Any],
     ) -> dict[str, Any]:
@@ -29,7 +34,7 @@ class _BLIPProbe(VLMProbe):
 
         Args:
             mission_type: 미션 유형 ('location' | 'atmosphere').
-            image_path: 이미지 파일 경로.
+            image_path: 이미지 파일 경로 또는 공유 ImageArtifact.
             answer: 미션 정답 키워드.
             prompt_bundle: 모델별 프롬프트 정보.
 
@@ -42,6 +47,12 @@ class _BLIPProbe(VLMProbe):
             return probe_with_blip_location(image_path, answer, prompt_bundle)
         return probe_with_blip_atmosphere(image_path, answer, prompt_bundle)
 
+    def warmup(self) -> None:
+        """BLIP 모델을 로드하고 더미 VQA를 실행한다."""
+        from app.models.blip import warmup
+
+        warmup()
+
 
 class _QwenProbe(VLMProbe):
     """Qwen-VL 모델 프로브 (OpenRouter 경유)."""
@@ -54,7 +65,7 @@ class _QwenProbe(VLMProbe):
     def probe(
         self,
         mission_type: str,
-        image_path: str,
+        image_path: str | ImageArtifact,
         answer: str,
         prompt_bundle: dict[str, Any],
     ) -> dict[str, Any]:
@@ -62,7 +73,7 @@ class _QwenProbe(VLMProbe):
 
         Args:
             mission_type: 미션 유형.
-            image_path: 이미지 파일 경로.
+            image_path: 이미지 파일 경로 또는 공유 ImageArtifact.
             answer: 미션 정답 키워드.
             prompt_bundle: 모델별 프롬프트 정보.
 
@@ -85,7 +96,7 @@ class _SigLIP2Probe(VLMProbe):
     def probe(
         self,
         mission_type: str,
-        image_path: str,
+        image_path: str | ImageArtifact,
         answer: str,
         prompt_bundle: dict[str, Any],
     ) -> dict[str, Any]:
@@ -93,7 +104,7 @@ class _SigLIP2Probe(VLMProbe):
 
         Args:
             mission_type: 미션 유형.
-            image_path: 이미지 파일 경로.
+            image_path: 이미지 파일 경로 또는 공유 ImageArtifact.
             answer: 미션 정답 키워드.
             prompt_bundle: 모델별 프롬프트 정보.
 
@@ -104,6 +115,86 @@ class _SigLIP2Probe(VLMProbe):
 
         return probe_with_siglip2(mission_type, image_path, answer, prompt_bundle)
 
+    def warmup(self) -> None:
+        """SigLIP2 모델을 로드하고 더미 유사도 추론을 실행한다."""
+        from app.models.siglip2 import warmup
+
+        warmup()
+
+
+class _SigLIP2OnnxProbe(VLMProbe):
+    """SigLIP2 모델 프로브 (비전 타워 ONNX Runtime 실행)."""
+
+    @property
+    def model_name(self) -> str:
+        """모델 식별자를 반환한다."""
+        return "siglip2-onnx"
+
+    def probe(
+        self,
+        mission_type: str,
+        image_path: str | ImageArtifact,
+        answer: str,
+        prompt_bundle: dict[str, Any],
+    ) -> dict[str, Any]:
+        """ONNX Runtime 비전 타워로 이미지-텍스트 유사도를 측정한다.
+
+        Args:
+            mission_type: 미션 유형.
+            image_path: 이미지 파일 경로 또는 공유 ImageArtifact.
+            answer: 미션 정답 키워드.
+            prompt_bundle: 모델별 프롬프트 정보.
+
+        Returns:
+            모델 투표 결과 딕셔너리.
+        """
+        from app.models.siglip2_onnx import probe_with_siglip2_onnx
+
+        return probe_with_siglip2_onnx(mission_type, image_path, answer, prompt_bundle)
+
+    def warmup(self) -> None:
+        """ONNX 세션을 준비(필요 시 내보내기)하고 더미 유사도 추론을 실행한다."""
+        from app.models.siglip2_onnx import warmup
+
+        warmup()
+
+
+class _GalleryProbe(VLMProbe):
+    """참조 사진 갤러리 kNN 랜드마크 프로브 (SigLIP2 이미지 임베딩)."""
+
+    @property
+    def model_name(self) -> str:
+        """모델 식별자를 반환한다."""
+        return "gallery"
+
+    def probe(
+        self,
+        mission_type: str,
+        image_path: str | ImageArtifact,
+        answer: str,
+        prompt_bundle: dict[str, Any],
+    ) -> dict[str, Any]:
+        """제출 사진을 정답 랜드마크 참조 사진과 코사인 kNN으로 비교한다.
+
+        Args:
+            mission_type: 미션 유형 ('location'만 지원).
+            image_path: 이미지 파일 경로 또는 공유 ImageArtifact.
+            answer: 미션 정답 키워드.
+            prompt_bundle: 모델별 프롬프트 정보.
+
+        Returns:
+            모델 투표 결과 딕셔너리.
+        """
+        from app.models.gallery import probe_with_gallery
+
+        return probe_with_gallery(mission_type, image_path, answer, prompt_bundle)
+
+    def warmup(self) -> None:
+        """SigLIP2 모델과 갤러리 인덱스를 로드하고 더미 kNN을 실행한다."""
+        from app.models.gallery import warmup
+
+        warmup()
+
 
 class ModelRegistry:
     """싱글턴 모델 레지스트리: VLMProbe 등록/조회."""
@@ -122,6 +213,13 @@ class ModelRegistry:
         if self._initialized:
             return
         self._probes: dict[str, VLMProbe] = {}
+        # 모델 이름 → {"state", "warmup_ms", "error"} 워밍업 상태
+        self._status: dict[str, dict[str, Any]] = {}
+        self._warmup_targets: list[str] | None = None
+        self._status_lock = threading.Lock()
+        # 모델 이름 → 전용 스레드 풀 (요청 간 재사용, 모델별 동시 실행 한도)
+        self._executors: dict[str, concurrent.futures.ThreadPoolExecutor] = {}
+        self._executor_lock = threading.Lock()
         self._initialized = True
 
     @classmethod
@@ -168,6 +266,127 @@ class ModelRegistry:
         """
         return list(self._probes.keys())
 
+    def submit(
+        self, name: str, fn: Callable[..., Any], *args: Any
+    ) -> concurrent.futures.Future:
+        """모델 전용 스레드 풀에 작업을 제출한다.
+
+        풀은 모델별로 처음 제출할 때 MODEL_CONCURRENCY_LIMITS 크기로 만들어
+        프로세스 수명 동안 재사용한다. 호출자는 결과를 기다리다 포기할 수 있으며,
+        아직 시작하지 않은 작업은 Future.cancel()로 큐에서 빠진다.
+
+        Args:
+            name: 모델 식별자 (동시 실행 한도 조회용).
+            fn: 실행할 함수.
+            *args: fn에 넘길 인자.
+
+        Returns:
+            fn 결과를 갖는 Future.
+        """
+        return self._executor(name.lower().strip()).submit(fn, *args)
+
+    def _executor(self, name: str) -> concurrent.futures.ThreadPoolExecutor:
+        with self._executor_lock:
+            executor = self._executors.get(name)
+            if executor is None:
+                limit = settings.model_concurrency(name)
+                executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=limit, thread_name_prefix=f"model-{name}"
+                )
+                self._executors[name] = executor
+                logger.info("[ModelRegistry] %s 실행 풀 생성 (동시 %d)", name, limit)
+        return executor
+
+    def shutdown(self) -> None:
+        """모델 실행 풀을 모두 종료하고 대기 중인 작업을 취소한다."""
+        with self._executor_lock:
+            executors = list(self._executors.values())
+            self._executors.clear()
+        for executor in executors:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def warmup(self, names: list[str]) -> None:
+        """지정한 모델을 순서대로 로드·워밍업하고 모델별 상태와 소요 시간을 기록한다.
+
+        한 모델이 실패해도 나머지 모델의 워밍업은 계속한다.
+
+        Args:
+            names: 워밍업할 모델 식별자 목록.
+        """
+        for name in self.schedule_warmup(names):
+            self._set_status(name, state="warming")
+            start = time.perf_counter()
+            try:
+                self._warmup_one(name)
+            except Exception as exc:
+                elapsed_ms = (time.perf_counter() - start) * 1000
+                logger.error("[ModelRegistry] %s 워밍업 실패: %s", name, exc)
+                self._set_status(
+                    name,
+                    state="failed",
+                    warmup_ms=round(elapsed_ms, 1),
+                    error=str(exc),
+                )
+                continue
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            logger.info("[ModelRegistry] %s 워밍업 완료 (%.0fms)", name, elapsed_ms)
+            self._set_status(name, state="ready", warmup_ms=round(elapsed_ms, 1))
+
+    def _warmup_one(self, name: str) -> None:
+        """워커 풀이 담당하는 모델은 워커 프로세스를, 나머지는 현재 프로세스를 워밍업한다."""
+        if settings.MODEL_WORKER_POOL_ENABLED:
+            from app.models.worker_pool import get_worker_pool
+
+            pool = get_worker_pool()
+            if pool.handles(name):
+                pool.warmup(name)
+                return
+        self.get(name).warmup()
+
+    def schedule_warmup(self, names: list[str]) -> list[str]:
+        """워밍업 대상을 기록하고 상태를 "pending"으로 초기화한다.
+
+        이후 readiness()는 대상 모델이 모두 "ready"가 될 때까지 준비 전으로 보고한다.
+
+        Args:
+            names: 워밍업할 모델 식별자 목록.
+
+        Returns:
+            정규화된 모델 식별자 목록.
+        """
+        names = [name.lower().strip() for name in names]
+        with self._status_lock:
+            self._warmup_targets = names
+            for name in names:
+                self._status[name] = {"state": "pending"}
+        return names
+
+    def readiness(self) -> dict[str, Any]:
+        """워밍업 대상 모델의 준비 여부와 모델별 상태를 반환한다.
+
+        워밍업을 요청하지 않았다면 모델은 첫 요청 시 지연 로드되므로 준비된 것으로 본다.
+
+        Returns:
+            {"ready": bool, "warmup_enabled": bool, "models": {모델: 상태}}.
+            워밍업 대상이 아닌 등록 모델의 상태는 "cold"이다.
+        """
+        with self._status_lock:
+            targets = self._warmup_targets
+            models = {name: {"state": "cold"} for name in self._probes}
+            models.update({name: dict(status) for name, status in self._status.items()})
+        ready = targets is None or all(
+            models[name]["state"] == "ready" for name in targets
+        )
+        return {
+            "ready": ready,
+            "warmup_enabled": targets is not None,
+            "models": models,
+        }
+
+    def _set_status(self, name: str, **status: Any) -> None:
+        with self._status_lock:
+            self._status[name] = status
+
 
 def register_default_models() -> None:
     """기본 모델 프로브를 레지스트리에 등록한다."""
@@ -175,3 +394,48 @@ def register_default_models() -> None:
     registry.register(_BLIPProbe())
     registry.register(_QwenProbe())
     registry.register(_SigLIP2Probe())
+    registry.register(_SigLIP2OnnxProbe())
+    registry.register(_GalleryProbe())
+
+
+def configured_models() -> list[str]:
+    """현재 설정의 미션별 모델 선택과 앙상블 구성에 등장하는 모델을 반환한다.
+
+    "ensemble"·"cascade"는 모델이 아니라 앙상블 목록을 쓰는 선택 모드이므로 건너뛴다
+    (두 모드의 모델은 이미 앙상블 목록으로 포함된다).
+
+    Returns:
+        중복 없는 모델 식별자 목록 (설정 순서 유지).
+    """
+    names = [*settings.location_ensemble_models, *settings.atmosphere_ensemble_models]
+    for mode in (
+        settings.MODEL_SELECTION_LOCATION,
+        settings.MODEL_SELECTION_ATMOSPHERE,
+    ):
+        mode = mode.lower().strip()
+        if mode and mode not in ("ensemble", "cascade"):
+            names.append(mode)
+    return list(dict.fromkeys(names))
+
+
+def start_background_warmup(names: list[str] | None = None) -> threading.Thread:
+    """모델 워밍업을 데몬 스레드에서 시작한다.
+
+    서버는 바로 요청을 받을 수 있고, 로드 밸런서는 /readyz가 준비 완료를
+    보고할 때까지 트래픽을 보내지 않는다.
+
+    Args:
+        names: 워밍업할 모델 목록. None이면 configured_models() 결과.
+
+    Returns:
+        시작된 워밍업 스레드.
+    """
+    registry = ModelRegistry.get_instance()
+    # 스레드 시작 전에 대상을 기록해 워밍업이 시작되기 전에도 준비 전으로 보고한다.
+    targets = registry.schedule_warmup(configured_models() if names is None else names)
+    thread = threading.Thread(
+        target=registry.warmup, args=(targets,), name="model-warmup", daemon=True
+    )
+    thread.start()
+    logger.info("[ModelRegistry] 백그라운드 워밍업 시작: %s", ", ".join(targets))
+    return thread
@@ -0,0 +1,85 @@
+"""모델 추론 정밀도(fp32 | bf16 | int8) 적용 모듈.
+
+MODEL_PRECISION 설정에 따라 로드 직후의 모델을 변환한다.
+- fp32: 변환 없음 (기본값).
+- bf16: 가중치를 bfloat16으로 변환한다. 입력 텐서도 같은 dtype으로 맞춰야 한다.
+- int8: nn.Linear만 동적 양자화(가중치 int8, 활성값은 추론 시 양자화)한다.
+  입력·출력은 float32 그대로이며 CPU에서만 지원된다.
+"""
+
+from __future__ import annotations
+
+import logging
+
+import torch
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+SUPPORTED_PRECISIONS: tuple[str, ...] = ("fp32", "bf16", "int8")
+
+
+def resolve_precision(device: str, precision: str | None = None) -> str:
+    """설정값을 검증해 실제로 적용할 정밀도를 결정한다.
+
+    알 수 없는 값이거나 GPU에서 int8을 요청하면 경고 후 fp32로 되돌린다.
+
+    Args:
+        device: 모델이 올라간 디바이스 ("cpu" | "cuda").
+        precision: 요청 정밀도. None이면 settings.MODEL_PRECISION을 사용한다.
+
+    Returns:
+        "fp32" | "bf16" | "int8" 중 하나.
+    """
+    requested = (precision or settings.MODEL_PRECISION or "fp32").strip().lower()
+    if requested not in SUPPORTED_PRECISIONS:
+        logger.warning("알 수 없는 MODEL_PRECISION '%s' → fp32 사용", requested)
+        return "fp32"
+    if requested == "int8" and device != "cpu":
+        logger.warning("int8 동적 양자화는 CPU 전용입니다 (%s) → fp32 사용", device)
+        return "fp32"
+    return requested
+
+
+def apply_precision(
+    model: torch.nn.Module, device: str, precision: str | None = None
+) -> torch.nn.Module:
+    """로드된 모델에 정밀도 설정을 적용한다.
+
+    Args:
+        model: from_pretrained로 로드해 device로 옮긴 모델.
+        device: 모델 디바이스.
+        precision: 요청 정밀도. None이면 settings.MODEL_PRECISION을 사용한다.
+
+    Returns:
+        변환된 모델 (fp32이면 입력 모델 그대로).
+    """
+    resolved = resolve_precision(device, precision)
+    if resolved == "bf16":
+        model = model.to(torch.bfloat16)
+    elif resolved == "int8":
+        model = torch.ao.quantization.quantize_dynamic(
+            model, {torch.nn.Linear}, dtype=torch.qint8
+        )
+    if resolved != "fp32":
+        logger.info("모델 정밀도 적용: %s (%s)", resolved, type(model).__name__)
+    return model
+
+
+def input_dtype(model: torch.nn.Module) -> torch.dtype:
+    """모델 입력(pixel_values)에 맞춰야 할 부동소수 dtype을 반환한다.
+
+    int8 동적 양자화 모델은 Conv 등 양자화되지 않은 층이 float32로 남으므로
+    float32를, bf16 모델은 bfloat16을 반환한다.
+
+    Args:
+        model: apply_precision을 거친 모델.
+
+    Returns:
+        첫 번째 부동소수 파라미터의 dtype (없으면 float32).
+    """
+    for parameter in model.parameters():
+        if parameter.is_floating_point():
+            return parameter.dtype
+    return torch.float32
@@ -51,6 +51,22 @@ def _to_english(answer: str, mission_type: str) -> str:
     return ATMOSPHERE_EN.get(answer, answer)
 
 
+def siglip2_vocabulary(mission_type: str) -> dict[str, str]:
+    """미션 유형의 전체 정답 어휘를 SigLIP2 후보 문장으로 변환한다.
+
+    정답 후보 문장과 같은 형식을 써서 텍스트 임베딩 캐시를 공유한다.
+
+    Args:
+        mission_type: 미션 유형 ('location' | 'atmosphere').
+
+    Returns:
+        한국어 정답 이름 → SigLIP2 후보 문장.
+    """
+    if mission_type == "location":
+        return {name: f"a photo of {en}" for name, en in LANDMARK_EN.items()}
+    return {name: f"a photo with {en} atmosphere" for name, en in ATMOSPHERE_EN.items()}
+
+
 def build_prompt_bundle(mission_type: str, answer: str | None = None) -> dict[str, Any]:
     """미션 유형과 정답 기반으로 프롬프트 번들을 생성한다.
 
@@ -78,6 +94,7 @@ def build_prompt_bundle(mission_type: str, answer: str | None = None) -> dict[st
                 f"a photo of {answer_en}",
                 "a photo of a different place",
             ],
+            "siglip2_vocabulary": siglip2_vocabulary(mission_type),
         }
 
     return {
@@ -93,4 +110,5 @@ def build_prompt_bundle(mission_type: str, answer: str | None = None) -> dict[st
             f"a photo with {answer_en} atmosphere",
             "a photo with a different atmosphere",
         ],
+        "siglip2_vocabulary": siglip2_vocabulary(mission_type),
     }
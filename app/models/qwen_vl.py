@@ -1,39 +1,141 @@
 """Qwen-VL 모델 스텁 (OpenRouter 연동).
 
 OpenRouter 플랫폼을 통해 Qwen 멀티모달 모델을 호출한다.
+ChatOpenAI 클라이언트는 모델 ID·설정별로 한 번만 만들어 keep-alive 연결 풀과 함께
+재사용하므로, evaluator와 QwenFallbackJudge의 호출이 TLS 연결을 공유한다.
 """
 
 from __future__ import annotations
 
 import base64
+import io
 import json
 import logging
+import threading
 from typing import Any
 
+import httpx
 from langchain_core.messages import HumanMessage
 from langchain_openai import ChatOpenAI
+from PIL import Image, ImageOps
 
 from app.core.config import settings
+from app.core.image_artifact import ImageArtifact
 
 logger = logging.getLogger(__name__)
 
+OPENROUTER_BASE_URL = "https://openrouter.ai/api/v1"
 
-def _encode_image_base64(image_path: str) -> str:
-    """이미지 파일을 Base64 인코딩 문자열로 변환한다.
+# (모델 ID, API 키, timeout, 재시도 수, 연결 수, keep-alive) → 공유 클라이언트
+_clients: dict[tuple[Any, ...], ChatOpenAI] = {}
+_clients_lock = threading.Lock()
+
+
+def get_qwen_client() -> ChatOpenAI:
+    """현재 설정에 맞는 공유 Qwen-VL 클라이언트를 반환한다.
+
+    처음 호출 시 keep-alive 연결 풀을 가진 httpx.Client와 함께 생성하고,
+    같은 설정이면 이후 호출은 같은 인스턴스를 재사용한다.
+
+    Returns:
+        OpenRouter Qwen-VL ChatOpenAI 인스턴스.
+    """
+    max_connections = settings.model_concurrency("qwen")
+    key = (
+        settings.QWEN_VL_MODEL_ID or "qwen/qwen3-vl-8b-instruct",
+        settings.OPENROUTER_API_KEY,
+        settings.API_TIMEOUT_SECONDS,
+        settings.API_MAX_RETRIES,
+        max_connections,
+        settings.QWEN_HTTP_KEEPALIVE_SECONDS,
+    )
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            model_id, api_key, timeout, max_retries, _, keepalive = key
+            http_client = httpx.Client(
+                timeout=timeout,
+                limits=httpx.Limits(
+                    max_connections=max_connections,
+                    max_keepalive_connections=max_connections,
+                    keepalive_expiry=keepalive,
+                ),
+            )
+            client = ChatOpenAI(
+                api_key=api_key,
+                base_url=OPENROUTER_BASE_URL,
+                model=model_id,
+                temperature=0.1,
+                max_tokens=300,
+                timeout=timeout,
+                max_retries=max_retries,
+                http_client=http_client,
+            )
+            _clients[key] = client
+            logger.info(
+                "[Qwen-VL] 클라이언트 생성: %s (연결 풀 %d)", model_id, max_connections
+            )
+    return client
+
+
+def clear_client_cache() -> None:
+    """공유 클라이언트를 모두 닫고 캐시를 비운다 (설정 변경·테스트용)."""
+    with _clients_lock:
+        for client in _clients.values():
+            http_client = getattr(client, "http_client", None)
+            if isinstance(http_client, httpx.Client):
+                http_client.close()
+        _clients.clear()
+
+
+def _encode_image_base64(image_path: str | ImageArtifact) -> str:
+    """Qwen-VL 전송용 JPEG Base64 문자열을 만든다.
+
+    원본(HEIC·PNG 등)을 한 번 디코드해 긴 변을 QWEN_IMAGE_MAX_SIDE 이하로 줄이고
+    QWEN_IMAGE_JPEG_QUALITY로 재인코딩한다. 공유 ImageArtifact를 받으면 디코드 결과와
+    인코딩 결과를 아티팩트에 캐시해 재사용한다.
 
     Args:
-        image_path: 인코딩할 이미지 파일 경로.
+        image_path: 인코딩할 이미지 파일 경로 또는 공유 ImageArtifact.
 
     Returns:
-        Base64 인코딩된 문자열.
+        Base64 인코딩된 JPEG 문자열.
+
+    Raises:
+        OSError: 파일을 읽을 수 없거나 이미지로 디코드할 수 없는 경우.
     """
-    with open(image_path, "rb") as image_file:
-        return base64.b64encode(image_file.read()).decode("utf-8")
+    artifact = ImageArtifact.resolve(image_path)
+    max_side = settings.QWEN_IMAGE_MAX_SIDE
+    quality = settings.QWEN_IMAGE_JPEG_QUALITY
+    return artifact.cached(
+        f"qwen.jpeg_base64.{max_side}.{quality}",
+        lambda: base64.b64encode(_to_jpeg(artifact.rgb, max_side, quality)).decode(
+            "utf-8"
+        ),
+    )
+
+
+def _to_jpeg(image: Image.Image, max_side: int, quality: int) -> bytes:
+    """긴 변을 max_side 이하로 줄인 JPEG 바이트를 반환한다 (원본 이미지는 변경하지 않는다).
+
+    재인코딩하면 EXIF가 빠지므로 회전 정보는 픽셀에 먼저 반영한다.
+    """
+    image = ImageOps.exif_transpose(image)
+    longest = max(image.size)
+    if 0 < max_side < longest:
+        scale = max_side / longest
+        image = image.resize(
+            (max(1, round(image.width * scale)), max(1, round(image.height * scale))),
+            Image.Resampling.LANCZOS,
+        )
+    buffer = io.BytesIO()
+    image.save(buffer, format="JPEG", quality=quality)
+    return buffer.getvalue()
 
 
 def probe_with_qwen(
     mission_type: str,
-    image_path: str,
+    image_path: str | ImageArtifact,
     answer: str,
     prompt_bundle: dict[str, Any],
 ) -> dict[str, Any]:
@@ -41,7 +143,7 @@ def probe_with_qwen(
 
     Args:
         mission_type: 미션 유형 ('location' | 'atmosphere').
-        image_path: 분석할 이미지 파일 경로.
+        image_path: 분석할 이미지 파일 경로 또는 공유 ImageArtifact.
         answer: 미션 정답 키워드.
         prompt_bundle: 모델별 프롬프트 정보 딕셔너리.
 
@@ -54,6 +156,7 @@ def probe_with_qwen(
             "score": 0.0,
             "label": "fail",
             "reason": "OPENROUTER_API_KEY가 설정되지 않아 Qwen-VL 호출을 건너뜁니다.",
+            "failed": True,
         }
 
     try:
@@ -62,15 +165,7 @@ def probe_with_qwen(
             settings.API_TIMEOUT_SECONDS,
             settings.API_MAX_RETRIES,
         )
-        llm = ChatOpenAI(
-            api_key=settings.OPENROUTER_API_KEY,
-            base_url="https://openrouter.ai/api/v1",
-            model=settings.QWEN_VL_MODEL_ID or "qwen/qwen3-vl-8b-instruct",
-            temperature=0.1,
-            max_tokens=300,
-            timeout=settings.API_TIMEOUT_SECONDS,
-            max_retries=settings.API_MAX_RETRIES,
-        )
+        llm = get_qwen_client()
 
         base64_image = _encode_image_base64(image_path)
         qwen_prompt = prompt_bundle.get(
@@ -116,4 +211,5 @@ def probe_with_qwen(
             "score": 0.0,
             "label": "fail",
             "reason": f"OpenRouter API 호출 또는 파싱 오류: {exc}",
+            "failed": True,
         }
@@ -1,18 +1,25 @@
 """SigLIP2 모델 프로브 모듈.
 
 실제 HuggingFace SigLIP2 모델 가중치를 로드하여 이미지-텍스트 유사도를 추론한다.
+후보 텍스트 임베딩은 (모델 ID, 문자열) 단위로 캐시하고, 제출마다 비전 타워만 실행한다.
 """
 
 from __future__ import annotations
 
 import logging
-from typing import Any
+import threading
+from typing import Any, Callable
 
+import numpy as np
 import torch
 from PIL import Image
 from transformers import AutoImageProcessor, AutoModel, GemmaTokenizerFast
 
 from app.core.config import settings
+from app.core.image_artifact import ImageArtifact
+from app.models import embedding_store
+from app.models.micro_batcher import MicroBatcher
+from app.models.precision import apply_precision, input_dtype, resolve_precision
 
 logger = logging.getLogger(__name__)
 
@@ -23,63 +30,291 @@ MODEL_NAME: str = settings.SIGLIP2_MODEL_ID
 _image_processor = None
 _tokenizer = None
 _model = None
+# 비전 타워 입력 dtype (MODEL_PRECISION=bf16이면 bfloat16)
+_input_dtype: torch.dtype = torch.float32
 
+# 워밍업 더미 추론에 사용하는 후보 텍스트
+WARMUP_TEXT: str = "a photo"
 
-def _load_siglip2() -> None:
+# ── 텍스트 임베딩 캐시 ─────────────────────────────────────────────────────
+# (모델 ID, 후보 문자열) → L2 정규화된 텍스트 임베딩 (D,)
+# 정답은 하루 단위로만 바뀌므로 텍스트 타워는 후보당 1회만 실행한다.
+_text_embedding_cache: dict[tuple[str, str], torch.Tensor] = {}
+_text_cache_lock = threading.Lock()
+
+# ── 비전 타워 마이크로 배칭 ────────────────────────────────────────────────
+# SIGLIP2_MICRO_BATCH_ENABLED일 때 동시 요청의 이미지를 모아 한 번에 실행한다.
+_vision_batcher: MicroBatcher | None = None
+_vision_batcher_lock = threading.Lock()
+
+
+def _load_siglip2(vision: bool = True) -> None:
     """SigLIP2 기반 모델과 프로세서를 지연(lazy) 로드한다.
 
+    Args:
+        vision: False면 로드 직후 PyTorch 비전 타워를 해제한다
+            (비전 타워를 ONNX Runtime으로 실행하는 백엔드용).
+            이미 해제된 상태에서 True로 호출되면 모델 전체를 다시 로드한다.
+
     Raises:
         Exception: 모델 로드 실패 시 예외를 그대로 전파한다.
     """
-    global _image_processor, _tokenizer, _model
-    if _model is None:
-        logger.info("SigLIP2 모델 로딩 중: '%s' on %s...", MODEL_NAME, DEVICE)
-        try:
-            _image_processor = AutoImageProcessor.from_pretrained(MODEL_NAME)
-            _tokenizer = GemmaTokenizerFast.from_pretrained(MODEL_NAME)
-            _model = AutoModel.from_pretrained(MODEL_NAME).to(DEVICE)
-            _model.eval()
-            logger.info("SigLIP2 모델 로드 완료.")
-        except Exception as exc:
-            logger.error("SigLIP2 모델 로드 중 오류 발생: %s", exc)
-            raise
+    global _image_processor, _tokenizer, _model, _input_dtype
+    if _model is not None and (not vision or _model.vision_model is not None):
+        return
+    logger.info("SigLIP2 모델 로딩 중: '%s' on %s...", MODEL_NAME, DEVICE)
+    try:
+        _image_processor = AutoImageProcessor.from_pretrained(MODEL_NAME)
+        _tokenizer = GemmaTokenizerFast.from_pretrained(MODEL_NAME)
+        model = AutoModel.from_pretrained(MODEL_NAME).eval()
+        if not vision:
+            model.vision_model = None
+        _model = apply_precision(model.to(DEVICE), DEVICE)
+        _input_dtype = input_dtype(_model)
+        logger.info("SigLIP2 모델 로드 완료%s.", "" if vision else " (텍스트 타워만)")
+    except Exception as exc:
+        logger.error("SigLIP2 모델 로드 중 오류 발생: %s", exc)
+        raise
 
 
-def probe_with_siglip2(
+def _encode_text(candidates: list[str]) -> torch.Tensor:
+    """후보 텍스트의 정규화 임베딩을 캐시에서 조회하고, 없는 항목만 계산해 채운다.
+
+    Args:
+        candidates: 임베딩할 후보 텍스트 목록.
+
+    Returns:
+        (len(candidates), D) 형태의 정규화된 float32 텍스트 임베딩 텐서.
+    """
+    missing = [
+        text
+        for text in dict.fromkeys(candidates)
+        if (MODEL_NAME, text) not in _text_embedding_cache
+    ]
+    if missing:
+        input_ids = _tokenizer(
+            missing, return_tensors="pt", padding="max_length", max_length=64
+        )["input_ids"].to(DEVICE)
+        with torch.no_grad():
+            text_embeds = _model.text_model(input_ids=input_ids).pooler_output.float()
+        text_embeds = text_embeds / text_embeds.norm(p=2, dim=-1, keepdim=True)
+        with _text_cache_lock:
+            for text, embed in zip(missing, text_embeds):
+                _text_embedding_cache[(MODEL_NAME, text)] = embed
+        logger.debug("SigLIP2 텍스트 임베딩 캐시 추가: %d개", len(missing))
+
+    return torch.stack([_text_embedding_cache[(MODEL_NAME, c)] for c in candidates])
+
+
+def _encode_image(pixel_values: torch.Tensor) -> torch.Tensor:
+    """비전 타워만 실행해 정규화된 이미지 임베딩을 반환한다.
+
+    Args:
+        pixel_values: 전처리된 이미지 텐서 (B, C, H, W).
+
+    Returns:
+        (B, D) 형태의 정규화된 float32 이미지 임베딩 텐서.
+    """
+    with torch.no_grad():
+        image_embeds = _model.vision_model(
+            pixel_values=pixel_values
+        ).pooler_output.float()
+    return image_embeds / image_embeds.norm(p=2, dim=-1, keepdim=True)
+
+
+def _get_vision_batcher() -> MicroBatcher:
+    """비전 타워용 MicroBatcher를 설정값으로 지연 생성한다."""
+    global _vision_batcher
+    if _vision_batcher is None:
+        with _vision_batcher_lock:
+            if _vision_batcher is None:
+                _vision_batcher = MicroBatcher(
+                    _encode_image,
+                    max_batch_size=settings.SIGLIP2_MICRO_BATCH_MAX_SIZE,
+                    max_wait_ms=settings.SIGLIP2_MICRO_BATCH_WAIT_MS,
+                    name="siglip2-vision",
+                )
+    return _vision_batcher
+
+
+def _embed_image(pixel_values: torch.Tensor) -> torch.Tensor:
+    """설정에 따라 비전 타워를 직접 실행하거나 마이크로 배칭 큐를 거쳐 실행한다.
+
+    Args:
+        pixel_values: 전처리된 이미지 텐서 (1, C, H, W).
+
+    Returns:
+        (1, D) 형태의 정규화된 이미지 임베딩 텐서.
+    """
+    if not settings.SIGLIP2_MICRO_BATCH_ENABLED:
+        return _encode_image(pixel_values)
+    return _get_vision_batcher().submit(pixel_values)
+
+
+def _similarity_logits(
+    image_embeds: torch.Tensor, text_embeds: torch.Tensor
+) -> torch.Tensor:
+    """SigLIP2 forward와 동일한 방식으로 이미지-텍스트 logit을 계산한다.
+
+    Args:
+        image_embeds: 정규화된 이미지 임베딩 (B, D).
+        text_embeds: 정규화된 텍스트 임베딩 (N, D).
+
+    Returns:
+        (B, N) 형태의 logits_per_image 텐서.
+    """
+    logits = image_embeds @ text_embeds.t().to(image_embeds.device)
+    return logits * _model.logit_scale.exp() + _model.logit_bias
+
+
+def prime_text_cache(candidates: list[str]) -> None:
+    """정답 교체 시점에 후보 텍스트 임베딩을 미리 계산해 둔다.
+
+    모델이 아직 로드되지 않았다면 아무 작업도 하지 않는다
+    (첫 제출 시 지연 로드와 함께 캐시가 채워진다).
+
+    Args:
+        candidates: 캐시에 올릴 후보 텍스트 목록.
+    """
+    if _model is None or not candidates:
+        return
+    try:
+        _encode_text(candidates)
+        logger.info("SigLIP2 텍스트 임베딩 캐시 갱신 완료 (%d개)", len(candidates))
+    except Exception as exc:
+        logger.warning("SigLIP2 텍스트 임베딩 캐시 갱신 실패: %s", exc)
+
+
+def clear_text_cache() -> None:
+    """텍스트 임베딩 캐시를 비운다."""
+    with _text_cache_lock:
+        _text_embedding_cache.clear()
+
+
+def warmup() -> None:
+    """모델을 로드하고 더미 이미지·텍스트로 추론 경로를 한 번 실행한다.
+
+    첫 제출이 from_pretrained와 첫 추론 초기화 비용을 떠안지 않도록
+    서버 시작 시 호출한다.
+
+    Raises:
+        Exception: 모델 로드 또는 더미 추론 실패 시.
+    """
+    _load_siglip2()
+    pixel_values = _image_processor(
+        images=Image.new("RGB", (64, 64)), return_tensors="pt"
+    )["pixel_values"].to(DEVICE, dtype=_input_dtype)
+    with torch.no_grad():
+        _similarity_logits(_embed_image(pixel_values), _encode_text([WARMUP_TEXT]))
+
+
+def _pixel_values(image: ImageArtifact) -> torch.Tensor:
+    """SigLIP2 전처리 텐서를 아티팩트에 캐시한다."""
+    return image.cached(
+        "siglip2.pixel_values",
+        lambda: _image_processor(images=image.rgb, return_tensors="pt")[
+            "pixel_values"
+        ].to(DEVICE, dtype=_input_dtype),
+    )
+
+
+def _image_embeds(image: ImageArtifact) -> torch.Tensor:
+    """PyTorch 비전 타워로 아티팩트의 정규화 이미지 임베딩을 계산한다."""
+    return _embed_image(_pixel_values(image))
+
+
+def image_embedding(image: ImageArtifact) -> torch.Tensor:
+    """아티팩트의 PyTorch 이미지 임베딩을 캐시해 같은 요청의 프로브끼리 공유한다.
+
+    Args:
+        image: 요청의 공유 ImageArtifact.
+
+    Returns:
+        (1, D) 형태의 정규화된 이미지 임베딩 텐서.
+    """
+    return image.cached("siglip2.image_embeds", lambda: _stored_image_embeds(image))
+
+
+def embedding_store_key() -> str:
+    """PyTorch 비전 타워 임베딩의 저장소 키 (모델 ID·백엔드·적용 정밀도).
+
+    MODEL_PRECISION을 바꾸면 다른 저장소를 써서, 이전 정밀도로 계산한 벡터를 재사용하지
+    않는다.
+    """
+    return f"{MODEL_NAME}/torch-{resolve_precision(DEVICE)}"
+
+
+def _stored_image_embeds(image: ImageArtifact) -> torch.Tensor:
+    """임베딩 저장소에 같은 사진(SHA-256)의 벡터가 있으면 재사용하고, 없으면 계산해 쌓는다.
+
+    저장소 입출력 실패는 추론을 막지 않고 비전 타워 결과를 그대로 쓴다.
+    """
+    store = embedding_store.get_embedding_store(embedding_store_key())
+    if store is None:
+        return _image_embeds(image)
+    try:
+        stored = store.get(image.sha256)
+    except OSError as exc:
+        logger.warning("SigLIP2 임베딩 저장소 조회 실패: %s", exc)
+        stored = None
+    if stored is not None:
+        return torch.from_numpy(np.asarray(stored, dtype=np.float32)).unsqueeze(0)
+    image_embeds = _image_embeds(image)
+    try:
+        store.put(image.sha256, image_embeds[0].float().cpu().numpy())
+    except (OSError, ValueError) as exc:
+        logger.warning("SigLIP2 임베딩 저장 실패: %s", exc)
+    return image_embeds
+
+
+def run_probe(
+    model: str,
+    load: Callable[[], None],
+    embed_image: Callable[[ImageArtifact], torch.Tensor],
     mission_type: str,
-    image_path: str,
+    image_path: str | ImageArtifact,
     answer: str,
     prompt_bundle: dict[str, Any],
 ) -> dict[str, Any]:
-    """SigLIP2 모델로 이미지-텍스트 유사도를 측정한다.
+    """비전 타워 구현과 무관한 SigLIP2 프로브 공통 흐름을 실행한다.
+
+    텍스트 임베딩 캐시·logit 계산·판정은 공유하고, 이미지 임베딩 계산만
+    백엔드(PyTorch | ONNX Runtime)별로 주입받는다.
 
     Args:
+        model: 투표 결과에 기록할 모델 식별자.
+        load: 백엔드 모델을 지연 로드하는 함수.
+        embed_image: 아티팩트 → (1, D) 정규화 이미지 임베딩 함수.
         mission_type: 미션 유형 ('location' | 'atmosphere' 등).
-        image_path: 이미지 파일 경로.
+        image_path: 이미지 파일 경로 또는 공유 ImageArtifact.
         answer: 미션 정답 키워드 (목표).
-        prompt_bundle: 프롬프트 번들 (siglip2_candidates 포함).
+        prompt_bundle: 프롬프트 번들 (siglip2_candidates, 선택적으로 siglip2_vocabulary).
 
     Returns:
-        모델 투표 결과 딕셔너리 (model, score, label, reason).
+        모델 투표 결과 딕셔너리 (model, score, label, reason). 번들에
+        siglip2_vocabulary가 있으면 어휘 이름(한국어) → 확률(softmax) 맵 scores를 더한다.
     """
     try:
-        _load_siglip2()
+        load()
     except Exception as exc:
         return {
-            "model": "siglip2",
+            "model": model,
             "score": 0.0,
             "label": "mismatch",
             "reason": f"Model load failed: {exc}",
+            "failed": True,
         }
 
+    image = ImageArtifact.resolve(image_path)
     try:
-        raw_image = Image.open(image_path).convert("RGB")
+        image.decode()
     except Exception as exc:
         return {
-            "model": "siglip2",
+            "model": model,
             "score": 0.0,
             "label": "mismatch",
             "reason": f"Image load failed: {str(exc)}",
+            "failed": True,
         }
 
     candidates = prompt_bundle.get("siglip2_candidates")
@@ -91,31 +326,40 @@ def probe_with_siglip2(
         candidates = [target_text]
 
     target_text = candidates[0]
+    # 판정 후보 뒤에 전체 어휘 문장을 붙여 이미지 1회·행렬곱 1회로 함께 점수화한다.
+    vocabulary: dict[str, str] = prompt_bundle.get("siglip2_vocabulary") or {}
+    texts = list(dict.fromkeys([*candidates, *vocabulary.values()]))
+    scores: dict[str, float] | None = None
 
     try:
-        pixel_values = _image_processor(images=raw_image, return_tensors="pt")[
-            "pixel_values"
-        ].to(DEVICE)
-        input_ids = _tokenizer(
-            candidates, return_tensors="pt", padding="max_length", max_length=64
-        )["input_ids"].to(DEVICE)
-
-        with torch.no_grad():
-            outputs = _model(input_ids=input_ids, pixel_values=pixel_values)
+        # 텍스트 임베딩은 캐시에서 재사용하고, 요청마다 비전 타워만 실행한다.
+        text_embeds = _encode_text(texts)
+        image_embeds = embed_image(image)
 
         # SigLIP 특성상 softmax 대신 독립적인 sigmoid 함수가 사용됨
         # 하지만 후보군(candidates) 간의 상대적 확률을 위해 softmax 적용 시도
-        logits_per_image = outputs.logits_per_image  # shape: (1, 2)
-        probs = torch.softmax(logits_per_image, dim=-1)  # shape: (1, 2)
+        with torch.no_grad():
+            logits_per_image = _similarity_logits(image_embeds, text_embeds)
+        probs = torch.softmax(
+            logits_per_image[:, : len(candidates)], dim=-1
+        )  # shape: (1, 2)
 
         score = float(probs[0][0].cpu().numpy())
+        if vocabulary:
+            columns = [texts.index(text) for text in vocabulary.values()]
+            vocabulary_probs = torch.softmax(logits_per_image[0, columns], dim=-1)
+            scores = {
+                name: float(prob)
+                for name, prob in zip(vocabulary, vocabulary_probs.tolist())
+            }
     except Exception as exc:
-        logger.error("[SigLIP2 Inference Error] %s", exc, exc_info=True)
+        logger.error("[%s Inference Error] %s", model, exc, exc_info=True)
         return {
-            "model": "siglip2",
+            "model": model,
             "score": 0.0,
             "label": "mismatch",
             "reason": f"Inference failed: {exc}",
+            "failed": True,
         }
 
     pass_threshold = (
@@ -125,9 +369,40 @@ def probe_with_siglip2(
     )
     label = "match" if score >= pass_threshold else "mismatch"
 
-    return {
-        "model": "siglip2",
+    vote = {
+        "model": model,
         "score": score,
         "label": label,
         "reason": f"SigLIP2 prediction score for '{target_text}'",
     }
+    if scores is not None:
+        vote["scores"] = scores
+    return vote
+
+
+def probe_with_siglip2(
+    mission_type: str,
+    image_path: str | ImageArtifact,
+    answer: str,
+    prompt_bundle: dict[str, Any],
+) -> dict[str, Any]:
+    """SigLIP2 모델로 이미지-텍스트 유사도를 측정한다.
+
+    Args:
+        mission_type: 미션 유형 ('location' | 'atmosphere' 등).
+        image_path: 이미지 파일 경로 또는 공유 ImageArtifact.
+        answer: 미션 정답 키워드 (목표).
+        prompt_bundle: 프롬프트 번들 (siglip2_candidates 포함).
+
+    Returns:
+        모델 투표 결과 딕셔너리 (model, score, label, reason).
+    """
+    return run_probe(
+        "siglip2",
+        _load_siglip2,
+        image_embedding,
+        mission_type,
+        image_path,
+        answer,
+        prompt_bundle,
+    )
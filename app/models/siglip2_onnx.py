@@ -0,0 +1,192 @@
+"""SigLIP2 비전 타워의 ONNX Runtime 백엔드.
+
+비전 타워를 한 번 ONNX로 내보내 data/model_cache/ 아래에 캐시하고,
+이후에는 ONNX Runtime CPU 실행 공급자로 이미지 임베딩을 계산한다.
+텍스트 임베딩 캐시·logit 계산·판정은 app.models.siglip2와 공유하므로
+점수는 PyTorch 프로브와 같은 기준으로 비교된다.
+
+onnxruntime은 선택 의존성이다 (pip install ".[onnx]").
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from typing import Any
+
+import numpy as np
+import torch
+from PIL import Image
+
+from app.core.config import settings
+from app.core.image_artifact import ImageArtifact
+from app.models import siglip2
+
+logger = logging.getLogger(__name__)
+
+# ONNX 그래프 opset (SigLIP2 attention·GELU 연산 지원 버전)
+ONNX_OPSET: int = 17
+
+_session = None
+_session_lock = threading.Lock()
+
+
+class _PooledVisionTower(torch.nn.Module):
+    """pixel_values → pooler_output만 반환하도록 비전 타워를 감싼 내보내기용 모듈."""
+
+    def __init__(self, vision_model: torch.nn.Module) -> None:
+        super().__init__()
+        self.vision_model = vision_model
+
+    def forward(self, pixel_values: torch.Tensor) -> torch.Tensor:
+        return self.vision_model(pixel_values=pixel_values).pooler_output
+
+
+def onnx_path() -> str:
+    """현재 SIGLIP2_MODEL_ID에 대응하는 ONNX 파일 경로를 반환한다."""
+    file_name = siglip2.MODEL_NAME.replace("/", "--") + "-vision.onnx"
+    return os.path.join(settings.MODEL_CACHE_DIR, file_name)
+
+
+def export_vision_tower(path: str) -> None:
+    """float32 비전 타워를 배치 차원이 동적인 ONNX 그래프로 내보낸다.
+
+    MODEL_PRECISION과 무관하게 원본 가중치를 새로 읽어 float32로 내보내고,
+    내보내기가 끝나면 이 사본은 바로 해제된다.
+    내보내기 중 중단돼도 깨진 파일이 남지 않도록 임시 파일에 쓴 뒤 교체한다.
+
+    Args:
+        path: 저장할 .onnx 파일 경로.
+    """
+    from transformers import AutoModel
+
+    logger.info("SigLIP2 비전 타워 ONNX 내보내기: '%s'", path)
+    vision_model = AutoModel.from_pretrained(siglip2.MODEL_NAME).vision_model.eval()
+    image_size = vision_model.config.image_size
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with torch.no_grad():
+        torch.onnx.export(
+            _PooledVisionTower(vision_model),
+            (torch.zeros(1, 3, image_size, image_size),),
+            tmp_path,
+            input_names=["pixel_values"],
+            output_names=["image_embeds"],
+            dynamic_axes={"pixel_values": {0: "batch"}, "image_embeds": {0: "batch"}},
+            opset_version=ONNX_OPSET,
+            dynamo=False,
+        )
+    os.replace(tmp_path, path)
+
+
+def _create_session(path: str) -> Any:
+    """그래프 최적화·스레드 설정을 적용한 CPU InferenceSession을 생성한다."""
+    import onnxruntime as ort
+
+    options = ort.SessionOptions()
+    options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    options.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+    # 요청 간 병렬성은 evaluator 스레드가 담당하므로 연산 간 병렬은 끈다.
+    options.inter_op_num_threads = 1
+    if settings.SIGLIP2_ONNX_INTRA_OP_THREADS > 0:
+        options.intra_op_num_threads = settings.SIGLIP2_ONNX_INTRA_OP_THREADS
+    return ort.InferenceSession(
+        path, sess_options=options, providers=["CPUExecutionProvider"]
+    )
+
+
+def _load_siglip2_onnx() -> None:
+    """텍스트 타워(PyTorch)와 ONNX 비전 세션을 지연 로드한다.
+
+    ONNX 파일이 없으면 먼저 내보낸다. 내보내기용 사본을 해제한 뒤 텍스트 타워를
+    로드하므로 PyTorch 가중치 사본이 동시에 두 벌 올라가지 않으며,
+    PyTorch 비전 타워는 메모리에 남기지 않는다.
+
+    Raises:
+        ImportError: onnxruntime이 설치되지 않은 경우.
+        Exception: 모델 로드·내보내기 실패 시.
+    """
+    global _session
+    if _session is not None:
+        return
+    import onnxruntime  # noqa: F401  # 선택 의존성 확인을 내보내기보다 먼저 한다.
+
+    with _session_lock:
+        if _session is not None:
+            return
+        path = onnx_path()
+        if not os.path.exists(path):
+            export_vision_tower(path)
+        siglip2._load_siglip2(vision=False)
+        _session = _create_session(path)
+        logger.info("SigLIP2 ONNX 세션 로드 완료: '%s'", path)
+
+
+def _encode_image(pixel_values: np.ndarray) -> torch.Tensor:
+    """ONNX 세션으로 비전 타워를 실행해 정규화된 이미지 임베딩을 반환한다.
+
+    Args:
+        pixel_values: float32 전처리 배열 (B, C, H, W).
+
+    Returns:
+        (B, D) 형태의 정규화된 float32 이미지 임베딩 텐서.
+    """
+    (pooled,) = _session.run(["image_embeds"], {"pixel_values": pixel_values})
+    image_embeds = torch.from_numpy(pooled)
+    return image_embeds / image_embeds.norm(p=2, dim=-1, keepdim=True)
+
+
+def _image_embeds(image: ImageArtifact) -> torch.Tensor:
+    """아티팩트의 ONNX용 전처리 배열을 캐시하고 이미지 임베딩을 계산한다."""
+    pixel_values = image.cached(
+        "siglip2_onnx.pixel_values",
+        lambda: siglip2._image_processor(images=image.rgb, return_tensors="np")[
+            "pixel_values"
+        ].astype(np.float32),
+    )
+    return _encode_image(pixel_values)
+
+
+def warmup() -> None:
+    """ONNX 세션을 준비하고 더미 이미지·텍스트로 추론 경로를 한 번 실행한다.
+
+    Raises:
+        Exception: 모델 로드·내보내기 또는 더미 추론 실패 시.
+    """
+    _load_siglip2_onnx()
+    pixel_values = siglip2._image_processor(
+        images=Image.new("RGB", (64, 64)), return_tensors="np"
+    )["pixel_values"].astype(np.float32)
+    with torch.no_grad():
+        siglip2._similarity_logits(
+            _encode_image(pixel_values), siglip2._encode_text([siglip2.WARMUP_TEXT])
+        )
+
+
+def probe_with_siglip2_onnx(
+    mission_type: str,
+    image_path: str | ImageArtifact,
+    answer: str,
+    prompt_bundle: dict[str, Any],
+) -> dict[str, Any]:
+    """ONNX Runtime 비전 타워로 SigLIP2 이미지-텍스트 유사도를 측정한다.
+
+    Args:
+        mission_type: 미션 유형 ('location' | 'atmosphere' 등).
+        image_path: 이미지 파일 경로 또는 공유 ImageArtifact.
+        answer: 미션 정답 키워드 (목표).
+        prompt_bundle: 프롬프트 번들 (siglip2_candidates 포함).
+
+    Returns:
+        모델 투표 결과 딕셔너리 (model, score, label, reason).
+    """
+    return siglip2.run_probe(
+        "siglip2-onnx",
+        _load_siglip2_onnx,
+        _image_embeds,
+        mission_type,
+        image_path,
+        answer,
+        prompt_bundle,
+    )
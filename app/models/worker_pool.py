@@ -0,0 +1,237 @@
+"""모델 전용 워커 프로세스 풀.
+
+evaluator의 스레드들은 한 인터프리터에서 GIL과 torch intra-op 스레드를 두고 경쟁한다.
+MODEL_WORKER_POOL_ENABLED이면 모델마다 별도 ProcessPoolExecutor를 두고,
+각 워커 프로세스는 모델 하나만 로드해 고정(pin)한 채 자기 몫의 torch 스레드만 쓴다.
+이미지 원본 바이트는 요청당 한 번 공유 메모리에 올리고 워커에는 블록 이름만 보낸다.
+"""
+
+from __future__ import annotations
+
+import atexit
+import concurrent.futures
+import logging
+import multiprocessing
+import os
+import threading
+from multiprocessing import shared_memory
+from typing import Any
+
+from app.core.config import settings
+from app.core.image_artifact import ImageArtifact
+
+logger = logging.getLogger(__name__)
+
+# 워커 프로세스가 고정한 모델 식별자와 워밍업 실패 사유 (워커 프로세스 안에서만 설정된다)
+_worker_model: str | None = None
+_worker_error: str | None = None
+
+_pool: ModelWorkerPool | None = None
+_pool_lock = threading.Lock()
+
+
+class SharedImage:
+    """요청 이미지 원본 바이트를 담은 공유 메모리 블록.
+
+    evaluator가 요청당 하나를 만들어 모든 워커 호출에 같은 블록 이름을 넘기고,
+    모든 모델 결과를 받은 뒤 close()로 해제한다.
+    """
+
+    def __init__(self, artifact: ImageArtifact) -> None:
+        """아티팩트 원본 바이트를 새 공유 메모리 블록에 복사한다.
+
+        Args:
+            artifact: 요청의 공유 ImageArtifact.
+
+        Raises:
+            OSError: 파일을 읽을 수 없거나 공유 메모리 생성에 실패한 경우.
+        """
+        data = artifact.data
+        self.path = artifact.path
+        self.size = len(data)
+        # 크기 0인 블록은 만들 수 없으므로 최소 1바이트를 확보한다.
+        self._shm = shared_memory.SharedMemory(create=True, size=max(1, self.size))
+        self._shm.buf[: self.size] = data
+
+    @property
+    def ref(self) -> tuple[str, int, str | None]:
+        """워커에 전달할 (블록 이름, 바이트 수, 원본 경로)."""
+        return self._shm.name, self.size, self.path
+
+    def close(self) -> None:
+        """블록을 닫고 삭제한다."""
+        self._shm.close()
+        try:
+            self._shm.unlink()
+        except FileNotFoundError:
+            pass
+
+    def __enter__(self) -> SharedImage:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+def _init_worker(model_name: str, num_threads: int) -> None:
+    """워커 프로세스 초기화: 스레드 예산을 설정하고 담당 모델을 로드·워밍업한다.
+
+    initializer가 예외를 던지면 풀 전체가 BrokenProcessPool이 되므로 실패 사유만
+    기록해 두고, _check_worker가 이를 다시 던져 워밍업 실패로 보고한다.
+    """
+    global _worker_model, _worker_error
+    import torch
+
+    from app.models.model_registry import ModelRegistry, register_default_models
+
+    torch.set_num_threads(num_threads)
+    _worker_model = model_name
+    register_default_models()
+    try:
+        ModelRegistry.get_instance().get(model_name).warmup()
+    except Exception as exc:
+        _worker_error = str(exc)
+        logger.error("[worker/%s] pid=%d 워밍업 실패: %s", model_name, os.getpid(), exc)
+        return
+    logger.info(
+        "[worker/%s] pid=%d 준비 완료 (torch 스레드 %d)",
+        model_name,
+        os.getpid(),
+        num_threads,
+    )
+
+
+def _check_worker() -> int:
+    """워커가 담당 모델을 쓸 수 있는지 확인하고 워커 pid를 반환한다.
+
+    Raises:
+        RuntimeError: 워커 초기화 중 모델 로드·워밍업이 실패한 경우.
+    """
+    if _worker_error is not None:
+        raise RuntimeError(f"{_worker_model} 워커 워밍업 실패: {_worker_error}")
+    return os.getpid()
+
+
+def _probe_in_worker(
+    image_ref: tuple[str, int, str | None],
+    mission_type: str,
+    answer: str,
+    prompt_bundle: dict[str, Any],
+) -> dict[str, Any]:
+    """워커 프로세스에서 공유 메모리 이미지로 담당 모델 프로브를 실행한다."""
+    from app.models.model_registry import ModelRegistry
+
+    name, size, path = image_ref
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        data = bytes(shm.buf[:size])
+    finally:
+        shm.close()
+    artifact = ImageArtifact(path=path, data=data)
+    probe = ModelRegistry.get_instance().get(_worker_model)
+    return probe.probe(mission_type, artifact, answer, prompt_bundle)
+
+
+class ModelWorkerPool:
+    """모델별 ProcessPoolExecutor 묶음."""
+
+    def __init__(self, processes: dict[str, int], threads_per_worker: int) -> None:
+        """모델별 프로세스 풀을 생성한다. 프로세스는 첫 제출 시 기동된다.
+
+        Args:
+            processes: 모델 식별자 → 워커 프로세스 수.
+            threads_per_worker: 워커당 torch 스레드 수.
+        """
+        context = multiprocessing.get_context("spawn")
+        self._executors = {
+            name: concurrent.futures.ProcessPoolExecutor(
+                max_workers=count,
+                mp_context=context,
+                initializer=_init_worker,
+                initargs=(name, threads_per_worker),
+            )
+            for name, count in processes.items()
+            if count > 0
+        }
+        self._processes = {name: processes[name] for name in self._executors}
+
+    def handles(self, model_name: str) -> bool:
+        """model_name이 워커 프로세스에서 실행되는지 여부."""
+        return model_name in self._executors
+
+    def submit(
+        self,
+        model_name: str,
+        image: SharedImage,
+        mission_type: str,
+        answer: str,
+        prompt_bundle: dict[str, Any],
+    ) -> concurrent.futures.Future:
+        """담당 워커에 프로브 실행을 제출한다.
+
+        Args:
+            model_name: 실행할 모델 식별자 (handles()가 True여야 한다).
+            image: 요청 이미지 공유 메모리 블록.
+            mission_type: 미션 유형.
+            answer: 미션 정답 키워드.
+            prompt_bundle: 모델별 프롬프트 정보.
+
+        Returns:
+            모델 투표 딕셔너리를 결과로 갖는 Future.
+        """
+        return self._executors[model_name].submit(
+            _probe_in_worker, image.ref, mission_type, answer, prompt_bundle
+        )
+
+    def warmup(self, model_name: str) -> None:
+        """담당 워커를 모두 기동해 모델 로드·워밍업이 끝날 때까지 기다린다.
+
+        Raises:
+            RuntimeError: 워커 중 하나라도 모델 워밍업에 실패한 경우.
+        """
+        executor = self._executors[model_name]
+        futures = [
+            executor.submit(_check_worker) for _ in range(self._processes[model_name])
+        ]
+        pids = {future.result() for future in futures}
+        logger.info("[worker/%s] 워커 %d개 기동", model_name, len(pids))
+
+    def shutdown(self) -> None:
+        """모든 워커 프로세스를 종료한다."""
+        for executor in self._executors.values():
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+def worker_threads(processes: dict[str, int]) -> int:
+    """워커당 torch 스레드 수를 결정한다.
+
+    MODEL_WORKER_THREADS가 0이면 CPU 코어를 전체 워커 수로 나눠
+    워커끼리 intra-op 스레드가 겹치지 않게 한다.
+
+    Args:
+        processes: 모델 식별자 → 워커 프로세스 수.
+
+    Returns:
+        1 이상의 스레드 수.
+    """
+    if settings.MODEL_WORKER_THREADS > 0:
+        return settings.MODEL_WORKER_THREADS
+    total_workers = sum(processes.values()) or 1
+    return max(1, (os.cpu_count() or 1) // total_workers)
+
+
+def get_worker_pool() -> ModelWorkerPool:
+    """설정값으로 워커 풀 싱글턴을 지연 생성한다."""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                processes = settings.model_worker_processes
+                _pool = ModelWorkerPool(processes, worker_threads(processes))
+                atexit.register(_pool.shutdown)
+                logger.info(
+                    "[worker_pool] 생성: %s (워커당 torch 스레드 %d)",
+                    ", ".join(f"{name}×{count}" for name, count in processes.items()),
+                    worker_threads(processes),
+                )
+    return _pool
@@ -6,6 +6,7 @@ import json
 import logging
 import os
 import random
+import sys
 from datetime import date
 
 from app.core.config import settings
@@ -115,6 +116,37 @@ def _resolve_mission_atmosphere(admin_choice: str | None) -> tuple[str, str, lis
     return choice["answer"], choice["hint"], choice.get("vqa_hints", [])
 
 
+def _prime_model_caches(location_answer: str, atmosphere_answer: str) -> None:
+    """정답 교체 시 SigLIP2 텍스트 임베딩 캐시를 새 정답 기준으로 채운다.
+
+    SigLIP2 모듈이 아직 import되지 않았다면 모델도 로드되지 않은 상태이므로
+    torch import 비용을 들이지 않고 건너뛴다 (첫 추론 시 지연 채움).
+
+    Args:
+        location_answer: 오늘의 location 미션 정답.
+        atmosphere_answer: 오늘의 atmosphere 미션 정답.
+    """
+    if settings.BYPASS_MODEL_VALIDATION or "app.models.siglip2" not in sys.modules:
+        return
+    try:
+        from app.models.prompts import build_prompt_bundle
+        from app.models.siglip2 import prime_text_cache
+
+        for mission_type, answer in (
+            ("location", location_answer),
+            ("atmosphere", atmosphere_answer),
+        ):
+            bundle = build_prompt_bundle(mission_type, answer)
+            prime_text_cache(
+                [
+                    *bundle.get("siglip2_candidates", []),
+                    *bundle.get("siglip2_vocabulary", {}).values(),
+                ]
+            )
+    except Exception as exc:
+        logger.warning("모델 캐시 갱신 실패 (첫 추론 시 재시도): %s", exc)
+
+
 def get_today_answers(
     admin_choice1: str | None = None, admin_choice2: str | None = None
 ) -> tuple[str, str, str, str, list[str], list[str]]:
@@ -150,4 +182,5 @@ def get_today_answers(
     with open(STATE_FILE, "w", encoding="utf-8") as f:
         json.dump(state, f, ensure_ascii=False, indent=2)
 
+    _prime_model_caches(answer1, answer2)
     return answer1, answer2, hint1, hint2, vqa_hints1, vqa_hints2
@@ -10,6 +10,7 @@ from datetime import datetime, timedelta, timezone
 from typing import Any, Callable
 
 from app.core.config import settings
+from app.core.image_artifact import ImageArtifact
 from app.core.utils import normalize_mission_type
 from app.db.repositories import MissionSessionRepository
 from app.db.utils import _utcnow
@@ -373,15 +374,19 @@ class MissionSessionService:
         self._write_all(data)
 
     @staticmethod
-    def hash_file(file_path: str) -> str:
+    def hash_file(file_path: str | ImageArtifact) -> str:
         """파일을 SHA-256으로 해시하여 16진수 문자열을 반환한다.
 
+        ImageArtifact를 받으면 이미 메모리에 있는 원본 바이트의 해시를 재사용한다.
+
         Args:
-            file_path: 해시할 파일의 절대 경로.
+            file_path: 해시할 파일의 절대 경로 또는 공유 ImageArtifact.
 
         Returns:
             SHA-256 hex digest 문자열.
         """
+        if isinstance(file_path, ImageArtifact):
+            return file_path.sha256
         hasher = hashlib.sha256()
         with open(file_path, "rb") as file:
             for chunk in iter(lambda: file.read(8192), b""):
@@ -73,6 +73,7 @@ from flask import Flask
 from flask_cors import CORS
 
 from app.api.admin_routes import admin_api
+from app.api.health_routes import health_api
 from app.api.user_routes import user_api
 from app.core.config import settings
 
@@ -88,16 +89,26 @@ def create_app():
     from app.models.model_registry import register_default_models
 
     register_default_models()
+    if settings.MODEL_WORKER_POOL_ENABLED:
+        # MODEL_WORKER_PROCESSES 형식 오류는 첫 요청이 아니라 기동 시점에 드러낸다.
+        settings.validate_model_worker_processes()
 
     # 3. 미션 플러그인 등록 (레거시 CLI/호환 경로용)
     from app.legacy.plugins.registry import register_default_plugins
 
     register_default_plugins()
 
+    # 4. 모델 워밍업 (선택) — 완료 전까지 /readyz는 503
+    if settings.MODEL_WARMUP_ENABLED and not settings.BYPASS_MODEL_VALIDATION:
+        from app.models.model_registry import start_background_warmup
+
+        start_background_warmup()
+
     app = Flask(__name__)
     CORS(app)
     app.register_blueprint(user_api)
     app.register_blueprint(admin_api)
+    app.register_blueprint(health_api)
     return app
 
 
@@ -122,6 +133,9 @@ if __name__ == "__main__":
     print("  [Model]")
     print(f"    Location  : {settings.MODEL_SELECTION_LOCATION}")
     print(f"    Atmosphere: {settings.MODEL_SELECTION_ATMOSPHERE}")
+    print(
+        f"    Warm-up   : {on if settings.MODEL_WARMUP_ENABLED else off}  (/readyz로 준비 상태 확인)"
+    )
     print("  [Threshold]")
     print(f"    Location  : {settings.LOCATION_PASS_THRESHOLD}")
     print(f"    Atmosphere: {settings.ATMOSPHERE_PASS_THRESHOLD}")
@@ -0,0 +1,302 @@
+"""MODEL_PRECISION 모드(fp32 | bf16 | int8)별 정확도·지연·모델 크기를 비교한다.
+
+모드마다 SigLIP2·BLIP을 새로 로드한 뒤 두 가지 기준으로 측정한다.
+- 분위기: data/atmosphere_ground_truth_siglip2.json의 이미지 × 분위기 클러스터마다
+  SigLIP2 점수를 구해 ATMOSPHERE_PASS_THRESHOLD 기준 라벨 일치율과
+  GT 점수 대비 평균 절대 편차(drift)를 계산한다.
+- 랜드마크: data/assets/<랜드마크>/ 참조 사진마다 자기 랜드마크(정답)와
+  다음 랜드마크(오답) 판정을 실행해 SigLIP2·BLIP의 통과율/오통과율을 계산한다.
+
+사용법 (프로젝트 루트):
+    $env:PYTHONPATH="."; python scripts/tools/benchmark_precision.py
+    $env:PYTHONPATH="."; python scripts/tools/benchmark_precision.py --modes fp32,int8 --limit 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import io
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+ROOT = Path(__file__).resolve().parents[2]
+DEFAULT_GROUND_TRUTH = ROOT / "data" / "atmosphere_ground_truth_siglip2.json"
+DEFAULT_ASSETS_DIR = ROOT / "data" / "assets"
+
+REPORT_COLUMNS: tuple[tuple[str, str], ...] = (
+    ("mode", "모드"),
+    ("load_s", "로드(s)"),
+    ("siglip2_mb", "SigLIP2(MB)"),
+    ("blip_mb", "BLIP(MB)"),
+    ("atmosphere_accuracy", "분위기 라벨 일치율"),
+    ("atmosphere_drift", "GT 점수 편차"),
+    ("siglip2_tpr", "SigLIP2 통과율"),
+    ("siglip2_fpr", "SigLIP2 오통과율"),
+    ("blip_tpr", "BLIP 통과율"),
+    ("blip_fpr", "BLIP 오통과율"),
+    ("siglip2_ms", "SigLIP2(ms)"),
+    ("blip_ms", "BLIP(ms)"),
+)
+
+
+def load_atmosphere_cases(
+    ground_truth: dict[str, Any], assets_dir: Path, clusters: list[str]
+) -> list[tuple[Path, set[str], dict[str, float]]]:
+    """GT JSON을 (이미지 경로, 정답 라벨, GT 점수) 목록으로 변환한다.
+
+    GT 키는 Windows 경로 구분자(\\)를 쓰므로 assets_dir 기준으로 정규화한다.
+    단색 이미지처럼 분위기 클러스터 라벨이 하나도 없는 항목과
+    디스크에 없는 이미지는 제외한다.
+
+    Args:
+        ground_truth: atmosphere_ground_truth_siglip2.json 내용.
+        assets_dir: 에셋 루트 디렉터리.
+        clusters: 측정할 분위기 클러스터 이름 목록.
+
+    Returns:
+        (경로, 정답 라벨 집합, {클러스터: GT 점수}) 튜플 리스트 (키 순).
+    """
+    cases: list[tuple[Path, set[str], dict[str, float]]] = []
+    for key in sorted(ground_truth):
+        entry = ground_truth[key]
+        labels = {label for label in entry.get("labels", []) if label in clusters}
+        if not labels:
+            continue
+        path = assets_dir.joinpath(*key.replace("\\", "/").split("/"))
+        if not path.is_file():
+            continue
+        cases.append((path, labels, dict(entry.get("scores", {}))))
+    return cases
+
+
+def landmark_trials(
+    images_by_landmark: dict[str, list[Path]],
+) -> list[tuple[Path, str, bool]]:
+    """참조 사진마다 정답 시도 1건과 오답 시도 1건을 만든다.
+
+    오답 랜드마크는 목록상 다음 랜드마크(마지막은 첫 번째)로 고정해
+    모드 간 비교가 같은 시도 집합에서 이루어지게 한다.
+
+    Args:
+        images_by_landmark: 랜드마크 → 참조 이미지 경로 리스트.
+
+    Returns:
+        (이미지 경로, 판정할 랜드마크, 기대 결과) 튜플 리스트.
+    """
+    landmarks = list(images_by_landmark)
+    trials: list[tuple[Path, str, bool]] = []
+    for index, landmark in enumerate(landmarks):
+        other = landmarks[(index + 1) % len(landmarks)]
+        for path in images_by_landmark[landmark]:
+            trials.append((path, landmark, True))
+            if other != landmark:
+                trials.append((path, other, False))
+    return trials
+
+
+def atmosphere_metrics(
+    cases: list[tuple[Path, set[str], dict[str, float]]],
+    predictions: list[dict[str, float]],
+    threshold: float,
+) -> dict[str, float]:
+    """분위기 예측 점수를 GT와 비교한다.
+
+    Args:
+        cases: load_atmosphere_cases 결과.
+        predictions: cases와 같은 순서의 {클러스터: 예측 점수}.
+        threshold: 라벨 통과 기준 점수.
+
+    Returns:
+        atmosphere_accuracy(이미지×클러스터 라벨 일치율),
+        atmosphere_drift(GT 점수 대비 평균 절대 편차).
+    """
+    matched = total = 0
+    drift_sum = 0.0
+    drift_count = 0
+    for (_, labels, gt_scores), scores in zip(cases, predictions):
+        for cluster, score in scores.items():
+            total += 1
+            matched += (score >= threshold) == (cluster in labels)
+            if cluster in gt_scores:
+                drift_sum += abs(score - gt_scores[cluster])
+                drift_count += 1
+    return {
+        "atmosphere_accuracy": matched / total if total else 0.0,
+        "atmosphere_drift": drift_sum / drift_count if drift_count else 0.0,
+    }
+
+
+def pass_rates(results: list[tuple[bool, bool]]) -> tuple[float, float]:
+    """(기대 결과, 실제 통과 여부) 목록에서 통과율과 오통과율을 계산한다.
+
+    Returns:
+        (정답 시도 중 통과 비율, 오답 시도 중 통과 비율).
+    """
+    positives = [passed for expected, passed in results if expected]
+    negatives = [passed for expected, passed in results if not expected]
+    tpr = sum(positives) / len(positives) if positives else 0.0
+    fpr = sum(negatives) / len(negatives) if negatives else 0.0
+    return tpr, fpr
+
+
+def format_report(rows: list[dict[str, Any]]) -> str:
+    """모드별 측정 결과를 마크다운 표로 만든다."""
+    lines = [
+        "| " + " | ".join(title for _, title in REPORT_COLUMNS) + " |",
+        "|" + "|".join(" :--- " for _ in REPORT_COLUMNS) + "|",
+    ]
+    for row in rows:
+        cells = []
+        for key, _ in REPORT_COLUMNS:
+            value = row.get(key, "-")
+            if isinstance(value, float):
+                value = f"{value:.3f}" if value < 10 else f"{value:.1f}"
+            cells.append(str(value))
+        lines.append("| " + " | ".join(cells) + " |")
+    return "\n".join(lines) + "\n"
+
+
+def model_size_mb(model: Any) -> float:
+    """state_dict 직렬화 크기(MB). 양자화된 packed 가중치까지 포함한다."""
+    import torch
+
+    buffer = io.BytesIO()
+    torch.save(model.state_dict(), buffer)
+    return buffer.tell() / (1024 * 1024)
+
+
+def measure_mode(
+    mode: str,
+    atmosphere_cases: list[tuple[Path, set[str], dict[str, float]]],
+    trials: list[tuple[Path, str, bool]],
+) -> dict[str, Any]:
+    """한 정밀도 모드로 모델을 다시 로드해 모든 지표를 측정한다.
+
+    전처리 텐서는 모드마다 dtype이 달라지므로 ImageArtifact를 새로 만든다.
+    """
+    from app.core.config import settings
+    from app.core.image_artifact import ImageArtifact
+    from app.models import blip, siglip2
+    from app.models.prompts import ATMOSPHERE_EN, build_prompt_bundle
+
+    settings.MODEL_PRECISION = mode
+    siglip2._model = None
+    siglip2.clear_text_cache()
+    blip._model = None
+    gc.collect()
+
+    started = time.perf_counter()
+    siglip2._load_siglip2()
+    blip._load_blip()
+    row: dict[str, Any] = {
+        "mode": mode,
+        "load_s": time.perf_counter() - started,
+        "siglip2_mb": model_size_mb(siglip2._model),
+        "blip_mb": model_size_mb(blip._model),
+    }
+
+    siglip2_seconds: list[float] = []
+    predictions: list[dict[str, float]] = []
+    for path, _, _ in atmosphere_cases:
+        artifact = ImageArtifact.from_path(str(path))
+        scores: dict[str, float] = {}
+        for cluster in ATMOSPHERE_EN:
+            started = time.perf_counter()
+            vote = siglip2.probe_with_siglip2(
+                "atmosphere",
+                artifact,
+                cluster,
+                build_prompt_bundle("atmosphere", cluster),
+            )
+            siglip2_seconds.append(time.perf_counter() - started)
+            scores[cluster] = vote["score"]
+        predictions.append(scores)
+    row.update(
+        atmosphere_metrics(
+            atmosphere_cases, predictions, settings.ATMOSPHERE_PASS_THRESHOLD
+        )
+    )
+
+    blip_seconds: list[float] = []
+    siglip2_results: list[tuple[bool, bool]] = []
+    blip_results: list[tuple[bool, bool]] = []
+    for path, landmark, expected in trials:
+        artifact = ImageArtifact.from_path(str(path))
+        vote = siglip2.probe_with_siglip2(
+            "location", artifact, landmark, build_prompt_bundle("location", landmark)
+        )
+        siglip2_results.append((expected, vote["label"] == "match"))
+        started = time.perf_counter()
+        passed, _, _ = blip.evaluate_location(artifact, landmark)
+        blip_seconds.append(time.perf_counter() - started)
+        blip_results.append((expected, passed))
+    row["siglip2_tpr"], row["siglip2_fpr"] = pass_rates(siglip2_results)
+    row["blip_tpr"], row["blip_fpr"] = pass_rates(blip_results)
+
+    if siglip2_seconds:
+        row["siglip2_ms"] = 1000 * sum(siglip2_seconds) / len(siglip2_seconds)
+    if blip_seconds:
+        row["blip_ms"] = 1000 * sum(blip_seconds) / len(blip_seconds)
+    return row
+
+
+def main(argv: list[str] | None = None) -> int:
+    # 모드마다 비전 타워를 실제로 실행하도록 저장된 임베딩을 쓰지 않는다.
+    # 설정 로드 전에 환경에 명시해 .env나 프로필 값보다 우선하게 한다.
+    os.environ["EMBEDDING_STORE_ENABLED"] = "false"
+
+    from select_landmark_questions import collect_reference_images
+
+    from app.core.config import settings
+    from app.models import blip
+    from app.models.precision import SUPPORTED_PRECISIONS
+    from app.models.prompts import ATMOSPHERE_EN
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--modes", default=",".join(SUPPORTED_PRECISIONS))
+    parser.add_argument("--ground-truth", type=Path, default=DEFAULT_GROUND_TRUTH)
+    parser.add_argument("--assets-dir", type=Path, default=DEFAULT_ASSETS_DIR)
+    parser.add_argument(
+        "--limit", type=int, default=0, help="측정할 최대 이미지 수 (0이면 전체)"
+    )
+    parser.add_argument("--output", type=Path, help="마크다운 표 저장 경로")
+    args = parser.parse_args(argv)
+    settings.BLIP_EARLY_EXIT = False
+    # 설정이 이미 로드된 경우(다른 모듈에서 먼저 import)에도 꺼지게 한다.
+    settings.EMBEDDING_STORE_ENABLED = False
+
+    modes = [mode.strip() for mode in args.modes.split(",") if mode.strip()]
+    unknown = [mode for mode in modes if mode not in SUPPORTED_PRECISIONS]
+    if unknown:
+        print(f"지원하지 않는 모드: {', '.join(unknown)}")
+        return 1
+
+    ground_truth = json.loads(args.ground_truth.read_text(encoding="utf-8"))
+    cases = load_atmosphere_cases(ground_truth, args.assets_dir, list(ATMOSPHERE_EN))
+    images = collect_reference_images(args.assets_dir, list(blip.landmark_qa_data))
+    if args.limit:
+        cases = cases[: args.limit]
+        images = {name: paths[: args.limit] for name, paths in images.items()}
+    trials = landmark_trials(images)
+    print(f"분위기 GT {len(cases)}장, 랜드마크 시도 {len(trials)}건")
+
+    rows = []
+    for mode in modes:
+        print(f"[{mode}] 측정 중...")
+        rows.append(measure_mode(mode, cases, trials))
+
+    report = format_report(rows)
+    print(report)
+    if args.output:
+        args.output.write_text(report, encoding="utf-8")
+        print(f"저장 완료: {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
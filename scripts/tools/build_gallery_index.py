@@ -0,0 +1,63 @@
+"""랜드마크 참조 사진으로 gallery 프로브용 임베딩 인덱스를 생성한다.
+
+data/assets/<랜드마크>/ 의 참조 사진을 SigLIP2 비전 타워로 한 장씩 임베딩해
+float16 행렬(.npy)과 라벨(.json)로 저장한다. 기본 출력 경로는 현재
+SIGLIP2_MODEL_ID에 대응하는 data/model_cache/<모델>-gallery.npy 이며, 서버는 이
+파일을 메모리 매핑으로 연다. 참조 사진이나 모델을 바꾸면 다시 실행한다.
+
+사용법 (프로젝트 루트):
+    $env:PYTHONPATH="."; python scripts/tools/build_gallery_index.py
+    $env:MODEL_SELECTION_LOCATION="gallery"   # 생성된 인덱스로 위치 판정
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+DEFAULT_ASSETS_DIR = ROOT / "data" / "assets"
+
+
+def main(argv: list[str] | None = None) -> int:
+    from app.core.config import settings
+    from app.models import gallery, siglip2
+    from app.models.prompts import LANDMARK_EN
+
+    # 참조 사진은 제출 임베딩 저장소에 섞지 않는다.
+    settings.EMBEDDING_STORE_ENABLED = False
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--assets-dir", type=Path, default=DEFAULT_ASSETS_DIR)
+    parser.add_argument(
+        "--output", type=Path, default=None, help="기본값: 모델별 data/model_cache 경로"
+    )
+    args = parser.parse_args(argv)
+
+    images = gallery.reference_images(args.assets_dir, list(LANDMARK_EN))
+    missing = sorted(set(LANDMARK_EN) - set(images))
+    if missing:
+        print(f"참조 사진 없음 (인덱스에서 제외): {', '.join(missing)}")
+    if not images:
+        print(f"참조 사진이 없습니다: {args.assets_dir}")
+        return 1
+
+    total = sum(len(paths) for paths in images.values())
+    print(f"SigLIP2 임베딩 시작: 랜드마크 {len(images)}개, 사진 {total}장")
+    siglip2._load_siglip2()
+    index, files = gallery.build_index(
+        images,
+        lambda image: siglip2.image_embedding(image).float().cpu().numpy(),
+    )
+
+    output = str(args.output) if args.output else gallery.index_path()
+    index.save(output, files)
+    for landmark, paths in images.items():
+        print(f"  {landmark}: {len(paths)}장")
+    print(f"저장 완료: {output} {index.matrix.shape} float16")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,233 @@
+"""랜드마크별 BLIP 질문을 판별력 순으로 골라 경량 Q&A 파일을 생성한다.
+
+data/assets/<랜드마크>/ 의 참조 사진 전체에 대해 BLIP yes/no 확률을 측정하고,
+각 질문이 자기 랜드마크 사진과 다른 랜드마크 사진을 얼마나 잘 구분하는지
+(margin = P_own(기대 답변) - P_others(기대 답변))로 순위를 매긴다.
+결과는 [질문, 기대 답변, margin] 형식으로 저장되며, margin은
+BLIP_EARLY_EXIT 모드에서 질문 순서 가중치로 사용된다.
+
+사용법 (프로젝트 루트):
+    $env:PYTHONPATH="."; python scripts/tools/select_landmark_questions.py
+    $env:LANDMARK_QA_FILE="landmark_qa_selected.json"   # 생성된 파일로 전환
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any
+
+ROOT = Path(__file__).resolve().parents[2]
+DEFAULT_ASSETS_DIR = ROOT / "data" / "assets"
+DEFAULT_INPUT = ROOT / "data" / "landmark_qa_labeled.json"
+DEFAULT_OUTPUT = ROOT / "data" / "landmark_qa_selected.json"
+IMAGE_SUFFIXES = {".jpg", ".jpeg", ".png", ".jfif", ".webp"}
+
+
+def collect_reference_images(
+    assets_dir: Path, landmarks: list[str]
+) -> dict[str, list[Path]]:
+    """랜드마크 이름과 같은 폴더에서 참조 이미지 경로를 수집한다.
+
+    Args:
+        assets_dir: 랜드마크별 하위 폴더를 가진 에셋 디렉터리.
+        landmarks: Q&A 데이터의 랜드마크 이름 목록.
+
+    Returns:
+        참조 이미지가 하나 이상 있는 랜드마크 → 이미지 경로 리스트.
+    """
+    images: dict[str, list[Path]] = {}
+    for landmark in landmarks:
+        folder = assets_dir / landmark
+        if not folder.is_dir():
+            continue
+        paths = sorted(
+            path
+            for path in folder.iterdir()
+            if path.is_file() and path.suffix.lower() in IMAGE_SUFFIXES
+        )
+        if paths:
+            images[landmark] = paths
+    return images
+
+
+def measure_yes_probabilities(
+    images_by_landmark: dict[str, list[Path]],
+    questions: tuple[str, ...],
+) -> dict[str, dict[str, float]]:
+    """랜드마크별 참조 사진에서 질문마다 평균 P(yes)를 측정한다.
+
+    이미지당 비전 인코더 1회 + 질문 배치당 디코더 forward 1회로 계산한다.
+
+    Args:
+        images_by_landmark: 랜드마크 → 참조 이미지 경로 리스트.
+        questions: 측정할 전체 질문 튜플 (모든 랜드마크 질문의 합집합).
+
+    Returns:
+        랜드마크 → {질문: 평균 P(yes)}.
+    """
+    import torch
+    from PIL import Image
+
+    from app.models import blip
+
+    blip._load_blip()
+    device = "cuda" if torch.cuda.is_available() else "cpu"
+
+    means: dict[str, dict[str, float]] = {}
+    for landmark, paths in images_by_landmark.items():
+        totals = [0.0] * len(questions)
+        counted = [0] * len(questions)
+        for path in paths:
+            try:
+                raw_image = Image.open(path).convert("RGB")
+            except Exception as exc:
+                print(f"  [skip] {path.name}: {exc}")
+                continue
+            pixel_values = blip._processor(
+                images=raw_image, return_tensors="pt"
+            ).pixel_values.to(device, dtype=blip._input_dtype)
+            image_embeds = blip._encode_image(pixel_values)
+            for index, prob in enumerate(blip._score_yes_no(image_embeds, questions)):
+                if prob is not None:
+                    totals[index] += prob
+                    counted[index] += 1
+        means[landmark] = {
+            question: totals[index] / counted[index]
+            for index, question in enumerate(questions)
+            if counted[index]
+        }
+        print(f"  {landmark}: {len(paths)}장 측정 완료")
+    return means
+
+
+def rank_questions(
+    qa_data: dict[str, list[list[Any]]],
+    yes_probabilities: dict[str, dict[str, float]],
+    max_questions: int,
+    min_questions: int,
+    min_margin: float,
+) -> dict[str, list[list[Any]]]:
+    """질문별 판별 margin을 계산해 랜드마크마다 상위 질문만 남긴다.
+
+    margin이 min_margin 이상인 질문을 내림차순으로 최대 max_questions개 고르며,
+    통과한 질문이 min_questions개보다 적으면 margin 순으로 채운다.
+    참조 사진이 없는 랜드마크는 원본 목록을 그대로 유지한다.
+
+    Args:
+        qa_data: 원본 {랜드마크: [[질문, 기대 답변], ...]}.
+        yes_probabilities: measure_yes_probabilities 결과.
+        max_questions: 랜드마크당 최대 질문 수.
+        min_questions: 랜드마크당 최소 질문 수.
+        min_margin: 채택할 최소 margin.
+
+    Returns:
+        {랜드마크: [[질문, 기대 답변, margin], ...]} (margin 내림차순).
+    """
+    selected: dict[str, list[list[Any]]] = {}
+    for landmark, question_list in qa_data.items():
+        own = yes_probabilities.get(landmark)
+        others = [
+            probs for name, probs in yes_probabilities.items() if name != landmark
+        ]
+        if own is None or not others:
+            selected[landmark] = [list(item) for item in question_list]
+            continue
+
+        scored: list[tuple[float, str, str]] = []
+        for item in question_list:
+            question, expected = item[0], item[1]
+            if question not in own:
+                continue
+            other_yes = [probs[question] for probs in others if question in probs]
+            if not other_yes:
+                continue
+            own_yes = own[question]
+            mean_other_yes = sum(other_yes) / len(other_yes)
+            if expected == "no":
+                margin = (1.0 - own_yes) - (1.0 - mean_other_yes)
+            else:
+                margin = own_yes - mean_other_yes
+            scored.append((margin, question, expected))
+
+        scored.sort(key=lambda entry: entry[0], reverse=True)
+        passing = [entry for entry in scored if entry[0] >= min_margin]
+        if len(passing) < min_questions:
+            passing = scored[:min_questions]
+        selected[landmark] = [
+            [question, expected, round(margin, 4)]
+            for margin, question, expected in passing[:max_questions]
+        ]
+    return selected
+
+
+def dump_qa(qa_data: dict[str, list[list[Any]]]) -> str:
+    """landmark_qa_labeled.json과 같은 레이아웃(항목당 한 줄)으로 직렬화한다."""
+    lines = ["{"]
+    landmarks = list(qa_data)
+    for landmark_index, landmark in enumerate(landmarks):
+        lines.append(f"  {json.dumps(landmark, ensure_ascii=False)}: [")
+        entries = qa_data[landmark]
+        for entry_index, entry in enumerate(entries):
+            comma = "," if entry_index < len(entries) - 1 else ""
+            lines.append(f"    {json.dumps(entry, ensure_ascii=False)}{comma}")
+        comma = "," if landmark_index < len(landmarks) - 1 else ""
+        lines.append(f"  ]{comma}")
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def main(argv: list[str] | None = None) -> int:
+    from app.core.config import settings
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--input", type=Path, default=DEFAULT_INPUT)
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT)
+    parser.add_argument("--assets-dir", type=Path, default=DEFAULT_ASSETS_DIR)
+    parser.add_argument("--max-questions", type=int, default=12)
+    parser.add_argument("--min-questions", type=int, default=4)
+    parser.add_argument("--min-margin", type=float, default=0.1)
+    parser.add_argument(
+        "--batch-size", type=int, default=32, help="BLIP 질문 배치 크기 (메모리 제한)"
+    )
+    args = parser.parse_args(argv)
+    if args.input.resolve() == args.output.resolve():
+        print(
+            "입력과 출력이 같은 파일입니다. 원본 Q&A를 덮어쓰지 않도록 --output을 바꾸세요."
+        )
+        return 1
+    settings.BLIP_VQA_BATCH_SIZE = args.batch_size
+
+    qa_data = json.loads(args.input.read_text(encoding="utf-8"))
+    images = collect_reference_images(args.assets_dir, list(qa_data))
+    missing = sorted(set(qa_data) - set(images))
+    if missing:
+        print(f"참조 사진 없음 (원본 유지): {', '.join(missing)}")
+    if len(images) < 2:
+        print("비교할 랜드마크 참조 사진이 2개 폴더 이상 필요합니다.")
+        return 1
+
+    questions = tuple(
+        dict.fromkeys(item[0] for items in qa_data.values() for item in items)
+    )
+    print(f"BLIP 측정 시작: 랜드마크 {len(images)}개, 질문 {len(questions)}개")
+    probabilities = measure_yes_probabilities(images, questions)
+    selected = rank_questions(
+        qa_data,
+        probabilities,
+        max_questions=args.max_questions,
+        min_questions=args.min_questions,
+        min_margin=args.min_margin,
+    )
+
+    args.output.write_text(dump_qa(selected), encoding="utf-8")
+    for landmark, entries in selected.items():
+        print(f"  {landmark}: {len(qa_data[landmark])} → {len(entries)}개")
+    print(f"저장 완료: {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
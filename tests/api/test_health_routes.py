@@ -0,0 +1,56 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+from flask import Flask
+
+from app.api.health_routes import health_api
+
+
+@pytest.fixture
+def client():
+    app = Flask(__name__)
+    app.register_blueprint(health_api)
+    app.config["TESTING"] = True
+    return app.test_client()
+
+
+def _registry(report: dict) -> MagicMock:
+    registry = MagicMock()
+    registry.readiness.return_value = report
+    return registry
+
+
+class TestReadyz:
+    """GET /readyz 엔드포인트 검증."""
+
+    def test_ready_returns_200_with_model_states(self, client):
+        """워밍업이 끝나면 200과 모델별 상태·소요 시간을 반환한다."""
+        report = {
+            "ready": True,
+            "warmup_enabled": True,
+            "models": {"siglip2": {"state": "ready", "warmup_ms": 812.4}},
+        }
+        with patch(
+            "app.api.health_routes.ModelRegistry.get_instance",
+            return_value=_registry(report),
+        ):
+            response = client.get("/readyz")
+
+        assert response.status_code == 200
+        assert response.get_json() == report
+
+    def test_not_ready_returns_503(self, client):
+        """워밍업 중이거나 실패한 모델이 있으면 503을 반환한다."""
+        report = {
+            "ready": False,
+            "warmup_enabled": True,
+            "models": {"blip": {"state": "warming"}},
+        }
+        with patch(
+            "app.api.health_routes.ModelRegistry.get_instance",
+            return_value=_registry(report),
+        ):
+            response = client.get("/readyz")
+
+        assert response.status_code == 503
+        assert response.get_json()["models"]["blip"]["state"] == "warming"
@@ -332,6 +332,57 @@ class TestMissionSubmitRoute:
         )
         mark_coupon_issued.assert_called_once_with("mission-1", "AUTO1234")
 
+    def test_submission_passes_request_deadline_to_pipeline(self, client):
+        """요청 도착 시점에 계산한 기한이 request_context["deadline"]으로 전달된다."""
+        mock_session = {
+            "mission_id": "mission-1",
+            "mission_type": "location",
+            "user_id": "guest",
+            "site_id": "default",
+            "answer": "지혜의숲",
+            "hint": "hint",
+        }
+        pipeline_output = {
+            "request_context": {},
+            "final_response": {"data": {"success": False, "couponEligible": False}},
+        }
+
+        with (
+            patch(
+                "app.api.user_routes.verify_supabase_token",
+                return_value=auth_principal(),
+            ),
+            patch(
+                "app.api.user_routes.mission_session_service.can_submit",
+                return_value=(True, "ok"),
+            ),
+            patch(
+                "app.api.user_routes.mission_session_service.get_session",
+                return_value=mock_session,
+            ),
+            patch("app.api.user_routes._validate_upload", return_value=(True, ".jpg")),
+            patch("app.api.user_routes.new_deadline", return_value=123.0),
+            patch(
+                "app.api.user_routes.pipeline_app.invoke", return_value=pipeline_output
+            ) as invoke,
+            patch("app.api.user_routes.mission_session_service.record_submission"),
+        ):
+            client.post(
+                "/api/mission/submit",
+                data={
+                    "mission_id": "mission-1",
+                    "client_lat": "37.711988",
+                    "client_lng": "126.6867095",
+                    "accuracy_meters": "20",
+                    "image": (io.BytesIO(b"fake-image"), "mission.jpg"),
+                },
+                content_type="multipart/form-data",
+                headers=AUTH_HEADERS,
+            )
+
+        state = invoke.call_args.args[0]
+        assert state["request_context"]["deadline"] == 123.0
+
     def test_submission_rejects_outside_gps_before_pipeline(self, client, monkeypatch):
         monkeypatch.setattr("app.api.user_routes.settings.DEMO_AUTH_ENABLED", False)
         monkeypatch.setattr("app.api.user_routes.settings.SKIP_GPS_VALIDATION", False)
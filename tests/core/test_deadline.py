@@ -0,0 +1,59 @@
+"""app.core.deadline 단위 테스트.
+
+검증 대상:
+  - new_deadline: 설정값 기본·0 이하면 기한 없음·기본 프로필은 기한 없음
+  - remaining / expired: 기한 없음·남은 시간·지난 기한
+  - cap_timeout: 단계 timeout을 남은 기한 이내로 제한
+"""
+
+from __future__ import annotations
+
+import time
+from unittest.mock import patch
+
+import pytest
+
+from app.core import deadline
+from app.core.config import settings
+
+
+class TestNewDeadline:
+    def test_defaults_to_setting(self) -> None:
+        with patch.object(settings, "REQUEST_DEADLINE_SECONDS", 9.0):
+            before = time.monotonic()
+            value = deadline.new_deadline()
+        assert value == pytest.approx(before + 9.0, abs=0.5)
+
+    def test_default_profile_has_no_deadline(self) -> None:
+        from app.core.config.environments import DEFAULT_PROFILE
+
+        assert DEFAULT_PROFILE["REQUEST_DEADLINE_SECONDS"] == 0
+
+    @pytest.mark.parametrize("seconds", [0, -1])
+    def test_non_positive_means_no_deadline(self, seconds: float) -> None:
+        assert deadline.new_deadline(seconds) is None
+
+
+class TestRemaining:
+    def test_no_deadline(self) -> None:
+        assert deadline.remaining(None) is None
+        assert deadline.expired(None) is False
+
+    def test_future_deadline(self) -> None:
+        value = deadline.new_deadline(5)
+        assert 0 < deadline.remaining(value) <= 5
+        assert deadline.expired(value) is False
+
+    def test_past_deadline_clamps_to_zero(self) -> None:
+        value = time.monotonic() - 1
+        assert deadline.remaining(value) == 0.0
+        assert deadline.expired(value) is True
+
+
+class TestCapTimeout:
+    def test_keeps_timeout_without_deadline(self) -> None:
+        assert deadline.cap_timeout(30, None) == 30
+
+    def test_caps_to_remaining(self) -> None:
+        assert deadline.cap_timeout(30, deadline.new_deadline(1)) <= 1
+        assert deadline.cap_timeout(0.5, deadline.new_deadline(10)) == 0.5
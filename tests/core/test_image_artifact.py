@@ -0,0 +1,201 @@
+"""app.core.image_artifact 단위 테스트.
+
+검증 대상:
+  - 원본 바이트: 지연 읽기·1회 읽기·메모리 바이트 직접 주입
+  - 파생 값: sha256(hash_file과 동일)·base64·EXIF·RGB 디코드 캐시·decode() 명시 디코드
+  - dhash: 재인코딩·축소본은 같은 해시, 다른 사진은 먼 해시
+  - cached: 키별 1회 계산·동시 호출 1회 계산·예외 미캐시
+  - resolve: 아티팩트 통과·경로 변환
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import io
+import threading
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from PIL import Image
+
+from app.core.image_artifact import ImageArtifact
+from app.services.mission_session_service import MissionSessionService
+
+
+def _write_jpeg(path: Path) -> bytes:
+    buffer = io.BytesIO()
+    Image.new("RGB", (8, 6), (200, 30, 30)).save(buffer, format="JPEG")
+    path.write_bytes(buffer.getvalue())
+    return buffer.getvalue()
+
+
+class TestRawBytes:
+    def test_file_is_read_lazily_and_once(self, tmp_path: Path) -> None:
+        """생성 시에는 읽지 않고, 여러 파생 값을 계산해도 파일은 한 번만 읽는다."""
+        image_file = tmp_path / "photo.jpg"
+        data = _write_jpeg(image_file)
+
+        with patch.object(
+            ImageArtifact, "_read", autospec=True, side_effect=lambda self: data
+        ) as mock_read:
+            artifact = ImageArtifact.from_path(str(image_file))
+            assert mock_read.call_count == 0
+            assert artifact.sha256 == hashlib.sha256(data).hexdigest()
+            assert artifact.base64 == base64.b64encode(data).decode()
+            assert isinstance(artifact.exif, Image.Exif)
+            assert artifact.rgb.size == (8, 6)
+        assert mock_read.call_count == 1
+
+    def test_in_memory_data_skips_file(self) -> None:
+        """data를 주면 경로 없이도 동작한다."""
+        artifact = ImageArtifact(data=b"abc")
+        assert artifact.data == b"abc"
+        assert artifact.name == "(memory)"
+
+    def test_requires_path_or_data(self) -> None:
+        with pytest.raises(ValueError):
+            ImageArtifact()
+
+
+class TestDerivedValues:
+    def test_sha256_matches_hash_file(self, tmp_path: Path) -> None:
+        """중복 검사 해시가 기존 hash_file 결과와 같다."""
+        image_file = tmp_path / "photo.jpg"
+        _write_jpeg(image_file)
+        artifact = ImageArtifact.from_path(str(image_file))
+
+        assert artifact.sha256 == MissionSessionService.hash_file(str(image_file))
+        assert MissionSessionService.hash_file(artifact) == artifact.sha256
+
+    def test_base64_and_sha256_of_raw_bytes(self) -> None:
+        artifact = ImageArtifact(data=b"fake image data")
+        assert artifact.base64 == base64.b64encode(b"fake image data").decode()
+        assert artifact.sha256 == hashlib.sha256(b"fake image data").hexdigest()
+
+    def test_rgb_is_decoded_once(self, tmp_path: Path) -> None:
+        """RGB 이미지는 같은 객체가 재사용된다."""
+        image_file = tmp_path / "photo.jpg"
+        _write_jpeg(image_file)
+        artifact = ImageArtifact.from_path(str(image_file))
+
+        first = artifact.rgb
+        assert first.mode == "RGB"
+        assert first.size == (8, 6)
+        assert artifact.rgb is first
+
+    def test_missing_file_raises_on_access(self, tmp_path: Path) -> None:
+        artifact = ImageArtifact.from_path(str(tmp_path / "missing.jpg"))
+        with pytest.raises(FileNotFoundError):
+            artifact.decode()
+
+    def test_decode_returns_cached_rgb(self, tmp_path: Path) -> None:
+        """decode()는 디코드를 바로 수행하고 rgb와 같은 객체를 돌려준다."""
+        image_file = tmp_path / "photo.jpg"
+        _write_jpeg(image_file)
+        artifact = ImageArtifact.from_path(str(image_file))
+
+        assert artifact.decode() is artifact.rgb
+
+    def test_decode_raises_on_invalid_bytes(self) -> None:
+        with pytest.raises(OSError):
+            ImageArtifact(data=b"not an image").decode()
+
+
+def _scene(seed: int, size: tuple[int, int] = (1200, 800)) -> Image.Image:
+    """색 블록을 부드럽게 확대한 합성 장면."""
+    blocks = Image.frombytes(
+        "RGB", (9, 6), bytes((seed * 37 + i * 91) % 256 for i in range(9 * 6 * 3))
+    )
+    return blocks.resize(size, Image.Resampling.BICUBIC)
+
+
+def _jpeg_bytes(image: Image.Image, quality: int = 90) -> bytes:
+    buffer = io.BytesIO()
+    image.save(buffer, format="JPEG", quality=quality)
+    return buffer.getvalue()
+
+
+class TestDhash:
+    def test_reencoded_and_downscaled_copy_keeps_hash(self) -> None:
+        scene = _scene(1)
+        original = ImageArtifact(data=_jpeg_bytes(scene)).dhash
+        copy = ImageArtifact(
+            data=_jpeg_bytes(scene.resize((400, 267)), quality=50)
+        ).dhash
+
+        assert 0 <= original < 2**64
+        assert (original ^ copy).bit_count() <= 2
+
+    def test_different_scene_is_far(self) -> None:
+        first = ImageArtifact(data=_jpeg_bytes(_scene(1))).dhash
+        second = ImageArtifact(data=_jpeg_bytes(_scene(2))).dhash
+
+        assert (first ^ second).bit_count() > 10
+
+    def test_computed_once(self) -> None:
+        artifact = ImageArtifact(data=_jpeg_bytes(_scene(1)))
+        with patch.object(artifact, "open", wraps=artifact.open) as mock_open:
+            assert artifact.dhash == artifact.dhash
+        mock_open.assert_called_once()
+
+
+class TestCached:
+    def test_factory_runs_once_per_key(self) -> None:
+        artifact = ImageArtifact(data=b"")
+        calls: list[str] = []
+
+        def factory() -> str:
+            calls.append("x")
+            return "value"
+
+        assert artifact.cached("blip.pixel_values", factory) == "value"
+        assert artifact.cached("blip.pixel_values", factory) == "value"
+        assert artifact.cached("siglip2.pixel_values", factory) == "value"
+        assert len(calls) == 2
+
+    def test_concurrent_callers_share_one_computation(self) -> None:
+        """evaluator 스레드가 동시에 요청해도 한 번만 계산한다."""
+        artifact = ImageArtifact(data=b"")
+        calls: list[int] = []
+
+        def slow_factory() -> int:
+            calls.append(1)
+            time.sleep(0.05)
+            return 42
+
+        results: list[int] = []
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(artifact.cached("k", slow_factory))
+            )
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == [42, 42, 42, 42]
+        assert len(calls) == 1
+
+    def test_failed_factory_is_not_cached(self) -> None:
+        artifact = ImageArtifact(data=b"")
+
+        with pytest.raises(RuntimeError):
+            artifact.cached("k", lambda: (_ for _ in ()).throw(RuntimeError("x")))
+        assert artifact.cached("k", lambda: "ok") == "ok"
+
+
+class TestResolve:
+    def test_passes_artifact_through(self) -> None:
+        artifact = ImageArtifact(data=b"")
+        assert ImageArtifact.resolve(artifact) is artifact
+
+    def test_wraps_path(self) -> None:
+        artifact = ImageArtifact.resolve("/tmp/photo.jpg")
+        assert isinstance(artifact, ImageArtifact)
+        assert artifact.path == "/tmp/photo.jpg"
+        assert artifact.name == "photo.jpg"
@@ -16,6 +16,7 @@
 
 from __future__ import annotations
 
+import concurrent.futures
 from typing import Any
 from unittest.mock import MagicMock, patch
 
@@ -62,6 +63,13 @@ def _make_qwen_mock(score: float = 0.9) -> tuple[MagicMock, MagicMock]:
     mock_probe.probe.return_value = {"score": score, "label": "match", "reason": "ok"}
     mock_registry = MagicMock()
     mock_registry.get.return_value = mock_probe
+
+    def submit(_name, fn, *args):
+        future: concurrent.futures.Future = concurrent.futures.Future()
+        future.set_result(fn(*args))
+        return future
+
+    mock_registry.submit.side_effect = submit
     return mock_registry, mock_probe
 
 
@@ -1,5 +1,15 @@
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
 import pytest
-from app.council.judges import ConsistencyJudge, ThresholdJudge, JudgeContext
+from app.council.judges import (
+    ConsistencyJudge,
+    JudgeContext,
+    QwenFallbackJudge,
+    ThresholdJudge,
+)
+from app.models.model_registry import ModelRegistry
 
 
 class TestConsistencyJudge:
@@ -145,3 +155,90 @@ class TestThresholdJudge:
         verdict = judge.evaluate(context)
         assert verdict["needs_escalation"] is True
         assert "Model conflict detected" in verdict["reason"]
+
+
+class TestQwenFallbackJudge:
+    """Qwen 재검증과 요청 기한 초과 시 ensemble 판정 유지."""
+
+    @pytest.fixture
+    def registry(self):
+        registry = ModelRegistry()
+        probe = MagicMock(model_name="qwen")
+        registry.register(probe)
+        with patch.object(ModelRegistry, "get_instance", return_value=registry):
+            yield registry, probe
+        registry.shutdown()
+
+    @staticmethod
+    def _context(deadline=None) -> JudgeContext:
+        return JudgeContext(
+            mission_type="location",
+            ensemble_result={"merged_score": 0.8, "threshold": 0.7},
+            model_votes=[],
+            request_context={
+                "mission_type": "location",
+                "image_path": "/img.jpg",
+                "answer": "지혜의숲",
+                "deadline": deadline,
+            },
+        )
+
+    def test_qwen_score_overrides(self, registry):
+        _, probe = registry
+        probe.probe.return_value = {"score": 0.2, "reason": "no"}
+
+        verdict = QwenFallbackJudge().evaluate(self._context())
+
+        assert verdict["approved"] is False
+        assert verdict["confidence"] == 0.2
+
+    def test_expired_deadline_keeps_ensemble_without_calling_qwen(self, registry):
+        _, probe = registry
+
+        verdict = QwenFallbackJudge().evaluate(self._context(time.monotonic() - 1))
+
+        probe.probe.assert_not_called()
+        assert verdict["approved"] is True
+        assert verdict["confidence"] == 0.5
+        assert "deadline" in verdict["reason"]
+
+    def test_slow_qwen_falls_back_at_deadline(self, registry):
+        _, probe = registry
+        release = threading.Event()
+        probe.probe.side_effect = lambda *_: release.wait(5) and {"score": 0.0}
+
+        start = time.monotonic()
+        verdict = QwenFallbackJudge().evaluate(self._context(start + 0.2))
+        elapsed = time.monotonic() - start
+        release.set()
+
+        assert elapsed < 2
+        assert verdict["approved"] is True
+        assert "timed out" in verdict["reason"]
+
+    def test_reuses_ensemble_qwen_vote(self, registry):
+        _, probe = registry
+        context = self._context()
+        context["model_votes"] = [
+            {"model": "siglip2", "score": 0.9, "label": "match"},
+            {"model": "qwen", "score": 0.3, "label": "mismatch", "reason": "no"},
+        ]
+
+        verdict = QwenFallbackJudge().evaluate(context)
+
+        probe.probe.assert_not_called()
+        assert verdict["approved"] is False
+        assert verdict["confidence"] == 0.3
+
+    def test_failed_ensemble_qwen_vote_is_retried(self, registry):
+        _, probe = registry
+        probe.probe.return_value = {"score": 0.9, "reason": "yes"}
+        context = self._context()
+        context["model_votes"] = [
+            {"model": "qwen", "score": 0.0, "label": "fail", "reason": "timeout"}
+        ]
+
+        verdict = QwenFallbackJudge().evaluate(context)
+
+        probe.probe.assert_called_once()
+        assert verdict["approved"] is True
@@ -0,0 +1,220 @@
+"""app.council.near_duplicate 단위 테스트.
+
+검증 대상:
+  - NearDuplicateShard: 최근접 검색·본인 제출 제외·중복 추가 무시·행렬 확장·차원 검증
+  - 영속화: 구성원 기록 후 임베딩 저장소 벡터로 재구성
+  - shard_days: 오늘부터 NEAR_DUPLICATE_WINDOW_DAYS일
+  - check/record: 유사도 하한·조회만으로는 미추가·다른 날 샤드 검색·사이트 분리
+    ·차원 불일치/꺼짐/우회/임베딩 실패 시 None
+"""
+
+from __future__ import annotations
+
+import hashlib
+from datetime import date
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+import torch
+
+from app.core.config import settings
+from app.core.image_artifact import ImageArtifact
+from app.council import near_duplicate
+from app.models import embedding_store, siglip2
+
+
+def _hash(name: str) -> str:
+    return hashlib.sha256(name.encode()).hexdigest()
+
+
+def _unit(*values: float) -> np.ndarray:
+    vector = np.asarray(values, dtype=np.float32)
+    return vector / np.linalg.norm(vector)
+
+
+@pytest.fixture(autouse=True)
+def _reset_shards():
+    near_duplicate._shards.clear()
+    yield
+    near_duplicate._shards.clear()
+
+
+class TestNearDuplicateShard:
+    def test_nearest_returns_most_similar_other_user(self) -> None:
+        shard = near_duplicate.NearDuplicateShard()
+        shard.add(_hash("a"), "alice", _unit(1, 0, 0))
+        shard.add(_hash("b"), "bob", _unit(0, 1, 0))
+
+        image_hash, similarity = shard.nearest(_unit(0.9, 0.1, 0), "carol")
+
+        assert image_hash == _hash("a")
+        assert similarity == pytest.approx(float(_unit(0.9, 0.1, 0)[0]))
+
+    def test_own_submissions_are_excluded(self) -> None:
+        shard = near_duplicate.NearDuplicateShard()
+        shard.add(_hash("a"), "alice", _unit(1, 0))
+        shard.add(_hash("b"), "bob", _unit(0, 1))
+
+        assert shard.nearest(_unit(1, 0), "alice")[0] == _hash("b")
+        assert near_duplicate.NearDuplicateShard().nearest(_unit(1, 0), "x") is None
+
+    def test_only_own_submissions_returns_none(self) -> None:
+        shard = near_duplicate.NearDuplicateShard()
+        shard.add(_hash("a"), "alice", _unit(1, 0))
+
+        assert shard.nearest(_unit(1, 0), "alice") is None
+
+    def test_same_user_and_hash_added_once(self) -> None:
+        shard = near_duplicate.NearDuplicateShard()
+        shard.add(_hash("a"), "alice", _unit(1, 0))
+        shard.add(_hash("a"), "alice", _unit(1, 0))
+        shard.add(_hash("a"), "bob", _unit(1, 0))
+
+        assert len(shard) == 2
+
+    def test_dimension_mismatch_raises(self) -> None:
+        shard = near_duplicate.NearDuplicateShard()
+        shard.add(_hash("a"), "alice", _unit(1, 0))
+
+        with pytest.raises(ValueError, match="차원"):
+            shard.add(_hash("b"), "bob", _unit(1, 0, 0))
+        assert len(shard) == 1
+
+    def test_matrix_grows_past_initial_capacity(self) -> None:
+        shard = near_duplicate.NearDuplicateShard()
+        for i in range(150):
+            shard.add(_hash(str(i)), f"user{i}", _unit(1, i / 150))
+        shard.add(_hash("last"), "last", _unit(0, 1))
+
+        assert len(shard) == 151
+        assert shard.nearest(_unit(0, 1), "other")[0] == _hash("last")
+
+
+class TestPersistence:
+    def test_shard_is_rebuilt_from_embedding_store(self, tmp_path) -> None:
+        store = embedding_store.EmbeddingStore(str(tmp_path / "store"), "model")
+        store.put(_hash("a"), _unit(1, 0))
+        path = str(tmp_path / "shard" / "2026-10-18.jsonl")
+        near_duplicate.NearDuplicateShard(path).add(_hash("a"), "alice", _unit(1, 0))
+
+        with patch.object(embedding_store, "get_embedding_store", return_value=store):
+            reloaded = near_duplicate.NearDuplicateShard(path)
+
+        assert len(reloaded) == 1
+        image_hash, similarity = reloaded.nearest(_unit(1, 0), "bob")
+        assert image_hash == _hash("a")
+        assert similarity == pytest.approx(1.0, abs=1e-3)
+
+    def test_shard_path_under_store_directory(self, tmp_path) -> None:
+        store = embedding_store.EmbeddingStore(str(tmp_path), "model")
+        with patch.object(embedding_store, "get_embedding_store", return_value=store):
+            path = near_duplicate._shard_path("site/1", "2026-10-18")
+
+        assert path == str(tmp_path / "near_duplicate" / "site_1" / "2026-10-18.jsonl")
+
+    def test_memory_only_without_store(self) -> None:
+        assert near_duplicate._shard_path("site", "2026-10-18") is None
+
+
+class TestShardDays:
+    def test_window_starts_today(self) -> None:
+        with patch.object(settings, "NEAR_DUPLICATE_WINDOW_DAYS", 3):
+            days = near_duplicate.shard_days(date(2026, 3, 1))
+
+        assert days == ["2026-03-01", "2026-02-28", "2026-02-27"]
+
+
+class TestCheck:
+    def _submit(
+        self,
+        vector: np.ndarray,
+        user_id: str = "bob",
+        site_id: str = "site",
+        accepted: bool = True,
+    ) -> dict | None:
+        """검사 후, 쿠폰 지급이 확정된 제출이면 샤드에 기록한다 (policy와 같은 순서)."""
+        artifact = ImageArtifact(data=user_id.encode() + vector.tobytes())
+        context = {"user_id": user_id, "site_id": site_id}
+        embeds = torch.from_numpy(vector).unsqueeze(0)
+        with (
+            patch.object(settings, "NEAR_DUPLICATE_ENABLED", True),
+            patch.object(settings, "BYPASS_MODEL_VALIDATION", False),
+            patch.object(settings, "NEAR_DUPLICATE_SIMILARITY", 0.95),
+            patch.object(siglip2, "_load_siglip2"),
+            patch.object(siglip2, "image_embedding", return_value=embeds),
+        ):
+            match = near_duplicate.check(context, artifact)
+            if accepted:
+                near_duplicate.record(context, artifact)
+        return match
+
+    def test_flags_other_users_similar_photo(self) -> None:
+        assert self._submit(_unit(1, 0), user_id="alice") is None
+
+        match = self._submit(_unit(1, 0.05), user_id="bob")
+
+        assert match is not None
+        assert match["similarity"] >= 0.95
+        assert len(match["image_hash"]) == 64
+
+    def test_check_does_not_add_to_shard(self) -> None:
+        self._submit(_unit(1, 0), user_id="alice", accepted=False)
+
+        assert self._submit(_unit(1, 0), user_id="bob") is None
+        assert (
+            len(near_duplicate.get_shard("site", near_duplicate.shard_days()[0])) == 1
+        )
+
+    def test_below_cutoff_is_not_flagged(self) -> None:
+        self._submit(_unit(1, 0), user_id="alice")
+
+        assert self._submit(_unit(1, 1), user_id="bob") is None
+
+    def test_same_user_resubmission_is_not_flagged(self) -> None:
+        self._submit(_unit(1, 0), user_id="alice")
+
+        assert self._submit(_unit(1, 0.01), user_id="alice") is None
+
+    def test_sites_are_separate(self) -> None:
+        self._submit(_unit(1, 0), user_id="alice", site_id="a")
+
+        assert self._submit(_unit(1, 0), user_id="bob", site_id="b") is None
+
+    def test_earlier_day_shard_is_searched(self) -> None:
+        yesterday = near_duplicate.shard_days()[1]
+        near_duplicate.get_shard("site", yesterday).add(
+            _hash("old"), "alice", _unit(1, 0)
+        )
+
+        match = self._submit(_unit(1, 0), user_id="bob")
+
+        assert match["image_hash"] == _hash("old")
+
+    def test_dimension_mismatch_returns_none(self) -> None:
+        near_duplicate.get_shard("site", near_duplicate.shard_days()[0]).add(
+            _hash("old"), "alice", _unit(1, 0, 0)
+        )
+
+        assert self._submit(_unit(1, 0), user_id="bob", accepted=False) is None
+
+    def test_disabled_or_bypass_returns_none(self) -> None:
+        artifact = ImageArtifact(data=b"x")
+        with patch.object(siglip2, "image_embedding") as mock_embed:
+            assert near_duplicate.check({}, artifact) is None
+            near_duplicate.record({}, artifact)
+            with (
+                patch.object(settings, "NEAR_DUPLICATE_ENABLED", True),
+                patch.object(settings, "BYPASS_MODEL_VALIDATION", True),
+            ):
+                assert near_duplicate.check({}, artifact) is None
+        mock_embed.assert_not_called()
+
+    def test_embedding_failure_returns_none(self) -> None:
+        with (
+            patch.object(settings, "NEAR_DUPLICATE_ENABLED", True),
+            patch.object(settings, "BYPASS_MODEL_VALIDATION", False),
+            patch.object(siglip2, "_load_siglip2", side_effect=RuntimeError("oom")),
+        ):
+            assert near_duplicate.check({}, ImageArtifact(data=b"x")) is None
+            near_duplicate.record({}, ImageArtifact(data=b"x"))
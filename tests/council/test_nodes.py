@@ -1,4 +1,7 @@
 from typing import Any, Dict
+from unittest.mock import patch
+
+from app.core.image_artifact import ImageArtifact
 
 from app.council.nodes import (
     validator,
@@ -134,6 +137,23 @@ class TestEvidenceAggregator:
         assert ensemble["merged_label"] == "match"
         assert ensemble["conflict"] is False
 
+    def test_onnx_backend_uses_siglip2_weight(self):
+        """siglip2-onnx 투표는 siglip2와 같은 가중치로 합산된다."""
+
+        def merged(siglip_model: str) -> float:
+            state = {
+                "request_context": {"mission_type": "atmosphere"},
+                "artifacts": {
+                    "model_votes": [
+                        {"model": siglip_model, "score": 0.9, "label": "match"},
+                        {"model": "blip", "score": 0.1, "label": "mismatch"},
+                    ]
+                },
+            }
+            return aggregator(state)["artifacts"]["ensemble_result"]["merged_score"]
+
+        assert merged("siglip2-onnx") == merged("siglip2")
+
 
 class TestDecisionEngine:
     def test_judge_success(self):
@@ -173,6 +193,68 @@ class TestCouponPolicyEngine:
 
         assert output["artifacts"]["coupon_decision"]["eligible"] is True
 
+    def test_policy_records_only_eligible_submission(self):
+        artifact = ImageArtifact(data=b"photo")
+        context = {"user_id": "u", "image_artifact": artifact}
+        with (
+            patch("app.council.nodes.near_duplicate.record") as mock_record,
+            patch("app.council.nodes.phash_index.record") as mock_phash_record,
+        ):
+            policy(
+                {
+                    "request_context": context,
+                    "artifacts": {
+                        "judgment": {"success": True},
+                        "gate_result": {"risk_flags": ["near_duplicate"]},
+                    },
+                }
+            )
+            mock_record.assert_not_called()
+            mock_phash_record.assert_not_called()
+            policy(
+                {
+                    "request_context": context,
+                    "artifacts": {
+                        "judgment": {"success": True},
+                        "gate_result": {"risk_flags": []},
+                    },
+                }
+            )
+
+        mock_record.assert_called_once_with(context, artifact)
+        mock_phash_record.assert_called_once_with(context, artifact)
+
+    def test_policy_denies_near_duplicate(self):
+        input_state = {
+            "artifacts": {
+                "judgment": {"success": True, "reason": "score_passed"},
+                "gate_result": {"risk_flags": ["near_duplicate"]},
+            }
+        }
+
+        output = policy(input_state)
+        _print_io("policy (near_duplicate)", input_state, output)
+
+        decision = output["artifacts"]["coupon_decision"]
+        assert decision["eligible"] is False
+        assert decision["deny_reason"] == "near_duplicate"
+
+    def test_policy_prefers_exact_duplicate_reason(self):
+        input_state = {
+            "artifacts": {
+                "judgment": {"success": True},
+                "gate_result": {
+                    "risk_flags": ["near_duplicate", "perceptual_duplicate"]
+                },
+            }
+        }
+
+        output = policy(input_state)
+
+        decision = output["artifacts"]["coupon_decision"]
+        assert decision["eligible"] is False
+        assert decision["deny_reason"] == "perceptual_duplicate"
+
 
 class TestFinalizer:
     def test_responder_success(self):
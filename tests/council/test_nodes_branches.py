@@ -9,20 +9,32 @@
   - 570-574 : judge — conflict + borderline → 강제 fail
   - 579-586 : judge — council_verdict override + escalated
   - 713-729 : responder — gate passed 但 success=False (fail 응답)
+  - 공유 ImageArtifact : validator 생성·재사용 → evaluator가 모델 프로브에 전달
+  - 근접 중복 : validator가 near_duplicate·perceptual_duplicate 플래그만 세우고 판정은 계속 진행
+  - 시간 초과 : 느린 모델을 기다리지 않고 반환 (모델 실행 풀에서 결과만 폐기)
+  - 워커 풀 : 모델별 프로세스/스레드 분기, 시간 초과 시 대기 작업 취소·공유 이미지 해제
+  - 요청 기한 : 기한 초과 시 모델 생략, 남은 기한까지만 대기
+  - cascade : 앙상블 모델을 순서대로 실행, 확신 구간 밖이면 나머지 생략
 """
 
 from __future__ import annotations
 
+import concurrent.futures
+import threading
+import time
 from typing import Any
 from unittest.mock import MagicMock, patch
 
 
+from app.core.image_artifact import ImageArtifact
 from app.council.nodes import (
     _invoke_model,
     _select_models,
+    aggregator,
     evaluator,
     judge,
     responder,
+    validator,
 )
 
 
@@ -174,6 +186,7 @@ class TestEvaluatorNoVotes:
             mock_settings.MODEL_SELECTION_LOCATION = "siglip2"
             mock_settings.location_ensemble_models = ["siglip2"]
             mock_settings.API_TIMEOUT_SECONDS = 30
+            mock_settings.MODEL_WORKER_POOL_ENABLED = False
             with patch(
                 "app.council.nodes._invoke_model", side_effect=RuntimeError("fail")
             ):
@@ -192,6 +205,7 @@ class TestEvaluatorNoVotes:
             mock_settings.MODEL_SELECTION_LOCATION = "siglip2"
             mock_settings.location_ensemble_models = ["siglip2"]
             mock_settings.API_TIMEOUT_SECONDS = 30
+            mock_settings.MODEL_WORKER_POOL_ENABLED = False
             with patch(
                 "app.council.nodes._invoke_model", side_effect=RuntimeError("fail")
             ):
@@ -214,6 +228,361 @@ class TestEvaluatorNoVotes:
         assert any("bypass" in m for m in result["messages"])
 
 
+# ── 공유 ImageArtifact ────────────────────────────────────────────────────────
+
+
+class TestSharedImageArtifact:
+    """validator가 만든 아티팩트 하나를 메타데이터·해시·모델 프로브가 공유한다."""
+
+    def _validate(
+        self, request_context: dict[str, Any]
+    ) -> tuple[dict[str, Any], MagicMock, MagicMock]:
+        with (
+            patch("app.council.nodes.settings") as mock_settings,
+            patch(
+                "app.council.nodes.validate_metadata", return_value=True
+            ) as mock_meta,
+            patch("app.council.nodes.mission_session_service") as mock_svc,
+        ):
+            mock_settings.SKIP_METADATA_VALIDATION = False
+            mock_svc.hash_file.return_value = "abc"
+            mock_svc.is_duplicate_hash_for_user.return_value = False
+            result = validator({"request_context": request_context})
+        return result, mock_meta, mock_svc
+
+    def test_validator_creates_one_artifact_for_all_checks(self) -> None:
+        result, mock_meta, mock_svc = self._validate({"image_path": "/img.jpg"})
+
+        artifact = result["request_context"]["image_artifact"]
+        assert isinstance(artifact, ImageArtifact)
+        assert artifact.path == "/img.jpg"
+        mock_meta.assert_called_once_with(artifact)
+        mock_svc.hash_file.assert_called_once_with(artifact)
+
+    def test_validator_reuses_existing_artifact(self) -> None:
+        existing = ImageArtifact(path="/img.jpg", data=b"raw")
+        result, _, _ = self._validate(
+            {"image_path": "/img.jpg", "image_artifact": existing}
+        )
+        assert result["request_context"]["image_artifact"] is existing
+
+    def test_validator_flags_near_duplicate_without_blocking(self) -> None:
+        match = {"image_hash": "def", "similarity": 0.98}
+        with patch(
+            "app.council.nodes.near_duplicate.check", return_value=match
+        ) as mock_check:
+            result, _, _ = self._validate({"image_path": "/img.jpg"})
+
+        gate = result["artifacts"]["gate_result"]
+        assert gate["passed"] is True
+        assert gate["risk_flags"] == ["near_duplicate"]
+        assert gate["near_duplicate"] == match
+        mock_check.assert_called_once_with(
+            result["request_context"], result["request_context"]["image_artifact"]
+        )
+
+    def test_validator_flags_perceptual_duplicate(self) -> None:
+        match = {"image_hash": "def", "distance": 3}
+        with patch("app.council.nodes.phash_index.check", return_value=match):
+            result, _, _ = self._validate({"image_path": "/img.jpg"})
+
+        gate = result["artifacts"]["gate_result"]
+        assert gate["passed"] is True
+        assert gate["risk_flags"] == ["perceptual_duplicate"]
+        assert gate["perceptual_duplicate"] == match
+
+    def test_validator_skips_near_duplicate_for_blocked_submission(self) -> None:
+        with (
+            patch("app.council.nodes.near_duplicate.check") as mock_check,
+            patch("app.council.nodes.phash_index.check") as mock_phash,
+            patch("app.council.nodes.settings") as mock_settings,
+            patch("app.council.nodes.validate_metadata", return_value=False),
+            patch("app.council.nodes.mission_session_service") as mock_svc,
+        ):
+            mock_settings.SKIP_METADATA_VALIDATION = False
+            mock_svc.hash_file.return_value = "abc"
+            mock_svc.is_duplicate_hash_for_user.return_value = False
+            result = validator({"request_context": {"image_path": "/img.jpg"}})
+
+        mock_check.assert_not_called()
+        mock_phash.assert_not_called()
+        assert result["artifacts"]["gate_result"]["near_duplicate"] is None
+
+    def test_evaluator_passes_artifact_to_probes(self) -> None:
+        artifact = ImageArtifact(path="/img.jpg", data=b"raw")
+        state = {
+            "request_context": {
+                "mission_type": "location",
+                "image_path": "/img.jpg",
+                "image_artifact": artifact,
+                "answer": "answer",
+                "model_selection": "ensemble",
+            },
+        }
+        with (
+            patch("app.council.nodes.settings") as mock_settings,
+            patch("app.council.nodes.build_prompt_bundle", return_value={}),
+            patch(
+                "app.council.nodes._invoke_model", return_value={"score": 1.0}
+            ) as mock_invoke,
+        ):
+            mock_settings.BYPASS_MODEL_VALIDATION = False
+            mock_settings.location_ensemble_models = ["siglip2", "blip"]
+            mock_settings.API_TIMEOUT_SECONDS = 30
+            mock_settings.MODEL_WORKER_POOL_ENABLED = False
+            evaluator(state)
+
+        assert mock_invoke.call_count == 2
+        for call in mock_invoke.call_args_list:
+            assert call.args[2] is artifact
+
+
+# ── evaluator — 시간 초과 모델 포기 ──────────────────────────────────────────
+
+
+class TestEvaluatorAbandonsTimedOutModel:
+    """시간 초과 모델을 기다리지 않고 나머지 투표로 즉시 반환한다."""
+
+    def test_returns_without_waiting_for_straggler(self) -> None:
+        release = threading.Event()
+
+        def invoke(model_name: str, *_: Any) -> dict[str, Any]:
+            if model_name == "blip":
+                release.wait(5)
+            return {"model": model_name, "score": 0.9}
+
+        state = {
+            "request_context": {
+                "mission_type": "location",
+                "image_path": "/img.jpg",
+                "answer": "answer",
+                "model_selection": "ensemble",
+            },
+        }
+        with (
+            patch("app.council.nodes.settings") as mock_settings,
+            patch("app.council.nodes.constants.MODEL_TIMEOUT_BUFFER_SECONDS", 0.3),
+            patch("app.council.nodes.build_prompt_bundle", return_value={}),
+            patch("app.council.nodes._invoke_model", side_effect=invoke),
+        ):
+            mock_settings.BYPASS_MODEL_VALIDATION = False
+            mock_settings.MODEL_WORKER_POOL_ENABLED = False
+            mock_settings.location_ensemble_models = ["siglip2", "blip"]
+            mock_settings.API_TIMEOUT_SECONDS = 0
+            start = time.monotonic()
+            result = evaluator(state)
+            elapsed = time.monotonic() - start
+            release.set()
+
+        assert elapsed < 2
+        assert [v["model"] for v in result["artifacts"]["model_votes"]] == ["siglip2"]
+        timeouts = [e for e in result["errors"] if e["code"] == "MODEL_TIMEOUT"]
+        assert [e["model"] for e in timeouts] == ["blip"]
+
+
+class TestEvaluatorDeadline:
+    """요청 기한이 지났거나 모자라면 이미 받은 투표까지만 사용한다."""
+
+    _STATE = {
+        "request_context": {
+            "mission_type": "location",
+            "image_path": "/img.jpg",
+            "answer": "answer",
+            "model_selection": "ensemble",
+        },
+    }
+
+    def _run(self, deadline: float, invoke: Any) -> dict[str, Any]:
+        state = {
+            "request_context": {**self._STATE["request_context"], "deadline": deadline}
+        }
+        with (
+            patch("app.council.nodes.settings") as mock_settings,
+            patch("app.council.nodes.build_prompt_bundle", return_value={}),
+            patch("app.council.nodes._invoke_model", side_effect=invoke) as mock_invoke,
+        ):
+            mock_settings.BYPASS_MODEL_VALIDATION = False
+            mock_settings.MODEL_WORKER_POOL_ENABLED = False
+            mock_settings.location_ensemble_models = ["siglip2", "blip"]
+            mock_settings.API_TIMEOUT_SECONDS = 30
+            result = evaluator(state)
+        result["invoked"] = mock_invoke.call_count
+        return result
+
+    def test_expired_deadline_skips_models(self) -> None:
+        result = self._run(
+            time.monotonic() - 1, lambda name, *_: {"model": name, "score": 0.9}
+        )
+
+        assert result["invoked"] == 0
+        assert result["artifacts"]["model_votes"] == []
+        assert [e["code"] for e in result["errors"]] == ["DEADLINE_EXCEEDED"]
+
+    def test_waits_only_until_deadline(self) -> None:
+        release = threading.Event()
+
+        def invoke(model_name: str, *_: Any) -> dict[str, Any]:
+            if model_name == "blip":
+                release.wait(5)
+            return {"model": model_name, "score": 0.9}
+
+        start = time.monotonic()
+        result = self._run(start + 0.3, invoke)
+        elapsed = time.monotonic() - start
+        release.set()
+
+        assert elapsed < 2
+        assert [v["model"] for v in result["artifacts"]["model_votes"]] == ["siglip2"]
+        timeouts = [e for e in result["errors"] if e["code"] == "MODEL_TIMEOUT"]
+        assert [e["model"] for e in timeouts] == ["blip"]
+
+
+class TestEvaluatorCascade:
+    """cascade 모드는 앞 모델 점수가 확실하면 뒤 모델을 부르지 않는다."""
+
+    def _run(self, siglip_score: float) -> tuple[dict[str, Any], list[str]]:
+        calls: list[str] = []
+
+        def invoke(model_name: str, *_: Any) -> dict[str, Any]:
+            calls.append(model_name)
+            score = siglip_score if model_name == "siglip2" else 0.5
+            label = "match" if score >= 0.7 else "mismatch"
+            return {"model": model_name, "score": score, "label": label}
+
+        state = {
+            "request_context": {
+                "mission_type": "location",
+                "image_path": "/img.jpg",
+                "answer": "answer",
+                "model_selection": "cascade",
+            },
+        }
+        with (
+            patch("app.council.nodes.settings") as mock_settings,
+            patch("app.council.nodes.build_prompt_bundle", return_value={}),
+            patch("app.council.nodes._invoke_model", side_effect=invoke),
+        ):
+            mock_settings.BYPASS_MODEL_VALIDATION = False
+            mock_settings.MODEL_WORKER_POOL_ENABLED = False
+            mock_settings.QWEN_PREFETCH_ENABLED = False
+            mock_settings.location_ensemble_models = ["siglip2", "blip"]
+            mock_settings.API_TIMEOUT_SECONDS = 30
+            mock_settings.LOCATION_PASS_THRESHOLD = 0.7
+            mock_settings.CASCADE_CONFIDENCE_MARGIN = 0.15
+            result = evaluator(state)
+        return result, calls
+
+    def test_select_models_uses_ensemble_list(self) -> None:
+        with patch("app.council.nodes.settings") as mock_settings:
+            mock_settings.location_ensemble_models = ["siglip2", "blip"]
+            assert _select_models("location", "cascade") == ["siglip2", "blip"]
+
+    def test_confident_first_model_stops_cascade(self) -> None:
+        result, calls = self._run(siglip_score=0.95)
+
+        assert calls == ["siglip2"]
+        assert [v["model"] for v in result["artifacts"]["model_votes"]] == ["siglip2"]
+        assert result["artifacts"]["selected_models"] == ["siglip2"]
+
+    def test_uncertain_first_model_escalates(self) -> None:
+        result, calls = self._run(siglip_score=0.72)
+
+        assert calls == ["siglip2", "blip"]
+        assert [v["model"] for v in result["artifacts"]["model_votes"]] == [
+            "siglip2",
+            "blip",
+        ]
+
+    def test_aggregator_accepts_cascade_votes(self) -> None:
+        result, _ = self._run(siglip_score=0.95)
+        state = {
+            "request_context": {"mission_type": "location"},
+            "artifacts": result["artifacts"],
+        }
+
+        ensemble = aggregator(state)["artifacts"]["ensemble_result"]
+
+        assert ensemble["merged_score"] == 0.95
+        assert ensemble["conflict"] is False
+
+
+# ── evaluator — 워커 프로세스 풀 분기 ────────────────────────────────────────
+
+
+class TestEvaluatorWorkerPool:
+    """풀이 담당하는 모델은 워커 프로세스로, 나머지는 스레드로 실행한다."""
+
+    _STATE = {
+        "request_context": {
+            "mission_type": "location",
+            "image_path": "/img.jpg",
+            "answer": "answer",
+            "model_selection": "ensemble",
+        },
+    }
+
+    def _run(
+        self, pool_future: concurrent.futures.Future, timeout: int = 30
+    ) -> tuple[dict[str, Any], MagicMock, MagicMock, MagicMock]:
+        pool = MagicMock()
+        pool.handles.side_effect = lambda name: name == "siglip2"
+        pool.submit.return_value = pool_future
+        shared_image = MagicMock()
+        with (
+            patch("app.council.nodes.settings") as mock_settings,
+            patch("app.council.nodes.constants.MODEL_TIMEOUT_BUFFER_SECONDS", 0),
+            patch("app.council.nodes.build_prompt_bundle", return_value={}),
+            patch("app.council.nodes._get_worker_pool", return_value=pool),
+            patch("app.council.nodes._share_image", return_value=shared_image),
+            patch(
+                "app.council.nodes._invoke_model",
+                return_value={"model": "blip", "score": 0.4},
+            ) as mock_invoke,
+        ):
+            mock_settings.BYPASS_MODEL_VALIDATION = False
+            mock_settings.location_ensemble_models = ["siglip2", "blip"]
+            mock_settings.API_TIMEOUT_SECONDS = timeout
+            result = evaluator(self._STATE)
+        return result, pool, shared_image, mock_invoke
+
+    def test_splits_models_between_pool_and_threads(self) -> None:
+        done: concurrent.futures.Future = concurrent.futures.Future()
+        done.set_result({"model": "siglip2", "score": 0.9})
+
+        result, pool, shared_image, mock_invoke = self._run(done)
+
+        pool.submit.assert_called_once_with(
+            "siglip2", shared_image, "location", "answer", {}
+        )
+        mock_invoke.assert_called_once()
+        assert mock_invoke.call_args.args[0] == "blip"
+        assert {v["model"] for v in result["artifacts"]["model_votes"]} == {
+            "siglip2",
+            "blip",
+        }
+        shared_image.close.assert_called_once()
+
+    def test_timeout_cancels_pending_worker_task(self) -> None:
+        pending: concurrent.futures.Future = concurrent.futures.Future()
+
+        result, _, shared_image, _ = self._run(pending, timeout=0)
+
+        assert pending.cancelled()
+        shared_image.close.assert_called_once()
+        timeouts = [e for e in result["errors"] if e["code"] == "MODEL_TIMEOUT"]
+        assert "siglip2" in [e["model"] for e in timeouts]
+
+    def test_running_worker_task_keeps_image_until_done(self) -> None:
+        running: concurrent.futures.Future = concurrent.futures.Future()
+        running.set_running_or_notify_cancel()
+
+        _, _, shared_image, _ = self._run(running, timeout=0)
+
+        shared_image.close.assert_not_called()
+        running.set_result({"model": "siglip2", "score": 0.9})
+        shared_image.close.assert_called_once()
+
+
 # ── judge — gate not passed ───────────────────────────────────────────────────
 
 
@@ -461,7 +830,9 @@ class TestResponderFail:
             return_value="감성적인 힌트 문장입니다.",
         ) as mock_hint:
             result = responder(self._fail_state())
-        mock_hint.assert_called_once_with("지혜의숲", "책이 가득한 곳", "location", [])
+        mock_hint.assert_called_once_with(
+            "지혜의숲", "책이 가득한 곳", "location", [], deadline=None
+        )
         assert result["final_response"]["data"]["hint"] == "감성적인 힌트 문장입니다."
 
     def test_fail_hint_llm_receives_static_hint_and_answer(self) -> None:
@@ -478,7 +849,7 @@ class TestResponderFail:
                 )
             )
         mock_hint.assert_called_once_with(
-            "화사한", "밝은 느낌의 사진", "atmosphere", []
+            "화사한", "밝은 느낌의 사진", "atmosphere", [], deadline=None
         )
 
     def test_fail_atmosphere_maps_to_photo_in_legacy(self) -> None:
@@ -0,0 +1,212 @@
+"""app.council.phash_index 단위 테스트.
+
+검증 대상:
+  - MultiIndexHash: 거리 이하 항목만 반환·같은 해시 항목 모음·선형 스캔과 같은 결과·최대 거리 검증
+  - PerceptualHashIndex: 최근접·본인 제출 제외·중복 추가 무시
+  - 영속화: JSONL 재로드·다른 프로세스 추가분 반영·쓰는 중인 줄 무시
+  - check/record: 다른 사용자의 근접 사진 플래그·조회만으로는 미추가·사이트 분리
+    ·정보가 부족한 해시 제외·꺼짐/디코드 실패 시 None
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import random
+from unittest.mock import PropertyMock, patch
+
+import pytest
+
+from app.core.config import settings
+from app.core.image_artifact import ImageArtifact
+from app.council import phash_index
+
+
+def _hash(name: str) -> str:
+    return hashlib.sha256(name.encode()).hexdigest()
+
+
+@pytest.fixture(autouse=True)
+def _reset_indexes():
+    phash_index._indexes.clear()
+    yield
+    phash_index._indexes.clear()
+
+
+class TestMultiIndexHash:
+    def test_search_returns_items_within_distance(self) -> None:
+        table = phash_index.MultiIndexHash(8)
+        table.add(0b0000, "zero")
+        table.add(0b0001, "one")
+        table.add(0b0111, "three")
+        table.add(0b1111, "four")
+
+        found = sorted(table.search(0b0000, 1))
+
+        assert found == [(0, "zero"), (1, "one")]
+        assert len(table) == 4
+        assert list(phash_index.MultiIndexHash(8).search(0, 8)) == []
+
+    def test_same_hash_keeps_all_items(self) -> None:
+        table = phash_index.MultiIndexHash(8)
+        table.add(42, "a")
+        table.add(42, "b")
+
+        assert sorted(item for _, item in table.search(42, 0)) == ["a", "b"]
+
+    def test_matches_linear_scan(self) -> None:
+        rng = random.Random(7)
+        values = [rng.getrandbits(64) for _ in range(500)]
+        # 몇 비트만 다른 근접 해시를 섞는다.
+        values += [v ^ (1 << rng.randrange(64)) for v in values[:50]]
+        table = phash_index.MultiIndexHash(8)
+        for i, value in enumerate(values):
+            table.add(value, i)
+
+        for query in values[:20]:
+            expected = {i for i, v in enumerate(values) if (v ^ query).bit_count() <= 8}
+            assert {item for _, item in table.search(query, 8)} == expected
+
+    def test_search_beyond_max_distance_raises(self) -> None:
+        with pytest.raises(ValueError, match="최대 거리"):
+            list(phash_index.MultiIndexHash(4).search(0, 5))
+
+
+class TestPerceptualHashIndex:
+    def test_nearest_other_user(self) -> None:
+        index = phash_index.PerceptualHashIndex()
+        index.add(0b1111, _hash("a"), "alice")
+        index.add(0b0111, _hash("b"), "bob")
+
+        assert index.nearest(0b1111, "carol", 2) == (_hash("a"), 0)
+        assert index.nearest(0b1111, "alice", 2) == (_hash("b"), 1)
+        assert index.nearest(0b1111, "alice", 0) is None
+
+    def test_same_user_and_hash_added_once(self) -> None:
+        index = phash_index.PerceptualHashIndex()
+        index.add(1, _hash("a"), "alice")
+        index.add(1, _hash("a"), "alice")
+
+        assert len(index) == 1
+
+    def test_reloads_from_jsonl(self, tmp_path) -> None:
+        path = str(tmp_path / "phash" / "site.jsonl")
+        phash_index.PerceptualHashIndex(path).add(0xFF, _hash("a"), "alice")
+
+        reloaded = phash_index.PerceptualHashIndex(path)
+
+        assert reloaded.nearest(0xFE, "bob", 1) == (_hash("a"), 1)
+        assert len(reloaded) == 1
+
+    def test_sees_records_appended_by_another_process(self, tmp_path) -> None:
+        path = str(tmp_path / "site.jsonl")
+        reader = phash_index.PerceptualHashIndex(path)
+        writer = phash_index.PerceptualHashIndex(path)
+        assert reader.nearest(0xFF, "bob", 1) is None
+
+        writer.add(0xFF, _hash("a"), "alice")
+
+        assert reader.nearest(0xFF, "bob", 1) == (_hash("a"), 0)
+
+    def test_partial_last_line_is_read_later(self, tmp_path) -> None:
+        path = tmp_path / "site.jsonl"
+        line = json.dumps({"phash": "00ff", "image_hash": _hash("a"), "user": "alice"})
+        path.write_text(line[:10])
+        index = phash_index.PerceptualHashIndex(str(path))
+
+        assert index.nearest(0xFF, "bob", 0) is None
+        path.write_text(line + "\n")
+        assert index.nearest(0xFF, "bob", 0) == (_hash("a"), 0)
+
+    def test_index_path_per_site(self, tmp_path) -> None:
+        with patch.object(settings, "DATA_DIR", str(tmp_path)):
+            path = phash_index.index_path("site/1")
+
+        assert path == str(tmp_path / "phash" / "site_1.jsonl")
+
+
+class TestCheck:
+    def _submit(
+        self, phash: int, user_id: str, site_id: str = "site", accepted: bool = True
+    ) -> dict | None:
+        """검사 후, 쿠폰 지급이 확정된 제출이면 인덱스에 기록한다 (policy와 같은 순서)."""
+        artifact = ImageArtifact(data=f"{user_id}{phash}".encode())
+        context = {"user_id": user_id, "site_id": site_id}
+        with (
+            patch.object(settings, "PHASH_INDEX_ENABLED", True),
+            patch.object(settings, "PHASH_MAX_DISTANCE", 6),
+            patch.object(
+                ImageArtifact, "dhash", new_callable=PropertyMock, return_value=phash
+            ),
+        ):
+            match = phash_index.check(context, artifact)
+            if accepted:
+                phash_index.record(context, artifact)
+        return match
+
+    @pytest.fixture(autouse=True)
+    def _data_dir(self, tmp_path):
+        with patch.object(settings, "DATA_DIR", str(tmp_path)):
+            yield
+
+    def test_flags_other_users_close_hash(self) -> None:
+        assert self._submit(0xFFFF, "alice") is None
+
+        match = self._submit(0xFFFF ^ 0b111, "bob")
+
+        assert match == {
+            "image_hash": hashlib.sha256(f"alice{0xFFFF}".encode()).hexdigest(),
+            "distance": 3,
+        }
+
+    def test_check_does_not_add_to_index(self) -> None:
+        self._submit(0xFFFF, "alice", accepted=False)
+
+        assert self._submit(0xFFFF, "bob") is None
+        assert len(phash_index.get_index("site")) == 1
+
+    def test_distant_hash_and_own_resubmission_are_not_flagged(self) -> None:
+        self._submit(0xFFFF, "alice")
+
+        assert self._submit(0xFFFF0000, "bob") is None
+        assert self._submit(0xFFFE, "alice") is None
+
+    def test_sites_are_separate(self) -> None:
+        self._submit(0xFFFF, "alice", site_id="a")
+
+        assert self._submit(0xFFFF, "bob", site_id="b") is None
+
+    @pytest.mark.parametrize("phash", [0, 0b1011, 2**64 - 1, (2**64 - 1) ^ 0b1])
+    def test_low_entropy_hash_is_skipped(self, phash: int) -> None:
+        self._submit(phash, "alice")
+
+        assert self._submit(phash, "bob") is None
+        assert phash_index._indexes == {}
+
+    def test_is_informative_bounds(self) -> None:
+        assert phash_index.is_informative(0xFF)
+        assert not phash_index.is_informative(0x7F)
+        assert phash_index.is_informative((2**64 - 1) ^ 0xFF)
+        assert not phash_index.is_informative((2**64 - 1) ^ 0x7F)
+
+    def test_records_phash_in_request_context(self) -> None:
+        context = {"user_id": "alice"}
+        with (
+            patch.object(settings, "PHASH_INDEX_ENABLED", True),
+            patch.object(
+                ImageArtifact, "dhash", new_callable=PropertyMock, return_value=0xAB
+            ),
+        ):
+            phash_index.check(context, ImageArtifact(data=b"x"))
+
+        assert context["phash"] == "00000000000000ab"
+
+    def test_disabled_returns_none(self) -> None:
+        with patch.object(settings, "PHASH_INDEX_ENABLED", False):
+            assert phash_index.check({}, ImageArtifact(data=b"x")) is None
+            phash_index.record({}, ImageArtifact(data=b"x"))
+        assert phash_index._indexes == {}
+
+    def test_undecodable_image_returns_none(self) -> None:
+        with patch.object(settings, "PHASH_INDEX_ENABLED", True):
+            assert phash_index.check({}, ImageArtifact(data=b"not an image")) is None
@@ -1,13 +1,16 @@
 """재시도 힌트 생성 단위 테스트.
 
 검증 대상:
-  - _generate_retry_hint: LLM 호출 / 실패 시 폴백
+  - _generate_retry_hint: LLM 호출 / 실패 시 폴백 / 요청 기한 초과 시 정적 힌트
+  - 분위기 미션: SigLIP2 어휘 점수 기반 대비 힌트
   - LLMService.generate_blip_hint: 프롬프트 렌더링 → LLM 호출 → 문자열 반환
   - prompt_hint_generation.yaml: 필수 변수 존재 / default variant 활성 여부
 """
 
 from __future__ import annotations
 
+import threading
+import time
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -93,6 +96,72 @@ class TestGenerateRetryHint:
         assert kwargs["mission_type"] == "atmosphere"
 
 
+class TestAtmosphereScoreHint:
+    """SigLIP2 투표의 어휘 점수(scores)로 분위기 대비 힌트를 고른다."""
+
+    _SCORES = {
+        "옛스럽고 빈티지한": 0.1,
+        "화사하고 활기찬": 0.7,
+        "차분하고 자연적인": 0.2,
+    }
+
+    @pytest.mark.parametrize("model", ["siglip2", "siglip2-onnx"])
+    def test_uses_contrast_hint_without_llm(self, model: str) -> None:
+        from app.core.hints import CONTRAST_HINTS
+
+        votes = [{"model": model, "score": 0.2, "scores": self._SCORES}]
+        with patch("app.models.llm.LLMService") as mock_llm:
+            result = _generate_retry_hint(
+                "옛스럽고 빈티지한", "정적 힌트", "atmosphere", votes=votes
+            )
+
+        assert result == CONTRAST_HINTS[("옛스럽고 빈티지한", "화사하고 활기찬")]
+        mock_llm.assert_not_called()
+
+
+class TestRetryHintDeadline:
+    """요청 기한이 있으면 LLM 힌트를 남은 시간만큼만 기다린다."""
+
+    def test_expired_deadline_skips_llm(self) -> None:
+        with patch("app.models.llm.LLMService") as mock_cls:
+            result = _generate_retry_hint(
+                "지혜의숲",
+                "책이 가득한 곳",
+                "location",
+                deadline=time.monotonic() - 1,
+            )
+        mock_cls.assert_not_called()
+        assert result == "책이 가득한 곳"
+
+    def test_returns_llm_hint_within_deadline(self) -> None:
+        mock_svc = MagicMock()
+        mock_svc.generate_blip_hint.return_value = "감성 힌트"
+        with patch("app.models.llm.LLMService", return_value=mock_svc):
+            result = _generate_retry_hint(
+                "지혜의숲",
+                "책이 가득한 곳",
+                "location",
+                deadline=time.monotonic() + 5,
+            )
+        assert result == "감성 힌트"
+
+    def test_slow_llm_falls_back_to_static_hint(self) -> None:
+        release = threading.Event()
+        mock_svc = MagicMock()
+        mock_svc.generate_blip_hint.side_effect = lambda **_: (
+            release.wait(5) and "늦은 힌트"
+        )
+        start = time.monotonic()
+        with patch("app.models.llm.LLMService", return_value=mock_svc):
+            result = _generate_retry_hint(
+                "지혜의숲", "책이 가득한 곳", "location", deadline=start + 0.2
+            )
+        elapsed = time.monotonic() - start
+        release.set()
+        assert elapsed < 2
+        assert result == "책이 가득한 곳"
+
+
 # ── LLMService.generate_blip_hint ─────────────────────────────────────────────
 
 
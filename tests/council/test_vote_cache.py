@@ -0,0 +1,256 @@
+"""app.council.vote_cache 단위 테스트.
+
+검증 대상:
+  - VoteCache: 저장·조회 사본, TTL 만료, LRU 축출, 실패 투표(fail·failed) 미저장
+  - 키: 프롬프트 번들 지문은 키 순서와 무관, image_hash 없거나 캐시 꺼지면 키 없음
+  - evaluator: 같은 사진·정답 재평가 시 모델 재실행 없이 캐시 투표 사용
+  - QwenFallbackJudge: evaluator가 남긴 qwen 투표를 캐시에서 재사용
+  - Qwen 선행 호출: 경계값/충돌 판단, evaluator 중 시작·결과 캐시, Judge가 진행 중 호출 대기
+"""
+
+from __future__ import annotations
+
+import concurrent.futures
+import threading
+import time
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.core.config import settings
+from app.council import vote_cache
+from app.council.judges import JudgeContext, QwenFallbackJudge
+from app.council.nodes import _should_prefetch_qwen, evaluator
+
+_VOTE = {"model": "siglip2", "score": 0.8, "label": "match", "reason": "ok"}
+
+
+@pytest.fixture
+def enabled_cache():
+    """캐시를 켜고 테스트마다 새 싱글턴을 쓴다."""
+    with (
+        patch.object(settings, "VOTE_CACHE_ENABLED", True),
+        patch.object(vote_cache, "_cache", None),
+    ):
+        yield vote_cache.get_vote_cache()
+
+
+class TestVoteCache:
+    def test_returns_copy_of_stored_vote(self) -> None:
+        cache = vote_cache.VoteCache(max_entries=4, ttl_seconds=60)
+        key = vote_cache.vote_key("hash", "siglip2", "location", "활돌이", {})
+        cache.put(key, _VOTE)
+
+        vote = cache.get(key)
+        vote["score"] = 0.0
+
+        assert cache.get(key) == _VOTE
+
+    def test_expired_entry_is_dropped(self) -> None:
+        cache = vote_cache.VoteCache(max_entries=4, ttl_seconds=10)
+        with patch.object(vote_cache.time, "monotonic", return_value=100.0):
+            cache.put(("k",) * 5, _VOTE)
+        with patch.object(vote_cache.time, "monotonic", return_value=110.0):
+            assert cache.get(("k",) * 5) is None
+        assert len(cache) == 0
+
+    def test_evicts_least_recently_used(self) -> None:
+        cache = vote_cache.VoteCache(max_entries=2, ttl_seconds=60)
+        a, b, c = (("a",) * 5), (("b",) * 5), (("c",) * 5)
+        cache.put(a, _VOTE)
+        cache.put(b, _VOTE)
+        cache.get(a)
+        cache.put(c, _VOTE)
+
+        assert cache.get(a) is not None
+        assert cache.get(b) is None
+        assert cache.get(c) is not None
+
+    @pytest.mark.parametrize(
+        "vote",
+        [
+            {"model": "qwen", "score": 0.0, "label": "fail", "reason": "timeout"},
+            {"score": 0.0, "label": "mismatch", "reason": "x", "failed": True},
+            {"model": "blip", "score": 0.0, "label": "mismatch", "failed": True},
+        ],
+    )
+    def test_failure_votes_are_not_stored(self, vote: dict[str, Any]) -> None:
+        cache = vote_cache.VoteCache(max_entries=4, ttl_seconds=60)
+        cache.put(("k",) * 5, vote)
+        assert len(cache) == 0
+
+    def test_reason_text_does_not_decide_cacheability(self) -> None:
+        vote = {"score": 0.0, "label": "mismatch", "reason": "Inference failed: x"}
+
+        assert vote_cache.is_cacheable(vote)
+
+
+class TestKeys:
+    def test_fingerprint_ignores_key_order(self) -> None:
+        assert vote_cache.prompt_fingerprint(
+            {"a": 1, "b": [1, 2]}
+        ) == vote_cache.prompt_fingerprint({"b": [1, 2], "a": 1})
+        assert vote_cache.prompt_fingerprint({"a": 1}) != (
+            vote_cache.prompt_fingerprint({"a": 2})
+        )
+
+    def test_no_key_without_image_hash(self, enabled_cache) -> None:
+        assert vote_cache.request_key({}, "siglip2", "location", "x", {}) is None
+
+    def test_no_key_when_disabled(self) -> None:
+        with patch.object(settings, "VOTE_CACHE_ENABLED", False):
+            key = vote_cache.request_key(
+                {"image_hash": "h"}, "siglip2", "location", "x", {}
+            )
+        assert key is None
+
+
+class TestEvaluatorUsesCache:
+    def test_second_evaluation_skips_models(self, enabled_cache) -> None:
+        state = {
+            "request_context": {
+                "mission_type": "location",
+                "image_path": "/img.jpg",
+                "image_hash": "hash-1",
+                "answer": "활돌이",
+                "model_selection": "siglip2",
+            },
+        }
+        with (
+            patch("app.council.nodes.build_prompt_bundle", return_value={"p": 1}),
+            patch("app.council.nodes._invoke_model", return_value=_VOTE) as invoke,
+        ):
+            first = evaluator(state)
+            second = evaluator(state)
+
+        assert invoke.call_count == 1
+        assert second["artifacts"]["model_votes"] == first["artifacts"]["model_votes"]
+
+
+class TestJudgeUsesCache:
+    def test_reuses_cached_qwen_vote(self, enabled_cache) -> None:
+        bundle = {"qwen_prompt": "p"}
+        qwen_vote = {"model": "qwen", "score": 0.2, "label": "mismatch", "reason": ""}
+        enabled_cache.put(
+            vote_cache.vote_key("hash-1", "qwen", "location", "활돌이", bundle),
+            qwen_vote,
+        )
+        registry = MagicMock()
+        context = JudgeContext(
+            mission_type="location",
+            ensemble_result={"merged_score": 0.75, "threshold": 0.7},
+            model_votes=[],
+            request_context={
+                "mission_type": "location",
+                "image_hash": "hash-1",
+                "answer": "활돌이",
+            },
+        )
+        with (
+            patch(
+                "app.models.model_registry.ModelRegistry.get_instance",
+                return_value=registry,
+            ),
+            patch("app.models.prompts.build_prompt_bundle", return_value=bundle),
+        ):
+            verdict = QwenFallbackJudge().evaluate(context)
+
+        registry.submit.assert_not_called()
+        assert verdict["approved"] is False
+        assert verdict["confidence"] == 0.2
+
+
+class TestQwenPrefetch:
+    @pytest.mark.parametrize(
+        ("votes", "expected"),
+        [
+            ([{"score": 0.72, "label": "match"}], True),
+            ([{"score": 0.95, "label": "match"}], False),
+            (
+                [
+                    {"score": 0.95, "label": "match"},
+                    {"score": 0.1, "label": "mismatch"},
+                ],
+                True,
+            ),
+            ([], False),
+        ],
+    )
+    def test_borderline_or_conflict(
+        self, votes: list[dict[str, Any]], expected: bool
+    ) -> None:
+        with (
+            patch.object(settings, "LOCATION_PASS_THRESHOLD", 0.7),
+            patch.object(settings, "COUNCIL_BORDERLINE_MARGIN", 0.08),
+        ):
+            assert _should_prefetch_qwen(votes, "location") is expected
+
+    def test_evaluator_starts_qwen_and_judge_reuses_it(self, enabled_cache) -> None:
+        qwen_vote = {"model": "qwen", "score": 0.9, "label": "match", "reason": "ok"}
+
+        def invoke(model_name: str, *_: Any) -> dict[str, Any]:
+            if model_name == "qwen":
+                return qwen_vote
+            return {"model": model_name, "score": 0.72, "label": "match"}
+
+        request_context = {
+            "mission_type": "location",
+            "image_path": "/img.jpg",
+            "image_hash": "hash-1",
+            "answer": "활돌이",
+            "model_selection": "siglip2",
+        }
+        bundle = {"qwen_prompt": "p"}
+        with (
+            patch.object(settings, "QWEN_PREFETCH_ENABLED", True),
+            patch.object(settings, "LOCATION_PASS_THRESHOLD", 0.7),
+            patch("app.council.nodes.build_prompt_bundle", return_value=bundle),
+            patch("app.council.nodes._invoke_model", side_effect=invoke) as mock_invoke,
+        ):
+            result = evaluator({"request_context": request_context})
+            key = vote_cache.vote_key("hash-1", "qwen", "location", "활돌이", bundle)
+            # 완료 콜백이 캐시에 저장한 뒤 진행 중 목록에서 빠진다.
+            deadline = time.monotonic() + 5
+            while vote_cache.in_flight(key) is not None and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+        assert [v["model"] for v in result["artifacts"]["model_votes"]] == ["siglip2"]
+        assert [c.args[0] for c in mock_invoke.call_args_list] == ["siglip2", "qwen"]
+        assert enabled_cache.get(key) == qwen_vote
+
+    def test_judge_waits_for_in_flight_call(self, enabled_cache) -> None:
+        bundle = {"qwen_prompt": "p"}
+        key = vote_cache.vote_key("hash-1", "qwen", "location", "활돌이", bundle)
+        future: concurrent.futures.Future = concurrent.futures.Future()
+        vote_cache.track(key, future)
+        timer = threading.Timer(
+            0.1,
+            future.set_result,
+            [{"model": "qwen", "score": 0.1, "label": "mismatch", "reason": ""}],
+        )
+        registry = MagicMock()
+        context = JudgeContext(
+            mission_type="location",
+            ensemble_result={"merged_score": 0.75, "threshold": 0.7},
+            model_votes=[],
+            request_context={
+                "mission_type": "location",
+                "image_hash": "hash-1",
+                "answer": "활돌이",
+            },
+        )
+        with (
+            patch(
+                "app.models.model_registry.ModelRegistry.get_instance",
+                return_value=registry,
+            ),
+            patch("app.models.prompts.build_prompt_bundle", return_value=bundle),
+        ):
+            timer.start()
+            verdict = QwenFallbackJudge().evaluate(context)
+
+        registry.submit.assert_not_called()
+        assert verdict["approved"] is False
+        assert vote_cache.in_flight(key) is None
+        assert enabled_cache.get(key) is not None
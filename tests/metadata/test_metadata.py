@@ -4,6 +4,7 @@
   - extract_gps_coordinates: GPS 있음/없음/예외
   - is_in_bbox: BBox 내부/외부 경계값
   - quick_photo_summary: 오늘+내부(True) / GPS없음(False) / 예외(False)
+  - 공유 ImageArtifact: EXIF 1회 읽기
 """
 
 from __future__ import annotations
@@ -11,7 +12,9 @@ from __future__ import annotations
 from datetime import datetime
 from unittest.mock import MagicMock, patch
 
+import pytest
 
+from app.core.image_artifact import ImageArtifact
 from app.metadata.metadata import (
     MAX_LAT,
     MAX_LON,
@@ -23,6 +26,13 @@ from app.metadata.metadata import (
 )
 
 
+@pytest.fixture(autouse=True)
+def _no_file_read():
+    """가짜 경로로도 동작하도록 아티팩트의 파일 읽기를 막는다 (디코드는 Image.open mock)."""
+    with patch.object(ImageArtifact, "_read", return_value=b""):
+        yield
+
+
 # ── is_in_bbox ────────────────────────────────────────────────────────────────
 
 
@@ -84,14 +94,14 @@ class TestExtractGpsCoordinates:
 
     def test_no_exif_returns_none(self) -> None:
         img = self._make_img_mock(has_exif=False)
-        with patch("app.metadata.metadata.Image.open", return_value=img):
+        with patch("app.core.image_artifact.Image.open", return_value=img):
             result = extract_gps_coordinates("/fake.jpg")
         assert result is None
 
     def test_empty_gps_ifd_returns_none(self) -> None:
         img = self._make_img_mock(gps_ifd=None)
         # gps_ifd=None → get_ifd returns None → falsy → return None
-        with patch("app.metadata.metadata.Image.open", return_value=img):
+        with patch("app.core.image_artifact.Image.open", return_value=img):
             result = extract_gps_coordinates("/fake.jpg")
         assert result is None
 
@@ -103,7 +113,7 @@ class TestExtractGpsCoordinates:
             4: (126.0, 41.0, 0.0),  # GPSLongitude (DMS)
         }
         img = self._make_img_mock(gps_ifd=gps_ifd)
-        with patch("app.metadata.metadata.Image.open", return_value=img):
+        with patch("app.core.image_artifact.Image.open", return_value=img):
             result = extract_gps_coordinates("/fake.jpg")
         assert result is not None
         lat, lon = result
@@ -118,7 +128,7 @@ class TestExtractGpsCoordinates:
             4: (20.0, 0.0, 0.0),
         }
         img = self._make_img_mock(gps_ifd=gps_ifd)
-        with patch("app.metadata.metadata.Image.open", return_value=img):
+        with patch("app.core.image_artifact.Image.open", return_value=img):
             result = extract_gps_coordinates("/fake.jpg")
         assert result is not None
         lat, _ = result
@@ -132,7 +142,7 @@ class TestExtractGpsCoordinates:
             4: (20.0, 0.0, 0.0),
         }
         img = self._make_img_mock(gps_ifd=gps_ifd)
-        with patch("app.metadata.metadata.Image.open", return_value=img):
+        with patch("app.core.image_artifact.Image.open", return_value=img):
             result = extract_gps_coordinates("/fake.jpg")
         assert result is not None
         _, lon = result
@@ -140,7 +150,7 @@ class TestExtractGpsCoordinates:
 
     def test_exception_returns_none(self) -> None:
         with patch(
-            "app.metadata.metadata.Image.open", side_effect=Exception("IO Error")
+            "app.core.image_artifact.Image.open", side_effect=Exception("IO Error")
         ):
             result = extract_gps_coordinates("/bad.jpg")
         assert result is None
@@ -177,7 +187,7 @@ class TestQuickPhotoSummary:
         img = MagicMock()
         img.getexif.return_value = FakeExif()
 
-        with patch("app.metadata.metadata.Image.open", return_value=img):
+        with patch("app.core.image_artifact.Image.open", return_value=img):
             result = quick_photo_summary("/fake.jpg")
 
         assert result is True
@@ -196,14 +206,14 @@ class TestQuickPhotoSummary:
         img = MagicMock()
         img.getexif.return_value = EmptyGpsExif()
 
-        with patch("app.metadata.metadata.Image.open", return_value=img):
+        with patch("app.core.image_artifact.Image.open", return_value=img):
             result = quick_photo_summary("/fake.jpg")
 
         assert result is False
 
     def test_exception_returns_false(self) -> None:
         with patch(
-            "app.metadata.metadata.Image.open", side_effect=Exception("IO Error")
+            "app.core.image_artifact.Image.open", side_effect=Exception("IO Error")
         ):
             result = quick_photo_summary("/bad.jpg")
         assert result is False
@@ -212,7 +222,19 @@ class TestQuickPhotoSummary:
         img = MagicMock()
         img.getexif.return_value = None
 
-        with patch("app.metadata.metadata.Image.open", return_value=img):
+        with patch("app.core.image_artifact.Image.open", return_value=img):
             result = quick_photo_summary("/fake.jpg")
 
         assert result is False
+
+    def test_shared_artifact_opens_image_once(self) -> None:
+        """아티팩트를 넘기면 날짜·GPS 검사가 EXIF를 한 번만 읽는다."""
+        img = MagicMock()
+        img.getexif.return_value = _MockExif(gps_ifd={})
+        artifact = ImageArtifact(path="/fake.jpg", data=b"")
+
+        with patch("app.core.image_artifact.Image.open", return_value=img) as mock_open:
+            quick_photo_summary(artifact)
+            extract_gps_coordinates(artifact)
+
+        mock_open.assert_called_once()
@@ -1,4 +1,8 @@
 from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.core.image_artifact import ImageArtifact
 from app.metadata.metadata import (
     extract_gps_coordinates,
     is_in_bbox,
@@ -6,6 +10,12 @@ from app.metadata.metadata import (
 )
 
 
+@pytest.fixture(autouse=True)
+def _no_file_read():
+    with patch.object(ImageArtifact, "_read", return_value=b""):
+        yield
+
+
 def test_is_in_bbox():
     # 파주출판단지 내부 좌표
     assert is_in_bbox(37.7115, 126.685) is True
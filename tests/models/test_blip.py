@@ -4,7 +4,12 @@
   - load_landmark_qa: 기본 파일·폴백·JSON 오류·파일 없음
   - check_with_blip: 모델 미로드·QA 없음·이미지 오류·성공·실패
   - get_visual_context: 이미지 오류·성공 경로
-  - probe_with_blip_location / probe_with_blip_atmosphere: 래퍼 결과 구조
+  - yes/no 스코어링 모드: 연속 확신도·단일 forward·generate 모드 호환
+  - 조기 종료: 판정 확정 시 중단·판정 동일성·가중치 순서·score 모드 점수 불변
+  - model.generate 정합성: 작은 무작위 BLIP으로 질문별 답변 토큰 비교
+  - 배치 VQA: 질문 사전 토크나이즈·단일 generate 호출·비전 인코딩 재사용·공유 아티팩트 전처리 1회·길이별 그룹·배치 분할·배치 실패 처리
+  - probe_with_blip_location / probe_with_blip_atmosphere: 래퍼 결과 구조·모델/이미지/추론 실패 시 failed 표시
+  - warmup: 모델 로드 + 비전 인코더·디코딩 1회·score 모드 스코어링
 """
 
 from __future__ import annotations
@@ -12,8 +17,40 @@ from __future__ import annotations
 import json
 from unittest.mock import MagicMock, patch
 
+import pytest
+import torch
 
 import app.models.blip as blip_module
+from app.core.image_artifact import ImageArtifact
+from app.council import vote_cache
+
+
+@pytest.fixture(autouse=True)
+def _clear_question_batches():
+    """테스트 간 질문 배치·yes/no 토큰 캐시가 공유되지 않도록 비운다."""
+    blip_module._question_batches.clear()
+    blip_module._yes_no_ids = None
+    yield
+    blip_module._question_batches.clear()
+    blip_module._yes_no_ids = None
+
+
+@pytest.fixture(autouse=True)
+def _no_file_read():
+    """가짜 경로로도 동작하도록 아티팩트의 파일 읽기를 막는다 (디코드는 Image.open mock)."""
+    with patch.object(ImageArtifact, "_read", return_value=b""):
+        yield
+
+
+def _mock_blip_model() -> MagicMock:
+    """비전 인코더·텍스트 인코더가 실제 텐서를 반환하는 BLIP 모델 mock."""
+    mock_model = MagicMock()
+    mock_model.decoder_start_token_id = 0
+    mock_model.vision_model.return_value = (torch.zeros(1, 2, 4),)
+    mock_model.text_encoder.side_effect = lambda input_ids, **_: (
+        torch.zeros(input_ids.shape[0], input_ids.shape[1], 4),
+    )
+    return mock_model
 
 
 # ── load_landmark_qa ──────────────────────────────────────────────────────────
@@ -82,10 +119,9 @@ class TestCheckWithBlip:
         mock_proc.return_value.pixel_values.to.return_value = MagicMock()
         mock_proc.return_value.input_ids = MagicMock()
         mock_proc.return_value.attention_mask = MagicMock()
-        token_output = MagicMock()
-        mock_proc.decode.return_value = "yes"
-        mock_model = MagicMock()
-        mock_model.generate.return_value = [token_output]
+        mock_proc.batch_decode.return_value = ["yes"]
+        mock_model = _mock_blip_model()
+        mock_model.text_decoder.generate.return_value = [MagicMock()]
         return mock_proc, mock_model
 
     def test_returns_false_when_no_qa_data(self) -> None:
@@ -120,7 +156,7 @@ class TestCheckWithBlip:
             patch.object(blip_module, "_processor", mock_proc),
             patch.object(blip_module, "_model", mock_model),
             patch.object(blip_module, "landmark_qa_data", {"활돌이": [["Q?", "yes"]]}),
-            patch("app.models.blip.Image.open", side_effect=FileNotFoundError),
+            patch("app.core.image_artifact.Image.open", side_effect=FileNotFoundError),
         ):
             result, hint = blip_module.check_with_blip("/missing.jpg", "활돌이")
         assert result is False
@@ -135,7 +171,9 @@ class TestCheckWithBlip:
             patch.object(blip_module, "_processor", mock_proc),
             patch.object(blip_module, "_model", mock_model),
             patch.object(blip_module, "landmark_qa_data", {"활돌이": [["Q?", "yes"]]}),
-            patch("app.models.blip.Image.open", side_effect=OSError("bad file")),
+            patch(
+                "app.core.image_artifact.Image.open", side_effect=OSError("bad file")
+            ),
         ):
             result, hint = blip_module.check_with_blip("/bad.jpg", "활돌이")
         assert result is False
@@ -149,7 +187,7 @@ class TestCheckWithBlip:
             patch.object(blip_module, "_processor", mock_proc),
             patch.object(blip_module, "_model", MagicMock()),
             patch.object(blip_module, "landmark_qa_data", {"활돌이": [["Q?", "yes"]]}),
-            patch("app.models.blip.Image.open", return_value=MagicMock()),
+            patch("app.core.image_artifact.Image.open", return_value=MagicMock()),
         ):
             result, hint = blip_module.check_with_blip("/img.jpg", "활돌이")
         assert result is False
@@ -159,10 +197,11 @@ class TestCheckWithBlip:
         mock_proc = MagicMock()
         pixel_mock = MagicMock()
         mock_proc.return_value.pixel_values.to.return_value = pixel_mock
-        mock_proc.decode.return_value = "yes"
+        mock_proc.return_value.input_ids = torch.ones(1, 4, dtype=torch.long)
+        mock_proc.batch_decode.return_value = ["yes", "yes"]
 
-        mock_model = MagicMock()
-        mock_model.generate.return_value = [MagicMock()]
+        mock_model = _mock_blip_model()
+        mock_model.text_decoder.generate.return_value = [MagicMock(), MagicMock()]
 
         qa_data = {"활돌이": [["Is it pink?", "yes"], ["Is it round?", "yes"]]}
         mock_image = MagicMock()
@@ -173,7 +212,7 @@ class TestCheckWithBlip:
             patch.object(blip_module, "_processor", mock_proc),
             patch.object(blip_module, "_model", mock_model),
             patch.object(blip_module, "landmark_qa_data", qa_data),
-            patch("app.models.blip.Image.open", return_value=mock_image),
+            patch("app.core.image_artifact.Image.open", return_value=mock_image),
         ):
             result, hint = blip_module.check_with_blip("/img.jpg", "활돌이")
         assert result is True
@@ -184,10 +223,11 @@ class TestCheckWithBlip:
         mock_proc = MagicMock()
         pixel_mock = MagicMock()
         mock_proc.return_value.pixel_values.to.return_value = pixel_mock
-        mock_proc.decode.return_value = "no"  # 모든 답변이 틀림
+        mock_proc.return_value.input_ids = torch.ones(1, 4, dtype=torch.long)
+        mock_proc.batch_decode.return_value = ["no"]  # 모든 답변이 틀림
 
-        mock_model = MagicMock()
-        mock_model.generate.return_value = [MagicMock()]
+        mock_model = _mock_blip_model()
+        mock_model.text_decoder.generate.return_value = [MagicMock()]
 
         qa_data = {"활돌이": [["Is it pink?", "yes"]]}  # expected: "yes", got: "no"
         mock_image = MagicMock()
@@ -198,7 +238,7 @@ class TestCheckWithBlip:
             patch.object(blip_module, "_processor", mock_proc),
             patch.object(blip_module, "_model", mock_model),
             patch.object(blip_module, "landmark_qa_data", qa_data),
-            patch("app.models.blip.Image.open", return_value=mock_image),
+            patch("app.core.image_artifact.Image.open", return_value=mock_image),
         ):
             result, hint = blip_module.check_with_blip("/img.jpg", "활돌이")
         assert result is False
@@ -206,6 +246,428 @@ class TestCheckWithBlip:
         assert hint[0]["expected_answer"] == "yes"
 
 
+# ── 배치 VQA ──────────────────────────────────────────────────────────────────
+
+
+class TestBatchedVqa:
+    def _loaded_mocks(self, answers: list[str]) -> tuple:
+        mock_proc = MagicMock()
+        mock_proc.return_value.pixel_values.to.return_value = MagicMock()
+        mock_proc.return_value.input_ids = torch.ones(1, 4, dtype=torch.long)
+        mock_proc.batch_decode.return_value = answers
+        mock_model = _mock_blip_model()
+        mock_model.text_decoder.generate.return_value = [MagicMock() for _ in answers]
+        mock_image = MagicMock()
+        mock_image.convert.return_value = mock_image
+        return mock_proc, mock_model, mock_image
+
+    def test_all_questions_answered_in_one_generate_call(self) -> None:
+        """질문 전체를 한 번의 generate 호출로 디코딩한다."""
+        qa_data = {"활돌이": [[f"Q{i}?", "yes"] for i in range(4)]}
+        mock_proc, mock_model, mock_image = self._loaded_mocks(["yes"] * 4)
+        with (
+            patch.object(blip_module, "_load_blip"),
+            patch.object(blip_module, "_processor", mock_proc),
+            patch.object(blip_module, "_model", mock_model),
+            patch.object(blip_module, "landmark_qa_data", qa_data),
+            patch.object(blip_module.settings, "BLIP_VQA_BATCH_SIZE", 0),
+            patch("app.core.image_artifact.Image.open", return_value=mock_image),
+        ):
+            result, _ = blip_module.check_with_blip("/img.jpg", "활돌이")
+        assert result is True
+        assert mock_model.text_decoder.generate.call_count == 1
+
+    def test_vision_encoder_runs_once_per_image(self) -> None:
+        """질문 배치가 여러 개여도 비전 인코더는 제출당 한 번만 실행된다."""
+        qa_data = {"활돌이": [[f"Q{i}?", "yes"] for i in range(4)]}
+        mock_proc, mock_model, mock_image = self._loaded_mocks(["yes", "yes"])
+        with (
+            patch.object(blip_module, "_load_blip"),
+            patch.object(blip_module, "_processor", mock_proc),
+            patch.object(blip_module, "_model", mock_model),
+            patch.object(blip_module, "landmark_qa_data", qa_data),
+            patch.object(blip_module.settings, "BLIP_VQA_BATCH_SIZE", 2),
+            patch("app.core.image_artifact.Image.open", return_value=mock_image),
+        ):
+            blip_module.check_with_blip("/img.jpg", "활돌이")
+        assert mock_model.text_decoder.generate.call_count == 2
+        assert mock_model.vision_model.call_count == 1
+        assert mock_model.text_encoder.call_count == 2
+
+    def test_shared_artifact_preprocesses_image_once(self) -> None:
+        """같은 ImageArtifact로 다시 호출하면 디코드·전처리 결과를 재사용한다."""
+        qa_data = {"활돌이": [["Q1?", "yes"]]}
+        mock_proc, mock_model, mock_image = self._loaded_mocks(["yes"])
+        artifact = ImageArtifact(path="/img.jpg", data=b"raw")
+        with (
+            patch.object(blip_module, "_load_blip"),
+            patch.object(blip_module, "_processor", mock_proc),
+            patch.object(blip_module, "_model", mock_model),
+            patch.object(blip_module, "landmark_qa_data", qa_data),
+            patch(
+                "app.core.image_artifact.Image.open", return_value=mock_image
+            ) as mock_open,
+        ):
+            blip_module.check_with_blip(artifact, "활돌이")
+            blip_module.get_visual_context(artifact)
+        image_calls = [c for c in mock_proc.call_args_list if "images" in c.kwargs]
+        assert len(image_calls) == 1
+        mock_open.assert_called_once()
+
+    def test_image_encoding_failure_returns_false(self) -> None:
+        """비전 인코더 실행이 실패하면 (False, [])를 반환한다."""
+        qa_data = {"활돌이": [["Q1?", "yes"]]}
+        mock_proc, mock_model, mock_image = self._loaded_mocks(["yes"])
+        mock_model.vision_model.side_effect = RuntimeError("oom")
+        with (
+            patch.object(blip_module, "_load_blip"),
+            patch.object(blip_module, "_processor", mock_proc),
+            patch.object(blip_module, "_model", mock_model),
+            patch.object(blip_module, "landmark_qa_data", qa_data),
+            patch("app.core.image_artifact.Image.open", return_value=mock_image),
+        ):
+            result, hint = blip_module.check_with_blip("/img.jpg", "활돌이")
+        assert result is False
+        assert hint == []
+        mock_model.text_decoder.generate.assert_not_called()
+
+    def test_batch_size_splits_generate_calls(self) -> None:
+        """BLIP_VQA_BATCH_SIZE 단위로 generate 호출을 나눈다."""
+        mock_proc, mock_model, _ = self._loaded_mocks(["yes", "yes"])
+        questions = ("Q1?", "Q2?", "Q3?", "Q4?")
+        with (
+            patch.object(blip_module, "_processor", mock_proc),
+            patch.object(blip_module, "_model", mock_model),
+            patch.object(blip_module.settings, "BLIP_VQA_BATCH_SIZE", 2),
+        ):
+            answers = blip_module._answer_questions(torch.zeros(1, 2, 4), questions, 10)
+        assert mock_model.text_decoder.generate.call_count == 2
+        assert len(answers) == 4
+
+    def test_questions_grouped_by_token_length(self) -> None:
+        """토큰 길이가 다른 질문은 패딩 없이 별도 배치로 나뉘고 순서는 유지된다."""
+        lengths = {"short?": 3, "long question?": 6, "tiny?": 3}
+        mock_proc = MagicMock()
+        mock_proc.side_effect = lambda text, **_: MagicMock(
+            input_ids=torch.ones(1, lengths[text], dtype=torch.long)
+        )
+        mock_proc.batch_decode.side_effect = lambda out, **_: (
+            [f"len{out.shape[1]}"] * out.shape[0]
+        )
+        mock_model = _mock_blip_model()
+        mock_model.text_decoder.generate.side_effect = lambda **kw: kw[
+            "encoder_hidden_states"
+        ]
+        with (
+            patch.object(blip_module, "_processor", mock_proc),
+            patch.object(blip_module, "_model", mock_model),
+            patch.object(blip_module.settings, "BLIP_VQA_BATCH_SIZE", 0),
+        ):
+            answers = blip_module._answer_questions(
+                torch.zeros(1, 2, 4), tuple(lengths), 10
+            )
+        assert mock_model.text_decoder.generate.call_count == 2
+        assert answers == ["len3", "len6", "len3"]
+
+    def test_questions_tokenized_once(self) -> None:
+        """같은 질문 목록은 한 번만 토크나이즈된다."""
+        mock_proc, mock_model, _ = self._loaded_mocks(["yes"])
+        with (
+            patch.object(blip_module, "_processor", mock_proc),
+            patch.object(blip_module, "_model", mock_model),
+        ):
+            blip_module._answer_questions(torch.zeros(1, 2, 4), ("Q1?",), 10)
+            blip_module._answer_questions(torch.zeros(1, 2, 4), ("Q1?",), 10)
+        text_calls = [c for c in mock_proc.call_args_list if "text" in c.kwargs]
+        assert len(text_calls) == 1
+
+    def test_batch_failure_marks_questions_as_error(self) -> None:
+        """배치 generate가 실패하면 해당 질문은 'error' 오답으로 기록된다."""
+        qa_data = {"활돌이": [["Q1?", "yes"], ["Q2?", "no"]]}
+        mock_proc, mock_model, mock_image = self._loaded_mocks([])
+        mock_model.text_decoder.generate.side_effect = RuntimeError("oom")
+        with (
+            patch.object(blip_module, "_load_blip"),
+            patch.object(blip_module, "_processor", mock_proc),
+            patch.object(blip_module, "_model", mock_model),
+            patch.object(blip_module, "landmark_qa_data", qa_data),
+            patch("app.core.image_artifact.Image.open", return_value=mock_image),
+        ):
+            result, hint = blip_module.check_with_blip("/img.jpg", "활돌이")
+        assert result is False
+        assert [h["model_answer"] for h in hint] == ["error", "error"]
+
+    def test_pretokenize_fills_cache_for_all_landmarks(self) -> None:
+        """모델 로드 시 랜드마크 질문과 시각 컨텍스트 질문을 미리 토크나이즈한다."""
+        qa_data = {"A": [["Q1?", "yes"]], "B": [["Q2?", "no"], ["Q3?", "yes"]]}
+        mock_proc = MagicMock()
+        mock_proc.return_value.input_ids = torch.ones(1, 4, dtype=torch.long)
+        with (
+            patch.object(blip_module, "_processor", mock_proc),
+            patch.object(blip_module, "landmark_qa_data", qa_data),
+        ):
+            blip_module._pretokenize_questions()
+        assert ("Q1?",) in blip_module._question_batches
+        assert ("Q2?", "Q3?") in blip_module._question_batches
+        assert blip_module.VISUAL_CONTEXT_PROBES in blip_module._question_batches
+
+
+# ── yes/no 스코어링 모드 ──────────────────────────────────────────────────────
+
+
+class TestScoreMode:
+    def _loaded_mocks(self, yes_logits: list[float]) -> tuple:
+        """디코더 첫 위치에서 [yes, no] 로짓이 [yes_logit, 0]인 mock 튜플."""
+        mock_proc = MagicMock()
+        mock_proc.return_value.pixel_values.to.return_value = MagicMock()
+        mock_proc.return_value.input_ids = torch.ones(1, 4, dtype=torch.long)
+        mock_proc.tokenizer.convert_tokens_to_ids.return_value = [0, 1]
+        mock_model = _mock_blip_model()
+        logits = torch.zeros(len(yes_logits), 1, 2)
+        logits[:, 0, 0] = torch.tensor(yes_logits)
+        mock_model.text_decoder.return_value.logits = logits
+        mock_image = MagicMock()
+        mock_image.convert.return_value = mock_image
+        return mock_proc, mock_model, mock_image
+
+    def _evaluate(self, qa_data: dict, mocks: tuple) -> tuple:
+        mock_proc, mock_model, mock_image = mocks
+        with (
+            patch.object(blip_module, "_load_blip"),
+            patch.object(blip_module, "_processor", mock_proc),
+            patch.object(blip_module, "_model", mock_model),
+            patch.object(blip_module, "landmark_qa_data", qa_data),
+            patch.object(blip_module.settings, "BLIP_LOCATION_MODE", "score"),
+            patch("app.core.image_artifact.Image.open", return_value=mock_image),
+        ):
+            return blip_module.evaluate_location("/img.jpg", "활돌이")
+
+    def test_score_is_mean_probability_of_expected_answer(self) -> None:
+        """점수는 질문별 P(기대 답변)의 평균이다."""
+        qa_data = {"활돌이": [["Q1?", "yes"], ["Q2?", "no"]]}
+        # P(yes) = sigmoid(logit): 질문1 0.9(기대 yes), 질문2 0.2(기대 no → 0.8)
+        logit_09 = torch.logit(torch.tensor(0.9)).item()
+        logit_02 = torch.logit(torch.tensor(0.2)).item()
+        mocks = self._loaded_mocks([logit_09, logit_02])
+        is_success, score, hint = self._evaluate(qa_data, mocks)
+        assert is_success is True
+        assert score == pytest.approx(0.85, abs=1e-5)
+        assert hint == []
+
+    def test_uses_single_forward_without_generation(self) -> None:
+        """자기회귀 generate 없이 디코더 forward 한 번으로 채점한다."""
+        qa_data = {"활돌이": [["Q1?", "yes"], ["Q2?", "yes"]]}
+        mocks = self._loaded_mocks([3.0, 3.0])
+        self._evaluate(qa_data, mocks)
+        mock_model = mocks[1]
+        assert mock_model.text_decoder.call_count == 1
+        mock_model.text_decoder.generate.assert_not_called()
+
+    def test_low_probability_marks_question_incorrect(self) -> None:
+        """P(기대 답변)이 0.5 미만이면 오답 힌트로 기록한다."""
+        qa_data = {"활돌이": [["Q1?", "yes"]]}
+        mocks = self._loaded_mocks([-2.0])
+        is_success, score, hint = self._evaluate(qa_data, mocks)
+        assert is_success is False
+        assert score < 0.5
+        assert hint == [
+            {"question": "Q1?", "model_answer": "no", "expected_answer": "yes"}
+        ]
+
+    def test_early_exit_does_not_change_probe_score(self) -> None:
+        """score 모드는 조기 종료 설정과 관계없이 전체 질문으로 같은 투표를 낸다."""
+        qa_data = {"활돌이": [[f"Q{i}?", "yes"] for i in range(8)]}
+        probabilities = torch.tensor([0.99, 0.95, 0.9, 0.9, 0.8, 0.7, 0.6, 0.55])
+        votes = []
+        for early_exit in (False, True):
+            mock_proc, mock_model, mock_image = self._loaded_mocks(
+                torch.logit(probabilities).tolist()
+            )
+            with (
+                patch.object(blip_module, "_load_blip"),
+                patch.object(blip_module, "_processor", mock_proc),
+                patch.object(blip_module, "_model", mock_model),
+                patch.object(blip_module, "landmark_qa_data", qa_data),
+                patch.object(blip_module.settings, "BLIP_LOCATION_MODE", "score"),
+                patch.object(blip_module.settings, "BLIP_EARLY_EXIT", early_exit),
+                patch.object(blip_module.settings, "BLIP_VQA_BATCH_SIZE", 0),
+                patch("app.core.image_artifact.Image.open", return_value=mock_image),
+            ):
+                votes.append(
+                    blip_module.probe_with_blip_location("/img.jpg", "활돌이", {})
+                )
+        assert votes[0] == votes[1]
+        assert votes[1]["score"] == pytest.approx(probabilities.mean().item(), abs=1e-5)
+
+    def test_generate_mode_keeps_binary_score(self) -> None:
+        """generate 모드에서는 기존처럼 성공 1.0 / 실패 0.0 점수를 반환한다."""
+        qa_data = {"활돌이": [["Q1?", "yes"]]}
+        mock_proc, mock_model, mock_image = self._loaded_mocks([0.0])
+        mock_proc.batch_decode.return_value = ["yes"]
+        with (
+            patch.object(blip_module, "_load_blip"),
+            patch.object(blip_module, "_processor", mock_proc),
+            patch.object(blip_module, "_model", mock_model),
+            patch.object(blip_module, "landmark_qa_data", qa_data),
+            patch.object(blip_module.settings, "BLIP_LOCATION_MODE", "generate"),
+            patch("app.core.image_artifact.Image.open", return_value=mock_image),
+        ):
+            is_success, score, _ = blip_module.evaluate_location("/img.jpg", "활돌이")
+        assert is_success is True
+        assert score == 1.0
+
+
+# ── model.generate 정합성 ─────────────────────────────────────────────────────
+
+
+class TestParityWithGenerate:
+    @pytest.fixture
+    def tiny_blip(self):
+        """작은 무작위 BlipForQuestionAnswering을 blip 모듈 전역에 설치한다."""
+        from transformers import BlipConfig, BlipForQuestionAnswering
+
+        torch.manual_seed(0)
+        config = BlipConfig(
+            text_config={
+                "vocab_size": 24,
+                "hidden_size": 32,
+                "intermediate_size": 64,
+                "num_hidden_layers": 2,
+                "num_attention_heads": 2,
+                "encoder_hidden_size": 32,
+                # 질문마다 다른 답변이 나오도록 초기 가중치 분산을 키운다.
+                "initializer_range": 0.5,
+                "pad_token_id": 0,
+                "bos_token_id": 5,
+                "sep_token_id": 3,
+            },
+            vision_config={
+                "hidden_size": 32,
+                "intermediate_size": 64,
+                "num_hidden_layers": 2,
+                "num_attention_heads": 2,
+                "image_size": 32,
+                "patch_size": 8,
+                "initializer_range": 0.5,
+            },
+        )
+        model = BlipForQuestionAnswering(config).eval()
+        with patch.object(blip_module, "_model", model):
+            yield model
+
+    def test_batched_answers_match_per_question_generate(self, tiny_blip) -> None:
+        """이미지 임베딩 재사용 배치 생성 결과가 질문별 model.generate와 같다."""
+        pixel_values = torch.randn(1, 3, 32, 32)
+        input_ids = torch.randint(6, 24, (4, 5))
+        input_ids[:, 0] = 2
+
+        batched = blip_module._generate_answers(
+            blip_module._encode_image(pixel_values), input_ids, max_new_tokens=10
+        )
+
+        pad_id = tiny_blip.config.text_config.pad_token_id
+        answers = set()
+        for index in range(input_ids.shape[0]):
+            with torch.no_grad():
+                (expected,) = tiny_blip.generate(
+                    pixel_values=pixel_values,
+                    input_ids=input_ids[index : index + 1],
+                    max_new_tokens=10,
+                )
+            actual = batched[index]
+            assert torch.equal(actual[: len(expected)], expected)
+            assert bool((actual[len(expected) :] == pad_id).all())
+            answers.add(tuple(expected.tolist()))
+        assert len(answers) > 1
+
+
+# ── 조기 종료 ─────────────────────────────────────────────────────────────────
+
+
+class TestEarlyExit:
+    def _run(self, qa_data: dict, answers_by_question: dict, early_exit: bool):
+        """질문 텍스트별로 고정 답변을 돌려주는 mock으로 evaluate_location을 실행한다."""
+        mock_proc = MagicMock()
+        token_ids = {q: i + 10 for i, q in enumerate(answers_by_question)}
+        mock_proc.side_effect = lambda text=None, **_: (
+            mock_proc.return_value
+            if text is None
+            else MagicMock(input_ids=torch.tensor([[token_ids[text]]]))
+        )
+        id_to_answer = {token_ids[q]: a for q, a in answers_by_question.items()}
+        mock_proc.batch_decode.side_effect = lambda out, **_: [
+            id_to_answer[int(row[0])] for row in out
+        ]
+        mock_model = _mock_blip_model()
+        mock_model.text_encoder.side_effect = lambda input_ids, **_: (input_ids,)
+        mock_model.text_decoder.generate.side_effect = lambda **kw: kw[
+            "encoder_hidden_states"
+        ]
+        mock_image = MagicMock()
+        mock_image.convert.return_value = mock_image
+        with (
+            patch.object(blip_module, "_load_blip"),
+            patch.object(blip_module, "_processor", mock_proc),
+            patch.object(blip_module, "_model", mock_model),
+            patch.object(blip_module, "landmark_qa_data", qa_data),
+            patch.object(blip_module.settings, "BLIP_LOCATION_MODE", "generate"),
+            patch.object(blip_module.settings, "BLIP_EARLY_EXIT", early_exit),
+            patch.object(blip_module.settings, "BLIP_VQA_BATCH_SIZE", 2),
+            patch("app.core.image_artifact.Image.open", return_value=mock_image),
+        ):
+            result = blip_module.evaluate_location("/img.jpg", "활돌이")
+        return result, mock_model.text_decoder.generate.call_count
+
+    def test_stops_once_success_is_guaranteed(self) -> None:
+        """필요한 정답 수(8개 중 6개)를 채우면 남은 질문을 생략한다."""
+        qa_data = {"활돌이": [[f"Q{i}?", "yes"] for i in range(8)]}
+        answers = {f"Q{i}?": "yes" for i in range(8)}
+        (is_success, _, _), calls = self._run(qa_data, answers, early_exit=True)
+        assert is_success is True
+        assert calls == 3
+
+    def test_stops_once_failure_is_guaranteed(self) -> None:
+        """오답이 허용치(8개 중 2개)를 넘으면 남은 질문을 생략한다."""
+        qa_data = {"활돌이": [[f"Q{i}?", "yes"] for i in range(8)]}
+        answers = {f"Q{i}?": "no" for i in range(8)}
+        (is_success, _, hint), calls = self._run(qa_data, answers, early_exit=True)
+        assert is_success is False
+        assert calls == 2
+        assert len(hint) == 4
+
+    def test_verdict_matches_full_evaluation(self) -> None:
+        """조기 종료 여부와 관계없이 판정은 동일하다."""
+        qa_data = {"활돌이": [[f"Q{i}?", "yes"] for i in range(8)]}
+        answers = {f"Q{i}?": ("no" if i in (6, 7) else "yes") for i in range(8)}
+        (early, _, _), early_calls = self._run(qa_data, answers, early_exit=True)
+        (full, _, _), full_calls = self._run(qa_data, answers, early_exit=False)
+        assert early is full is True
+        assert full_calls == 4
+        assert early_calls == 3
+
+    def test_questions_ordered_by_weight(self) -> None:
+        """세 번째 원소(가중치)가 큰 질문부터 묻는다."""
+        qa_list = [["Q0?", "yes", 0.1], ["Q1?", "yes", 0.9], ["Q2?", "yes"]]
+        with (
+            patch.object(blip_module.settings, "BLIP_EARLY_EXIT", True),
+            patch.object(blip_module.settings, "BLIP_VQA_BATCH_SIZE", 1),
+        ):
+            chunks = blip_module._question_chunks(qa_list)
+        assert [chunk[0][0] for chunk in chunks] == ["Q1?", "Q0?", "Q2?"]
+
+    def test_disabled_keeps_original_order_in_one_chunk(self) -> None:
+        """조기 종료가 꺼져 있으면 원래 순서의 단일 청크를 반환한다."""
+        qa_list = [["Q0?", "yes", 0.1], ["Q1?", "yes", 0.9]]
+        with patch.object(blip_module.settings, "BLIP_EARLY_EXIT", False):
+            assert blip_module._question_chunks(qa_list) == [qa_list]
+
+    def test_required_correct_matches_threshold(self) -> None:
+        """필요 정답 수는 정답률 ≥ SUCCESS_THRESHOLD를 만족하는 최소 개수다."""
+        assert blip_module._required_correct(40) == 30
+        assert blip_module._required_correct(8) == 6
+        assert blip_module._required_correct(1) == 1
+
+
 # ── get_visual_context ────────────────────────────────────────────────────────
 
 
@@ -214,7 +676,7 @@ class TestGetVisualContext:
         """이미지 로드 실패 시 에러 메시지 문자열을 반환한다."""
         with (
             patch.object(blip_module, "_load_blip"),
-            patch("app.models.blip.Image.open", side_effect=OSError("fail")),
+            patch("app.core.image_artifact.Image.open", side_effect=OSError("fail")),
         ):
             result = blip_module.get_visual_context("/bad.jpg")
         assert "이미지 로드 오류" in result
@@ -224,10 +686,13 @@ class TestGetVisualContext:
         mock_proc = MagicMock()
         pixel_mock = MagicMock()
         mock_proc.return_value.pixel_values.to.return_value = pixel_mock
-        mock_proc.decode.return_value = "bright"
+        mock_proc.return_value.input_ids = torch.ones(1, 4, dtype=torch.long)
+        mock_proc.batch_decode.return_value = ["bright"] * len(
+            blip_module.VISUAL_CONTEXT_PROBES
+        )
 
-        mock_model = MagicMock()
-        mock_model.generate.return_value = [MagicMock()]
+        mock_model = _mock_blip_model()
+        mock_model.text_decoder.generate.return_value = [MagicMock()]
 
         mock_image = MagicMock()
         mock_image.convert.return_value = mock_image
@@ -236,7 +701,7 @@ class TestGetVisualContext:
             patch.object(blip_module, "_load_blip"),
             patch.object(blip_module, "_processor", mock_proc),
             patch.object(blip_module, "_model", mock_model),
-            patch("app.models.blip.Image.open", return_value=mock_image),
+            patch("app.core.image_artifact.Image.open", return_value=mock_image),
         ):
             result = blip_module.get_visual_context("/img.jpg")
         assert isinstance(result, str)
@@ -249,25 +714,39 @@ class TestGetVisualContext:
 class TestProbeWithBlip:
     def test_location_probe_success_structure(self) -> None:
         """위치 프로브 성공 시 표준 투표 딕셔너리를 반환한다."""
-        with patch.object(blip_module, "check_with_blip", return_value=(True, [])):
+        with patch.object(
+            blip_module, "_evaluate_location", return_value=(True, 1.0, [], False)
+        ):
             result = blip_module.probe_with_blip_location("/img.jpg", "활돌이", {})
         assert result["model"] == "blip"
         assert result["score"] == 1.0
         assert result["label"] == "match"
+        assert "failed" not in result
 
     def test_location_probe_failure_structure(self) -> None:
         """위치 프로브 실패 시 score=0.0, label='mismatch'를 반환한다."""
         with patch.object(
-            blip_module, "check_with_blip", return_value=(False, [{"q": "x"}])
+            blip_module,
+            "_evaluate_location",
+            return_value=(False, 0.0, [{"q": "x"}], False),
         ):
             result = blip_module.probe_with_blip_location("/img.jpg", "활돌이", {})
         assert result["score"] == 0.0
         assert result["label"] == "mismatch"
 
+    def test_location_probe_passes_continuous_score(self) -> None:
+        """score 모드의 연속 확신도를 그대로 투표 점수로 사용한다."""
+        with patch.object(
+            blip_module, "_evaluate_location", return_value=(True, 0.83, [], False)
+        ):
+            result = blip_module.probe_with_blip_location("/img.jpg", "활돌이", {})
+        assert result["score"] == 0.83
+        assert result["label"] == "match"
+
     def test_atmosphere_probe_keyword_found(self) -> None:
         """컨텍스트에 키워드가 있으면 score=0.85를 반환한다."""
         with patch.object(
-            blip_module, "get_visual_context", return_value="화사한 분위기"
+            blip_module, "_visual_context", return_value=("화사한 분위기", False)
         ):
             result = blip_module.probe_with_blip_atmosphere("/img.jpg", "화사한", {})
         assert result["model"] == "blip"
@@ -277,8 +756,111 @@ class TestProbeWithBlip:
     def test_atmosphere_probe_keyword_not_found(self) -> None:
         """컨텍스트에 키워드가 없으면 score=0.2를 반환한다."""
         with patch.object(
-            blip_module, "get_visual_context", return_value="dark and gloomy"
+            blip_module, "_visual_context", return_value=("dark and gloomy", False)
         ):
             result = blip_module.probe_with_blip_atmosphere("/img.jpg", "화사한", {})
         assert result["score"] == 0.2
         assert result["label"] == "mismatch"
+        assert "failed" not in result
+
+    def test_location_probe_marks_image_failure(self) -> None:
+        """이미지 로드 실패로 얻은 mismatch는 failed=True로 표시해 캐시되지 않게 한다."""
+        with (
+            patch.object(blip_module, "_load_blip"),
+            patch.object(blip_module, "_processor", MagicMock()),
+            patch.object(blip_module, "_model", MagicMock()),
+            patch.object(blip_module, "landmark_qa_data", {"활돌이": [["Q?", "yes"]]}),
+            patch("app.core.image_artifact.Image.open", side_effect=OSError("bad")),
+        ):
+            result = blip_module.probe_with_blip_location("/bad.jpg", "활돌이", {})
+        assert result["label"] == "mismatch"
+        assert result["failed"] is True
+
+    def test_location_probe_marks_errored_questions(self) -> None:
+        """질문 추론이 'error'로 끝나면 failed=True로 표시한다."""
+        mock_proc = MagicMock()
+        mock_proc.return_value.pixel_values.to.return_value = MagicMock()
+        mock_proc.return_value.input_ids = torch.ones(1, 4, dtype=torch.long)
+        mock_model = _mock_blip_model()
+        mock_model.text_decoder.generate.side_effect = RuntimeError("oom")
+        mock_image = MagicMock()
+        mock_image.convert.return_value = mock_image
+        with (
+            patch.object(blip_module, "_load_blip"),
+            patch.object(blip_module, "_processor", mock_proc),
+            patch.object(blip_module, "_model", mock_model),
+            patch.object(blip_module, "landmark_qa_data", {"활돌이": [["Q?", "yes"]]}),
+            patch("app.core.image_artifact.Image.open", return_value=mock_image),
+        ):
+            result = blip_module.probe_with_blip_location("/img.jpg", "활돌이", {})
+        assert result["failed"] is True
+        assert not vote_cache.is_cacheable(result)
+
+    def test_location_probe_without_qa_data_is_not_failure(self) -> None:
+        """Q&A 데이터가 없는 정답은 재시도해도 같으므로 실패로 표시하지 않는다."""
+        with (
+            patch.object(blip_module, "_load_blip"),
+            patch.object(blip_module, "_processor", MagicMock()),
+            patch.object(blip_module, "_model", MagicMock()),
+            patch.object(blip_module, "landmark_qa_data", {}),
+        ):
+            result = blip_module.probe_with_blip_location("/img.jpg", "없는장소", {})
+        assert "failed" not in result
+
+    def test_atmosphere_probe_marks_image_failure(self) -> None:
+        """이미지 로드 실패 시 failed=True로 표시한다."""
+        with (
+            patch.object(blip_module, "_load_blip"),
+            patch("app.core.image_artifact.Image.open", side_effect=OSError("fail")),
+        ):
+            result = blip_module.probe_with_blip_atmosphere("/bad.jpg", "화사한", {})
+        assert result["label"] == "mismatch"
+        assert result["failed"] is True
+
+
+# ── warmup ────────────────────────────────────────────────────────────────────
+
+
+class TestWarmup:
+    def _mocks(self) -> tuple:
+        mock_proc = MagicMock()
+        mock_proc.return_value.input_ids = torch.ones(1, 4, dtype=torch.long)
+        mock_proc.return_value.pixel_values.to.return_value = MagicMock()
+        mock_model = _mock_blip_model()
+        return mock_proc, mock_model
+
+    def test_runs_vision_encoder_and_generation_once(self) -> None:
+        mock_proc, mock_model = self._mocks()
+        with (
+            patch.object(blip_module, "_load_blip") as mock_load,
+            patch.object(blip_module, "_processor", mock_proc),
+            patch.object(blip_module, "_model", mock_model),
+            patch.object(blip_module.settings, "BLIP_LOCATION_MODE", "generate"),
+        ):
+            blip_module.warmup()
+        mock_load.assert_called_once_with()
+        assert mock_model.vision_model.call_count == 1
+        assert mock_model.text_decoder.generate.call_count == 1
+
+    def test_score_mode_also_warms_yes_no_scoring(self) -> None:
+        mock_proc, mock_model = self._mocks()
+        with (
+            patch.object(blip_module, "_load_blip"),
+            patch.object(blip_module, "_processor", mock_proc),
+            patch.object(blip_module, "_model", mock_model),
+            patch.object(blip_module.settings, "BLIP_LOCATION_MODE", "score"),
+            patch.object(blip_module, "_score_yes_no") as mock_score,
+        ):
+            blip_module.warmup()
+        mock_score.assert_called_once()
+
+    def test_generation_failure_propagates(self) -> None:
+        mock_proc, mock_model = self._mocks()
+        mock_model.text_decoder.generate.side_effect = RuntimeError("cuda")
+        with (
+            patch.object(blip_module, "_load_blip"),
+            patch.object(blip_module, "_processor", mock_proc),
+            patch.object(blip_module, "_model", mock_model),
+        ):
+            with pytest.raises(RuntimeError, match="cuda"):
+                blip_module.warmup()
@@ -0,0 +1,191 @@
+"""app.models.embedding_store 단위 테스트.
+
+검증 대상:
+  - EmbeddingStore: float16 추가·조회·재열기 후 유지·중복 해시 무시·차원 검증
+  - 다른 인스턴스(프로세스)가 추가한 행 조회·matrix()/hashes() 행 대응
+  - 복구: 끊긴 마지막 행·인덱스 레코드 무시
+  - get_embedding_store: 설정 꺼짐 시 None·모델별 디렉터리
+  - siglip2.image_embedding: 저장된 벡터 재사용·새 벡터 저장·정밀도별 저장소 키
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+import torch
+
+import app.models.embedding_store as embedding_store
+import app.models.siglip2 as siglip2_module
+from app.core.image_artifact import ImageArtifact
+
+
+def _hash(name: str) -> str:
+    return hashlib.sha256(name.encode()).hexdigest()
+
+
+def _vector(*values: float) -> np.ndarray:
+    return np.asarray(values, dtype=np.float32)
+
+
+@pytest.fixture
+def store_dir(tmp_path) -> str:
+    return str(tmp_path / "store")
+
+
+class TestEmbeddingStore:
+    def test_put_and_get_round_trip_as_float16(self, store_dir) -> None:
+        store = embedding_store.EmbeddingStore(store_dir, "model")
+
+        assert store.put(_hash("a"), _vector(0.6, 0.8, 0.0)) is True
+        stored = store.get(_hash("a"))
+
+        assert stored.dtype == np.float16
+        np.testing.assert_allclose(stored, [0.6, 0.8, 0.0], atol=1e-3)
+        assert store.get(_hash("missing")) is None
+        assert _hash("a") in store
+
+    def test_persists_across_reopen(self, store_dir) -> None:
+        store = embedding_store.EmbeddingStore(store_dir, "model")
+        store.put(_hash("a"), _vector(1, 0))
+        store.put(_hash("b"), _vector(0, 1))
+
+        reopened = embedding_store.EmbeddingStore(store_dir, "model")
+
+        assert len(reopened) == 2
+        np.testing.assert_allclose(reopened.get(_hash("b")), [0, 1])
+        again = embedding_store.EmbeddingStore(store_dir, "model")
+        np.testing.assert_allclose(again.get(_hash("b")), [0, 1])
+        assert os.path.getsize(os.path.join(store_dir, "vectors.f16")) == 2 * 2 * 2
+
+    def test_existing_hash_is_not_rewritten(self, store_dir) -> None:
+        store = embedding_store.EmbeddingStore(store_dir, "model")
+        store.put(_hash("a"), _vector(1, 0))
+
+        assert store.put(_hash("a"), _vector(0, 1)) is False
+        np.testing.assert_allclose(store.get(_hash("a")), [1, 0])
+
+    def test_dimension_mismatch_raises(self, store_dir) -> None:
+        store = embedding_store.EmbeddingStore(store_dir, "model")
+        store.put(_hash("a"), _vector(1, 0))
+
+        with pytest.raises(ValueError, match="차원"):
+            store.put(_hash("b"), _vector(1, 0, 0))
+
+    def test_sees_rows_appended_by_another_instance(self, store_dir) -> None:
+        reader = embedding_store.EmbeddingStore(store_dir, "model")
+        writer = embedding_store.EmbeddingStore(store_dir, "model")
+        writer.put(_hash("a"), _vector(1, 0))
+        writer.put(_hash("b"), _vector(0, 1))
+
+        np.testing.assert_allclose(reader.get(_hash("b")), [0, 1])
+        rows = reader.hashes()
+        matrix = reader.matrix()
+        assert matrix.shape == (2, 2)
+        np.testing.assert_allclose(matrix[rows[_hash("a")]], [1, 0])
+
+    def test_interrupted_writes_are_ignored(self, store_dir) -> None:
+        store = embedding_store.EmbeddingStore(store_dir, "model")
+        store.put(_hash("a"), _vector(1, 0))
+        # 행 일부만 쓰이고 인덱스 레코드도 일부만 쓰인 상태
+        with open(os.path.join(store_dir, "vectors.f16"), "ab") as f:
+            f.write(b"\x00")
+        with open(os.path.join(store_dir, "index.bin"), "ab") as f:
+            f.write(b"\x01" * 10)
+
+        reopened = embedding_store.EmbeddingStore(store_dir, "model")
+        reopened.put(_hash("b"), _vector(0, 1))
+
+        assert len(reopened) == 2
+        np.testing.assert_allclose(reopened.get(_hash("b")), [0, 1])
+
+    def test_empty_store_matrix(self, store_dir) -> None:
+        store = embedding_store.EmbeddingStore(store_dir, "model")
+
+        assert store.get(_hash("a")) is None
+        assert store.matrix().shape[0] == 0
+
+
+class TestGetEmbeddingStore:
+    @pytest.fixture(autouse=True)
+    def _reset(self):
+        embedding_store._stores.clear()
+        yield
+        embedding_store._stores.clear()
+
+    def test_disabled_returns_none(self) -> None:
+        with patch.object(embedding_store.settings, "EMBEDDING_STORE_ENABLED", False):
+            assert embedding_store.get_embedding_store("google/siglip2") is None
+
+    def test_directory_per_model(self, tmp_path) -> None:
+        with (
+            patch.object(embedding_store.settings, "EMBEDDING_STORE_ENABLED", True),
+            patch.object(
+                embedding_store.settings, "EMBEDDING_STORE_DIR", str(tmp_path)
+            ),
+        ):
+            store = embedding_store.get_embedding_store("google/siglip2")
+            again = embedding_store.get_embedding_store("google/siglip2")
+
+        assert store is again
+        assert store.directory == str(tmp_path / "google--siglip2")
+
+
+class TestSiglip2StoredEmbedding:
+    def test_reuses_stored_vector_without_vision_tower(self, store_dir) -> None:
+        store = embedding_store.EmbeddingStore(store_dir, "model")
+        artifact = ImageArtifact(data=b"photo")
+        store.put(artifact.sha256, _vector(0.6, 0.8))
+
+        with (
+            patch.object(embedding_store, "get_embedding_store", return_value=store),
+            patch.object(siglip2_module, "_image_embeds") as mock_embeds,
+        ):
+            embeds = siglip2_module.image_embedding(artifact)
+
+        mock_embeds.assert_not_called()
+        assert embeds.shape == (1, 2)
+        assert embeds.dtype == torch.float32
+        assert torch.allclose(embeds, torch.tensor([[0.6, 0.8]]), atol=1e-3)
+
+    def test_stores_new_vector(self, store_dir) -> None:
+        store = embedding_store.EmbeddingStore(store_dir, "model")
+        artifact = ImageArtifact(data=b"photo")
+
+        with (
+            patch.object(embedding_store, "get_embedding_store", return_value=store),
+            patch.object(
+                siglip2_module, "_image_embeds", return_value=torch.tensor([[1.0, 0.0]])
+            ),
+        ):
+            siglip2_module.image_embedding(artifact)
+
+        np.testing.assert_allclose(store.get(artifact.sha256), [1, 0])
+
+    def test_store_key_includes_backend_and_precision(self) -> None:
+        with patch.object(siglip2_module, "DEVICE", "cpu"):
+            with patch.object(siglip2_module.settings, "MODEL_PRECISION", "fp32"):
+                fp32 = siglip2_module.embedding_store_key()
+            with patch.object(siglip2_module.settings, "MODEL_PRECISION", "int8"):
+                int8 = siglip2_module.embedding_store_key()
+
+        assert fp32 == f"{siglip2_module.MODEL_NAME}/torch-fp32"
+        assert int8 == f"{siglip2_module.MODEL_NAME}/torch-int8"
+        assert embedding_store.store_path(fp32) != embedding_store.store_path(int8)
+
+    def test_looks_up_store_by_precision_key(self) -> None:
+        with (
+            patch.object(siglip2_module, "embedding_store_key", return_value="k"),
+            patch.object(
+                embedding_store, "get_embedding_store", return_value=None
+            ) as mock_get,
+            patch.object(
+                siglip2_module, "_image_embeds", return_value=torch.ones(1, 2)
+            ),
+        ):
+            siglip2_module.image_embedding(ImageArtifact(data=b"photo"))
+
+        mock_get.assert_called_once_with("k")
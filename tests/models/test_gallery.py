@@ -0,0 +1,188 @@
+"""app.models.gallery 단위 테스트.
+
+검증 대상:
+  - GalleryIndex: float16 저장·메모리 매핑 로드·라벨 수 검증·코사인 kNN 순서
+  - reference_images / build_index: 랜드마크 폴더 수집·행별 라벨
+  - knn_score: 정답 이웃 유사도 비중·최소 유사도 미만 제외
+  - probe_with_gallery: 판정·위치 미션 전용·인덱스 없음·정답 참조 없음
+    ·GALLERY_KNN_K 범위 보정·빈 이웃 결과
+  - 이미지 임베딩 공유: siglip2 프로브와 같은 아티팩트면 비전 타워 1회
+"""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+import torch
+
+import app.models.gallery as gallery
+import app.models.siglip2 as siglip2_module
+from app.core.image_artifact import ImageArtifact
+
+
+def _unit(*values: float) -> np.ndarray:
+    vector = np.asarray(values, dtype=np.float32)
+    return vector / np.linalg.norm(vector)
+
+
+def _index() -> gallery.GalleryIndex:
+    matrix = np.stack(
+        [_unit(1, 0, 0), _unit(0.9, 0.1, 0), _unit(0, 1, 0), _unit(0, 0, 1)]
+    ).astype(np.float16)
+    return gallery.GalleryIndex(matrix, ["활돌이", "활돌이", "네모탑", "피노키오"])
+
+
+@pytest.fixture(autouse=True)
+def _reset_index():
+    gallery._index = None
+    yield
+    gallery._index = None
+
+
+class TestGalleryIndex:
+    def test_save_and_load_memory_maps_float16(self, tmp_path) -> None:
+        path = str(tmp_path / "gallery.npy")
+        _index().save(path, ["a.jpg", "b.jpg", "c.jpg", "d.jpg"])
+
+        loaded = gallery.GalleryIndex.load(path)
+
+        assert isinstance(loaded.matrix, np.memmap)
+        assert loaded.matrix.dtype == np.float16
+        assert loaded.matrix.shape == (4, 3)
+        assert loaded.labels == ["활돌이", "활돌이", "네모탑", "피노키오"]
+
+    def test_label_count_must_match_rows(self) -> None:
+        with pytest.raises(ValueError, match="라벨 수"):
+            gallery.GalleryIndex(np.zeros((2, 3), dtype=np.float16), ["활돌이"])
+
+    def test_neighbours_sorted_by_cosine_similarity(self) -> None:
+        neighbours = _index().neighbours(_unit(1, 0.05, 0), k=3)
+
+        assert [label for label, _ in neighbours] == ["활돌이", "활돌이", "네모탑"]
+        assert neighbours[0][1] == pytest.approx(1.0, abs=1e-2)
+        assert neighbours[0][1] >= neighbours[1][1] >= neighbours[2][1]
+
+    def test_k_larger_than_index_returns_all(self) -> None:
+        assert len(_index().neighbours(_unit(1, 0, 0), k=10)) == 4
+
+
+class TestBuildIndex:
+    def test_collects_landmark_folders_and_labels_rows(self, tmp_path) -> None:
+        for name, files in {"활돌이": ["a.jpg", "b.png"], "네모탑": ["c.jpg"]}.items():
+            (tmp_path / name).mkdir()
+            for file in files:
+                (tmp_path / name / file).write_bytes(b"")
+        (tmp_path / "활돌이" / "notes.txt").write_text("x")
+
+        images = gallery.reference_images(tmp_path, ["활돌이", "네모탑", "피노키오"])
+        index, files = gallery.build_index(
+            images, lambda image: np.array([[1.0, 0.0]], dtype=np.float32)
+        )
+
+        assert list(images) == ["활돌이", "네모탑"]
+        assert index.labels == ["활돌이", "활돌이", "네모탑"]
+        assert index.matrix.dtype == np.float16
+        assert index.matrix.shape == (3, 2)
+        assert [f.rsplit("/", 1)[-1] for f in files] == ["a.jpg", "b.png", "c.jpg"]
+
+
+class TestKnnScore:
+    def test_share_of_answer_similarity(self) -> None:
+        neighbours = [("활돌이", 0.9), ("활돌이", 0.8), ("네모탑", 0.3)]
+        with patch.object(gallery.settings, "GALLERY_MIN_SIMILARITY", 0.5):
+            score = gallery.knn_score(neighbours, "활돌이")
+
+        assert score == pytest.approx(1.7 / 2.0)
+
+    def test_answer_neighbours_below_min_similarity_do_not_count(self) -> None:
+        neighbours = [("활돌이", 0.4), ("네모탑", 0.3)]
+        with patch.object(gallery.settings, "GALLERY_MIN_SIMILARITY", 0.5):
+            assert gallery.knn_score(neighbours, "활돌이") == 0.0
+
+    def test_non_positive_similarities_score_zero(self) -> None:
+        assert gallery.knn_score([("활돌이", -0.2)], "활돌이") == 0.0
+
+
+class TestProbeWithGallery:
+    def _probe(self, query: np.ndarray, answer: str = "활돌이", k: int = 3) -> dict:
+        embeds = torch.from_numpy(query).unsqueeze(0)
+        with (
+            patch.object(gallery, "_load"),
+            patch.object(gallery, "_index", _index()),
+            patch.object(siglip2_module, "image_embedding", return_value=embeds),
+            patch.object(ImageArtifact, "rgb", new="decoded"),
+            patch.object(gallery.settings, "GALLERY_KNN_K", k),
+            patch.object(gallery.settings, "GALLERY_MIN_SIMILARITY", 0.5),
+            patch.object(gallery.settings, "LOCATION_PASS_THRESHOLD", 0.7),
+        ):
+            return gallery.probe_with_gallery(
+                "location", ImageArtifact(data=b"x"), answer, {}
+            )
+
+    def test_match_when_nearest_references_are_answer(self) -> None:
+        vote = self._probe(_unit(1, 0.05, 0))
+
+        assert vote["model"] == "gallery"
+        assert vote["label"] == "match"
+        assert vote["score"] > 0.7
+        assert "2/3" in vote["reason"]
+
+    def test_mismatch_when_nearest_references_are_other_landmark(self) -> None:
+        vote = self._probe(_unit(0, 1, 0.1))
+
+        assert vote["label"] == "mismatch"
+        assert vote["score"] < 0.7
+
+    @pytest.mark.parametrize(("k", "expected"), [(0, "1/1"), (-2, "1/1"), (99, "2/4")])
+    def test_knn_k_is_clamped_to_index_size(self, k: int, expected: str) -> None:
+        vote = self._probe(_unit(1, 0.05, 0), k=k)
+
+        assert "failed" not in vote
+        assert expected in vote["reason"]
+
+    def test_empty_neighbours_is_inference_failure(self) -> None:
+        with patch.object(gallery.GalleryIndex, "neighbours", return_value=[]):
+            vote = self._probe(_unit(1, 0, 0))
+
+        assert vote["label"] == "mismatch"
+        assert vote["failed"] is True
+        assert "no neighbours" in vote["reason"]
+
+    def test_answer_without_references(self) -> None:
+        vote = self._probe(_unit(1, 0, 0), answer="로드킬 부엉이")
+
+        assert vote["score"] == 0.0
+        assert "no gallery reference photos" in vote["reason"]
+        assert "failed" not in vote
+
+    def test_atmosphere_mission_is_not_supported(self) -> None:
+        vote = gallery.probe_with_gallery("atmosphere", "/img.jpg", "차분한", {})
+
+        assert vote["label"] == "mismatch"
+        assert "location missions only" in vote["reason"]
+
+    def test_missing_index_returns_load_failure(self, tmp_path) -> None:
+        with (
+            patch.object(siglip2_module, "_load_siglip2"),
+            patch.object(gallery.settings, "MODEL_CACHE_DIR", str(tmp_path)),
+        ):
+            vote = gallery.probe_with_gallery("location", "/img.jpg", "활돌이", {})
+
+        assert vote["score"] == 0.0
+        assert vote["reason"].startswith("Model load failed")
+        assert vote["failed"] is True
+
+
+class TestSharedImageEmbedding:
+    def test_vision_tower_runs_once_per_artifact(self) -> None:
+        artifact = ImageArtifact(data=b"x")
+        with patch.object(
+            siglip2_module, "_image_embeds", return_value=torch.ones(1, 3)
+        ) as mock_embeds:
+            first = siglip2_module.image_embedding(artifact)
+            second = siglip2_module.image_embedding(artifact)
+
+        assert first is second
+        mock_embeds.assert_called_once_with(artifact)
@@ -0,0 +1,106 @@
+"""app.models.micro_batcher 단위 테스트.
+
+검증 대상:
+  - 단일 요청 결과 반환
+  - 동시 요청 병합·최대 배치 크기 제한
+  - shape별 그룹 실행
+  - 배치 함수 예외 전파
+"""
+
+from __future__ import annotations
+
+import threading
+
+import pytest
+import torch
+
+from app.models.micro_batcher import MicroBatcher
+
+
+class _RecordingFn:
+    """호출별 배치 크기를 기록하고 입력에 1을 더해 반환하는 배치 함수."""
+
+    def __init__(self) -> None:
+        self.batch_sizes: list[int] = []
+
+    def __call__(self, inputs: torch.Tensor) -> torch.Tensor:
+        self.batch_sizes.append(inputs.shape[0])
+        return inputs + 1
+
+
+def _submit_concurrently(
+    batcher: MicroBatcher, inputs: list[torch.Tensor]
+) -> list[torch.Tensor]:
+    results: list[torch.Tensor | None] = [None] * len(inputs)
+    barrier = threading.Barrier(len(inputs))
+
+    def worker(index: int) -> None:
+        barrier.wait()
+        results[index] = batcher.submit(inputs[index])
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(len(inputs))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+    return results
+
+
+class TestMicroBatcher:
+    def test_single_submit_returns_own_result(self) -> None:
+        """요청이 하나뿐이면 대기 후 단독 실행 결과를 반환한다."""
+        fn = _RecordingFn()
+        batcher = MicroBatcher(fn, max_batch_size=4, max_wait_ms=1)
+        result = batcher.submit(torch.zeros(1, 2))
+        assert torch.equal(result, torch.ones(1, 2))
+        assert fn.batch_sizes == [1]
+
+    def test_concurrent_submits_share_one_forward(self) -> None:
+        """대기 시간 안에 도착한 동시 요청은 한 번의 호출로 묶인다."""
+        fn = _RecordingFn()
+        batcher = MicroBatcher(fn, max_batch_size=4, max_wait_ms=500)
+        inputs = [torch.full((1, 2), float(i)) for i in range(4)]
+
+        results = _submit_concurrently(batcher, inputs)
+
+        assert fn.batch_sizes == [4]
+        for index, result in enumerate(results):
+            assert torch.equal(result, inputs[index] + 1)
+
+    def test_batch_size_is_capped(self) -> None:
+        """max_batch_size를 넘는 요청은 다음 배치로 넘어간다."""
+        fn = _RecordingFn()
+        batcher = MicroBatcher(fn, max_batch_size=2, max_wait_ms=200)
+        inputs = [torch.full((1, 2), float(i)) for i in range(4)]
+
+        results = _submit_concurrently(batcher, inputs)
+
+        assert max(fn.batch_sizes) <= 2
+        assert sum(fn.batch_sizes) == 4
+        for index, result in enumerate(results):
+            assert torch.equal(result, inputs[index] + 1)
+
+    def test_different_shapes_run_in_separate_groups(self) -> None:
+        """입력 shape이 다른 요청은 이어 붙이지 않고 따로 실행한다."""
+        fn = _RecordingFn()
+        batcher = MicroBatcher(fn, max_batch_size=4, max_wait_ms=500)
+        inputs = [torch.zeros(1, 2), torch.zeros(1, 3)]
+
+        results = _submit_concurrently(batcher, inputs)
+
+        assert sorted(fn.batch_sizes) == [1, 1]
+        assert results[0].shape == (1, 2)
+        assert results[1].shape == (1, 3)
+
+    def test_exception_propagates_to_every_caller(self) -> None:
+        """배치 함수가 실패하면 해당 배치의 모든 호출자가 예외를 받는다."""
+
+        def failing(_: torch.Tensor) -> torch.Tensor:
+            raise RuntimeError("oom")
+
+        batcher = MicroBatcher(failing, max_batch_size=2, max_wait_ms=1)
+        with pytest.raises(RuntimeError, match="oom"):
+            batcher.submit(torch.zeros(1, 2))
+        # 실패 후에도 워커는 계속 다음 요청을 처리한다
+        with pytest.raises(RuntimeError, match="oom"):
+            batcher.submit(torch.zeros(1, 2))
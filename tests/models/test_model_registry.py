@@ -4,17 +4,28 @@
   - ModelRegistry 싱글턴 동작
   - register / get / list_models
   - get — 미등록 모델 ValueError
-  - _BLIPProbe / _QwenProbe / _SigLIP2Probe model_name 및 probe 라우팅
+  - _BLIPProbe / _QwenProbe / _SigLIP2Probe / _SigLIP2OnnxProbe / _GalleryProbe
+    model_name 및 probe 라우팅
   - register_default_models
+  - warmup / readiness: 모델별 상태·소요 시간 기록, 실패 격리, 준비 여부 판정
+  - configured_models / start_background_warmup
+  - submit: 모델별 실행 풀 재사용·동시 실행 한도·대기 작업 취소·shutdown
 """
 
 from __future__ import annotations
 
+import threading
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from app.models.model_registry import ModelRegistry, register_default_models
+from app.core.config import settings
+from app.models.model_registry import (
+    ModelRegistry,
+    configured_models,
+    register_default_models,
+    start_background_warmup,
+)
 from app.models.base import VLMProbe
 
 
@@ -32,6 +43,7 @@ def fresh_registry():
 
     yield
 
+    ModelRegistry.get_instance().shutdown()
     ModelRegistry._instance = original_instance
     ModelRegistry._initialized = original_initialized
 
@@ -144,6 +156,12 @@ class TestBLIPProbe:
         m.assert_called_once_with("/img.jpg", "calm", {})
         assert result == mock_result
 
+    def test_warmup_delegates_to_blip_warmup(self) -> None:
+        probe = self._get_blip_probe()
+        with patch("app.models.blip.warmup") as m:
+            probe.warmup()
+        m.assert_called_once_with()
+
 
 # ── _QwenProbe ────────────────────────────────────────────────────────────────
 
@@ -166,6 +184,11 @@ class TestQwenProbe:
         m.assert_called_once_with("location", "/img.jpg", "target", {"bundle": "x"})
         assert result == mock_result
 
+    def test_warmup_is_noop(self) -> None:
+        """원격 API 모델은 로드할 가중치가 없어 기본 워밍업(무동작)을 쓴다."""
+        probe = self._get_qwen_probe()
+        assert probe.warmup() is None
+
 
 # ── _SigLIP2Probe ─────────────────────────────────────────────────────────────
 
@@ -190,6 +213,69 @@ class TestSigLIP2Probe:
         m.assert_called_once_with("atmosphere", "/img.jpg", "화사한", {"bundle": "y"})
         assert result == mock_result
 
+    def test_warmup_delegates_to_siglip2_warmup(self) -> None:
+        probe = self._get_siglip2_probe()
+        with patch("app.models.siglip2.warmup") as m:
+            probe.warmup()
+        m.assert_called_once_with()
+
+
+# ── _SigLIP2OnnxProbe ─────────────────────────────────────────────────────────
+
+
+class TestSigLIP2OnnxProbe:
+    def _get_onnx_probe(self):
+        from app.models.model_registry import _SigLIP2OnnxProbe
+
+        return _SigLIP2OnnxProbe()
+
+    def test_model_name(self) -> None:
+        assert self._get_onnx_probe().model_name == "siglip2-onnx"
+
+    def test_probe_delegates_to_probe_with_siglip2_onnx(self) -> None:
+        probe = self._get_onnx_probe()
+        with patch(
+            "app.models.siglip2_onnx.probe_with_siglip2_onnx",
+            return_value={"score": 0.7},
+        ) as m:
+            result = probe.probe("location", "/img.jpg", "활돌이", {"bundle": "z"})
+        m.assert_called_once_with("location", "/img.jpg", "활돌이", {"bundle": "z"})
+        assert result == {"score": 0.7}
+
+    def test_warmup_delegates_to_onnx_warmup(self) -> None:
+        probe = self._get_onnx_probe()
+        with patch("app.models.siglip2_onnx.warmup") as m:
+            probe.warmup()
+        m.assert_called_once_with()
+
+
+# ── _GalleryProbe ─────────────────────────────────────────────────────────────
+
+
+class TestGalleryProbe:
+    def _get_gallery_probe(self):
+        from app.models.model_registry import _GalleryProbe
+
+        return _GalleryProbe()
+
+    def test_model_name(self) -> None:
+        assert self._get_gallery_probe().model_name == "gallery"
+
+    def test_probe_delegates_to_probe_with_gallery(self) -> None:
+        probe = self._get_gallery_probe()
+        with patch(
+            "app.models.gallery.probe_with_gallery", return_value={"score": 0.8}
+        ) as m:
+            result = probe.probe("location", "/img.jpg", "활돌이", {"bundle": "g"})
+        m.assert_called_once_with("location", "/img.jpg", "활돌이", {"bundle": "g"})
+        assert result == {"score": 0.8}
+
+    def test_warmup_delegates_to_gallery_warmup(self) -> None:
+        probe = self._get_gallery_probe()
+        with patch("app.models.gallery.warmup") as m:
+            probe.warmup()
+        m.assert_called_once_with()
+
 
 # ── register_default_models ───────────────────────────────────────────────────
 
@@ -202,9 +288,173 @@ class TestRegisterDefaultModels:
         assert "blip" in names
         assert "qwen" in names
         assert "siglip2" in names
+        assert "siglip2-onnx" in names
+        assert "gallery" in names
 
     def test_get_blip_after_register_default(self) -> None:
         register_default_models()
         registry = ModelRegistry.get_instance()
         probe = registry.get("blip")
         assert probe.model_name == "blip"
+
+
+# ── warmup / readiness ────────────────────────────────────────────────────────
+
+
+def _probe(name: str, warmup_error: Exception | None = None) -> MagicMock:
+    probe = MagicMock(spec=VLMProbe)
+    probe.model_name = name
+    if warmup_error is not None:
+        probe.warmup.side_effect = warmup_error
+    return probe
+
+
+class TestWarmup:
+    def test_ready_without_warmup_request(self) -> None:
+        """워밍업을 요청하지 않으면 지연 로드 모드로 보고 ready로 판정한다."""
+        registry = ModelRegistry.get_instance()
+        registry.register(_probe("siglip2"))
+        report = registry.readiness()
+        assert report["ready"] is True
+        assert report["warmup_enabled"] is False
+        assert report["models"] == {"siglip2": {"state": "cold"}}
+
+    def test_warmup_records_state_and_latency(self) -> None:
+        registry = ModelRegistry.get_instance()
+        siglip2 = _probe("siglip2")
+        registry.register(siglip2)
+        registry.register(_probe("blip"))
+
+        registry.warmup(["SigLIP2"])
+
+        siglip2.warmup.assert_called_once_with()
+        report = registry.readiness()
+        assert report["ready"] is True
+        assert report["warmup_enabled"] is True
+        assert report["models"]["siglip2"]["state"] == "ready"
+        assert report["models"]["siglip2"]["warmup_ms"] >= 0.0
+        assert report["models"]["blip"] == {"state": "cold"}
+
+    def test_failure_is_isolated_and_blocks_readiness(self) -> None:
+        registry = ModelRegistry.get_instance()
+        registry.register(_probe("blip", RuntimeError("oom")))
+        siglip2 = _probe("siglip2")
+        registry.register(siglip2)
+
+        registry.warmup(["blip", "siglip2"])
+
+        report = registry.readiness()
+        assert report["ready"] is False
+        assert report["models"]["blip"]["state"] == "failed"
+        assert "oom" in report["models"]["blip"]["error"]
+        assert report["models"]["siglip2"]["state"] == "ready"
+        siglip2.warmup.assert_called_once_with()
+
+    def test_unregistered_model_is_reported_as_failed(self) -> None:
+        registry = ModelRegistry.get_instance()
+        registry.warmup(["unknown"])
+        report = registry.readiness()
+        assert report["ready"] is False
+        assert report["models"]["unknown"]["state"] == "failed"
+
+    def test_scheduled_models_are_pending_until_warmed(self) -> None:
+        registry = ModelRegistry.get_instance()
+        registry.register(_probe("siglip2"))
+        registry.schedule_warmup(["siglip2"])
+        report = registry.readiness()
+        assert report["ready"] is False
+        assert report["models"]["siglip2"] == {"state": "pending"}
+
+
+class TestConfiguredModels:
+    def test_collects_ensembles_and_single_selections(self) -> None:
+        with patch("app.models.model_registry.settings") as mock_settings:
+            mock_settings.location_ensemble_models = ["siglip2", "blip"]
+            mock_settings.atmosphere_ensemble_models = ["siglip2"]
+            mock_settings.MODEL_SELECTION_LOCATION = "ensemble"
+            mock_settings.MODEL_SELECTION_ATMOSPHERE = " Qwen "
+            assert configured_models() == ["siglip2", "blip", "qwen"]
+
+    def test_cascade_selection_is_not_a_model(self) -> None:
+        with patch("app.models.model_registry.settings") as mock_settings:
+            mock_settings.location_ensemble_models = ["siglip2", "blip"]
+            mock_settings.atmosphere_ensemble_models = ["siglip2"]
+            mock_settings.MODEL_SELECTION_LOCATION = "cascade"
+            mock_settings.MODEL_SELECTION_ATMOSPHERE = "Cascade"
+            assert configured_models() == ["siglip2", "blip"]
+
+    def test_warmup_with_cascade_selection_becomes_ready(self) -> None:
+        registry = ModelRegistry.get_instance()
+        siglip2, blip = _probe("siglip2"), _probe("blip")
+        registry.register(siglip2)
+        registry.register(blip)
+        with patch("app.models.model_registry.settings") as mock_settings:
+            mock_settings.location_ensemble_models = ["siglip2", "blip"]
+            mock_settings.atmosphere_ensemble_models = ["siglip2"]
+            mock_settings.MODEL_SELECTION_LOCATION = "cascade"
+            mock_settings.MODEL_SELECTION_ATMOSPHERE = "ensemble"
+            mock_settings.MODEL_WORKER_POOL_ENABLED = False
+            thread = start_background_warmup()
+            thread.join(timeout=5)
+
+        report = registry.readiness()
+        assert report["ready"] is True
+        assert set(report["models"]) == {"siglip2", "blip"}
+
+    def test_background_warmup_uses_configured_models(self) -> None:
+        registry = ModelRegistry.get_instance()
+        siglip2 = _probe("siglip2")
+        registry.register(siglip2)
+        with patch(
+            "app.models.model_registry.configured_models", return_value=["siglip2"]
+        ):
+            thread = start_background_warmup()
+        thread.join(timeout=5)
+        assert thread.daemon is True
+        siglip2.warmup.assert_called_once_with()
+        assert registry.readiness()["ready"] is True
+
+
+# ── 모델 실행 풀 ──────────────────────────────────────────────────────────────
+
+
+class TestSubmit:
+    def test_reuses_one_executor_per_model(self) -> None:
+        registry = ModelRegistry.get_instance()
+        thread_names = [
+            registry.submit("SigLIP2", lambda: threading.current_thread().name).result()
+            for _ in range(3)
+        ]
+        registry.submit("blip", lambda: None).result()
+
+        assert all(name.startswith("model-siglip2") for name in thread_names)
+        assert set(registry._executors) == {"siglip2", "blip"}
+
+    def test_limits_concurrency_per_model_and_cancels_queued(self) -> None:
+        registry = ModelRegistry.get_instance()
+        release = threading.Event()
+        with patch.object(settings, "MODEL_CONCURRENCY_LIMITS", "blip:1"):
+            running = registry.submit("blip", release.wait, 5)
+            queued = registry.submit("blip", lambda: "late")
+            other = registry.submit("qwen", lambda: "free")
+
+            assert other.result(timeout=5) == "free"
+            assert queued.cancel() is True
+        release.set()
+
+        assert running.result(timeout=5) is True
+        assert queued.cancelled()
+
+    def test_uses_default_limit_for_unlisted_model(self) -> None:
+        with (
+            patch.object(settings, "MODEL_CONCURRENCY_LIMITS", "blip:3"),
+            patch.object(settings, "MODEL_CONCURRENCY_DEFAULT", 5),
+        ):
+            assert settings.model_concurrency("blip") == 3
+            assert settings.model_concurrency("custom") == 5
+
+    def test_shutdown_drops_executors(self) -> None:
+        registry = ModelRegistry.get_instance()
+        registry.submit("blip", lambda: None).result()
+        registry.shutdown()
+        assert registry._executors == {}
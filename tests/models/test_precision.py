@@ -0,0 +1,72 @@
+"""app.models.precision 단위 테스트.
+
+검증 대상:
+  - resolve_precision: 설정값 사용·대소문자 무시·알 수 없는 값/GPU int8 → fp32
+  - apply_precision: fp32 무변환·bf16 dtype 변환·int8 Linear 동적 양자화
+  - input_dtype: 모드별 입력 dtype
+"""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import torch
+
+from app.models.precision import apply_precision, input_dtype, resolve_precision
+
+
+class _TinyNet(torch.nn.Module):
+    """Conv(양자화 제외) + Linear(양자화 대상)로 구성된 테스트용 모델."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.conv = torch.nn.Conv2d(3, 4, kernel_size=2)
+        self.fc = torch.nn.Linear(4, 2)
+
+    def forward(self, pixel_values: torch.Tensor) -> torch.Tensor:
+        return self.fc(self.conv(pixel_values).mean(dim=(2, 3)))
+
+
+class TestResolvePrecision:
+    def test_uses_settings_when_not_given(self) -> None:
+        with patch("app.models.precision.settings") as mock_settings:
+            mock_settings.MODEL_PRECISION = "BF16"
+            assert resolve_precision("cpu") == "bf16"
+
+    def test_unknown_value_falls_back_to_fp32(self) -> None:
+        assert resolve_precision("cpu", "fp8") == "fp32"
+
+    def test_int8_on_gpu_falls_back_to_fp32(self) -> None:
+        """동적 양자화 커널은 CPU 전용이다."""
+        assert resolve_precision("cuda", "int8") == "fp32"
+        assert resolve_precision("cpu", "int8") == "int8"
+
+
+class TestApplyPrecision:
+    def test_fp32_returns_same_model(self) -> None:
+        model = _TinyNet()
+        assert apply_precision(model, "cpu", "fp32") is model
+        assert input_dtype(model) == torch.float32
+
+    def test_bf16_converts_weights_and_input_dtype(self) -> None:
+        model = apply_precision(_TinyNet(), "cpu", "bf16")
+
+        assert model.fc.weight.dtype == torch.bfloat16
+        assert input_dtype(model) == torch.bfloat16
+        output = model(torch.zeros(1, 3, 4, 4, dtype=torch.bfloat16))
+        assert output.dtype == torch.bfloat16
+
+    def test_int8_quantizes_linear_only(self) -> None:
+        """Linear만 int8 동적 양자화되고 Conv와 입출력은 float32로 남는다."""
+        model = _TinyNet().eval()
+        pixel_values = torch.rand(2, 3, 4, 4)
+        expected = model(pixel_values)
+
+        quantized = apply_precision(model, "cpu", "int8")
+
+        assert isinstance(quantized.fc, torch.ao.nn.quantized.dynamic.Linear)
+        assert isinstance(quantized.conv, torch.nn.Conv2d)
+        assert input_dtype(quantized) == torch.float32
+        output = quantized(pixel_values)
+        assert output.dtype == torch.float32
+        assert torch.allclose(output, expected, atol=0.05)
@@ -3,6 +3,7 @@
 검증 대상:
   - _to_english: location / atmosphere 분기, 매핑 없는 경우 원본 반환
   - build_prompt_bundle: location / atmosphere 반환값, None answer 기본값
+  - siglip2_vocabulary: 전체 어휘 포함·정답 후보 문장과 같은 형식
 """
 
 from __future__ import annotations
@@ -13,6 +14,7 @@ from app.models.prompts import (
     LANDMARK_EN,
     _to_english,
     build_prompt_bundle,
+    siglip2_vocabulary,
 )
 
 
@@ -116,3 +118,27 @@ class TestBuildPromptBundle:
     def test_answer_en_translated_for_atmosphere(self) -> None:
         bundle = build_prompt_bundle("atmosphere", "차분하고 자연적인")
         assert bundle["answer_en"] == ATMOSPHERE_EN["차분하고 자연적인"]
+
+
+# ── siglip2_vocabulary ────────────────────────────────────────────────────────
+
+
+class TestSiglip2Vocabulary:
+    def test_location_covers_every_landmark(self) -> None:
+        vocabulary = siglip2_vocabulary("location")
+        assert list(vocabulary) == list(LANDMARK_EN)
+
+    def test_atmosphere_covers_every_atmosphere(self) -> None:
+        vocabulary = siglip2_vocabulary("atmosphere")
+        assert list(vocabulary) == list(ATMOSPHERE_EN)
+
+    def test_answer_prompt_matches_target_candidate(self) -> None:
+        """정답의 어휘 문장은 정답 후보 문장과 같아 텍스트 임베딩을 공유한다."""
+        for mission_type, answer in (
+            ("location", "네모탑"),
+            ("atmosphere", "차분하고 자연적인"),
+        ):
+            bundle = build_prompt_bundle(mission_type, answer)
+            assert (
+                bundle["siglip2_vocabulary"][answer] == bundle["siglip2_candidates"][0]
+            )
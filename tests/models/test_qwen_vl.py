@@ -1,38 +1,96 @@
 """app.models.qwen_vl 단위 테스트.
 
 검증 대상:
-  - _encode_image_base64: 성공·파일 없음
+  - _encode_image_base64: JPEG 재인코딩·긴 변 축소·EXIF 회전 반영·파일 없음·
+    이미지 아님·공유 ImageArtifact 재사용
   - probe_with_qwen: API 키 없음·성공·커스텀 프롬프트·JSON 파싱 오류·일반 예외
+  - get_qwen_client: 설정별 1회 생성·재사용, keep-alive 연결 풀, 캐시 정리
 """
 
 from __future__ import annotations
 
 import base64
+import io
 import json
 from unittest.mock import MagicMock, patch
 
 import pytest
+from PIL import Image
 
 import app.models.qwen_vl as qwen_module
+from app.core.image_artifact import ImageArtifact
+
+
+@pytest.fixture(autouse=True)
+def _reset_clients():
+    """테스트 간 공유 클라이언트가 재사용되지 않도록 캐시를 비운다."""
+    qwen_module.clear_client_cache()
+    yield
+    qwen_module.clear_client_cache()
 
 
 # ── _encode_image_base64 ──────────────────────────────────────────────────────
 
 
+def _image_bytes(size: tuple[int, int], fmt: str = "PNG", **save_kwargs) -> bytes:
+    buffer = io.BytesIO()
+    Image.new("RGB", size, (200, 30, 30)).save(buffer, format=fmt, **save_kwargs)
+    return buffer.getvalue()
+
+
+def _decode(encoded: str) -> Image.Image:
+    return Image.open(io.BytesIO(base64.b64decode(encoded)))
+
+
 class TestEncodeImageBase64:
-    def test_encodes_file_contents(self, tmp_path: object) -> None:
-        """파일 내용을 Base64 인코딩 문자열로 올바르게 반환한다."""
-        img_file = tmp_path / "test.jpg"
-        img_file.write_bytes(b"fake image data")
-        result = qwen_module._encode_image_base64(str(img_file))
-        expected = base64.b64encode(b"fake image data").decode("utf-8")
-        assert result == expected
+    def test_reencodes_file_as_jpeg(self, tmp_path: object) -> None:
+        """PNG 파일도 JPEG로 재인코딩해 image/jpeg 라벨과 실제 포맷이 일치한다."""
+        img_file = tmp_path / "test.png"
+        img_file.write_bytes(_image_bytes((64, 48)))
+        image = _decode(qwen_module._encode_image_base64(str(img_file)))
+        assert image.format == "JPEG"
+        assert image.size == (64, 48)
+
+    def test_downscales_long_side(self) -> None:
+        artifact = ImageArtifact(data=_image_bytes((4000, 3000)))
+        with (
+            patch.object(qwen_module.settings, "QWEN_IMAGE_MAX_SIDE", 1000),
+            patch.object(qwen_module.settings, "QWEN_IMAGE_JPEG_QUALITY", 80),
+        ):
+            encoded = qwen_module._encode_image_base64(artifact)
+        assert _decode(encoded).size == (1000, 750)
+        assert len(base64.b64decode(encoded)) < len(artifact.data)
+
+    def test_zero_max_side_keeps_size(self) -> None:
+        artifact = ImageArtifact(data=_image_bytes((300, 200)))
+        with patch.object(qwen_module.settings, "QWEN_IMAGE_MAX_SIDE", 0):
+            encoded = qwen_module._encode_image_base64(artifact)
+        assert _decode(encoded).size == (300, 200)
+
+    def test_applies_exif_orientation(self) -> None:
+        """재인코딩으로 EXIF가 빠져도 세로 사진이 눕지 않는다."""
+        exif = Image.Exif()
+        exif[0x0112] = 6  # 90도 회전
+        artifact = ImageArtifact(
+            data=_image_bytes((80, 40), "JPEG", exif=exif.tobytes())
+        )
+        assert _decode(qwen_module._encode_image_base64(artifact)).size == (40, 80)
+
+    def test_reuses_artifact_encoding(self) -> None:
+        """공유 ImageArtifact를 받으면 파일을 다시 읽지 않고 인코딩 결과를 재사용한다."""
+        artifact = ImageArtifact(path="/not/read.jpg", data=_image_bytes((32, 32)))
+        result = qwen_module._encode_image_base64(artifact)
+        assert qwen_module._encode_image_base64(artifact) is result
 
     def test_raises_on_missing_file(self, tmp_path: object) -> None:
         """파일이 없으면 FileNotFoundError를 발생시킨다."""
         with pytest.raises(FileNotFoundError):
             qwen_module._encode_image_base64(str(tmp_path / "missing.jpg"))
 
+    def test_raises_on_non_image(self) -> None:
+        with pytest.raises(OSError):
+            qwen_module._encode_image_base64(ImageArtifact(data=b"not an image"))
+
 
 # ── probe_with_qwen ───────────────────────────────────────────────────────────
 
@@ -44,6 +102,8 @@ def _mock_settings(api_key: str = "fake-api-key") -> MagicMock:
     s.API_TIMEOUT_SECONDS = 30
     s.API_MAX_RETRIES = 2
     s.QWEN_VL_MODEL_ID = "qwen/test-model"
+    s.QWEN_HTTP_KEEPALIVE_SECONDS = 60.0
+    s.model_concurrency.return_value = 8
     return s
 
 
@@ -174,3 +234,55 @@ class TestProbeWithQwen:
         assert result["label"] == "mismatch"
         assert isinstance(result["reason"], str)
         assert len(result["reason"]) > 0
+
+
+# ── get_qwen_client ───────────────────────────────────────────────────────────
+
+
+class TestQwenClientCache:
+    def test_reuses_client_across_probes(self) -> None:
+        """같은 설정이면 호출마다 클라이언트를 새로 만들지 않는다."""
+        mock_response = MagicMock()
+        mock_response.content = json.dumps({"score": 0.5, "label": "match"})
+
+        with (
+            patch.object(qwen_module, "settings", _mock_settings()),
+            patch("app.models.qwen_vl._encode_image_base64", return_value="b64"),
+            patch("app.models.qwen_vl.ChatOpenAI") as mock_cls,
+        ):
+            mock_cls.return_value.invoke.return_value = mock_response
+            for _ in range(3):
+                qwen_module.probe_with_qwen("location", "/img.jpg", "활돌이", {})
+
+        assert mock_cls.call_count == 1
+        assert mock_cls.return_value.invoke.call_count == 3
+
+    def test_new_client_when_settings_change(self) -> None:
+        mock_settings = _mock_settings()
+        with (
+            patch.object(qwen_module, "settings", mock_settings),
+            patch("app.models.qwen_vl.ChatOpenAI", side_effect=lambda **_: MagicMock()),
+        ):
+            first = qwen_module.get_qwen_client()
+            mock_settings.QWEN_VL_MODEL_ID = "qwen/other-model"
+            second = qwen_module.get_qwen_client()
+
+        assert first is not second
+
+    def test_uses_pooled_keepalive_http_client(self) -> None:
+        """실제 ChatOpenAI에 연결 풀 크기·keep-alive가 설정된 httpx 클라이언트를 넘긴다."""
+        with patch.object(qwen_module, "settings", _mock_settings()):
+            client = qwen_module.get_qwen_client()
+            assert qwen_module.get_qwen_client() is client
+
+        http_client = client.http_client
+        assert isinstance(http_client, qwen_module.httpx.Client)
+        pool = http_client._transport._pool
+        assert pool._max_connections == 8
+        assert pool._max_keepalive_connections == 8
+        assert pool._keepalive_expiry == 60.0
+        assert client.model_name == "qwen/test-model"
+        assert client.openai_api_base == qwen_module.OPENROUTER_BASE_URL
+
+        qwen_module.clear_client_cache()
+        assert http_client.is_closed
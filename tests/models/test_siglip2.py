@@ -2,17 +2,26 @@
 
 검증 대상:
   - probe_with_siglip2: 모델 로드 실패·이미지 로드 실패·추론 실패·성공·실패
+  - 공유 ImageArtifact: 전처리 텐서 재사용
   - 후보 텍스트: siglip2_candidates 제공 / location·atmosphere 폴백
+  - 어휘 점수: 전체 어휘 scores 맵·단일 텍스트 인코딩·판정 점수 불변
+  - 텍스트 임베딩 캐시: 재사용·모델 ID 키·prime_text_cache
+  - 마이크로 배칭: 설정에 따른 비전 타워 경로 선택
+  - 모델 로드: 텍스트 타워만 로드·비전 타워 재로드·기존 전체 모델 유지
+  - warmup: 모델 로드 + 더미 추론 1회·실패 전파
 """
 
 from __future__ import annotations
 
+import math
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
 import torch
 
 import app.models.siglip2 as siglip2_module
+from app.core.image_artifact import ImageArtifact
 
 
 # ── 헬퍼 ─────────────────────────────────────────────────────────────────────
@@ -21,28 +30,63 @@ import app.models.siglip2 as siglip2_module
 def _make_inference_mocks(score_val: float = 0.9) -> tuple:
     """추론 성공 경로용 mock 세트를 반환한다.
 
+    텍스트 임베딩은 단위 벡터(eye)로, 이미지 임베딩과 logit_scale은
+    softmax(logits)[0] == score_val 이 되도록 구성한다.
+
     Returns:
         (mock_proc, mock_tok, mock_model, mock_image, mock_probs)
     """
-    # _image_processor / _tokenizer — 체인 호출 결과만 mock
     mock_proc = MagicMock()
-    mock_tok = MagicMock()
+    mock_tok = MagicMock(
+        side_effect=lambda texts, **_: {
+            "input_ids": torch.zeros(len(texts), 64, dtype=torch.long)
+        }
+    )
 
     # probs[0][0].cpu().numpy() → score_val
     mock_node = MagicMock()
     mock_node.cpu.return_value.numpy.return_value = score_val
     mock_probs = [[mock_node]]  # 실제 중첩 리스트로 구성
 
+    logit_gap = math.log(score_val / (1.0 - score_val))
+    image_vec = [1.0, 0.0] if logit_gap >= 0 else [0.0, 1.0]
+
     mock_model = MagicMock()
-    mock_model.return_value.logits_per_image = torch.log(
-        torch.tensor([[score_val, 1.0 - score_val]], dtype=torch.float32)
+    mock_model.text_model.side_effect = lambda input_ids: SimpleNamespace(
+        pooler_output=torch.eye(2)[: input_ids.shape[0]]
+    )
+    mock_model.vision_model.return_value = SimpleNamespace(
+        pooler_output=torch.tensor([image_vec])
     )
+    mock_model.logit_scale = torch.tensor(math.log(abs(logit_gap)))
+    mock_model.logit_bias = torch.tensor(0.0)
     mock_image = MagicMock()
     mock_image.convert.return_value = mock_image
 
     return mock_proc, mock_tok, mock_model, mock_image, mock_probs
 
 
+# 실제 파이프라인처럼 정답/대조 후보 2개를 제공하는 번들
+_TWO_CANDIDATES = {
+    "siglip2_candidates": ["a photo of 활돌이", "a photo of a different place"]
+}
+
+
+@pytest.fixture(autouse=True)
+def _clear_text_cache():
+    """테스트 간 텍스트 임베딩 캐시가 공유되지 않도록 비운다."""
+    siglip2_module.clear_text_cache()
+    yield
+    siglip2_module.clear_text_cache()
+
+
+@pytest.fixture(autouse=True)
+def _no_file_read():
+    """가짜 경로로도 동작하도록 아티팩트의 파일 읽기를 막는다 (디코드는 Image.open mock)."""
+    with patch.object(ImageArtifact, "_read", return_value=b""):
+        yield
+
+
 # ── probe_with_siglip2 ────────────────────────────────────────────────────────
 
 
@@ -59,6 +103,7 @@ class TestProbeWithSiglip2:
         assert result["score"] == 0.0
         assert result["label"] == "mismatch"
         assert "oom" in result["reason"]
+        assert result["failed"] is True
 
     def test_returns_mismatch_on_image_load_failure(self) -> None:
         """이미지 로드 실패 시 score=0.0, label='mismatch'를 반환한다."""
@@ -68,7 +113,7 @@ class TestProbeWithSiglip2:
             patch.object(siglip2_module, "_image_processor", MagicMock()),
             patch.object(siglip2_module, "_tokenizer", MagicMock()),
             patch(
-                "app.models.siglip2.Image.open",
+                "app.core.image_artifact.Image.open",
                 side_effect=OSError("no file"),
             ),
         ):
@@ -78,6 +123,7 @@ class TestProbeWithSiglip2:
         assert result["score"] == 0.0
         assert result["label"] == "mismatch"
         assert "Image load failed" in result["reason"]
+        assert result["failed"] is True
 
     def test_returns_mismatch_on_inference_failure(self) -> None:
         """추론 중 예외 발생 시 score=0.0, label='mismatch'를 반환한다."""
@@ -91,7 +137,7 @@ class TestProbeWithSiglip2:
             patch.object(siglip2_module, "_image_processor", mock_proc),
             patch.object(siglip2_module, "_tokenizer", MagicMock()),
             patch.object(siglip2_module, "_model", MagicMock()),
-            patch("app.models.siglip2.Image.open", return_value=mock_image),
+            patch("app.core.image_artifact.Image.open", return_value=mock_image),
         ):
             result = siglip2_module.probe_with_siglip2(
                 "location", "/img.jpg", "활돌이", {}
@@ -99,6 +145,30 @@ class TestProbeWithSiglip2:
         assert result["score"] == 0.0
         assert result["label"] == "mismatch"
         assert "Inference failed" in result["reason"]
+        assert result["failed"] is True
+
+    def test_shared_artifact_preprocesses_image_once(self) -> None:
+        """같은 ImageArtifact로 다시 호출하면 pixel_values를 재사용한다."""
+        mock_proc, mock_tok, mock_model, mock_image, _ = _make_inference_mocks(0.9)
+        artifact = ImageArtifact(path="/img.jpg", data=b"raw")
+        with (
+            patch.object(siglip2_module, "_load_siglip2"),
+            patch.object(siglip2_module, "_image_processor", mock_proc),
+            patch.object(siglip2_module, "_tokenizer", mock_tok),
+            patch.object(siglip2_module, "_model", mock_model),
+            patch(
+                "app.core.image_artifact.Image.open", return_value=mock_image
+            ) as mock_open,
+        ):
+            first = siglip2_module.probe_with_siglip2(
+                "location", artifact, "활돌이", _TWO_CANDIDATES
+            )
+            second = siglip2_module.probe_with_siglip2(
+                "location", artifact, "활돌이", _TWO_CANDIDATES
+            )
+        assert first["score"] == pytest.approx(second["score"])
+        assert mock_proc.call_count == 1
+        mock_open.assert_called_once()
 
     def test_fallback_candidate_location(self) -> None:
         """candidates 없고 location 타입이면 'a photo of {answer}' 텍스트를 사용한다."""
@@ -110,7 +180,7 @@ class TestProbeWithSiglip2:
             patch.object(siglip2_module, "_image_processor", mock_proc),
             patch.object(siglip2_module, "_tokenizer", mock_tok),
             patch.object(siglip2_module, "_model", mock_model),
-            patch("app.models.siglip2.Image.open", return_value=mock_image),
+            patch("app.core.image_artifact.Image.open", return_value=mock_image),
             patch("app.models.siglip2.torch.sigmoid", return_value=mock_probs),
             patch("app.models.siglip2.torch.no_grad"),
         ):
@@ -129,7 +199,7 @@ class TestProbeWithSiglip2:
             patch.object(siglip2_module, "_image_processor", mock_proc),
             patch.object(siglip2_module, "_tokenizer", mock_tok),
             patch.object(siglip2_module, "_model", mock_model),
-            patch("app.models.siglip2.Image.open", return_value=mock_image),
+            patch("app.core.image_artifact.Image.open", return_value=mock_image),
             patch("app.models.siglip2.torch.sigmoid", return_value=mock_probs),
             patch("app.models.siglip2.torch.no_grad"),
         ):
@@ -149,7 +219,7 @@ class TestProbeWithSiglip2:
             patch.object(siglip2_module, "_image_processor", mock_proc),
             patch.object(siglip2_module, "_tokenizer", mock_tok),
             patch.object(siglip2_module, "_model", mock_model),
-            patch("app.models.siglip2.Image.open", return_value=mock_image),
+            patch("app.core.image_artifact.Image.open", return_value=mock_image),
             patch("app.models.siglip2.torch.sigmoid", return_value=mock_probs),
             patch("app.models.siglip2.torch.no_grad"),
         ):
@@ -166,19 +236,20 @@ class TestProbeWithSiglip2:
         mock_settings = MagicMock()
         mock_settings.LOCATION_PASS_THRESHOLD = 0.5
         mock_settings.ATMOSPHERE_PASS_THRESHOLD = 0.5
+        mock_settings.SIGLIP2_MICRO_BATCH_ENABLED = False
 
         with (
             patch.object(siglip2_module, "_load_siglip2"),
             patch.object(siglip2_module, "_image_processor", mock_proc),
             patch.object(siglip2_module, "_tokenizer", mock_tok),
             patch.object(siglip2_module, "_model", mock_model),
-            patch("app.models.siglip2.Image.open", return_value=mock_image),
+            patch("app.core.image_artifact.Image.open", return_value=mock_image),
             patch("app.models.siglip2.torch.sigmoid", return_value=mock_probs),
             patch("app.models.siglip2.torch.no_grad"),
             patch.object(siglip2_module, "settings", mock_settings),
         ):
             result = siglip2_module.probe_with_siglip2(
-                "location", "/img.jpg", "활돌이", {}
+                "location", "/img.jpg", "활돌이", _TWO_CANDIDATES
             )
         assert result["model"] == "siglip2"
         assert result["score"] == pytest.approx(0.95)
@@ -192,19 +263,288 @@ class TestProbeWithSiglip2:
         mock_settings = MagicMock()
         mock_settings.LOCATION_PASS_THRESHOLD = 0.5
         mock_settings.ATMOSPHERE_PASS_THRESHOLD = 0.5
+        mock_settings.SIGLIP2_MICRO_BATCH_ENABLED = False
 
         with (
             patch.object(siglip2_module, "_load_siglip2"),
             patch.object(siglip2_module, "_image_processor", mock_proc),
             patch.object(siglip2_module, "_tokenizer", mock_tok),
             patch.object(siglip2_module, "_model", mock_model),
-            patch("app.models.siglip2.Image.open", return_value=mock_image),
+            patch("app.core.image_artifact.Image.open", return_value=mock_image),
             patch("app.models.siglip2.torch.sigmoid", return_value=mock_probs),
             patch("app.models.siglip2.torch.no_grad"),
             patch.object(siglip2_module, "settings", mock_settings),
         ):
             result = siglip2_module.probe_with_siglip2(
-                "location", "/img.jpg", "활돌이", {}
+                "location", "/img.jpg", "활돌이", _TWO_CANDIDATES
             )
         assert result["label"] == "mismatch"
         assert result["score"] == pytest.approx(0.1)
+
+
+# ── 텍스트 임베딩 캐시 ───────────────────────────────────────────────────────
+
+
+class TestTextEmbeddingCache:
+    def test_text_tower_runs_once_for_repeated_candidates(self) -> None:
+        """같은 후보로 여러 번 추론해도 텍스트 타워는 한 번만 실행된다."""
+        mock_proc, mock_tok, mock_model, mock_image, _ = _make_inference_mocks(0.9)
+        bundle = {"siglip2_candidates": ["a photo of x", "a photo of y"]}
+        with (
+            patch.object(siglip2_module, "_load_siglip2"),
+            patch.object(siglip2_module, "_image_processor", mock_proc),
+            patch.object(siglip2_module, "_tokenizer", mock_tok),
+            patch.object(siglip2_module, "_model", mock_model),
+            patch("app.core.image_artifact.Image.open", return_value=mock_image),
+        ):
+            first = siglip2_module.probe_with_siglip2("location", "/a.jpg", "x", bundle)
+            second = siglip2_module.probe_with_siglip2(
+                "location", "/b.jpg", "x", bundle
+            )
+        assert mock_model.text_model.call_count == 1
+        assert mock_model.vision_model.call_count == 2
+        assert first["score"] == pytest.approx(second["score"])
+
+    def test_only_missing_candidates_are_encoded(self) -> None:
+        """캐시에 없는 후보만 토크나이즈된다."""
+        _, mock_tok, mock_model, _, _ = _make_inference_mocks(0.9)
+        with (
+            patch.object(siglip2_module, "_tokenizer", mock_tok),
+            patch.object(siglip2_module, "_model", mock_model),
+        ):
+            siglip2_module._encode_text(["a"])
+            embeds = siglip2_module._encode_text(["a", "b"])
+        assert mock_tok.call_args_list[-1].args[0] == ["b"]
+        assert embeds.shape == (2, 2)
+
+    def test_cache_is_keyed_by_model_id(self) -> None:
+        """모델 ID가 바뀌면 같은 후보라도 다시 계산한다."""
+        _, mock_tok, mock_model, _, _ = _make_inference_mocks(0.9)
+        with (
+            patch.object(siglip2_module, "_tokenizer", mock_tok),
+            patch.object(siglip2_module, "_model", mock_model),
+        ):
+            siglip2_module._encode_text(["a"])
+            with patch.object(siglip2_module, "MODEL_NAME", "other/model"):
+                siglip2_module._encode_text(["a"])
+        assert mock_model.text_model.call_count == 2
+
+    def test_prime_text_cache_skips_when_model_not_loaded(self) -> None:
+        """모델 미로드 상태에서는 캐시를 채우지 않는다."""
+        with patch.object(siglip2_module, "_model", None):
+            siglip2_module.prime_text_cache(["a photo of x"])
+        assert siglip2_module._text_embedding_cache == {}
+
+    def test_prime_text_cache_fills_cache(self) -> None:
+        """모델이 로드되어 있으면 후보 임베딩을 미리 계산한다."""
+        _, mock_tok, mock_model, _, _ = _make_inference_mocks(0.9)
+        with (
+            patch.object(siglip2_module, "_tokenizer", mock_tok),
+            patch.object(siglip2_module, "_model", mock_model),
+        ):
+            siglip2_module.prime_text_cache(["a photo of x", "a photo of y"])
+        assert (
+            siglip2_module.MODEL_NAME,
+            "a photo of x",
+        ) in siglip2_module._text_embedding_cache
+
+
+# ── 마이크로 배칭 ─────────────────────────────────────────────────────────────
+
+
+class TestVisionMicroBatching:
+    def test_disabled_runs_vision_tower_directly(self) -> None:
+        """마이크로 배칭이 꺼져 있으면 배처 없이 비전 타워를 실행한다."""
+        pixel_values = torch.zeros(1, 3, 2, 2)
+        with (
+            patch.object(siglip2_module.settings, "SIGLIP2_MICRO_BATCH_ENABLED", False),
+            patch.object(siglip2_module, "_encode_image", return_value="direct"),
+            patch.object(siglip2_module, "_get_vision_batcher") as get_batcher,
+        ):
+            assert siglip2_module._embed_image(pixel_values) == "direct"
+        get_batcher.assert_not_called()
+
+    def test_enabled_submits_to_shared_batcher(self) -> None:
+        """마이크로 배칭이 켜져 있으면 공유 배처에 제출한다."""
+        pixel_values = torch.zeros(1, 3, 2, 2)
+        batcher = MagicMock()
+        batcher.submit.return_value = "batched"
+        with (
+            patch.object(siglip2_module.settings, "SIGLIP2_MICRO_BATCH_ENABLED", True),
+            patch.object(siglip2_module, "_vision_batcher", batcher),
+        ):
+            assert siglip2_module._embed_image(pixel_values) == "batched"
+        batcher.submit.assert_called_once_with(pixel_values)
+
+    def test_probe_result_unchanged_with_micro_batching(self) -> None:
+        """배처를 거쳐도 프로브 점수는 직접 실행과 같다."""
+        mock_proc, mock_tok, mock_model, mock_image, _ = _make_inference_mocks(0.8)
+        mock_proc.return_value = {"pixel_values": torch.zeros(1, 3, 2, 2)}
+        results = []
+        for enabled in (False, True):
+            siglip2_module.clear_text_cache()
+            with (
+                patch.object(siglip2_module, "_load_siglip2"),
+                patch.object(siglip2_module, "_image_processor", mock_proc),
+                patch.object(siglip2_module, "_tokenizer", mock_tok),
+                patch.object(siglip2_module, "_model", mock_model),
+                patch.object(siglip2_module, "_vision_batcher", None),
+                patch.object(
+                    siglip2_module.settings, "SIGLIP2_MICRO_BATCH_ENABLED", enabled
+                ),
+                patch("app.core.image_artifact.Image.open", return_value=mock_image),
+            ):
+                results.append(
+                    siglip2_module.probe_with_siglip2(
+                        "location", "/img.jpg", "활돌이", _TWO_CANDIDATES
+                    )["score"]
+                )
+        assert results[0] == pytest.approx(0.8)
+        assert results[1] == pytest.approx(results[0])
+
+
+# ── 어휘 점수 ─────────────────────────────────────────────────────────────────
+
+
+def _make_vocabulary_model() -> MagicMock:
+    """텍스트마다 서로 다른 임베딩을 돌려주는 mock 모델 (토큰 0번 = 텍스트 길이)."""
+    model = MagicMock()
+    model.text_model.side_effect = lambda input_ids: SimpleNamespace(
+        pooler_output=torch.stack(
+            [
+                torch.tensor([math.cos(float(n)), math.sin(float(n)), 0.1])
+                for n in input_ids[:, 0].tolist()
+            ]
+        )
+    )
+    model.vision_model.return_value = SimpleNamespace(
+        pooler_output=torch.tensor([[1.0, 0.5, 0.2]])
+    )
+    model.logit_scale = torch.tensor(math.log(10.0))
+    model.logit_bias = torch.tensor(0.0)
+    return model
+
+
+class TestVocabularyScores:
+    _BUNDLE = {
+        "siglip2_candidates": ["a photo of x", "a photo of a different place"],
+        "siglip2_vocabulary": {
+            "엑스": "a photo of x",
+            "와이": "a photo of a tall y",
+            "제트": "a photo of zz",
+        },
+    }
+
+    def _probe(self, model: MagicMock, bundle: dict) -> dict:
+        mock_image = MagicMock()
+        mock_image.convert.return_value = mock_image
+        tokenizer = MagicMock(
+            side_effect=lambda texts, **_: {
+                "input_ids": torch.tensor([[len(text), 0] for text in texts])
+            }
+        )
+        with (
+            patch.object(siglip2_module, "_load_siglip2"),
+            patch.object(siglip2_module, "_image_processor", MagicMock()),
+            patch.object(siglip2_module, "_tokenizer", tokenizer),
+            patch.object(siglip2_module, "_model", model),
+            patch("app.core.image_artifact.Image.open", return_value=mock_image),
+        ):
+            return siglip2_module.probe_with_siglip2(
+                "location", "/img.jpg", "x", bundle
+            )
+
+    def test_returns_score_for_every_vocabulary_entry(self) -> None:
+        vote = self._probe(_make_vocabulary_model(), self._BUNDLE)
+
+        assert list(vote["scores"]) == ["엑스", "와이", "제트"]
+        assert sum(vote["scores"].values()) == pytest.approx(1.0)
+
+    def test_encodes_all_texts_in_one_pass(self) -> None:
+        """후보와 어휘의 중복 문장은 한 번만, 전체를 텍스트 타워 1회로 인코딩한다."""
+        model = _make_vocabulary_model()
+        self._probe(model, self._BUNDLE)
+
+        assert model.text_model.call_count == 1
+        assert model.text_model.call_args.kwargs["input_ids"].shape[0] == 4
+        assert model.vision_model.call_count == 1
+
+    def test_verdict_score_ignores_vocabulary(self) -> None:
+        """판정 점수는 어휘가 있어도 정답/대조 후보 두 문장 사이의 확률 그대로다."""
+        with_vocabulary = self._probe(_make_vocabulary_model(), self._BUNDLE)
+        siglip2_module.clear_text_cache()
+        without_vocabulary = self._probe(
+            _make_vocabulary_model(),
+            {"siglip2_candidates": self._BUNDLE["siglip2_candidates"]},
+        )
+
+        assert with_vocabulary["score"] == pytest.approx(without_vocabulary["score"])
+        assert with_vocabulary["label"] == without_vocabulary["label"]
+        assert "scores" not in without_vocabulary
+
+
+# ── 모델 로드 ─────────────────────────────────────────────────────────────────
+
+
+class TestLoad:
+    def _load(
+        self, current: MagicMock | None, vision: bool
+    ) -> tuple[MagicMock, MagicMock]:
+        model = MagicMock()
+        model.eval.return_value = model
+        model.to.return_value = model
+        with (
+            patch.object(siglip2_module, "_model", current),
+            patch.object(siglip2_module, "AutoImageProcessor"),
+            patch.object(siglip2_module, "GemmaTokenizerFast"),
+            patch.object(siglip2_module, "AutoModel") as mock_auto,
+            patch.object(siglip2_module, "apply_precision", side_effect=lambda m, _: m),
+            patch.object(siglip2_module, "input_dtype", return_value=torch.float32),
+        ):
+            mock_auto.from_pretrained.return_value = model
+            siglip2_module._load_siglip2(vision=vision)
+            loaded = siglip2_module._model
+        return mock_auto, loaded
+
+    def test_text_only_load_drops_vision_tower(self) -> None:
+        mock_auto, loaded = self._load(None, vision=False)
+        mock_auto.from_pretrained.assert_called_once()
+        assert loaded.vision_model is None
+
+    def test_vision_load_reloads_text_only_model(self) -> None:
+        mock_auto, loaded = self._load(MagicMock(vision_model=None), vision=True)
+        mock_auto.from_pretrained.assert_called_once()
+        assert loaded.vision_model is not None
+
+    def test_text_only_load_keeps_existing_full_model(self) -> None:
+        full = MagicMock()
+        mock_auto, loaded = self._load(full, vision=False)
+        mock_auto.from_pretrained.assert_not_called()
+        assert loaded is full
+
+
+# ── warmup ────────────────────────────────────────────────────────────────────
+
+
+class TestWarmup:
+    def test_loads_model_and_runs_dummy_inference(self) -> None:
+        mock_proc, mock_tok, mock_model, _, _ = _make_inference_mocks(0.8)
+        mock_proc.return_value = {"pixel_values": torch.zeros(1, 3, 2, 2)}
+        with (
+            patch.object(siglip2_module, "_load_siglip2") as mock_load,
+            patch.object(siglip2_module, "_image_processor", mock_proc),
+            patch.object(siglip2_module, "_tokenizer", mock_tok),
+            patch.object(siglip2_module, "_model", mock_model),
+            patch.object(siglip2_module.settings, "SIGLIP2_MICRO_BATCH_ENABLED", False),
+        ):
+            siglip2_module.warmup()
+        mock_load.assert_called_once_with()
+        assert mock_model.vision_model.call_count == 1
+        assert mock_model.text_model.call_count == 1
+
+    def test_load_failure_propagates(self) -> None:
+        with patch.object(
+            siglip2_module, "_load_siglip2", side_effect=RuntimeError("no weights")
+        ):
+            with pytest.raises(RuntimeError, match="no weights"):
+                siglip2_module.warmup()
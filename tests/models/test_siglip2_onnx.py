@@ -0,0 +1,224 @@
+"""app.models.siglip2_onnx 단위 테스트.
+
+검증 대상:
+  - 선택 의존성: onnxruntime 미설치 시 "Model load failed" 투표
+  - ONNX 캐시: 파일이 없을 때만 내보내기·MODEL_ID별 파일 경로
+  - 세션 옵션: 그래프 최적화·CPU 공급자·스레드 설정
+  - PyTorch 프로브와의 정합성 (onnxruntime 설치 시): 이미지 임베딩·점수·라벨
+  - 텍스트 타워만 로드: 내보내기 사본 해제 후 로드·PyTorch 비전 타워 미보관
+"""
+
+from __future__ import annotations
+
+import copy
+import io
+import os
+import sys
+from unittest.mock import MagicMock, patch
+
+import pytest
+import torch
+from PIL import Image
+
+import app.models.siglip2 as siglip2_module
+import app.models.siglip2_onnx as onnx_module
+from app.core.image_artifact import ImageArtifact
+
+_TWO_CANDIDATES = {
+    "siglip2_candidates": ["a photo of 활돌이", "a photo of a different place"]
+}
+
+
+@pytest.fixture(autouse=True)
+def _reset_state():
+    """테스트 간 ONNX 세션과 텍스트 임베딩 캐시가 공유되지 않도록 비운다."""
+    onnx_module._session = None
+    siglip2_module.clear_text_cache()
+    yield
+    onnx_module._session = None
+    siglip2_module.clear_text_cache()
+
+
+class TestOptionalDependency:
+    def test_missing_onnxruntime_returns_load_failure(self) -> None:
+        with (
+            patch.dict(sys.modules, {"onnxruntime": None}),
+            patch.object(siglip2_module, "_load_siglip2") as mock_load,
+        ):
+            result = onnx_module.probe_with_siglip2_onnx(
+                "location", ImageArtifact(data=b""), "활돌이", _TWO_CANDIDATES
+            )
+
+        assert result["model"] == "siglip2-onnx"
+        assert result["score"] == 0.0
+        assert result["label"] == "mismatch"
+        assert "Model load failed" in result["reason"]
+        mock_load.assert_not_called()
+
+
+class TestOnnxCache:
+    def test_exports_only_when_file_missing(self, tmp_path) -> None:
+        """캐시 파일이 있으면 내보내기 없이 세션만 만든다."""
+        with (
+            patch.dict(sys.modules, {"onnxruntime": MagicMock()}),
+            patch.object(onnx_module.settings, "MODEL_CACHE_DIR", str(tmp_path)),
+            patch.object(siglip2_module, "_load_siglip2"),
+            patch.object(
+                onnx_module,
+                "export_vision_tower",
+                side_effect=lambda path: open(path, "wb").close(),
+            ) as mock_export,
+            patch.object(onnx_module, "_create_session") as mock_session,
+        ):
+            onnx_module._load_siglip2_onnx()
+            onnx_module._session = None
+            onnx_module._load_siglip2_onnx()
+            expected_path = onnx_module.onnx_path()
+
+        assert mock_export.call_count == 1
+        assert mock_session.call_count == 2
+        mock_session.assert_called_with(expected_path)
+
+    def test_path_is_keyed_by_model_id(self, tmp_path) -> None:
+        with (
+            patch.object(onnx_module.settings, "MODEL_CACHE_DIR", str(tmp_path)),
+            patch.object(siglip2_module, "MODEL_NAME", "google/siglip2-x"),
+        ):
+            path = onnx_module.onnx_path()
+
+        assert path == str(tmp_path / "google--siglip2-x-vision.onnx")
+
+
+class TestSessionOptions:
+    def test_applies_graph_optimization_and_threads(self) -> None:
+        ort = pytest.importorskip("onnxruntime")
+        with (
+            patch.object(ort, "InferenceSession") as mock_session,
+            patch.object(onnx_module.settings, "SIGLIP2_ONNX_INTRA_OP_THREADS", 2),
+        ):
+            onnx_module._create_session("model.onnx")
+
+        options = mock_session.call_args.kwargs["sess_options"]
+        assert (
+            options.graph_optimization_level
+            == ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        )
+        assert options.intra_op_num_threads == 2
+        assert options.inter_op_num_threads == 1
+        assert mock_session.call_args.kwargs["providers"] == ["CPUExecutionProvider"]
+
+
+class TestParityWithPyTorch:
+    @pytest.fixture
+    def tiny_siglip(self):
+        """작은 SigLIP 모델을 siglip2 모듈 전역에 설치한다."""
+        pytest.importorskip("onnxruntime")
+        pytest.importorskip("onnx")
+        from transformers import SiglipConfig, SiglipImageProcessor, SiglipModel
+
+        torch.manual_seed(0)
+        config = SiglipConfig(
+            text_config={
+                "vocab_size": 64,
+                "hidden_size": 32,
+                "intermediate_size": 64,
+                "num_hidden_layers": 2,
+                "num_attention_heads": 2,
+                "max_position_embeddings": 64,
+            },
+            vision_config={
+                "hidden_size": 32,
+                "intermediate_size": 64,
+                "num_hidden_layers": 2,
+                "num_attention_heads": 2,
+                "image_size": 32,
+                "patch_size": 8,
+            },
+        )
+        model = SiglipModel(config).eval()
+
+        def tokenizer(texts, **_):
+            ids = [[len(text) % 64, *range(1, 64)] for text in texts]
+            return {"input_ids": torch.tensor(ids)}
+
+        with (
+            patch.object(siglip2_module, "_model", model),
+            patch.object(
+                siglip2_module,
+                "_image_processor",
+                SiglipImageProcessor(size={"height": 32, "width": 32}),
+            ),
+            patch.object(siglip2_module, "_tokenizer", tokenizer),
+            patch.object(siglip2_module, "_input_dtype", torch.float32),
+            patch("transformers.AutoModel.from_pretrained", return_value=model),
+        ):
+            yield model
+
+    @staticmethod
+    def _artifact(color: tuple[int, int, int]) -> ImageArtifact:
+        buffer = io.BytesIO()
+        Image.new("RGB", (48, 40), color).save(buffer, format="PNG")
+        return ImageArtifact(data=buffer.getvalue())
+
+    def test_matches_pytorch_probe(self, tiny_siglip, tmp_path) -> None:
+        with (
+            patch.object(onnx_module.settings, "MODEL_CACHE_DIR", str(tmp_path)),
+            patch.object(siglip2_module.settings, "SIGLIP2_MICRO_BATCH_ENABLED", False),
+        ):
+            for color in [(200, 30, 30), (20, 180, 90)]:
+                image = self._artifact(color)
+                expected = siglip2_module.probe_with_siglip2(
+                    "location", image, "활돌이", _TWO_CANDIDATES
+                )
+                actual = onnx_module.probe_with_siglip2_onnx(
+                    "location", image, "활돌이", _TWO_CANDIDATES
+                )
+
+                assert torch.allclose(
+                    onnx_module._image_embeds(image),
+                    siglip2_module._image_embeds(image),
+                    atol=1e-5,
+                )
+                assert actual["model"] == "siglip2-onnx"
+                assert actual["score"] == pytest.approx(expected["score"], abs=1e-5)
+                assert actual["label"] == expected["label"]
+            assert os.path.exists(onnx_module.onnx_path())
+
+    def test_loads_text_tower_only_after_export(self, tiny_siglip, tmp_path) -> None:
+        """내보내기 사본을 해제한 뒤 텍스트 타워만 남긴 모델을 로드한다."""
+        image = self._artifact((200, 30, 30))
+        with patch.object(
+            siglip2_module.settings, "SIGLIP2_MICRO_BATCH_ENABLED", False
+        ):
+            expected = siglip2_module.probe_with_siglip2(
+                "location", image, "활돌이", _TWO_CANDIDATES
+            )
+        siglip2_module.clear_text_cache()
+        exported_before_load: list[bool] = []
+
+        def from_pretrained(*_, **__):
+            exported_before_load.append(os.path.exists(onnx_module.onnx_path()))
+            return copy.deepcopy(tiny_siglip)
+
+        with (
+            patch.object(onnx_module.settings, "MODEL_CACHE_DIR", str(tmp_path)),
+            patch.object(siglip2_module, "_model", None),
+            patch.object(siglip2_module, "AutoImageProcessor"),
+            patch.object(siglip2_module, "GemmaTokenizerFast"),
+            patch(
+                "transformers.AutoModel.from_pretrained", side_effect=from_pretrained
+            ),
+        ):
+            processor, tokenizer = (
+                siglip2_module._image_processor,
+                siglip2_module._tokenizer,
+            )
+            siglip2_module.AutoImageProcessor.from_pretrained.return_value = processor
+            siglip2_module.GemmaTokenizerFast.from_pretrained.return_value = tokenizer
+            actual = onnx_module.probe_with_siglip2_onnx(
+                "location", image, "활돌이", _TWO_CANDIDATES
+            )
+            assert siglip2_module._model.vision_model is None
+
+        assert exported_before_load == [False, True]
+        assert actual["score"] == pytest.approx(expected["score"], abs=1e-5)
@@ -0,0 +1,97 @@
+"""app.models.worker_pool 단위 테스트.
+
+검증 대상:
+  - MODEL_WORKER_PROCESSES 파싱: 수 생략·형식 오류·기동 시 검증
+  - 워커당 torch 스레드 수 결정
+  - SharedImage → 워커 프로브 왕복 (원본 바이트·경로 보존, 해제 후 접근 불가)
+  - 워밍업 실패 워커 확인 시 예외
+"""
+
+from __future__ import annotations
+
+from multiprocessing import shared_memory
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+import app.models.worker_pool as worker_pool
+from app.core.config import settings
+from app.core.image_artifact import ImageArtifact
+
+
+class TestModelWorkerProcesses:
+    def test_parses_counts_and_defaults_to_one(self) -> None:
+        with patch.object(settings, "MODEL_WORKER_PROCESSES", "siglip2:2, blip"):
+            assert settings.model_worker_processes == {"siglip2": 2, "blip": 1}
+
+    @pytest.mark.parametrize("value", ["siglip2:two", "blip:-1", ":2"])
+    def test_malformed_value_raises_config_error(self, value: str) -> None:
+        with (
+            patch.object(settings, "MODEL_WORKER_PROCESSES", value),
+            pytest.raises(ValueError, match="MODEL_WORKER_PROCESSES"),
+        ):
+            settings.validate_model_worker_processes()
+
+    def test_valid_value_passes_validation(self) -> None:
+        with patch.object(settings, "MODEL_WORKER_PROCESSES", "siglip2:0,blip"):
+            settings.validate_model_worker_processes()
+
+
+class TestWorkerThreads:
+    def test_explicit_setting_wins(self) -> None:
+        with patch.object(settings, "MODEL_WORKER_THREADS", 3):
+            assert worker_pool.worker_threads({"siglip2": 4}) == 3
+
+    def test_splits_cores_across_all_workers(self) -> None:
+        with (
+            patch.object(settings, "MODEL_WORKER_THREADS", 0),
+            patch.object(worker_pool.os, "cpu_count", return_value=8),
+        ):
+            assert worker_pool.worker_threads({"siglip2": 2, "blip": 2}) == 2
+            assert worker_pool.worker_threads({"siglip2": 16}) == 1
+
+
+class TestSharedImage:
+    def test_round_trip_to_worker_probe(self) -> None:
+        artifact = ImageArtifact(path="/img.jpg", data=b"raw-bytes")
+        probe = MagicMock()
+        probe.probe.return_value = {"model": "siglip2", "score": 0.5}
+        registry = MagicMock()
+        registry.get.return_value = probe
+
+        with (
+            worker_pool.SharedImage(artifact) as image,
+            patch(
+                "app.models.model_registry.ModelRegistry.get_instance",
+                return_value=registry,
+            ),
+            patch.object(worker_pool, "_worker_model", "siglip2"),
+        ):
+            vote = worker_pool._probe_in_worker(image.ref, "location", "활돌이", {})
+            name = image.ref[0]
+
+        assert vote == {"model": "siglip2", "score": 0.5}
+        registry.get.assert_called_once_with("siglip2")
+        received = probe.probe.call_args.args[1]
+        assert received.data == b"raw-bytes"
+        assert received.path == "/img.jpg"
+        with pytest.raises(FileNotFoundError):
+            shared_memory.SharedMemory(name=name)
+
+    def test_empty_image_is_shared(self) -> None:
+        with worker_pool.SharedImage(ImageArtifact(data=b"")) as image:
+            assert image.ref[1] == 0
+
+
+class TestCheckWorker:
+    def test_returns_pid_when_ready(self) -> None:
+        with patch.object(worker_pool, "_worker_error", None):
+            assert worker_pool._check_worker() == worker_pool.os.getpid()
+
+    def test_raises_when_warmup_failed(self) -> None:
+        with (
+            patch.object(worker_pool, "_worker_model", "blip"),
+            patch.object(worker_pool, "_worker_error", "weights missing"),
+            pytest.raises(RuntimeError, match="blip.*weights missing"),
+        ):
+            worker_pool._check_worker()
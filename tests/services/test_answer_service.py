@@ -96,3 +96,24 @@ def test_cache_reloads_on_new_day(mock_answer_json, monkeypatch):
         ans = get_today_answers()
         assert ans[0] == "loc1"
         assert mock_choice.call_count == 2
+
+
+def test_rotation_primes_siglip2_text_cache(mock_answer_json, monkeypatch):
+    # SigLIP2 모듈이 로드된 상태에서 정답이 바뀌면 텍스트 캐시를 채운다.
+    import app.models.siglip2  # noqa: F401
+    import app.services.answer_service as answer_service
+
+    monkeypatch.setattr(answer_service.settings, "BYPASS_MODEL_VALIDATION", False)
+    with patch("app.models.siglip2.prime_text_cache") as mock_prime:
+        get_today_answers(admin_choice1="loc1", admin_choice2="atm1")
+    assert mock_prime.call_count == 2
+
+
+def test_rotation_skips_cache_priming_in_bypass_mode(mock_answer_json, monkeypatch):
+    import app.models.siglip2  # noqa: F401
+    import app.services.answer_service as answer_service
+
+    monkeypatch.setattr(answer_service.settings, "BYPASS_MODEL_VALIDATION", True)
+    with patch("app.models.siglip2.prime_text_cache") as mock_prime:
+        get_today_answers(admin_choice1="loc1", admin_choice2="atm1")
+    mock_prime.assert_not_called()
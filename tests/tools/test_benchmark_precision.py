@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+
+MODULE_PATH = (
+    Path(__file__).resolve().parents[2] / "scripts" / "tools" / "benchmark_precision.py"
+)
+
+
+def load_module():
+    spec = importlib.util.spec_from_file_location("benchmark_precision", MODULE_PATH)
+    module = importlib.util.module_from_spec(spec)
+    assert spec.loader is not None
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+CLUSTERS = ["화사하고 활기찬", "차분하고 자연적인"]
+
+
+def test_loads_cases_with_windows_keys_and_skips_invalid(tmp_path: Path) -> None:
+    module = load_module()
+    (tmp_path / "A").mkdir()
+    (tmp_path / "A" / "a_01.jpg").write_bytes(b"x")
+    (tmp_path / "A" / "a_02.jpg").write_bytes(b"x")
+    ground_truth = {
+        "A\\a_01.jpg": {
+            "labels": ["화사하고 활기찬"],
+            "scores": {"화사하고 활기찬": 0.8},
+        },
+        "A\\a_02.jpg": {"labels": ["무효함 (Monochromatic)"], "scores": {}},
+        "A\\missing.jpg": {"labels": ["화사하고 활기찬"], "scores": {}},
+    }
+
+    cases = module.load_atmosphere_cases(ground_truth, tmp_path, CLUSTERS)
+
+    assert cases == [
+        (tmp_path / "A" / "a_01.jpg", {"화사하고 활기찬"}, {"화사하고 활기찬": 0.8})
+    ]
+
+
+def test_landmark_trials_pair_each_photo_with_next_landmark() -> None:
+    module = load_module()
+    images = {"A": [Path("a1.jpg")], "B": [Path("b1.jpg"), Path("b2.jpg")]}
+
+    trials = module.landmark_trials(images)
+
+    assert trials == [
+        (Path("a1.jpg"), "A", True),
+        (Path("a1.jpg"), "B", False),
+        (Path("b1.jpg"), "B", True),
+        (Path("b1.jpg"), "A", False),
+        (Path("b2.jpg"), "B", True),
+        (Path("b2.jpg"), "A", False),
+    ]
+
+
+def test_atmosphere_metrics_counts_label_agreement_and_drift() -> None:
+    module = load_module()
+    cases = [
+        (
+            Path("a.jpg"),
+            {"화사하고 활기찬"},
+            {"화사하고 활기찬": 0.8, "차분하고 자연적인": 0.2},
+        )
+    ]
+    # 활기찬 0.7 ≥ 0.35 (정답 라벨, 일치), 자연적인 0.4 ≥ 0.35 (비라벨, 불일치)
+    predictions = [{"화사하고 활기찬": 0.7, "차분하고 자연적인": 0.4}]
+
+    metrics = module.atmosphere_metrics(cases, predictions, threshold=0.35)
+
+    assert metrics["atmosphere_accuracy"] == 0.5
+    assert metrics["atmosphere_drift"] == pytest.approx(0.15)
+
+
+def test_pass_rates_split_positive_and_negative_trials() -> None:
+    module = load_module()
+
+    tpr, fpr = module.pass_rates(
+        [(True, True), (True, False), (False, True), (False, False), (False, False)]
+    )
+
+    assert tpr == 0.5
+    assert fpr == pytest.approx(1 / 3)
+    assert module.pass_rates([]) == (0.0, 0.0)
+
+
+def test_format_report_renders_one_row_per_mode() -> None:
+    module = load_module()
+
+    text = module.format_report(
+        [{"mode": "fp32", "blip_mb": 1476.5, "atmosphere_accuracy": 0.91234}]
+    )
+
+    lines = text.splitlines()
+    assert len(lines) == 3
+    assert lines[2].startswith("| fp32 | - | - | 1476.5 | 0.912 |")
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import importlib.util
+import json
+import sys
+from pathlib import Path
+
+
+MODULE_PATH = (
+    Path(__file__).resolve().parents[2]
+    / "scripts"
+    / "tools"
+    / "select_landmark_questions.py"
+)
+
+
+def load_module():
+    spec = importlib.util.spec_from_file_location(
+        "select_landmark_questions", MODULE_PATH
+    )
+    module = importlib.util.module_from_spec(spec)
+    assert spec.loader is not None
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+QA_DATA = {
+    "A": [["Is it pink?", "yes"], ["Is it a statue?", "yes"], ["Is it blue?", "no"]],
+    "B": [["Is it a tower?", "yes"], ["Is it a statue?", "no"]],
+}
+YES_PROBABILITIES = {
+    "A": {"Is it pink?": 0.9, "Is it a statue?": 0.95, "Is it blue?": 0.1},
+    "B": {"Is it pink?": 0.1, "Is it a statue?": 0.9, "Is it blue?": 0.3},
+}
+
+
+def test_ranks_questions_by_margin_and_drops_uninformative() -> None:
+    module = load_module()
+
+    selected = module.rank_questions(
+        {"A": QA_DATA["A"]},
+        YES_PROBABILITIES,
+        max_questions=10,
+        min_questions=1,
+        min_margin=0.1,
+    )
+
+    # pink: 0.9-0.1=0.8, blue(no): 0.9-0.7=0.2, statue: 0.95-0.9=0.05 (탈락)
+    assert selected["A"] == [["Is it pink?", "yes", 0.8], ["Is it blue?", "no", 0.2]]
+
+
+def test_fills_up_to_min_questions_and_caps_at_max() -> None:
+    module = load_module()
+
+    filled = module.rank_questions(
+        {"A": QA_DATA["A"]},
+        YES_PROBABILITIES,
+        max_questions=10,
+        min_questions=3,
+        min_margin=0.5,
+    )
+    capped = module.rank_questions(
+        {"A": QA_DATA["A"]},
+        YES_PROBABILITIES,
+        max_questions=1,
+        min_questions=1,
+        min_margin=0.0,
+    )
+
+    assert [entry[0] for entry in filled["A"]] == [
+        "Is it pink?",
+        "Is it blue?",
+        "Is it a statue?",
+    ]
+    assert [entry[0] for entry in capped["A"]] == ["Is it pink?"]
+
+
+def test_keeps_original_list_without_reference_photos() -> None:
+    module = load_module()
+
+    selected = module.rank_questions(
+        {"C": [["Is it red?", "yes"]]},
+        YES_PROBABILITIES,
+        max_questions=10,
+        min_questions=1,
+        min_margin=0.1,
+    )
+
+    assert selected["C"] == [["Is it red?", "yes"]]
+
+
+def test_collects_only_image_files_in_landmark_folders(tmp_path: Path) -> None:
+    module = load_module()
+    (tmp_path / "A").mkdir()
+    (tmp_path / "A" / "a_01.jpg").write_bytes(b"x")
+    (tmp_path / "A" / "a_02.JFIF").write_bytes(b"x")
+    (tmp_path / "A" / "notes.txt").write_text("x")
+    (tmp_path / "B").mkdir()
+
+    images = module.collect_reference_images(tmp_path, ["A", "B", "C"])
+
+    assert list(images) == ["A"]
+    assert [path.name for path in images["A"]] == ["a_01.jpg", "a_02.JFIF"]
+
+
+def test_dump_round_trips_through_json() -> None:
+    module = load_module()
+    selected = {"활돌이": [["Is it pink?", "yes", 0.8], ["Is it blue?", "no", 0.2]]}
+
+    text = module.dump_qa(selected)
+
+    assert json.loads(text) == selected
+    assert '    ["Is it pink?", "yes", 0.8],' in text.splitlines()
+
+
+def test_defaults_to_full_labeled_question_file() -> None:
+    module = load_module()
+
+    assert module.DEFAULT_INPUT.name == "landmark_qa_labeled.json"
+    assert module.DEFAULT_INPUT != module.DEFAULT_OUTPUT
+
+
+def test_refuses_to_overwrite_input(tmp_path: Path) -> None:
+    module = load_module()
+    qa_path = tmp_path / "qa.json"
+    qa_path.write_text(json.dumps(QA_DATA), encoding="utf-8")
+
+    code = module.main(["--input", str(qa_path), "--output", str(qa_path)])
+
+    assert code == 1
+    assert json.loads(qa_path.read_text(encoding="utf-8")) == QA_DATA